@@ -19,6 +19,11 @@ target_metadata = Base.metadata
 # access to the values within the .ini file in use.
 config = context.config
 
+# Use the app's DATABASE_URL when set (e.g. Postgres); otherwise alembic.ini
+from app.core.config import settings
+if settings.database_url:
+    config.set_main_option("sqlalchemy.url", settings.database_url)
+
 # Interpret the config file for Python logging.
 # This line sets up loggers basically.
 if config.config_file_name is not None:
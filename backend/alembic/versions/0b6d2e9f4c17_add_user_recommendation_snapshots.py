@@ -0,0 +1,37 @@
+"""Add per-user recommendation snapshots
+
+Revision ID: 0b6d2e9f4c17
+Revises: f5a3c8e27b14
+Create Date: 2026-10-18 22:41:09.553817
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0b6d2e9f4c17'
+down_revision: Union[str, Sequence[str], None] = 'f5a3c8e27b14'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('user_recommendation_snapshots',
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('pools_json', sa.Text(), nullable=False),
+    sa.Column('is_stale', sa.Boolean(), nullable=False),
+    sa.Column('refreshed_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('user_id')
+    )
+    op.create_index(op.f('ix_user_recommendation_snapshots_is_stale'), 'user_recommendation_snapshots', ['is_stale'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_user_recommendation_snapshots_is_stale'), table_name='user_recommendation_snapshots')
+    op.drop_table('user_recommendation_snapshots')
@@ -0,0 +1,53 @@
+"""Add harmonic search index tables
+
+Revision ID: a3c91e5f7d20
+Revises: fef0d9cc5b77
+Create Date: 2026-10-18 10:12:41.218530
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a3c91e5f7d20'
+down_revision: Union[str, Sequence[str], None] = 'fef0d9cc5b77'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('song_harmonic_ngrams',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('ngram', sa.String(), nullable=False),
+    sa.Column('song_id', sa.String(), nullable=False),
+    sa.Column('size', sa.Integer(), nullable=False),
+    sa.Column('position', sa.Integer(), nullable=False),
+    sa.Column('start_index', sa.Integer(), nullable=False),
+    sa.Column('end_index', sa.Integer(), nullable=False),
+    sa.Column('start_time', sa.Float(), nullable=False),
+    sa.Column('end_time', sa.Float(), nullable=False),
+    sa.ForeignKeyConstraint(['song_id'], ['songs.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_song_harmonic_ngrams_ngram'), 'song_harmonic_ngrams', ['ngram'], unique=False)
+    op.create_index(op.f('ix_song_harmonic_ngrams_song_id'), 'song_harmonic_ngrams', ['song_id'], unique=False)
+    op.create_table('song_harmonic_signatures',
+    sa.Column('song_id', sa.String(), nullable=False),
+    sa.Column('signature_json', sa.Text(), nullable=False),
+    sa.Column('token_count', sa.Integer(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['song_id'], ['songs.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('song_id')
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('song_harmonic_signatures')
+    op.drop_index(op.f('ix_song_harmonic_ngrams_song_id'), table_name='song_harmonic_ngrams')
+    op.drop_index(op.f('ix_song_harmonic_ngrams_ngram'), table_name='song_harmonic_ngrams')
+    op.drop_table('song_harmonic_ngrams')
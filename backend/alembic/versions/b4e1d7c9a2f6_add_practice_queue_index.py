@@ -0,0 +1,32 @@
+"""Add practice queue index on curriculum exercises
+
+Revision ID: b4e1d7c9a2f6
+Revises: a3c91e5f7d20
+Create Date: 2026-10-18 14:05:12.604311
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b4e1d7c9a2f6'
+down_revision: Union[str, Sequence[str], None] = 'a3c91e5f7d20'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'ix_curriculum_exercises_practice_queue',
+        'curriculum_exercises',
+        ['lesson_id', 'is_mastered', 'next_review_at'],
+        unique=False
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_curriculum_exercises_practice_queue', table_name='curriculum_exercises')
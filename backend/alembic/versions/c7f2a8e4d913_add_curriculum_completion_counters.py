@@ -0,0 +1,58 @@
+"""Add completion counters to curriculum lessons and modules
+
+Revision ID: c7f2a8e4d913
+Revises: b4e1d7c9a2f6
+Create Date: 2026-10-18 15:32:47.118204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c7f2a8e4d913'
+down_revision: Union[str, Sequence[str], None] = 'b4e1d7c9a2f6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Use batch operations for SQLite compatibility
+    with op.batch_alter_table('curriculum_lessons', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('exercises_total', sa.Integer(), nullable=False, server_default='0'))
+        batch_op.add_column(sa.Column('exercises_mastered', sa.Integer(), nullable=False, server_default='0'))
+
+    with op.batch_alter_table('curriculum_modules', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('lessons_total', sa.Integer(), nullable=False, server_default='0'))
+        batch_op.add_column(sa.Column('lessons_completed', sa.Integer(), nullable=False, server_default='0'))
+
+    # Backfill from existing rows
+    op.execute(
+        "UPDATE curriculum_lessons SET "
+        "exercises_total = (SELECT COUNT(*) FROM curriculum_exercises "
+        "WHERE curriculum_exercises.lesson_id = curriculum_lessons.id), "
+        "exercises_mastered = (SELECT COUNT(*) FROM curriculum_exercises "
+        "WHERE curriculum_exercises.lesson_id = curriculum_lessons.id AND curriculum_exercises.is_mastered IS TRUE)"
+    )
+    op.execute(
+        "UPDATE curriculum_modules SET "
+        "lessons_total = (SELECT COUNT(*) FROM curriculum_lessons "
+        "WHERE curriculum_lessons.module_id = curriculum_modules.id), "
+        "lessons_completed = (SELECT COUNT(*) FROM curriculum_lessons "
+        "WHERE curriculum_lessons.module_id = curriculum_modules.id AND curriculum_lessons.is_completed IS TRUE)"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # Use batch operations for SQLite compatibility
+    with op.batch_alter_table('curriculum_modules', schema=None) as batch_op:
+        batch_op.drop_column('lessons_completed')
+        batch_op.drop_column('lessons_total')
+
+    with op.batch_alter_table('curriculum_lessons', schema=None) as batch_op:
+        batch_op.drop_column('exercises_mastered')
+        batch_op.drop_column('exercises_total')
@@ -0,0 +1,40 @@
+"""Add shared content source to curriculum exercises
+
+Revision ID: e2b9d4f61a08
+Revises: c7f2a8e4d913
+Create Date: 2026-10-18 16:48:03.527911
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e2b9d4f61a08'
+down_revision: Union[str, Sequence[str], None] = 'c7f2a8e4d913'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Use batch operations for SQLite compatibility
+    with op.batch_alter_table('curriculum_exercises', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('content_source_id', sa.String(length=36), nullable=True))
+        batch_op.create_foreign_key(
+            'fk_curriculum_exercises_content_source_id',
+            'curriculum_exercises',
+            ['content_source_id'],
+            ['id'],
+            ondelete='RESTRICT'
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # Use batch operations for SQLite compatibility
+    with op.batch_alter_table('curriculum_exercises', schema=None) as batch_op:
+        batch_op.drop_constraint('fk_curriculum_exercises_content_source_id', type_='foreignkey')
+        batch_op.drop_column('content_source_id')
@@ -0,0 +1,32 @@
+"""Add (user_id, next_review) index on user exercise progress
+
+Revision ID: f5a3c8e27b14
+Revises: e2b9d4f61a08
+Create Date: 2026-10-18 18:21:36.904417
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f5a3c8e27b14'
+down_revision: Union[str, Sequence[str], None] = 'e2b9d4f61a08'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'ix_user_exercise_progress_user_next_review',
+        'user_exercise_progress',
+        ['user_id', 'next_review'],
+        unique=False
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_user_exercise_progress_user_next_review', table_name='user_exercise_progress')
@@ -298,9 +298,10 @@ async def regenerate_audio(
         exercise.audio_generation_status = "pending"
         await session.commit()
 
-        # Queue Celery task
+        # Queue Celery task (bypassing the shared render cache)
         task = generate_exercise_audio_task.apply_async(
             args=[exercise_id, request.method],
+            kwargs={"force": True},
             countdown=0
         )
 
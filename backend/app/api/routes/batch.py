@@ -0,0 +1,39 @@
+"""Batch Arrangement Generation API Routes - Concurrent Multi-Genre Generation"""
+
+from fastapi import APIRouter
+from fastapi.responses import StreamingResponse
+
+from app.schemas.batch import BatchArrangementRequest
+from app.services.batch_arrangement import batch_arrangement_service
+
+
+router = APIRouter(prefix="/batch", tags=["Batch Generation"])
+
+
+@router.post(
+    "/arrangements",
+    response_class=StreamingResponse,
+    responses={200: {"content": {"application/x-ndjson": {}}}}
+)
+async def generate_arrangement_batch(request: BatchArrangementRequest):
+    """
+    Generate many arrangements across genres in one request.
+
+    Pipeline per item:
+    1. Chord progression (LLM calls run concurrently under a shared rate limit)
+    2. Arrangement + MIDI encoding in a worker process pool
+
+    Returns a stream of newline-delimited JSON BatchArrangementResult objects,
+    one per item, in completion order (use "index" to match them to items).
+    A failed item produces a result with success=false and does not stop the batch.
+    """
+    async def stream():
+        async for result in batch_arrangement_service.generate(
+            request.items,
+            max_concurrency=request.max_concurrency,
+            persist=request.save,
+            include_midi=request.include_midi
+        ):
+            yield result.model_dump_json() + "\n"
+
+    return StreamingResponse(stream(), media_type="application/x-ndjson")
@@ -1,6 +1,6 @@
 """Blues Piano Generation API Routes + Theory Integration"""
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Response
 from fastapi.responses import FileResponse
 from pathlib import Path
 from typing import List, Dict, Any
@@ -36,6 +36,34 @@ async def generate_blues(request: GenerateBluesRequest):
     return await blues_generator_service.generate_blues_arrangement(request)
 
 
+@router.post(
+    "/generate/midi",
+    response_class=Response,
+    responses={200: {"content": {"audio/midi": {}}}},
+)
+async def generate_blues_midi(request: GenerateBluesRequest, save: bool = False):
+    """
+    Generate a blues arrangement and stream the MIDI file directly.
+
+    Runs the same pipeline as /blues/generate but returns raw `audio/midi`
+    bytes instead of base64 inside JSON. Nothing is written to disk unless
+    `save=true`, in which case the file is also available via /blues/download.
+    """
+    try:
+        midi_bytes, filename = await blues_generator_service.generate_midi(request, persist=save)
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Blues generation failed: {str(e)}"
+        )
+
+    return Response(
+        content=midi_bytes,
+        media_type="audio/midi",
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+
 @router.get("/download/{filename}")
 async def download_blues_midi(filename: str):
     """Download generated blues MIDI file"""
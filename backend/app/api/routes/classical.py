@@ -1,6 +1,6 @@
 """Classical Piano Generation API Routes"""
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Response
 from fastapi.responses import FileResponse
 from pathlib import Path
 
@@ -33,6 +33,34 @@ async def generate_classical(request: GenerateClassicalRequest):
     return await classical_generator_service.generate_classical_arrangement(request)
 
 
+@router.post(
+    "/generate/midi",
+    response_class=Response,
+    responses={200: {"content": {"audio/midi": {}}}},
+)
+async def generate_classical_midi(request: GenerateClassicalRequest, save: bool = False):
+    """
+    Generate a classical arrangement and stream the MIDI file directly.
+
+    Runs the same pipeline as /classical/generate but returns raw `audio/midi`
+    bytes instead of base64 inside JSON. Nothing is written to disk unless
+    `save=true`, in which case the file is also available via /classical/download.
+    """
+    try:
+        midi_bytes, filename = await classical_generator_service.generate_midi(request, persist=save)
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Classical generation failed: {str(e)}"
+        )
+
+    return Response(
+        content=midi_bytes,
+        media_type="audio/midi",
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+
 @router.get("/download/{filename}")
 async def download_classical_midi(filename: str):
     """Download generated classical MIDI file"""
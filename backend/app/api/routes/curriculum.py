@@ -8,7 +8,7 @@ from datetime import datetime
 from typing import List, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, status, Body
-from sqlalchemy import select, and_
+from sqlalchemy import select, update, and_
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import get_current_user
@@ -22,6 +22,7 @@ from app.database.curriculum_models import (
     CurriculumExercise,
 )
 from app.services.curriculum_service import CurriculumService
+from app.services.srs_simulator import ReviewForecastService, SM2Parameters
 from app.schemas.curriculum import (
     AssessmentSubmission,
     UserSkillProfileResponse,
@@ -38,6 +39,8 @@ from app.schemas.curriculum import (
     AddLickToPracticeRequest,
     DailyPracticeQueue,
     DailyPracticeItem,
+    ReviewForecastRequest,
+    ReviewForecastResponse,
     SkillLevels,
     StyleFamiliarity,
     LessonSummary,
@@ -440,7 +443,7 @@ def _lesson_to_response(lesson: CurriculumLesson) -> CurriculumLessonResponse:
 
 def _exercise_to_response(exercise: CurriculumExercise) -> CurriculumExerciseResponse:
     """Convert exercise model to response schema"""
-    content_dict = json.loads(exercise.content_json or '{}')
+    content_dict = json.loads(exercise.effective_content_json or '{}')
     
     return CurriculumExerciseResponse(
         id=exercise.id,
@@ -492,7 +495,7 @@ async def get_daily_practice(
     service: CurriculumService = Depends(get_curriculum_service)
 ):
     """Get today's practice queue"""
-    curriculum = await service.get_active_curriculum(user_id)
+    curriculum = await service.get_active_curriculum(user_id, load_modules=False)
     if not curriculum:
         raise HTTPException(status_code=404, detail="No active curriculum found")
     
@@ -530,6 +533,43 @@ async def get_daily_practice(
         new_count=new_count,
     )
 
+
+@router.post("/review-forecast", response_model=ReviewForecastResponse)
+async def get_review_forecast(
+    request: ReviewForecastRequest,
+    user_id: int = Depends(get_current_user_id),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Project daily review counts for the next N days.
+
+    Monte-Carlo simulates SM-2 over the active curriculum's unmastered
+    exercises, drawing ratings from the user's history (or the supplied
+    distribution). SM-2 parameters can be overridden to compare schedules.
+    """
+    params = SM2Parameters(
+        initial_ease=request.initial_ease,
+        min_ease=request.min_ease,
+        first_interval=request.first_interval,
+        second_interval=request.second_interval,
+        fail_interval=request.fail_interval,
+        interval_modifier=request.interval_modifier,
+        max_interval=request.max_interval,
+    )
+    probs = request.quality_distribution
+    if probs is not None and (min(probs) < 0 or sum(probs) <= 0):
+        raise HTTPException(status_code=400, detail="quality_distribution must be non-negative with a positive sum")
+
+    return await ReviewForecastService(db).forecast(
+        [user_id],
+        days=request.days,
+        simulations=request.simulations,
+        quality_probs=probs,
+        params=params,
+        new_cards_per_day=request.new_cards_per_day,
+        seed=request.seed,
+    )
+
 # === Phase 2: Tutorial & Performance Endpoints ===
 
 @router.get("/lessons/{lesson_id}/tutorial")
@@ -1100,6 +1140,12 @@ async def add_lick_to_practice(
                 estimated_duration_minutes=30
             )
             db.add(lesson)
+            await db.execute(
+                update(CurriculumModule)
+                .where(CurriculumModule.id == module.id)
+                .values(lessons_total=CurriculumModule.lessons_total + 1)
+                .execution_options(synchronize_session=False)
+            )
             await db.flush()
 
         # Create lick exercise
@@ -1128,6 +1174,12 @@ async def add_lick_to_practice(
         )
 
         db.add(exercise)
+        await db.execute(
+            update(CurriculumLesson)
+            .where(CurriculumLesson.id == lesson.id)
+            .values(exercises_total=CurriculumLesson.exercises_total + 1)
+            .execution_options(synchronize_session=False)
+        )
         await db.commit()
         await db.refresh(exercise)
 
@@ -1139,7 +1191,7 @@ async def add_lick_to_practice(
             description=exercise.description,
             order_index=exercise.order_index,
             exercise_type=exercise.exercise_type,
-            content=json.loads(exercise.content_json),
+            content=json.loads(exercise.effective_content_json),
             difficulty=exercise.difficulty,
             estimated_duration_minutes=exercise.estimated_duration_minutes,
             target_bpm=exercise.target_bpm,
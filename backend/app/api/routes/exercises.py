@@ -7,8 +7,11 @@ from typing import List, Optional
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.api.deps import get_current_user
+from app.database.models import User
 from app.database.session import get_db
 from app.services.exercise_library_service import get_exercise_library_service, ExerciseLibraryService
+from app.services.exercise_recommendation_service import get_exercise_recommendation_service
 from app.services.template_parser import template_parser
 from app.schemas.curriculum import (
     TemplateExercise,
@@ -304,6 +307,53 @@ async def mark_exercise_complete(
     }
 
 
+@router.get("/recommended")
+async def get_recommended_exercises(
+    limit: int = Query(10, ge=1, le=50),
+    genre: Optional[str] = None,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """Get personalized exercise recommendations
+
+    Served from the user's precomputed recommendation snapshot.
+
+    Args:
+        limit: Maximum recommendations (1-50)
+        genre: Optional genre filter (matches the exercise library's genre)
+        current_user: Authenticated user
+        db: Database session
+
+    Returns:
+        Recommended exercises with reasoning
+    """
+    service = get_exercise_recommendation_service(db)
+    recommendations = await service.get_recommended_exercises(current_user.id, limit, genre)
+
+    return {
+        "recommendations": recommendations,
+        "total": len(recommendations)
+    }
+
+
+@router.get("/recommended/metrics")
+async def get_recommendation_metrics(
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """Get recommendation snapshot hit-rate and staleness metrics
+
+    Args:
+        current_user: Authenticated user
+        db: Database session
+
+    Returns:
+        Hit/miss counters for this process and snapshot staleness totals
+    """
+    service = get_exercise_recommendation_service(db)
+    return await service.get_snapshot_metrics()
+
+
 @router.get("/stats")
 async def get_library_stats(db: AsyncSession = Depends(get_db)):
     """Get overall exercise library statistics
@@ -1,6 +1,6 @@
 """Gospel Piano Generation API Routes - Gemini + MLX Hybrid + Theory Integration"""
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Response
 from fastapi.responses import FileResponse
 from typing import List, Dict, Any, Optional
 from pydantic import BaseModel
@@ -87,6 +87,34 @@ async def generate_gospel_arrangement(request: GenerateGospelRequest):
         )
 
 
+@router.post(
+    "/generate/midi",
+    response_class=Response,
+    responses={200: {"content": {"audio/midi": {}}}},
+)
+async def generate_gospel_midi(request: GenerateGospelRequest, save: bool = False):
+    """
+    Generate a gospel arrangement and stream the MIDI file directly.
+
+    Runs the same pipeline as /gospel/generate but returns raw `audio/midi`
+    bytes instead of base64 inside JSON. Nothing is written to disk unless
+    `save=true`, in which case the file is also available via /gospel/download.
+    """
+    try:
+        midi_bytes, filename = await gospel_generator_service.generate_midi(request, persist=save)
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Gospel generation failed: {str(e)}"
+        )
+
+    return Response(
+        content=midi_bytes,
+        media_type="audio/midi",
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+
 @router.get("/download/{filename}")
 async def download_gospel_midi(filename: str):
     """
@@ -1,6 +1,6 @@
 """Jazz Piano Generation API Routes - Gemini + Rule-Based + Theory Integration"""
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Response
 from fastapi.responses import FileResponse
 from typing import List, Dict, Any, Optional
 from pydantic import BaseModel
@@ -95,6 +95,34 @@ async def generate_jazz_arrangement(request: GenerateJazzRequest):
         )
 
 
+@router.post(
+    "/generate/midi",
+    response_class=Response,
+    responses={200: {"content": {"audio/midi": {}}}},
+)
+async def generate_jazz_midi(request: GenerateJazzRequest, save: bool = False):
+    """
+    Generate a jazz arrangement and stream the MIDI file directly.
+
+    Runs the same pipeline as /jazz/generate but returns raw `audio/midi`
+    bytes instead of base64 inside JSON. Nothing is written to disk unless
+    `save=true`, in which case the file is also available via /jazz/download.
+    """
+    try:
+        midi_bytes, filename = await jazz_generator_service.generate_midi(request, persist=save)
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Jazz generation failed: {str(e)}"
+        )
+
+    return Response(
+        content=midi_bytes,
+        media_type="audio/midi",
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+
 @router.get("/download/{filename}")
 async def download_jazz_midi(filename: str):
     """
@@ -1,9 +1,12 @@
 """Job management endpoints"""
 
+import json
 from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import StreamingResponse
 from typing import Optional
 
 from app.schemas.transcription import TranscriptionJob, JobStatus
+from app.services.job_events import job_event_broker
 from app.services.transcription import TranscriptionService
 
 router = APIRouter(prefix="/jobs", tags=["jobs"])
@@ -43,6 +46,58 @@ async def list_jobs(
     return service.list_jobs(status=status, limit=limit, offset=offset)
 
 
+@router.get(
+    "/events",
+    response_class=StreamingResponse,
+    responses={200: {"content": {"text/event-stream": {}}}}
+)
+async def stream_all_job_events():
+    """
+    Server-sent events for every job
+
+    Starts with a "snapshot" event per job still in progress, then pushes
+    stage transitions, progress and per-step timings as they happen
+    (JobEvent JSON in each event's data). Use this instead of polling GET /jobs.
+    """
+    service = get_transcription_service()
+    return _event_stream(None, service)
+
+
+@router.get(
+    "/{job_id}/events",
+    response_class=StreamingResponse,
+    responses={200: {"content": {"text/event-stream": {}}}}
+)
+async def stream_job_events(job_id: str):
+    """
+    Server-sent events for one job
+
+    Starts with the job's current state, then pushes stage transitions,
+    progress and per-step timings. The stream ends after the job's terminal
+    event (complete, error, cancelled or deleted); a finished job sends that
+    event straight away.
+    """
+    service = get_transcription_service()
+    if service.get_job(job_id) is None:
+        raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
+    return _event_stream(job_id, service)
+
+
+def _event_stream(job_id: Optional[str], service: TranscriptionService) -> StreamingResponse:
+    async def stream():
+        async for event in job_event_broker.stream(job_id, lambda: service.event_snapshot(job_id)):
+            if event is None:
+                yield ": keep-alive\n\n"
+            else:
+                yield f"event: {event['event']}\ndata: {json.dumps(event)}\n\n"
+
+    return StreamingResponse(
+        stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
 @router.delete("/{job_id}", status_code=204)
 async def cancel_job(job_id: str):
     """
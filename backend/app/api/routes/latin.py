@@ -1,6 +1,6 @@
 """Latin/Salsa Piano Generation API Routes"""
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Response
 from app.schemas.latin import (
     GenerateLatinRequest,
     GenerateLatinResponse,
@@ -66,3 +66,31 @@ async def generate_latin_arrangement(request: GenerateLatinRequest):
         return response
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.post(
+    "/generate/midi",
+    response_class=Response,
+    responses={200: {"content": {"audio/midi": {}}}},
+)
+async def generate_latin_midi(request: GenerateLatinRequest, save: bool = False):
+    """
+    Generate a Latin arrangement and stream the MIDI file directly.
+
+    Runs the same pipeline as /latin/generate but returns raw `audio/midi`
+    bytes instead of base64 inside JSON. Nothing is written to disk unless
+    `save=true`, in which case a copy is kept on the server as well.
+    """
+    try:
+        midi_bytes, filename = await latin_generator_service.generate_midi(request, persist=save)
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Latin generation failed: {str(e)}"
+        )
+
+    return Response(
+        content=midi_bytes,
+        media_type="audio/midi",
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
@@ -7,7 +7,16 @@ from sqlalchemy import select, or_
 
 from app.database.session import get_db
 from app.database.models import Song, Tag, SongTag
-from app.schemas.library import SongSummary, SongDetail, SongUpdate, SongNoteResponse, SongChordResponse
+from app.schemas.library import (
+    SongSummary,
+    SongDetail,
+    SongUpdate,
+    SongNoteResponse,
+    SongChordResponse,
+    HarmonicSearchResult,
+    SimilarSongResult,
+)
+from app.services.harmonic_search_service import HarmonicSearchService
 
 router = APIRouter(prefix="/library", tags=["library"])
 
@@ -76,6 +85,50 @@ async def list_songs(
     ]
 
 
+@router.get("/search/harmonic", response_model=list[HarmonicSearchResult])
+async def search_harmonic(
+    q: str = Query(..., min_length=1, description="Chord progression in any key, e.g. 'Dm7 G7 Cmaj7 Db7'"),
+    limit: int = Query(20, ge=1, le=100, description="Maximum songs"),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Find songs containing a chord progression, in any key
+
+    Uses the harmonic n-gram index, so matching is transposition-invariant
+    and ignores chord extensions (Dm7 and Dm9 both match a minor chord).
+    Results are ranked by number of occurrences and include the chord
+    indices and times of every match.
+    """
+    try:
+        results = await HarmonicSearchService(db).search_progression(q, limit=limit)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    return [HarmonicSearchResult(**r) for r in results]
+
+
+@router.get("/songs/{song_id}/similar", response_model=list[SimilarSongResult])
+async def get_similar_songs(
+    song_id: str,
+    limit: int = Query(10, ge=1, le=50, description="Maximum songs"),
+    db: AsyncSession = Depends(get_db),
+):
+    """Find songs harmonically similar to this one (MinHash over chord n-grams)"""
+    results = await HarmonicSearchService(db).find_similar(song_id, limit=limit)
+
+    if results is None:
+        raise HTTPException(status_code=404, detail=f"Song {song_id} is not in the harmonic index")
+
+    return [SimilarSongResult(**r) for r in results]
+
+
+@router.post("/harmonic-index/rebuild")
+async def rebuild_harmonic_index(db: AsyncSession = Depends(get_db)):
+    """Rebuild the harmonic search index from all stored song chords"""
+    indexed = await HarmonicSearchService(db).rebuild_index()
+    return {"message": f"Indexed {indexed} songs", "songs_indexed": indexed}
+
+
 @router.get("/songs/{song_id}", response_model=SongDetail)
 async def get_song(song_id: str, db: AsyncSession = Depends(get_db)):
     """
@@ -155,6 +208,7 @@ async def delete_song(song_id: str, db: AsyncSession = Depends(get_db)):
     if not song:
         raise HTTPException(status_code=404, detail=f"Song {song_id} not found")
     
+    await HarmonicSearchService(db).remove_song(song_id)
     await db.delete(song)
     await db.commit()
     
@@ -1,6 +1,6 @@
 """Neo-Soul Piano Generation API Routes - Gemini + Rule-Based + Theory Integration"""
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Response
 from fastapi.responses import FileResponse
 from typing import List, Dict, Any, Optional
 from pydantic import BaseModel
@@ -94,6 +94,34 @@ async def generate_neosoul_arrangement(request: GenerateNeosoulRequest):
         )
 
 
+@router.post(
+    "/generate/midi",
+    response_class=Response,
+    responses={200: {"content": {"audio/midi": {}}}},
+)
+async def generate_neosoul_midi(request: GenerateNeosoulRequest, save: bool = False):
+    """
+    Generate a neo-soul arrangement and stream the MIDI file directly.
+
+    Runs the same pipeline as /neosoul/generate but returns raw `audio/midi`
+    bytes instead of base64 inside JSON. Nothing is written to disk unless
+    `save=true`, in which case the file is also available via /neosoul/download.
+    """
+    try:
+        midi_bytes, filename = await neosoul_generator_service.generate_midi(request, persist=save)
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Neo-soul generation failed: {str(e)}"
+        )
+
+    return Response(
+        content=midi_bytes,
+        media_type="audio/midi",
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+
 @router.get("/download/{filename}")
 async def download_neosoul_midi(filename: str):
     """
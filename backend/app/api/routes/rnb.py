@@ -1,6 +1,6 @@
 """R&B Piano Generation API Routes"""
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Response
 from app.schemas.rnb import (
     GenerateRnBRequest,
     GenerateRnBResponse,
@@ -66,3 +66,31 @@ async def generate_rnb_arrangement(request: GenerateRnBRequest):
         return response
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.post(
+    "/generate/midi",
+    response_class=Response,
+    responses={200: {"content": {"audio/midi": {}}}},
+)
+async def generate_rnb_midi(request: GenerateRnBRequest, save: bool = False):
+    """
+    Generate an R&B arrangement and stream the MIDI file directly.
+
+    Runs the same pipeline as /rnb/generate but returns raw `audio/midi`
+    bytes instead of base64 inside JSON. Nothing is written to disk unless
+    `save=true`, in which case a copy is kept on the server as well.
+    """
+    try:
+        midi_bytes, filename = await rnb_generator_service.generate_midi(request, persist=save)
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"R&B generation failed: {str(e)}"
+        )
+
+    return Response(
+        content=midi_bytes,
+        media_type="audio/midi",
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
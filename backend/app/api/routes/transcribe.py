@@ -29,7 +29,8 @@ async def transcribe_from_url(request: TranscribeUrlRequest):
     """
     Start transcription from YouTube URL
     
-    Returns immediately with job ID. Poll GET /transcribe/{job_id} for status.
+    Returns immediately with job ID. Follow GET /jobs/{job_id}/events (SSE)
+    or poll GET /transcribe/{job_id} for status.
     """
     service = get_transcription_service()
     job_id = await service.process_url(request.url, request.options)
@@ -47,7 +48,8 @@ async def transcribe_from_upload(
     """
     Start transcription from uploaded audio/video file
     
-    Returns immediately with job ID. Poll GET /transcribe/{job_id} for status.
+    Returns immediately with job ID. Follow GET /jobs/{job_id}/events (SSE)
+    or poll GET /transcribe/{job_id} for status.
     """
     service = get_transcription_service()
     
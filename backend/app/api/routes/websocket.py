@@ -314,3 +314,44 @@ async def get_active_sessions():
             for session in active_sessions.values()
         ]
     }
+
+
+@router.websocket("/ws/jobs")
+async def websocket_job_events(websocket: WebSocket, job_id: Optional[str] = None):
+    """
+    WebSocket stream of transcription job progress.
+
+    Same events as GET /jobs/events (or GET /jobs/{job_id}/events when
+    ?job_id= is given), for clients that already hold a WebSocket.
+
+    Server → Client:
+        {"type": "job", "data": {JobEvent}}
+        {"type": "ping", "timestamp": ...}      (while idle)
+        {"type": "error", "message": "..."}
+
+    A single-job stream closes after the job's terminal event.
+    """
+    from app.api.routes import jobs
+    from app.services.job_events import job_event_broker
+
+    await websocket.accept()
+
+    service = jobs.transcription_service
+    if service is None or (job_id is not None and service.get_job(job_id) is None):
+        await websocket.send_json({
+            "type": "error",
+            "message": f"Job {job_id} not found" if service else "Transcription service not initialized"
+        })
+        await websocket.close()
+        return
+
+    try:
+        async for event in job_event_broker.stream(job_id, lambda: service.event_snapshot(job_id)):
+            if event is None:
+                await websocket.send_json({"type": "ping", "timestamp": time.time()})
+            else:
+                await websocket.send_json({"type": "job", "data": event})
+        await websocket.close()
+
+    except WebSocketDisconnect:
+        logger.info("Job event stream disconnected")
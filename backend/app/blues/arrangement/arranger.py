@@ -95,12 +95,13 @@ class BluesArranger(BaseArranger):
         """
         return generate_blues_right_hand_pattern(pattern_name, context)
 
-    def _apply_rhythm_transformations(self, notes: List[Note], rhythm_patterns: List[str]) -> List[Note]:
+    def _apply_rhythm_transformations(self, notes: List[Note], rhythm_patterns: List[str], rng: random.Random) -> List[Note]:
         """Apply blues rhythm transformations (shuffle).
 
         Args:
             notes: Notes to transform
             rhythm_patterns: List of blues rhythm pattern names
+            rng: Random source for this arrangement
 
         Returns:
             Transformed notes with blues shuffle feel
@@ -114,7 +115,8 @@ class BluesArranger(BaseArranger):
         self,
         context: ChordContext,
         config: dict,
-        position: int
+        position: int,
+        rng: random.Random
     ) -> str:
         """Select appropriate left hand pattern based on context.
 
@@ -127,6 +129,7 @@ class BluesArranger(BaseArranger):
             context: Chord context
             config: Application configuration
             position: Position in progression
+            rng: Random source for this arrangement
 
         Returns:
             Pattern name
@@ -138,7 +141,7 @@ class BluesArranger(BaseArranger):
             # Start with strong pattern (boogie or shuffle)
             preferred = [p for p in available_patterns if p in ["boogie_woogie", "shuffle_bass"]]
             if preferred:
-                return random.choice(preferred)
+                return rng.choice(preferred)
 
         elif context.is_phrase_end:
             # End with walking bass for movement
@@ -147,13 +150,14 @@ class BluesArranger(BaseArranger):
                 return preferred[0]
 
         # Default: random selection
-        return random.choice(available_patterns)
+        return rng.choice(available_patterns)
 
     def _select_right_pattern(
         self,
         context: ChordContext,
         config: dict,
-        position: int
+        position: int,
+        rng: random.Random
     ) -> str:
         """Select appropriate right hand pattern based on context.
 
@@ -166,6 +170,7 @@ class BluesArranger(BaseArranger):
             context: Chord context
             config: Application configuration
             position: Position in progression
+            rng: Random source for this arrangement
 
         Returns:
             Pattern name
@@ -177,22 +182,23 @@ class BluesArranger(BaseArranger):
             # Start with call (question)
             preferred = [p for p in available_patterns if p in ["call_response", "blues_lick"]]
             if preferred:
-                return random.choice(preferred)
+                return rng.choice(preferred)
 
         elif context.is_phrase_end:
             # End with response or bends
             preferred = [p for p in available_patterns if p in ["call_response", "blues_bends"]]
             if preferred:
-                return random.choice(preferred)
+                return rng.choice(preferred)
 
         # Default: random selection
-        return random.choice(available_patterns)
+        return rng.choice(available_patterns)
 
     def _add_improvisation(
         self,
         context: ChordContext,
         position: int,
-        application: str
+        application: str,
+        rng: random.Random
     ) -> List[Note]:
         """Add blues improvisation elements.
 
@@ -205,6 +211,7 @@ class BluesArranger(BaseArranger):
             context: Chord context
             position: Position in progression
             application: Application type
+            rng: Random source for this arrangement
 
         Returns:
             List of improvisation notes
@@ -212,7 +219,7 @@ class BluesArranger(BaseArranger):
         improv_notes = []
 
         # Add blues lick at phrase end
-        if context.is_phrase_end and random.random() < 0.5:
+        if context.is_phrase_end and rng.random() < 0.5:
             # Simple descending blues lick
             root_midi = 72  # C5
 
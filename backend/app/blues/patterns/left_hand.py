@@ -17,6 +17,7 @@ Key Blues Concepts:
 
 from typing import List, Tuple
 from app.gospel import Note, ChordContext, HandPattern
+from app.core.arrangers.pattern_templates import PatternTemplateLibrary
 
 # MIDI note mappings
 NOTE_TO_MIDI = {
@@ -402,6 +403,30 @@ BLUES_LEFT_HAND_PATTERNS = {
 }
 
 
+def _build_blues_left_hand_pattern(pattern_name: str, context: ChordContext) -> HandPattern:
+    """Run the named pattern generator for one chord."""
+    if pattern_name not in BLUES_LEFT_HAND_PATTERNS:
+        raise ValueError(
+            f"Unknown blues left hand pattern: {pattern_name}. "
+            f"Available: {list(BLUES_LEFT_HAND_PATTERNS.keys())}"
+        )
+
+    generator = BLUES_LEFT_HAND_PATTERNS[pattern_name]
+    return generator(context)
+
+
+# Compiled per chord quality; walking_blues_bass reads next_chord and runs per bar
+BLUES_LEFT_HAND_TEMPLATES = PatternTemplateLibrary(
+    _build_blues_left_hand_pattern,
+    transposable=[
+        "boogie_woogie",
+        "shuffle_bass",
+        "blues_chord_voicing",
+        "octave_bass",
+    ]
+)
+
+
 def generate_blues_left_hand_pattern(pattern_name: str, context: ChordContext) -> HandPattern:
     """Generate a blues left hand pattern by name.
 
@@ -415,18 +440,12 @@ def generate_blues_left_hand_pattern(pattern_name: str, context: ChordContext) -
     Raises:
         ValueError: If pattern name not found
     """
-    if pattern_name not in BLUES_LEFT_HAND_PATTERNS:
-        raise ValueError(
-            f"Unknown blues left hand pattern: {pattern_name}. "
-            f"Available: {list(BLUES_LEFT_HAND_PATTERNS.keys())}"
-        )
-
-    generator = BLUES_LEFT_HAND_PATTERNS[pattern_name]
-    return generator(context)
+    return BLUES_LEFT_HAND_TEMPLATES.generate(pattern_name, context)
 
 
 __all__ = [
     "generate_blues_left_hand_pattern",
     "BLUES_LEFT_HAND_PATTERNS",
     "parse_chord_symbol",
+    "BLUES_LEFT_HAND_TEMPLATES",
 ]
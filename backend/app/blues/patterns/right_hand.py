@@ -17,6 +17,7 @@ Key Blues Concepts:
 
 from typing import List, Tuple
 from app.gospel import Note, ChordContext, HandPattern
+from app.core.arrangers.pattern_templates import PatternTemplateLibrary
 
 # MIDI note mappings
 NOTE_TO_MIDI = {
@@ -329,6 +330,31 @@ BLUES_RIGHT_HAND_PATTERNS = {
 }
 
 
+def _build_blues_right_hand_pattern(pattern_name: str, context: ChordContext) -> HandPattern:
+    """Run the named pattern generator for one chord."""
+    if pattern_name not in BLUES_RIGHT_HAND_PATTERNS:
+        raise ValueError(
+            f"Unknown blues right hand pattern: {pattern_name}. "
+            f"Available: {list(BLUES_RIGHT_HAND_PATTERNS.keys())}"
+        )
+
+    generator = BLUES_RIGHT_HAND_PATTERNS[pattern_name]
+    return generator(context)
+
+
+# Every pattern depends only on the chord, so all are compiled per chord quality
+BLUES_RIGHT_HAND_TEMPLATES = PatternTemplateLibrary(
+    _build_blues_right_hand_pattern,
+    transposable=[
+        "blues_lick",
+        "call_response",
+        "blues_bends",
+        "double_stop_sixths",
+        "blues_tremolo",
+    ]
+)
+
+
 def generate_blues_right_hand_pattern(pattern_name: str, context: ChordContext) -> HandPattern:
     """Generate a blues right hand pattern by name.
 
@@ -342,17 +368,11 @@ def generate_blues_right_hand_pattern(pattern_name: str, context: ChordContext)
     Raises:
         ValueError: If pattern name not found
     """
-    if pattern_name not in BLUES_RIGHT_HAND_PATTERNS:
-        raise ValueError(
-            f"Unknown blues right hand pattern: {pattern_name}. "
-            f"Available: {list(BLUES_RIGHT_HAND_PATTERNS.keys())}"
-        )
-
-    generator = BLUES_RIGHT_HAND_PATTERNS[pattern_name]
-    return generator(context)
+    return BLUES_RIGHT_HAND_TEMPLATES.generate(pattern_name, context)
 
 
 __all__ = [
     "generate_blues_right_hand_pattern",
     "BLUES_RIGHT_HAND_PATTERNS",
+    "BLUES_RIGHT_HAND_TEMPLATES",
 ]
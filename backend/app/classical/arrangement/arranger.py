@@ -9,7 +9,7 @@ Coordinates classical piano arrangement generation:
 Extends BaseArranger with classical-specific implementations.
 """
 
-from typing import List
+from typing import List, Optional
 import random
 
 from app.core.arrangers.base_arranger import BaseArranger
@@ -101,7 +101,7 @@ class ClassicalArranger(BaseArranger):
         """
         return generate_classical_right_hand_pattern(pattern_name, context)
 
-    def _apply_rhythm_transformations(self, notes: List[Note], rhythm_patterns: List[str]) -> List[Note]:
+    def _apply_rhythm_transformations(self, notes: List[Note], rhythm_patterns: List[str], rng: random.Random) -> List[Note]:
         """Apply rhythm transformations.
 
         Classical music uses strict time (no swing/shuffle).
@@ -110,6 +110,7 @@ class ClassicalArranger(BaseArranger):
         Args:
             notes: Notes to transform
             rhythm_patterns: List of rhythm pattern names (unused)
+            rng: Random source for this arrangement
 
         Returns:
             Notes unchanged (strict time)
@@ -121,7 +122,8 @@ class ClassicalArranger(BaseArranger):
         self,
         context: ChordContext,
         config: dict,
-        position: int
+        position: int,
+        rng: random.Random
     ) -> str:
         """Select appropriate left hand pattern based on context.
 
@@ -135,6 +137,7 @@ class ClassicalArranger(BaseArranger):
             context: Chord context
             config: Application configuration
             position: Position in progression
+            rng: Random source for this arrangement
 
         Returns:
             Pattern name
@@ -146,22 +149,23 @@ class ClassicalArranger(BaseArranger):
             # Start with clear harmonic foundation
             preferred = [p for p in available_patterns if p in ["alberti_bass", "broken_chord_classical"]]
             if preferred:
-                return random.choice(preferred)
+                return rng.choice(preferred)
 
         elif context.is_phrase_end:
             # End with grounded bass (pedal or counterpoint)
             preferred = [p for p in available_patterns if p in ["bass_melody_counterpoint", "pedal_tone"]]
             if preferred:
-                return preferred[0] if len(preferred) == 1 else random.choice(preferred)
+                return preferred[0] if len(preferred) == 1 else rng.choice(preferred)
 
         # Default: random selection from available patterns
-        return random.choice(available_patterns)
+        return rng.choice(available_patterns)
 
     def _select_right_pattern(
         self,
         context: ChordContext,
         config: dict,
-        position: int
+        position: int,
+        rng: random.Random
     ) -> str:
         """Select appropriate right hand pattern based on context.
 
@@ -175,6 +179,7 @@ class ClassicalArranger(BaseArranger):
             context: Chord context
             config: Application configuration
             position: Position in progression
+            rng: Random source for this arrangement
 
         Returns:
             Pattern name
@@ -186,22 +191,23 @@ class ClassicalArranger(BaseArranger):
             # Start with clear melodic statement
             preferred = [p for p in available_patterns if p in ["melody_solo", "melody_with_accompaniment"]]
             if preferred:
-                return random.choice(preferred)
+                return rng.choice(preferred)
 
         elif context.is_phrase_end:
             # End with resolution or cadence
             preferred = [p for p in available_patterns if p in ["melody_solo", "arpeggios_broken"]]
             if preferred:
-                return random.choice(preferred)
+                return rng.choice(preferred)
 
         # Default: random selection
-        return random.choice(available_patterns)
+        return rng.choice(available_patterns)
 
     def _add_improvisation(
         self,
         context: ChordContext,
         position: int,
-        application: str
+        application: str,
+        rng: random.Random
     ) -> List[Note]:
         """Add classical ornamentation and embellishments.
 
@@ -215,6 +221,7 @@ class ClassicalArranger(BaseArranger):
             context: Chord context
             position: Position in progression
             application: Application type (period)
+            rng: Random source for this arrangement
 
         Returns:
             List of ornamentation notes
@@ -222,7 +229,7 @@ class ClassicalArranger(BaseArranger):
         ornament_notes = []
 
         # Add trill at phrase end (cadence)
-        if context.is_phrase_end and random.random() < 0.4:
+        if context.is_phrase_end and rng.random() < 0.4:
             # Simple trill: rapid alternation between two adjacent notes
             root_midi = 72  # C5
 
@@ -253,7 +260,8 @@ class ClassicalArranger(BaseArranger):
         bpm: int,
         application: str,
         time_signature: tuple = (4, 4),
-        complexity: int = 5
+        complexity: int = 5,
+        rng: Optional[random.Random] = None
     ):
         """Override arrange_progression to add classical voice leading.
 
@@ -266,12 +274,13 @@ class ClassicalArranger(BaseArranger):
             application: Period style (baroque, classical, romantic)
             time_signature: Time signature tuple
             complexity: Complexity level (1-10)
+            rng: Random source for this arrangement (None = unseeded)
 
         Returns:
             Arrangement with classical voice leading applied
         """
         # Call base implementation
-        arrangement = super().arrange_progression(chords, key, bpm, application, time_signature, complexity)
+        arrangement = super().arrange_progression(chords, key, bpm, application, time_signature, complexity, rng=rng)
 
         # Apply classical voice leading rules
         config = self.application_configs.get(application, self.application_configs["classical"])
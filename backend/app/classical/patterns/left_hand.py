@@ -17,6 +17,7 @@ Key Classical Concepts:
 
 from typing import List, Tuple
 from app.gospel import Note, ChordContext, HandPattern
+from app.core.arrangers.pattern_templates import PatternTemplateLibrary
 
 # MIDI note mappings
 NOTE_TO_MIDI = {
@@ -353,6 +354,31 @@ CLASSICAL_LEFT_HAND_PATTERNS = {
 }
 
 
+def _build_classical_left_hand_pattern(pattern_name: str, context: ChordContext) -> HandPattern:
+    """Run the named pattern generator for one chord."""
+    if pattern_name not in CLASSICAL_LEFT_HAND_PATTERNS:
+        raise ValueError(
+            f"Unknown classical left hand pattern: {pattern_name}. "
+            f"Available: {list(CLASSICAL_LEFT_HAND_PATTERNS.keys())}"
+        )
+
+    generator = CLASSICAL_LEFT_HAND_PATTERNS[pattern_name]
+    return generator(context)
+
+
+# Every pattern depends only on the chord, so all are compiled per chord quality
+CLASSICAL_LEFT_HAND_TEMPLATES = PatternTemplateLibrary(
+    _build_classical_left_hand_pattern,
+    transposable=[
+        "alberti_bass",
+        "waltz_bass",
+        "broken_chord_classical",
+        "bass_melody_counterpoint",
+        "pedal_tone",
+    ]
+)
+
+
 def generate_classical_left_hand_pattern(pattern_name: str, context: ChordContext) -> HandPattern:
     """Generate a classical left hand pattern by name.
 
@@ -366,17 +392,11 @@ def generate_classical_left_hand_pattern(pattern_name: str, context: ChordContex
     Raises:
         ValueError: If pattern name not found
     """
-    if pattern_name not in CLASSICAL_LEFT_HAND_PATTERNS:
-        raise ValueError(
-            f"Unknown classical left hand pattern: {pattern_name}. "
-            f"Available: {list(CLASSICAL_LEFT_HAND_PATTERNS.keys())}"
-        )
-
-    generator = CLASSICAL_LEFT_HAND_PATTERNS[pattern_name]
-    return generator(context)
+    return CLASSICAL_LEFT_HAND_TEMPLATES.generate(pattern_name, context)
 
 
 __all__ = [
     "generate_classical_left_hand_pattern",
     "CLASSICAL_LEFT_HAND_PATTERNS",
+    "CLASSICAL_LEFT_HAND_TEMPLATES",
 ]
@@ -14,7 +14,9 @@ Key Concepts:
 - Articulation: Staccato, legato, tenuto
 """
 
-from typing import List
+from typing import List, Optional
+import random
+
 from app.gospel import Note
 
 
@@ -83,7 +85,11 @@ def apply_classical_phrasing(notes: List[Note]) -> List[Note]:
     return classical_notes
 
 
-def apply_romantic_rubato(notes: List[Note], intensity: float = 0.15) -> List[Note]:
+def apply_romantic_rubato(
+    notes: List[Note],
+    intensity: float = 0.15,
+    rng: Optional[random.Random] = None
+) -> List[Note]:
     """Apply Romantic rubato (expressive timing).
 
     Rubato: "Stolen time" - slight tempo variations for expression
@@ -92,18 +98,19 @@ def apply_romantic_rubato(notes: List[Note], intensity: float = 0.15) -> List[No
     Args:
         notes: Notes to transform
         intensity: Amount of rubato (0.0-0.3, default 0.15)
+        rng: Random source (None = the global random module)
 
     Returns:
         Notes with rubato timing
     """
-    import random
+    rng = rng or random
 
     rubato_notes = []
 
     for note in notes:
         # Apply random rubato within intensity range
         # Bias towards delaying (romantic style often delays)
-        rubato_offset = random.triangular(-intensity * 0.5, intensity, intensity * 0.3)
+        rubato_offset = rng.triangular(-intensity * 0.5, intensity, intensity * 0.3)
 
         rubato_note = Note(
             pitch=note.pitch,
@@ -286,7 +293,11 @@ def apply_tenuto(notes: List[Note]) -> List[Note]:
     return tenuto_notes
 
 
-def apply_classical_rhythm_pattern(notes: List[Note], pattern_name: str) -> List[Note]:
+def apply_classical_rhythm_pattern(
+    notes: List[Note],
+    pattern_name: str,
+    rng: Optional[random.Random] = None
+) -> List[Note]:
     """Apply Classical rhythm pattern transformation.
 
     Args:
@@ -300,6 +311,7 @@ def apply_classical_rhythm_pattern(notes: List[Note], pattern_name: str) -> List
                      - "staccato": Short, detached
                      - "legato": Smooth, connected
                      - "tenuto": Full-length, emphasized
+        rng: Random source for randomized patterns (None = the global random module)
 
     Returns:
         Transformed notes
@@ -312,7 +324,7 @@ def apply_classical_rhythm_pattern(notes: List[Note], pattern_name: str) -> List
     elif pattern_name == "classical":
         return apply_classical_phrasing(notes)
     elif pattern_name == "romantic_rubato":
-        return apply_romantic_rubato(notes, intensity=0.15)
+        return apply_romantic_rubato(notes, intensity=0.15, rng=rng)
     elif pattern_name == "waltz":
         return apply_waltz_feel(notes)
     elif pattern_name == "agogic":
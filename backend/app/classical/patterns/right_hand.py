@@ -17,6 +17,7 @@ Key Classical Concepts:
 
 from typing import List, Tuple
 from app.gospel import Note, ChordContext, HandPattern
+from app.core.arrangers.pattern_templates import PatternTemplateLibrary
 
 # MIDI note mappings
 NOTE_TO_MIDI = {
@@ -312,6 +313,31 @@ CLASSICAL_RIGHT_HAND_PATTERNS = {
 }
 
 
+def _build_classical_right_hand_pattern(pattern_name: str, context: ChordContext) -> HandPattern:
+    """Run the named pattern generator for one chord."""
+    if pattern_name not in CLASSICAL_RIGHT_HAND_PATTERNS:
+        raise ValueError(
+            f"Unknown classical right hand pattern: {pattern_name}. "
+            f"Available: {list(CLASSICAL_RIGHT_HAND_PATTERNS.keys())}"
+        )
+
+    generator = CLASSICAL_RIGHT_HAND_PATTERNS[pattern_name]
+    return generator(context)
+
+
+# Every pattern depends only on the chord, so all are compiled per chord quality
+CLASSICAL_RIGHT_HAND_TEMPLATES = PatternTemplateLibrary(
+    _build_classical_right_hand_pattern,
+    transposable=[
+        "melody_solo",
+        "melody_with_accompaniment",
+        "scale_runs",
+        "arpeggios_broken",
+        "counterpoint_melody",
+    ]
+)
+
+
 def generate_classical_right_hand_pattern(pattern_name: str, context: ChordContext) -> HandPattern:
     """Generate a classical right hand pattern by name.
 
@@ -325,17 +351,11 @@ def generate_classical_right_hand_pattern(pattern_name: str, context: ChordConte
     Raises:
         ValueError: If pattern name not found
     """
-    if pattern_name not in CLASSICAL_RIGHT_HAND_PATTERNS:
-        raise ValueError(
-            f"Unknown classical right hand pattern: {pattern_name}. "
-            f"Available: {list(CLASSICAL_RIGHT_HAND_PATTERNS.keys())}"
-        )
-
-    generator = CLASSICAL_RIGHT_HAND_PATTERNS[pattern_name]
-    return generator(context)
+    return CLASSICAL_RIGHT_HAND_TEMPLATES.generate(pattern_name, context)
 
 
 __all__ = [
     "generate_classical_right_hand_pattern",
     "CLASSICAL_RIGHT_HAND_PATTERNS",
+    "CLASSICAL_RIGHT_HAND_TEMPLATES",
 ]
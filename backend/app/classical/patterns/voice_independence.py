@@ -14,6 +14,8 @@ Based on classical harmony rules from:
 """
 
 from typing import List, Tuple, Optional
+import random
+
 from app.gospel import Note
 
 
@@ -149,7 +151,8 @@ def check_voice_crossing(left_notes: List[Note], right_notes: List[Note]) -> Lis
 def apply_contrary_motion(
     left_notes: List[Note],
     right_notes: List[Note],
-    probability: float = 0.3
+    probability: float = 0.3,
+    rng: Optional[random.Random] = None
 ) -> Tuple[List[Note], List[Note]]:
     """Encourage contrary motion between hands.
 
@@ -160,13 +163,14 @@ def apply_contrary_motion(
         left_notes: Left hand notes
         right_notes: Right hand notes
         probability: Probability of applying contrary motion adjustment
+        rng: Random source (None = the global random module)
 
     Returns:
         Adjusted (left_notes, right_notes)
     """
-    import random
+    rng = rng or random
 
-    if random.random() > probability:
+    if rng.random() > probability:
         return left_notes, right_notes
 
     # Sort notes by time
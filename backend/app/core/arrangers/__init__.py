@@ -1,5 +1,6 @@
 """Base arrangers for multi-genre piano music generation"""
 
 from app.core.arrangers.base_arranger import BaseArranger
+from app.core.arrangers.pattern_templates import PatternTemplateLibrary
 
-__all__ = ["BaseArranger"]
+__all__ = ["BaseArranger", "PatternTemplateLibrary"]
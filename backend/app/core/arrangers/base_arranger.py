@@ -5,7 +5,7 @@ Genre-specific pattern selection and improvisation are implemented in subclasses
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 import random
 
 from app.gospel import Note, ChordContext, Arrangement
@@ -49,7 +49,8 @@ class BaseArranger(ABC):
         bpm: int,
         application: str,
         time_signature: Tuple[int, int] = (4, 4),
-        complexity: int = 5
+        complexity: int = 5,
+        rng: Optional[random.Random] = None
     ) -> Arrangement:
         """Generate complete two-hand piano arrangement.
 
@@ -63,6 +64,8 @@ class BaseArranger(ABC):
             application: Application variant (genre-specific, e.g., "worship", "ballad")
             time_signature: Time signature tuple (default 4/4)
             complexity: Complexity level (1-10) for note density and pattern selection
+            rng: Random source for every choice in this arrangement; pass
+                random.Random(seed) for a reproducible result (None = unseeded)
 
         Returns:
             Complete Arrangement with left and right hand notes
@@ -77,6 +80,7 @@ class BaseArranger(ABC):
             )
 
         config = self.application_configs[application]
+        rng = rng or random.Random()
 
         # Step 1: Build chord contexts with harmonic metadata
         contexts = self._build_chord_contexts(chords, key, bpm, time_signature)
@@ -92,8 +96,8 @@ class BaseArranger(ABC):
             context.previous_voicing = previous_left_voicing
 
             # Select patterns (genre-specific abstract methods)
-            left_pattern_name = self._select_left_pattern(context, config, i)
-            right_pattern_name = self._select_right_pattern(context, config, i)
+            left_pattern_name = self._select_left_pattern(context, config, i, rng=rng)
+            right_pattern_name = self._select_right_pattern(context, config, i, rng=rng)
 
             # Generate patterns (calls genre-specific pattern generators)
             left_pattern = self._generate_left_pattern(left_pattern_name, context, complexity)
@@ -113,17 +117,17 @@ class BaseArranger(ABC):
             right_hand_notes.extend(right_notes_adjusted)
 
             # Step 3: Add improvisation (genre-specific)
-            if random.random() < config["improvisation_probability"]:
-                improv_notes = self._add_improvisation(context, i, application)
+            if rng.random() < config["improvisation_probability"]:
+                improv_notes = self._add_improvisation(context, i, application, rng=rng)
                 right_hand_notes.extend(improv_notes)
 
         # Step 4: Apply rhythm transformations (genre-specific)
         if config["rhythm"]:
             left_hand_notes = self._apply_rhythm_transformations(
-                left_hand_notes, config["rhythm"]
+                left_hand_notes, config["rhythm"], rng=rng
             )
             right_hand_notes = self._apply_rhythm_transformations(
-                right_hand_notes, config["rhythm"]
+                right_hand_notes, config["rhythm"], rng=rng
             )
 
         # Step 5: Apply velocity normalization (shared)
@@ -250,7 +254,8 @@ class BaseArranger(ABC):
         self,
         context: ChordContext,
         config: dict,
-        position: int
+        position: int,
+        rng: random.Random
     ) -> str:
         """Select appropriate left hand pattern based on context.
 
@@ -260,6 +265,7 @@ class BaseArranger(ABC):
             context: Chord context with harmonic metadata
             config: Application configuration
             position: Position in progression (0-indexed)
+            rng: Random source for this arrangement
 
         Returns:
             Pattern name (string matching genre's pattern library)
@@ -271,7 +277,8 @@ class BaseArranger(ABC):
         self,
         context: ChordContext,
         config: dict,
-        position: int
+        position: int,
+        rng: random.Random
     ) -> str:
         """Select appropriate right hand pattern based on context.
 
@@ -281,6 +288,7 @@ class BaseArranger(ABC):
             context: Chord context with harmonic metadata
             config: Application configuration
             position: Position in progression (0-indexed)
+            rng: Random source for this arrangement
 
         Returns:
             Pattern name (string matching genre's pattern library)
@@ -292,7 +300,8 @@ class BaseArranger(ABC):
         self,
         context: ChordContext,
         position: int,
-        application: str
+        application: str,
+        rng: random.Random
     ) -> List[Note]:
         """Add improvisation elements (fills, runs, turnarounds).
 
@@ -307,6 +316,7 @@ class BaseArranger(ABC):
             context: Chord context
             position: Position in progression
             application: Application type
+            rng: Random source for this arrangement
 
         Returns:
             List of improvisation notes
@@ -346,7 +356,7 @@ class BaseArranger(ABC):
         pass
 
     @abstractmethod
-    def _apply_rhythm_transformations(self, notes: List[Note], rhythm_patterns: List[str]) -> List[Note]:
+    def _apply_rhythm_transformations(self, notes: List[Note], rhythm_patterns: List[str], rng: random.Random) -> List[Note]:
         """Apply rhythm transformations.
 
         Genre-specific - each genre has different rhythm feels.
@@ -359,6 +369,7 @@ class BaseArranger(ABC):
         Args:
             notes: Notes to transform
             rhythm_patterns: List of rhythm pattern names
+            rng: Random source for this arrangement
 
         Returns:
             Transformed notes
@@ -0,0 +1,219 @@
+"""Pattern Templates - Precompiled, transposable hand patterns
+
+Most hand pattern generators only look at the chord symbol: they parse it,
+build chord tones from a root MIDI note plus fixed intervals, and lay out a
+fixed rhythm. Their output for any root is the output for C moved by the
+root's pitch class. A PatternTemplateLibrary compiles each such pattern once
+per chord quality (at a C root) into a NoteArray of key-relative pitches,
+rhythm and velocities, and instantiates a bar by transposing that array.
+
+Patterns that voice-lead with the gospel get_chord_tones() helper depend on
+the previous voicing only through an octave shift (every inversion of a
+chord ties with root position, so find_closest_voicing() keeps root position
+and picks among 0/+12/-12). That choice is made from the template's chord
+tones, and each transposition is materialized once and reused.
+
+Patterns that read next_chord, draw random numbers, or otherwise depend on
+more than the chord are left out of the transposable set and always run
+their generator.
+"""
+
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from app.gospel import ChordContext, HandPattern, Note
+from app.gospel.note_array import NoteArray
+
+
+ROOT_PITCH_CLASSES = {
+    "C": 0, "C#": 1, "Db": 1, "D": 2, "D#": 3, "Eb": 3,
+    "E": 4, "F": 5, "F#": 6, "Gb": 6, "G": 7, "G#": 8,
+    "Ab": 8, "A": 9, "A#": 10, "Bb": 10, "B": 11
+}
+
+# Candidate octave shifts, in find_closest_voicing() order
+VOICE_LEADING_SHIFTS = (0, 12, -12)
+
+NoteRow = Tuple[int, float, float, int, str]
+
+
+@dataclass
+class PatternTemplate:
+    """A hand pattern compiled at a C root.
+
+    Attributes:
+        name: Pattern name reported by the generator
+        notes: Notes of the compiled pattern (pitches for a C root)
+        difficulty: Difficulty reported by the generator
+        tempo_range: Tempo range reported by the generator
+        characteristics: Characteristics reported by the generator
+        chord_tones: Root-position chord tones for C (voice-led patterns only)
+    """
+    name: str
+    notes: NoteArray
+    difficulty: str
+    tempo_range: Tuple[int, int]
+    characteristics: Tuple[str, ...]
+    chord_tones: Optional[Tuple[int, ...]] = None
+    _variants: Dict[int, Tuple[NoteRow, ...]] = field(default_factory=dict, repr=False, compare=False)
+
+    def instantiate(self, root_pc: int, previous_voicing: Optional[List[int]] = None) -> HandPattern:
+        """Build the pattern for a root pitch class.
+
+        Args:
+            root_pc: Pitch class of the chord root (0 = C)
+            previous_voicing: Previous bar's pitches (voice-led patterns only)
+
+        Returns:
+            HandPattern with transposed notes
+        """
+        offset = root_pc
+        if self.chord_tones is not None and previous_voicing:
+            offset += voice_leading_shift([t + root_pc for t in self.chord_tones], previous_voicing)
+
+        return HandPattern(
+            name=self.name,
+            notes=[Note(*row) for row in self.transposed_rows(offset)],
+            difficulty=self.difficulty,
+            tempo_range=self.tempo_range,
+            characteristics=list(self.characteristics)
+        )
+
+    def transposed_rows(self, offset: int) -> Tuple[NoteRow, ...]:
+        """Note fields transposed by offset semitones (one array add per offset)."""
+        rows = self._variants.get(offset)
+        if rows is None:
+            transposed = self.notes.transposed(offset)
+            rows = tuple(
+                (n.pitch, n.time, n.duration, n.velocity, n.hand)
+                for n in transposed.to_notes()
+            )
+            self._variants[offset] = rows
+        return rows
+
+
+def voice_leading_shift(chord_tones: List[int], previous_voicing: List[int]) -> int:
+    """Octave shift find_closest_voicing() would apply to root-position tones.
+
+    Movement is the sum over chord tones of the distance to the nearest
+    previous pitch; the first shift with minimum movement wins.
+
+    Args:
+        chord_tones: Root-position chord tones
+        previous_voicing: Previous voicing pitches
+
+    Returns:
+        0, 12 or -12
+    """
+    best_shift = 0
+    min_movement = float('inf')
+    for shift in VOICE_LEADING_SHIFTS:
+        movement = sum(min(abs(t + shift - p) for p in previous_voicing) for t in chord_tones)
+        if movement < min_movement:
+            min_movement = movement
+            best_shift = shift
+    return best_shift
+
+
+def split_chord_root(chord: str) -> Tuple[str, str]:
+    """Split a chord symbol into root and suffix, the way the pattern parsers do.
+
+    Examples:
+        >>> split_chord_root("Bbmaj7")
+        ("Bb", "maj7")
+    """
+    if len(chord) > 1 and chord[1] in ('b', '#'):
+        return chord[:2], chord[2:]
+    return chord[:1], chord[1:]
+
+
+class PatternTemplateLibrary:
+    """Compiled templates for one hand's pattern generator.
+
+    Args:
+        build: Pattern generator, called as build(pattern_name, context, **kwargs)
+        transposable: Names of patterns whose output depends only on the chord
+        voicing_tones: For voice-led patterns, returns the root-position chord
+            tones the generator voice-leads from (e.g. get_chord_tones at the
+            pattern's octave). None if the patterns ignore previous_voicing.
+        maxsize: Maximum number of compiled templates kept
+    """
+
+    def __init__(
+        self,
+        build: Callable[..., HandPattern],
+        transposable: Iterable[str],
+        voicing_tones: Optional[Callable[[str], List[int]]] = None,
+        maxsize: int = 1024
+    ):
+        self.build = build
+        self.transposable = frozenset(transposable)
+        self.voicing_tones = voicing_tones
+        self._compile = lru_cache(maxsize=maxsize)(self._compile_template)
+
+    def generate(self, pattern_name: str, context: ChordContext, **kwargs: Any) -> HandPattern:
+        """Generate a pattern, from its compiled template when possible.
+
+        Args:
+            pattern_name: Name of pattern to generate
+            context: Chord context for pattern generation
+            **kwargs: Extra generator arguments (part of the template key)
+
+        Returns:
+            Generated HandPattern
+        """
+        root, suffix = split_chord_root(context.chord)
+        if (
+            pattern_name not in self.transposable
+            or root not in ROOT_PITCH_CLASSES
+            or suffix[:1] in ('b', '#')
+            or '/' in suffix
+        ):
+            return self.build(pattern_name, context, **kwargs)
+
+        template = self._compile(pattern_name, suffix, tuple(sorted(kwargs.items())))
+        return template.instantiate(ROOT_PITCH_CLASSES[root], context.previous_voicing)
+
+    def template(self, pattern_name: str, suffix: str, **kwargs: Any) -> PatternTemplate:
+        """Compiled template for a pattern and chord suffix (e.g. "maj7")."""
+        return self._compile(pattern_name, suffix, tuple(sorted(kwargs.items())))
+
+    def cache_info(self):
+        """Hit/miss statistics of the template cache."""
+        return self._compile.cache_info()
+
+    def clear(self) -> None:
+        """Drop all compiled templates."""
+        self._compile.cache_clear()
+
+    def _compile_template(
+        self,
+        pattern_name: str,
+        suffix: str,
+        kwargs: Tuple[Tuple[str, Any], ...]
+    ) -> PatternTemplate:
+        chord = f"C{suffix}"
+        context = ChordContext(chord=chord, key="C", position=0, tempo=120)
+        pattern = self.build(pattern_name, context, **dict(kwargs))
+
+        chord_tones = None
+        if self.voicing_tones is not None:
+            chord_tones = tuple(self.voicing_tones(chord))
+
+        return PatternTemplate(
+            name=pattern.name,
+            notes=NoteArray.from_notes(pattern.notes),
+            difficulty=pattern.difficulty,
+            tempo_range=tuple(pattern.tempo_range),
+            characteristics=tuple(pattern.characteristics),
+            chord_tones=chord_tones
+        )
+
+
+__all__ = [
+    "PatternTemplate",
+    "PatternTemplateLibrary",
+    "split_chord_root",
+    "voice_leading_shift",
+]
@@ -14,8 +14,8 @@ logger = logging.getLogger(__name__)
 # Create Celery app
 celery_app = Celery(
     "gospel_keys",
-    broker=settings.CELERY_BROKER_URL,
-    backend=settings.CELERY_RESULT_BACKEND,
+    broker=settings.celery_broker_url,
+    backend=settings.celery_result_backend,
     include=[
         "app.tasks.audio_generation",
         "app.tasks.curriculum_adaptation",
@@ -48,6 +48,16 @@ celery_app.conf.beat_schedule = {
         "task": "app.tasks.audio_generation.cleanup_failed_audio_tasks",
         "schedule": crontab(hour=3, minute=0),
     },
+    # Daily repair of denormalized curriculum completion counters (every day at 4:00 AM)
+    "daily-completion-counter-repair": {
+        "task": "app.tasks.curriculum_adaptation.recompute_completion_counters_task",
+        "schedule": crontab(hour=4, minute=0),
+    },
+    # Rebuild stale exercise recommendation snapshots (every 15 minutes)
+    "recommendation-snapshot-refresh": {
+        "task": "app.tasks.curriculum_adaptation.refresh_recommendation_snapshots_task",
+        "schedule": crontab(minute="*/15"),
+    },
 }
 
 logger.info("Celery app configured successfully")
@@ -1,7 +1,7 @@
 """Core configuration for Gospel Keys API"""
 
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -50,6 +50,13 @@ class Settings(BaseSettings):
     google_api_key: Optional[str] = None
     anthropic_api_key: Optional[str] = None
 
+    # Database
+    database_url: Optional[str] = None  # Default: sqlite+aiosqlite:///<BASE_DIR>/piano_keys.db
+    database_pool_size: int = 5  # Non-SQLite backends only
+    database_max_overflow: int = 10  # Non-SQLite backends only
+    sqlite_busy_timeout_ms: int = 5000  # Wait this long for a competing writer
+    sqlite_mmap_size: int = 268435456  # 256 MB memory-mapped reads
+
     # Celery & Redis Config
     celery_broker_url: str = "redis://localhost:6379/0"
     celery_result_backend: str = "redis://localhost:6379/0"
@@ -57,6 +64,39 @@ class Settings(BaseSettings):
 
     # Background job settings
     audio_generation_timeout: int = 300  # 5 minutes per exercise
+    audio_generation_batch_size: int = 25  # Exercises rendered per batch task
+    audio_generation_rate_limit: str = "10/m"  # Batch tasks started per worker (Celery token bucket)
+    audio_generation_defer_seconds: int = 30  # Retry delay for content another worker is rendering
+
+    # Seeded arrangement result cache (rendered MIDI)
+    arrangement_cache_size: int = 256  # In-memory entries
+    arrangement_cache_disk_entries: int = 2048  # Files kept under outputs/arrangement_cache
+
+    # AI response cache (orchestrator prompts + generator progressions)
+    ai_cache_max_entries: int = 1024  # In-memory LRU entries per process
+    ai_cache_backend: str = "memory"  # "memory", "sqlite" (workers on one host) or "redis" (redis_url)
+    ai_cache_sqlite_path: Optional[Path] = None  # Default: outputs/ai_cache.sqlite3
+
+    # Job progress events (SSE / WebSocket streams)
+    job_events_backend: str = "memory"  # "memory" (one API process) or "redis" (redis_url, every API worker)
+    job_events_queue_size: int = 100  # Buffered events per subscriber; oldest dropped when full
+    job_events_heartbeat_seconds: float = 15.0  # Keep-alive interval for idle streams
+
+    # Curriculum
+    daily_practice_cache_seconds: int = 30  # Per-user practice queue cache (0 = off)
+    curriculum_clone_share_content: bool = False  # Cloned exercises reference the template's content_json instead of copying it
+    curriculum_adaptation_chunk_size: int = 500  # Curricula per weekly adaptation subtask
+
+    # Exercise recommendation snapshots
+    recommendation_snapshot_ttl_seconds: int = 3600  # Snapshots older than this are rebuilt in the background
+    recommendation_pool_size: int = 50  # Candidates stored per pool (review, weak, new, variety)
+    recommendation_refresh_batch_size: int = 200  # Stale snapshots rebuilt per refresh task run
+
+    # Batch arrangement generation
+    batch_max_workers: int = 4  # Worker processes for arrangement + MIDI encoding
+    batch_max_concurrency: int = 16  # Items in progress per batch
+    batch_llm_requests_per_minute: int = 60  # Progression LLM calls per minute
+    batch_llm_max_concurrency: int = 4  # Progression LLM calls in flight
 
     # Local LLM Config (MLX on M4 Pro with 24GB RAM)
     # SAFE for 24GB RAM: Qwen2.5-7B (complexity 1-7)
@@ -64,6 +104,17 @@ class Settings(BaseSettings):
     local_llm_model: str = "mlx-community/Qwen2.5-7B-Instruct-4bit"
     force_local_llm: bool = True  # Force MLX-only mode - no cloud API calls
 
+    # Model residency (all locally loaded models share one budget)
+    model_memory_budget_gb: float = 20.0  # Declared model sizes allowed resident at once
+    model_idle_timeout_seconds: float = 900.0  # Unload models unused this long (0 = never)
+    model_preload: List[str] = []  # Registry keys loaded at startup, e.g. ["llm:mlx-community/Phi-3.5-mini-instruct-4bit"]
+
+    # Local LLM inference worker (keeps MLX calls off the event loop)
+    local_llm_max_batch_size: int = 4  # Queued same-tier requests dispatched together
+    local_llm_batch_window_ms: int = 10  # Wait for more same-tier requests before dispatching
+    local_llm_max_queue_size: int = 256  # Outstanding requests before new ones are rejected
+    local_llm_request_timeout: float = 120.0  # Seconds a request may wait + run
+
     model_config = SettingsConfigDict(
         env_file=".env",
         env_file_encoding="utf-8",
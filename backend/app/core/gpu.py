@@ -9,7 +9,10 @@ from dataclasses import dataclass
 from functools import lru_cache
 from typing import Literal, Optional
 
-import torch
+from app.core.lazy import lazy_import
+
+# Imported on first device query, not at startup
+torch = lazy_import("torch")
 
 logger = logging.getLogger(__name__)
 
@@ -27,7 +30,7 @@ class GPUInfo:
 
 
 @lru_cache(maxsize=1)
-def get_device() -> torch.device:
+def get_device() -> "torch.device":
     """
     Auto-detect and return the best available device.
     
@@ -99,7 +102,7 @@ def get_device_info() -> GPUInfo:
     )
 
 
-def warmup_device(device: Optional[torch.device] = None) -> None:
+def warmup_device(device: Optional["torch.device"] = None) -> None:
     """
     Warm up the GPU to reduce first-inference latency.
     
@@ -135,7 +138,7 @@ def warmup_device(device: Optional[torch.device] = None) -> None:
         logger.warning(f"Device warmup failed: {e}")
 
 
-def to_device(tensor: torch.Tensor, device: Optional[torch.device] = None) -> torch.Tensor:
+def to_device(tensor: "torch.Tensor", device: Optional["torch.device"] = None) -> "torch.Tensor":
     """
     Move tensor to the specified or default device.
     
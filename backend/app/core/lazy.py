@@ -0,0 +1,154 @@
+"""
+Deferred construction of service singletons and heavy imports.
+
+Route modules import their services at startup, so a service built at
+module level (opening clients, loading models, probing subprocesses) or a
+module that imports torch/librosa/music21 slows every worker start. Both
+are deferred until first use:
+
+    rag_service = lazy_service("rag", RagService)      # built on first attribute access
+    librosa = lazy_import("librosa")                   # imported on first attribute access
+
+    if module_available("essentia"):                    # no import needed to check
+        ...
+
+service_registry records which services have been built and how long each took.
+"""
+
+import importlib
+import importlib.util
+import threading
+import time
+from types import ModuleType
+from typing import Any, Callable, Dict, Generic, List, TypeVar
+
+T = TypeVar("T")
+
+
+class LazyService(Generic[T]):
+    """
+    Stand-in for a module-level singleton, built on first attribute access.
+
+    Construction runs once (thread-safe); afterwards attribute access goes
+    straight to the instance. Use resolve() where the real object is needed
+    (e.g. isinstance checks).
+    """
+
+    def __init__(self, name: str, factory: Callable[[], T]):
+        object.__setattr__(self, "_name", name)
+        object.__setattr__(self, "_factory", factory)
+        object.__setattr__(self, "_instance", None)
+        object.__setattr__(self, "_lock", threading.Lock())
+        object.__setattr__(self, "_build_seconds", None)
+
+    @property
+    def created(self) -> bool:
+        return self._instance is not None
+
+    def resolve(self) -> T:
+        instance = self._instance
+        if instance is not None:
+            return instance
+        with self._lock:
+            if self._instance is None:
+                started = time.perf_counter()
+                object.__setattr__(self, "_instance", self._factory())
+                object.__setattr__(self, "_build_seconds", time.perf_counter() - started)
+            return self._instance
+
+    def reset(self) -> None:
+        """Drop the instance; the next access builds a new one."""
+        with self._lock:
+            object.__setattr__(self, "_instance", None)
+
+    def __getattr__(self, attr: str) -> Any:
+        return getattr(self.resolve(), attr)
+
+    def __setattr__(self, attr: str, value: Any) -> None:
+        setattr(self.resolve(), attr, value)
+
+    def __delattr__(self, attr: str) -> None:
+        delattr(self.resolve(), attr)
+
+    def __repr__(self) -> str:
+        state = repr(self._instance) if self.created else "not built"
+        return f"<LazyService {self._name}: {state}>"
+
+
+class ServiceRegistry:
+    """Named lazy services, for diagnostics and tests."""
+
+    def __init__(self):
+        self._services: Dict[str, LazyService] = {}
+
+    def register(self, name: str, factory: Callable[[], T]) -> LazyService[T]:
+        service = LazyService(name, factory)
+        self._services[name] = service
+        return service
+
+    def get(self, name: str) -> Any:
+        """The built service (building it if needed)."""
+        return self._services[name].resolve()
+
+    def created(self) -> List[str]:
+        return [name for name, service in self._services.items() if service.created]
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            name: {
+                "created": service.created,
+                "build_seconds": (
+                    round(service._build_seconds, 3) if service._build_seconds is not None else None
+                ),
+            }
+            for name, service in self._services.items()
+        }
+
+
+service_registry = ServiceRegistry()
+
+
+def lazy_service(name: str, factory: Callable[[], T]) -> LazyService[T]:
+    """Register a singleton built by factory on first use."""
+    return service_registry.register(name, factory)
+
+
+class _LazyModule(ModuleType):
+    """Module stand-in that imports the real module on first attribute access."""
+
+    def __init__(self, name: str):
+        super().__init__(name)
+        object.__setattr__(self, "_lazy_lock", threading.Lock())
+        object.__setattr__(self, "_lazy_module", None)
+
+    def _load(self) -> ModuleType:
+        module = object.__getattribute__(self, "_lazy_module")
+        if module is None:
+            with object.__getattribute__(self, "_lazy_lock"):
+                module = object.__getattribute__(self, "_lazy_module")
+                if module is None:
+                    module = importlib.import_module(self.__name__)
+                    object.__setattr__(self, "_lazy_module", module)
+        return module
+
+    def __getattr__(self, attr: str) -> Any:
+        return getattr(self._load(), attr)
+
+    def __setattr__(self, attr: str, value: Any) -> None:
+        setattr(self._load(), attr, value)
+
+    def __delattr__(self, attr: str) -> None:
+        delattr(self._load(), attr)
+
+
+def lazy_import(name: str) -> ModuleType:
+    """Module proxy for name, imported on first attribute access."""
+    return _LazyModule(name)
+
+
+def module_available(name: str) -> bool:
+    """Whether name can be imported, without importing it."""
+    try:
+        return importlib.util.find_spec(name) is not None
+    except (ImportError, ValueError):
+        return False
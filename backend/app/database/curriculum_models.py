@@ -8,7 +8,7 @@ import uuid
 from datetime import datetime
 from typing import List, Optional, TYPE_CHECKING
 
-from sqlalchemy import String, Float, Integer, Boolean, Text, DateTime, ForeignKey
+from sqlalchemy import String, Float, Integer, Boolean, Text, DateTime, ForeignKey, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database.models import Base
@@ -114,6 +114,9 @@ class CurriculumModule(Base):
     
     # Completion tracking
     completion_percentage: Mapped[float] = mapped_column(Float, default=0.0)
+    # Denormalized counters, kept in step by CurriculumService (see recompute_completion_counters)
+    lessons_total: Mapped[int] = mapped_column(Integer, default=0)
+    lessons_completed: Mapped[int] = mapped_column(Integer, default=0)
     
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
     
@@ -151,6 +154,9 @@ class CurriculumLesson(Base):
     # Completion tracking
     is_completed: Mapped[bool] = mapped_column(Boolean, default=False)
     completed_at: Mapped[Optional[datetime]] = mapped_column(DateTime)
+    # Denormalized counters, kept in step by CurriculumService (see recompute_completion_counters)
+    exercises_total: Mapped[int] = mapped_column(Integer, default=0)
+    exercises_mastered: Mapped[int] = mapped_column(Integer, default=0)
 
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
     
@@ -166,6 +172,10 @@ class CurriculumLesson(Base):
 class CurriculumExercise(Base):
     """Daily practice item within a lesson"""
     __tablename__ = "curriculum_exercises"
+    __table_args__ = (
+        # Backs the daily practice queue (unmastered exercises by due date)
+        Index("ix_curriculum_exercises_practice_queue", "lesson_id", "is_mastered", "next_review_at"),
+    )
     
     id: Mapped[str] = mapped_column(String(36), primary_key=True, default=generate_uuid)
     lesson_id: Mapped[str] = mapped_column(ForeignKey("curriculum_lessons.id", ondelete="CASCADE"), index=True)
@@ -183,6 +193,12 @@ class CurriculumExercise(Base):
     # scale: {"scale": "major", "key": "C", "octaves": 2}
     # voicing: {"chord": "Cmaj7", "voicing_type": "drop2", "notes": ["E", "G", "B", "C"]}
     content_json: Mapped[str] = mapped_column(Text, default="{}")
+    # Clones of template exercises may share the template's content instead of copying it;
+    # when set, content comes from that exercise (read effective_content_json)
+    # RESTRICT: CurriculumService.delete_curriculum copies the content into clones first
+    content_source_id: Mapped[Optional[str]] = mapped_column(
+        ForeignKey("curriculum_exercises.id", ondelete="RESTRICT")
+    )
     
     # Difficulty: beginner, intermediate, advanced, expert
     difficulty: Mapped[str] = mapped_column(String(20), default="beginner")
@@ -217,6 +233,17 @@ class CurriculumExercise(Base):
 
     # Relationships
     lesson: Mapped["CurriculumLesson"] = relationship(back_populates="exercises")
+    content_source: Mapped[Optional["CurriculumExercise"]] = relationship(
+        remote_side="CurriculumExercise.id",
+        lazy="selectin"
+    )
+
+    @property
+    def effective_content_json(self) -> str:
+        """Exercise content JSON, following content_source for shared clones."""
+        if self.content_source is not None:
+            return self.content_source.content_json
+        return self.content_json
 
 
 class Assessment(Base):
@@ -0,0 +1,70 @@
+"""Database engine factory
+
+One place to build async engines for the API process, Celery workers and
+scripts, so they share the same URL and connection settings:
+
+- SQLite: WAL journal, busy_timeout, synchronous=NORMAL and mmap applied on
+  every new connection, so API and worker writers wait for each other
+  instead of failing with "database is locked".
+- Other backends (e.g. postgresql+asyncpg://...): a sized, pre-pinged pool.
+
+Set DATABASE_URL to switch backends; the default is the local SQLite file.
+"""
+
+from typing import Any, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+
+from app.core.config import settings
+
+
+def get_database_url() -> str:
+    """Configured database URL (settings.database_url or the local SQLite file)"""
+    return settings.database_url or f"sqlite+aiosqlite:///{settings.BASE_DIR}/piano_keys.db"
+
+
+def create_engine(url: Optional[str] = None, **kwargs: Any) -> AsyncEngine:
+    """
+    Build an async engine with the project's connection settings.
+
+    Args:
+        url: Database URL (default: get_database_url())
+        **kwargs: Extra create_async_engine arguments (override the defaults)
+
+    Returns:
+        AsyncEngine
+    """
+    url = url or get_database_url()
+    options: dict = {"echo": False}
+
+    if make_url(url).get_backend_name() != "sqlite":
+        options.update(
+            pool_size=settings.database_pool_size,
+            max_overflow=settings.database_max_overflow,
+            pool_pre_ping=True,
+        )
+    options.update(kwargs)
+
+    engine = create_async_engine(url, **options)
+    if engine.dialect.name == "sqlite":
+        event.listen(engine.sync_engine, "connect", _apply_sqlite_pragmas)
+    return engine
+
+
+def create_sessionmaker(engine: AsyncEngine) -> async_sessionmaker:
+    """Session factory used throughout the app (objects stay usable after commit)"""
+    return async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+
+def _apply_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+    cursor = dbapi_connection.cursor()
+    try:
+        # WAL lets readers proceed during a write (in-memory databases ignore it)
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute(f"PRAGMA busy_timeout={int(settings.sqlite_busy_timeout_ms)}")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute(f"PRAGMA mmap_size={int(settings.sqlite_mmap_size)}")
+    finally:
+        cursor.close()
@@ -6,12 +6,15 @@ Defines all database tables using SQLAlchemy 2.0 declarative style with async su
 import uuid
 from datetime import datetime
 from decimal import Decimal
-from typing import List, Optional
+from typing import List, Optional, TYPE_CHECKING
 
-from sqlalchemy import String, Float, Integer, Boolean, Text, DateTime, ForeignKey, Enum as SQLEnum, Numeric
+from sqlalchemy import String, Float, Integer, Boolean, Text, DateTime, ForeignKey, Index, Enum as SQLEnum, Numeric
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 from sqlalchemy.ext.asyncio import AsyncAttrs
 
+if TYPE_CHECKING:
+    from app.database.curriculum_models import Curriculum, UserSkillProfile
+
 
 class Base(AsyncAttrs, DeclarativeBase):
     """Base class for all database models"""
@@ -35,10 +38,9 @@ class User(Base):
     collections: Mapped[List["Collection"]] = relationship(back_populates="user", cascade="all, delete-orphan")
     practice_sessions: Mapped[List["PracticeSession"]] = relationship(back_populates="user", cascade="all, delete-orphan")
     
-    # Curriculum relationships
-    # TODO: Uncomment when UserSkillProfile and Curriculum models are created
-    # skill_profile: Mapped["UserSkillProfile"] = relationship(back_populates="user", uselist=False, cascade="all, delete-orphan")
-    # curricula: Mapped[List["Curriculum"]] = relationship(back_populates="user", cascade="all, delete-orphan")
+    # Curriculum relationships (models live in app.database.curriculum_models)
+    skill_profile: Mapped["UserSkillProfile"] = relationship(back_populates="user", uselist=False, cascade="all, delete-orphan")
+    curricula: Mapped[List["Curriculum"]] = relationship(back_populates="user", cascade="all, delete-orphan")
 
     # Exercise progress relationships
     exercise_progress: Mapped[List["UserExerciseProgress"]] = relationship(cascade="all, delete-orphan")
@@ -264,6 +266,34 @@ class ChordVoicing(Base):
     song_chord: Mapped["SongChord"] = relationship(back_populates="voicing_analysis")
 
 
+class SongHarmonicNgram(Base):
+    """
+    Inverted index entry: one transposition-invariant chord n-gram occurrence.
+    Built from SongChord rows by app.pipeline.harmonic_index.
+    """
+    __tablename__ = "song_harmonic_ngrams"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    ngram: Mapped[str] = mapped_column(String, nullable=False, index=True)  # e.g. "m|5:7|5:M" (ii-V-I)
+    song_id: Mapped[str] = mapped_column(ForeignKey("songs.id", ondelete="CASCADE"), index=True)
+    size: Mapped[int] = mapped_column(Integer, nullable=False)
+    position: Mapped[int] = mapped_column(Integer, nullable=False)  # Token index (repeated chords merged)
+    start_index: Mapped[int] = mapped_column(Integer, nullable=False)  # SongChord index (ordered by time)
+    end_index: Mapped[int] = mapped_column(Integer, nullable=False)
+    start_time: Mapped[float] = mapped_column(Float, nullable=False)
+    end_time: Mapped[float] = mapped_column(Float, nullable=False)
+
+
+class SongHarmonicSignature(Base):
+    """MinHash signature of a song's chord n-gram set, used for similarity search"""
+    __tablename__ = "song_harmonic_signatures"
+
+    song_id: Mapped[str] = mapped_column(ForeignKey("songs.id", ondelete="CASCADE"), primary_key=True)
+    signature_json: Mapped[str] = mapped_column(Text, nullable=False)  # JSON list of ints
+    token_count: Mapped[int] = mapped_column(Integer, default=0)
+    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+
 class Annotation(Base):
     """User annotation on a song at a specific timestamp"""
     __tablename__ = "annotations"
@@ -627,6 +657,10 @@ class UserExerciseProgress(Base):
     Implements spaced repetition (SM-2 algorithm) and performance metrics
     """
     __tablename__ = "user_exercise_progress"
+    __table_args__ = (
+        # Backs the due queue and review stats (per user, by next review date)
+        Index("ix_user_exercise_progress_user_next_review", "user_id", "next_review"),
+    )
 
     user_id: Mapped[int] = mapped_column(
         ForeignKey("users.id", ondelete="CASCADE"),
@@ -666,3 +700,21 @@ class UserExerciseProgress(Base):
     # Relationships
     user: Mapped["User"] = relationship()
     exercise: Mapped["ExerciseLibrary"] = relationship(back_populates="user_progress")
+
+
+class UserRecommendationSnapshot(Base):
+    """
+    Precomputed exercise recommendation candidate pools for one user.
+    Marked stale when the user's progress changes and rebuilt on the next
+    read or by the periodic refresh task.
+    """
+    __tablename__ = "user_recommendation_snapshots"
+
+    user_id: Mapped[int] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    pools_json: Mapped[str] = mapped_column(Text, nullable=False)  # JSON {pool: [scored candidates]}
+    is_stale: Mapped[bool] = mapped_column(Boolean, default=False, index=True)
+    refreshed_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+
+
+# Register curriculum models so the string relationships above always resolve
+from app.database import curriculum_models  # noqa: E402,F401
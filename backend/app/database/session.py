@@ -3,25 +3,16 @@
 Provides async SQLAlchemy session factory and database dependency injection.
 """
 
-from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
-from app.core.config import settings
+from app.database.engine import create_engine, create_sessionmaker, get_database_url
 
-# Database URL for SQLite with async driver
-DATABASE_URL = f"sqlite+aiosqlite:///{settings.BASE_DIR}/piano_keys.db"
+# Database URL (settings.database_url, default: local SQLite file)
+DATABASE_URL = get_database_url()
 
-# Create async engine
-engine = create_async_engine(
-    DATABASE_URL,
-    echo=False,  # Set to True for SQL query logging
-    future=True,
-)
+# Create async engine (SQLite pragmas / pool settings applied by the factory)
+engine = create_engine(DATABASE_URL)
 
 # Create async session factory
-async_session_maker = async_sessionmaker(
-    engine,
-    class_=AsyncSession,
-    expire_on_commit=False,
-)
+async_session_maker = create_sessionmaker(engine)
 
 
 async def get_db():
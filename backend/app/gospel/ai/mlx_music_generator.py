@@ -19,17 +19,20 @@ import mlx.core as mx
 import mlx.nn as nn
 from mlx_lm import load, generate
 from miditok import REMI
+from functools import partial
 from pathlib import Path
 from typing import Optional
 import json
 
 # Memory safety check
 try:
-    from ...utils.memory_check import get_recommended_model, is_model_safe, get_system_memory
+    from ...utils.memory_check import get_recommended_model, is_model_safe, get_system_memory, estimate_model_ram
     MEMORY_CHECK_AVAILABLE = True
 except ImportError:
     MEMORY_CHECK_AVAILABLE = False
 
+from ...services.model_registry import model_registry
+
 try:
     from ...services.humanizer import ArrangementHumanizer
 except ImportError:
@@ -104,9 +107,14 @@ Word, MIDILike)
         # Initialize MIDI tokenizer
         self.midi_tokenizer = self._init_midi_tokenizer(tokenizer_type)
 
-        # Load MLX language model
+        # Load MLX language model through the shared registry (same key as
+        # MultiModelLLMService, so identical weights are loaded once)
         print(f"🔄 Loading model: {model_path} (this may take a while on first run)...")
-        self.model, self.llm_tokenizer = load(model_path)
+        self.registry_key = f"llm:{model_path}"
+        if not model_registry.is_registered(self.registry_key):
+            size_gb = estimate_model_ram(model_path)[0] if MEMORY_CHECK_AVAILABLE else 12.0
+            model_registry.register(self.registry_key, partial(load, model_path), size_gb=size_gb)
+        model_registry.load(self.registry_key)
 
         # If gospel checkpoint exists, load fine-tuned weights
         if checkpoint_dir and checkpoint_dir.exists():
@@ -172,16 +180,17 @@ Word, MIDILike)
 
         print(f"🤖 Generating piano arrangement with {self.model_path.split('/')[-1]}...")
         
-        # Generate text using MLX
-        generated_text = generate(
-            self.model,
-            self.llm_tokenizer,
-            prompt=prompt,
-            max_tokens=4096,  # Allow enough space for JSON
-            temp=creativity,
-            top_p=0.95,
-            repetition_penalty=1.05
-        )
+        # Generate text using MLX (pinned so the registry cannot evict it mid-run)
+        with model_registry.use(self.registry_key) as (model, llm_tokenizer):
+            generated_text = generate(
+                model,
+                llm_tokenizer,
+                prompt=prompt,
+                max_tokens=4096,  # Allow enough space for JSON
+                temp=creativity,
+                top_p=0.95,
+                repetition_penalty=1.05
+            )
 
         try:
             # Parse JSON from generated text
@@ -327,53 +336,7 @@ Generate the JSON array for the entire {num_bars} bars:
         if not self.humanizer:
             return arrangement
         
-        # Convert arrangement notes to humanizer format
-        all_notes = []
-        for note in arrangement.left_hand_notes:
-            all_notes.append({
-                "pitch": note.pitch,
-                "time": note.time,
-                "duration": note.duration,
-                "velocity": note.velocity,
-                "hand": "left"
-            })
-        for note in arrangement.right_hand_notes:
-            all_notes.append({
-                "pitch": note.pitch,
-                "time": note.time,
-                "duration": note.duration,
-                "velocity": note.velocity,
-                "hand": "right"
-            })
-        
-        # Apply humanization
-        humanized_notes = self.humanizer.humanize(all_notes, intensity)
-        
-        # Separate back into hands
-        left_hand = []
-        right_hand = []
-        for n in humanized_notes:
-            note = Note(
-                pitch=n["pitch"],
-                time=n["time"],
-                duration=n["duration"],
-                velocity=n["velocity"],
-                hand=n.get("hand", "right")
-            )
-            if n.get("hand") == "left":
-                left_hand.append(note)
-            else:
-                right_hand.append(note)
-        
-        return Arrangement(
-            left_hand_notes=left_hand,
-            right_hand_notes=right_hand,
-            tempo=arrangement.tempo,
-            time_signature=arrangement.time_signature,
-            key=arrangement.key,
-            total_bars=arrangement.total_bars,
-            application=arrangement.application
-        )
+        return self.humanizer.humanize_arrangement(arrangement, intensity)
 
     # Legacy methods removed/simplified
     def _chords_to_primer_tokens(self, *args): return []
@@ -94,26 +94,28 @@ class GospelArranger(BaseArranger):
         """
         return generate_right_hand_pattern(pattern_name, context)
 
-    def _apply_rhythm_transformations(self, notes: List[Note], rhythm_patterns: List[str]) -> List[Note]:
+    def _apply_rhythm_transformations(self, notes: List[Note], rhythm_patterns: List[str], rng: random.Random) -> List[Note]:
         """Apply gospel rhythm transformations.
 
         Args:
             notes: Notes to transform
             rhythm_patterns: List of gospel rhythm pattern names
+            rng: Random source for this arrangement
 
         Returns:
             Transformed notes with gospel rhythm feel
         """
         transformed = notes
         for rhythm_pattern in rhythm_patterns:
-            transformed = apply_rhythm_pattern(transformed, rhythm_pattern)
+            transformed = apply_rhythm_pattern(transformed, rhythm_pattern, rng=rng)
         return transformed
 
     def _select_left_pattern(
         self,
         context: ChordContext,
         config: dict,
-        position: int
+        position: int,
+        rng: random.Random
     ) -> str:
         """Select appropriate left hand pattern based on context.
 
@@ -121,6 +123,7 @@ class GospelArranger(BaseArranger):
             context: Chord context
             config: Application configuration
             position: Position in progression
+            rng: Random source for this arrangement
 
         Returns:
             Pattern name
@@ -132,22 +135,23 @@ class GospelArranger(BaseArranger):
             # Start phrases with strong patterns (stride, walking)
             preferred = [p for p in available_patterns if p in ["stride_bass", "walking_bass"]]
             if preferred:
-                return random.choice(preferred)
+                return rng.choice(preferred)
 
         elif context.is_phrase_end:
             # End phrases with resolution (shell voicing for sustain)
             preferred = [p for p in available_patterns if p in ["shell_voicing", "alberti_bass"]]
             if preferred:
-                return random.choice(preferred)
+                return rng.choice(preferred)
 
         # Default: random selection from available patterns
-        return random.choice(available_patterns)
+        return rng.choice(available_patterns)
 
     def _select_right_pattern(
         self,
         context: ChordContext,
         config: dict,
-        position: int
+        position: int,
+        rng: random.Random
     ) -> str:
         """Select appropriate right hand pattern based on context.
 
@@ -155,6 +159,7 @@ class GospelArranger(BaseArranger):
             context: Chord context
             config: Application configuration
             position: Position in progression
+            rng: Random source for this arrangement
 
         Returns:
             Pattern name
@@ -166,22 +171,23 @@ class GospelArranger(BaseArranger):
             # Start with strong voicings
             preferred = [p for p in available_patterns if p in ["block_chord", "polychord"]]
             if preferred:
-                return random.choice(preferred)
+                return rng.choice(preferred)
 
         elif context.is_phrase_end:
             # End with fills or arpeggios
             preferred = [p for p in available_patterns if p in ["chord_fills", "arpeggiated_voicing"]]
             if preferred:
-                return random.choice(preferred)
+                return rng.choice(preferred)
 
         # Default: random selection
-        return random.choice(available_patterns)
+        return rng.choice(available_patterns)
 
     def _add_improvisation(
         self,
         context: ChordContext,
         position: int,
-        application: str
+        application: str,
+        rng: random.Random
     ) -> List[Note]:
         """Add improvisation elements (fills, runs, turnarounds).
 
@@ -189,6 +195,7 @@ class GospelArranger(BaseArranger):
             context: Chord context
             position: Position in progression
             application: Application type
+            rng: Random source for this arrangement
 
         Returns:
             List of improvisation notes
@@ -206,8 +213,8 @@ class GospelArranger(BaseArranger):
             improv_notes.extend(turnaround)
 
         # Add fills between chord changes
-        elif context.next_chord and random.random() < 0.3:
-            fill_type = random.choice(["ascending", "chromatic", "pentatonic"])
+        elif context.next_chord and rng.random() < 0.3:
+            fill_type = rng.choice(["ascending", "chromatic", "pentatonic"])
             fill = generate_gospel_fill(
                 context,
                 fill_type=fill_type,
@@ -19,7 +19,6 @@ import random
 
 from ..import Note, ChordContext, Arrangement
 from .arranger import GospelArranger
-from ..ai.mlx_music_generator import MLXGospelGenerator
 
 
 class HybridGospelArranger(GospelArranger):
@@ -57,6 +56,9 @@ class HybridGospelArranger(GospelArranger):
         self.mlx_generator = None
         if ai_percentage > 0:
             try:
+                # Deferred: importing the MLX generator loads mlx/mlx_lm/miditok
+                from ..ai.mlx_music_generator import MLXGospelGenerator
+
                 print(f"🎹 Initializing MLX Gospel Generator (AI: {ai_percentage * 100}%)")
                 self.mlx_generator = MLXGospelGenerator(
                     checkpoint_dir=mlx_checkpoint
@@ -76,7 +78,8 @@ class HybridGospelArranger(GospelArranger):
         bpm: int,
         application: str,
         time_signature: str = "4/4",
-        use_ai: Optional[bool] = None
+        use_ai: Optional[bool] = None,
+        rng: Optional[random.Random] = None
     ) -> Arrangement:
         """
         Arrange gospel piano progression with hybrid AI + rules.
@@ -88,12 +91,16 @@ class HybridGospelArranger(GospelArranger):
             application: "worship", "uptempo", "practice", "concert"
             time_signature: Time signature
             use_ai: Override ai_percentage (None = use configured percentage)
+            rng: Random source for the AI/rules choice and the rule-based
+                arrangement (None = unseeded)
 
         Returns:
             Arrangement with left/right hand notes
         """
+        rng = rng or random.Random()
+
         # Determine if this arrangement uses AI
-        use_ai_for_this = use_ai if use_ai is not None else (random.random() < self.ai_percentage)
+        use_ai_for_this = use_ai if use_ai is not None else (rng.random() < self.ai_percentage)
 
         if use_ai_for_this and self.mlx_generator:
             try:
@@ -109,7 +116,7 @@ class HybridGospelArranger(GospelArranger):
         # Generate with rules (original GospelArranger)
         print(f"📏 Generating with rules (application: {application})")
         return super().arrange_progression(
-            chords, key, bpm, application, time_signature
+            chords, key, bpm, application, time_signature, rng=rng
         )
 
     def _generate_with_ai(
@@ -0,0 +1,207 @@
+"""In-memory Standard MIDI File encoder
+
+Encodes an Arrangement straight to SMF bytes without mido objects or disk I/O:
+- Same track layout as export_enhanced_midi (meta track, left hand, right hand)
+- Note and pedal events built as NumPy arrays, stably sorted by tick
+- Delta times and event bytes assembled with vectorized variable-length
+  encoding and running status
+
+With humanize=False the output is byte-identical to export_enhanced_midi.
+"""
+
+from typing import List, Optional
+
+import numpy as np
+
+from app.gospel import Arrangement, Note
+from app.gospel.midi.enhanced_exporter import _get_key_sharps
+from app.gospel.note_array import NoteArray
+
+
+TICKS_PER_BEAT = 480
+
+# Sharps (+) / flats (-) per major key, as written in the key_signature meta event
+_KEY_SIGNATURE_SHARPS = {
+    "C": 0, "G": 1, "D": 2, "A": 3, "E": 4, "B": 5, "F#": 6,
+    "F": -1, "Bb": -2, "Eb": -3, "Ab": -4, "Db": -5, "Gb": -6,
+}
+
+_NOTE_ON = 0x90
+_NOTE_OFF = 0x80
+_CONTROL_CHANGE = 0xB0
+_PROGRAM_CHANGE = 0xC0
+_SUSTAIN_PEDAL = 64
+
+
+def encode_arrangement(
+    arrangement: Arrangement,
+    include_pedal: bool = True,
+    humanize: bool = True,
+    program: int = 0,
+    seed: Optional[int] = None
+) -> bytes:
+    """Encode arrangement as a Type 1 multi-track MIDI file.
+
+    Args:
+        arrangement: Complete piano arrangement
+        include_pedal: Add sustain pedal automation
+        humanize: Add slight timing/velocity variations
+        program: MIDI program number (default 0 = Acoustic Grand Piano)
+        seed: Seed for humanization jitter (None = non-deterministic)
+
+    Returns:
+        SMF bytes ready to stream or write to disk
+    """
+    rng = np.random.default_rng(seed)
+    beats_per_bar = arrangement.time_signature[0]
+
+    tracks = [
+        _meta_track(arrangement),
+        _hand_track(arrangement.left_hand_notes, "Left Hand", 0, program, humanize, include_pedal, beats_per_bar, rng),
+        _hand_track(arrangement.right_hand_notes, "Right Hand", 1, program, humanize, include_pedal, beats_per_bar, rng),
+    ]
+
+    out = bytearray(b"MThd")
+    out += (6).to_bytes(4, "big")
+    out += (1).to_bytes(2, "big")
+    out += len(tracks).to_bytes(2, "big")
+    out += TICKS_PER_BEAT.to_bytes(2, "big")
+
+    for track in tracks:
+        out += b"MTrk"
+        out += len(track).to_bytes(4, "big")
+        out += track
+
+    return bytes(out)
+
+
+def _vlq(value: int) -> bytes:
+    """Variable-length quantity for a single value"""
+    out = [value & 0x7F]
+    value >>= 7
+    while value:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    return bytes(reversed(out))
+
+
+def _meta_event(kind: int, data: bytes) -> bytes:
+    """Meta event with zero delta time"""
+    return b"\x00\xff" + bytes([kind]) + _vlq(len(data)) + data
+
+
+def _text_event(name: str) -> bytes:
+    return _meta_event(0x03, name.encode("latin-1"))
+
+
+_END_OF_TRACK = _meta_event(0x2F, b"")
+
+
+def _meta_track(arrangement: Arrangement) -> bytearray:
+    """Track 0: name, tempo, time signature, key signature"""
+    numerator, denominator = arrangement.time_signature
+    tempo = int(60_000_000 / arrangement.tempo)
+    sharps = _KEY_SIGNATURE_SHARPS[_get_key_sharps(arrangement.key)]
+
+    track = bytearray()
+    track += _text_event("Gospel Piano")
+    track += _meta_event(0x51, tempo.to_bytes(3, "big"))
+    track += _meta_event(0x58, bytes([numerator, denominator.bit_length() - 1, 24, 8]))
+    track += _meta_event(0x59, bytes([sharps & 0xFF, 0]))
+    track += _END_OF_TRACK
+    return track
+
+
+def _hand_track(
+    notes: List[Note],
+    track_name: str,
+    channel: int,
+    program: int,
+    humanize: bool,
+    include_pedal: bool,
+    beats_per_bar: int,
+    rng: np.random.Generator
+) -> bytearray:
+    """Encode one hand's notes (plus pedal cycling) as a track chunk body"""
+    track = bytearray()
+    track += _text_event(track_name)
+    track += bytes([0x00, _PROGRAM_CHANGE | channel, program])
+
+    if not notes:
+        track += _END_OF_TRACK
+        return track
+
+    # Stable sort by onset, matching sorted(notes, key=lambda n: n.time)
+    ordered = NoteArray.from_notes(notes).sorted()
+    times = ordered.time
+    durations = ordered.duration
+    pitches = ordered.pitch.astype(np.int64)
+    velocities = ordered.velocity.astype(np.int64)
+
+    starts = (times * TICKS_PER_BEAT).astype(np.int64)
+    ends = ((times + durations) * TICKS_PER_BEAT).astype(np.int64)
+
+    if humanize:
+        starts = np.maximum(0, starts + rng.normal(0, 5, len(starts)).astype(np.int64))
+        ends = np.maximum(starts + 1, ends)
+        velocities = np.clip(velocities + rng.normal(0, 2, len(velocities)).astype(np.int64), 1, 127)
+
+    # Events as (tick, status, data1, data2); pedal first, then on/off per note,
+    # so the stable sort reproduces the exporter's event order on ties
+    note_events = np.empty((2 * len(starts), 4), dtype=np.int64)
+    note_events[0::2] = np.column_stack([starts, np.full_like(starts, _NOTE_ON | channel), pitches, velocities])
+    note_events[1::2] = np.column_stack([ends, np.full_like(ends, _NOTE_OFF | channel), pitches, np.zeros_like(ends)])
+
+    if include_pedal:
+        events = np.concatenate([_pedal_events(float((times + durations).max()), beats_per_bar, channel), note_events])
+    else:
+        events = note_events
+
+    events = events[np.argsort(events[:, 0], kind="stable")]
+    deltas = np.diff(events[:, 0], prepend=0)
+
+    track += _encode_channel_events(deltas, events[:, 1:])
+    track += _END_OF_TRACK
+    return track
+
+
+def _pedal_events(last_note_end: float, beats_per_bar: int, channel: int) -> np.ndarray:
+    """Sustain pedal down on each bar line, lifted 10 ticks before the next"""
+    bar_ticks = int(beats_per_bar * TICKS_PER_BEAT)
+    total_bars = int(last_note_end / beats_per_bar) + 1
+    bar_starts = np.arange(total_bars, dtype=np.int64) * bar_ticks
+    status = _CONTROL_CHANGE | channel
+
+    # Per bar: [lift (except bar 0), press]
+    events = []
+    for bar_start in bar_starts:
+        if bar_start > 0:
+            events.append((max(0, bar_start - 10), status, _SUSTAIN_PEDAL, 0))
+        events.append((bar_start, status, _SUSTAIN_PEDAL, 127))
+    events.append((int(last_note_end * TICKS_PER_BEAT) + 20, status, _SUSTAIN_PEDAL, 0))
+
+    return np.array(events, dtype=np.int64)
+
+
+def _encode_channel_events(deltas: np.ndarray, messages: np.ndarray) -> bytes:
+    """Vectorized encoding of (delta VLQ, status, data1, data2) rows.
+
+    Uses running status (status byte omitted when it repeats), like mido.
+    """
+    groups = np.stack([(deltas >> shift) & 0x7F for shift in (21, 14, 7, 0)], axis=1)
+    groups[:, :3] |= 0x80
+    lengths = 1 + (deltas >= 1 << 7) + (deltas >= 1 << 14) + (deltas >= 1 << 21)
+
+    status = messages[:, 0]
+    new_status = np.concatenate([[True], status[1:] != status[:-1]])
+
+    rows = np.concatenate([groups, messages], axis=1).astype(np.uint8)
+    mask = np.column_stack([
+        np.arange(4) >= 4 - lengths[:, None],
+        new_status,
+        np.ones((len(rows), 2), dtype=bool),
+    ])
+    return rows[mask].tobytes()
+
+
+__all__ = ["encode_arrangement", "TICKS_PER_BEAT"]
@@ -0,0 +1,319 @@
+"""Array-backed note storage for arrangements and patterns
+
+Structured NumPy alternative to lists of Note dataclasses:
+- One record per note: pitch, time, duration, velocity, hand (int8 code)
+- Bulk validation with the same rules and messages as Note.__post_init__
+- Vectorized time offsetting, velocity scaling and stable sorting
+- Adapters to and from List[Note] so arrangers can migrate gradually
+"""
+
+import random
+import time
+from typing import Dict, Iterable, List, Optional, Sequence, Union
+
+import numpy as np
+
+from app.gospel import Arrangement, Note
+
+
+NOTE_DTYPE = np.dtype([
+    ("pitch", np.int16),
+    ("time", np.float64),
+    ("duration", np.float64),
+    ("velocity", np.int16),
+    ("hand", np.int8),
+])
+
+HAND_LEFT = 0
+HAND_RIGHT = 1
+HAND_NAMES = ("left", "right")
+HAND_CODES = {name: code for code, name in enumerate(HAND_NAMES)}
+
+
+class NoteArray:
+    """Sequence of notes stored as a structured NumPy array.
+
+    Operations return new NoteArrays and never modify the receiver, matching
+    the copy-on-adjust behaviour of the list-based arranger helpers.
+    """
+
+    __slots__ = ("data",)
+
+    def __init__(self, data: Optional[np.ndarray] = None, validate: bool = True):
+        """Wrap a NOTE_DTYPE record array.
+
+        Args:
+            data: Structured array with NOTE_DTYPE fields (None = empty)
+            validate: Check pitch/velocity/hand/duration ranges
+
+        Raises:
+            ValueError: If any note is out of range
+        """
+        if data is None:
+            data = np.empty(0, dtype=NOTE_DTYPE)
+        elif data.dtype != NOTE_DTYPE:
+            data = data.astype(NOTE_DTYPE)
+        self.data = data
+
+        if validate:
+            self.validate()
+
+    # Construction
+
+    @classmethod
+    def from_notes(cls, notes: Iterable[Note]) -> "NoteArray":
+        """Build from Note objects (already validated on construction)."""
+        records = [
+            (n.pitch, n.time, n.duration, n.velocity, HAND_CODES[n.hand])
+            for n in notes
+        ]
+        return cls(np.array(records, dtype=NOTE_DTYPE), validate=False)
+
+    @classmethod
+    def from_columns(
+        cls,
+        pitch: Sequence[int],
+        time: Sequence[float],
+        duration: Sequence[float],
+        velocity: Sequence[int],
+        hand: Union[str, Sequence[int]]
+    ) -> "NoteArray":
+        """Build from parallel columns.
+
+        Args:
+            pitch: MIDI note numbers
+            time: Onsets in beats
+            duration: Lengths in beats
+            velocity: MIDI velocities
+            hand: "left"/"right" for every note, or per-note hand codes
+
+        Raises:
+            ValueError: If columns differ in length or any note is out of range
+        """
+        pitch = np.asarray(pitch)
+        data = np.empty(len(pitch), dtype=NOTE_DTYPE)
+        data["pitch"] = pitch
+        data["time"] = time
+        data["duration"] = duration
+        data["velocity"] = velocity
+        data["hand"] = HAND_CODES[hand] if isinstance(hand, str) else hand
+        return cls(data)
+
+    @classmethod
+    def concatenate(cls, arrays: Iterable["NoteArray"]) -> "NoteArray":
+        """Join arrays in order (no re-validation)."""
+        parts = [a.data for a in arrays]
+        if not parts:
+            return cls(validate=False)
+        return cls(np.concatenate(parts), validate=False)
+
+    # Conversion
+
+    def to_notes(self) -> List[Note]:
+        """Convert back to Note objects in array order."""
+        return [
+            Note(pitch=p, time=t, duration=d, velocity=v, hand=HAND_NAMES[h])
+            for p, t, d, v, h in zip(
+                self.data["pitch"].tolist(),
+                self.data["time"].tolist(),
+                self.data["duration"].tolist(),
+                self.data["velocity"].tolist(),
+                self.data["hand"].tolist(),
+            )
+        ]
+
+    # Validation
+
+    def validate(self) -> None:
+        """Check every note against the Note invariants.
+
+        Raises:
+            ValueError: For the first offending note, with Note's message
+        """
+        d = self.data
+        checks = (
+            ((d["pitch"] < 0) | (d["pitch"] > 127), "pitch", "Invalid MIDI pitch: {} (must be 0-127)"),
+            ((d["velocity"] < 0) | (d["velocity"] > 127), "velocity", "Invalid velocity: {} (must be 0-127)"),
+            ((d["hand"] < 0) | (d["hand"] >= len(HAND_NAMES)), "hand", "Invalid hand code: {} (must be 0 or 1)"),
+            (~(d["duration"] > 0), "duration", "Invalid duration: {} (must be positive)"),
+        )
+        for bad, field, message in checks:
+            if bad.any():
+                index = int(np.argmax(bad))
+                raise ValueError(f"Note {index}: " + message.format(d[field][index]))
+
+    # Vectorized transforms
+
+    def shifted(self, offset: float) -> "NoteArray":
+        """Return a copy with every onset moved by offset beats."""
+        data = self.data.copy()
+        data["time"] += offset
+        return NoteArray(data, validate=False)
+
+    def transposed(self, semitones: int) -> "NoteArray":
+        """Return a copy with every pitch moved by semitones (range-checked)."""
+        data = self.data.copy()
+        data["pitch"] += semitones
+        return NoteArray(data)
+
+    def with_velocity_range(self, min_velocity: int, max_velocity: int) -> "NoteArray":
+        """Scale velocities from 0-127 into [min_velocity, max_velocity].
+
+        Same arithmetic as BaseArranger._apply_velocity_range: linear scale,
+        truncate to int, clamp to the range.
+        """
+        data = self.data.copy()
+        scaled = (min_velocity + (data["velocity"] / 127.0) * (max_velocity - min_velocity)).astype(np.int64)
+        data["velocity"] = np.clip(scaled, min_velocity, max_velocity)
+        return NoteArray(data, validate=False)
+
+    def sorted(self) -> "NoteArray":
+        """Stable sort by onset, like sorted(notes, key=lambda n: n.time)."""
+        order = np.argsort(self.data["time"], kind="stable")
+        return NoteArray(self.data[order], validate=False)
+
+    def for_hand(self, hand: str) -> "NoteArray":
+        """Notes played by one hand."""
+        return NoteArray(self.data[self.data["hand"] == HAND_CODES[hand]], validate=False)
+
+    # Accessors
+
+    @property
+    def pitch(self) -> np.ndarray:
+        return self.data["pitch"]
+
+    @property
+    def time(self) -> np.ndarray:
+        return self.data["time"]
+
+    @property
+    def duration(self) -> np.ndarray:
+        return self.data["duration"]
+
+    @property
+    def velocity(self) -> np.ndarray:
+        return self.data["velocity"]
+
+    @property
+    def hand(self) -> np.ndarray:
+        return self.data["hand"]
+
+    @property
+    def end_time(self) -> float:
+        """Latest note end in beats (0.0 when empty)."""
+        if not len(self.data):
+            return 0.0
+        return float((self.data["time"] + self.data["duration"]).max())
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def __getitem__(self, index) -> "NoteArray":
+        selected = self.data[index]
+        if selected.ndim == 0:
+            selected = selected.reshape(1)
+        return NoteArray(selected, validate=False)
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, NoteArray):
+            return NotImplemented
+        return np.array_equal(self.data, other.data)
+
+    def __repr__(self) -> str:
+        return f"NoteArray({len(self)} notes)"
+
+
+def benchmark_note_array(num_bars: int = 64, iterations: int = 20, seed: int = 0) -> Dict[str, float]:
+    """
+    Compare list-of-Note and NoteArray processing on a gospel arrangement.
+
+    Builds one num_bars arrangement with GospelArranger, then times the
+    arranger's bar-offset / velocity-range / sort steps both ways.
+
+    Args:
+        num_bars: Arrangement length in bars
+        iterations: Timed repetitions per method
+        seed: Seed for the arrangement's random choices
+
+    Returns:
+        Dictionary with note count and per-iteration timings in milliseconds
+    """
+    from app.gospel.arrangement.arranger import GospelArranger
+
+    chords = (["Cmaj9", "Am11", "Dm9", "G13"] * (num_bars // 4 + 1))[:num_bars]
+    arrangement = GospelArranger().arrange_progression(
+        chords, key="C", bpm=120, application="worship", rng=random.Random(seed)
+    )
+    bars = _split_bars(arrangement, num_bars)
+    velocity_range = (50, 100)
+
+    def list_pipeline():
+        notes = []
+        for i, bar in enumerate(bars):
+            notes.extend(
+                Note(pitch=n.pitch, time=n.time + i * 4, duration=n.duration, velocity=n.velocity, hand=n.hand)
+                for n in bar
+            )
+        min_vel, max_vel = velocity_range
+        notes = [
+            Note(
+                pitch=n.pitch,
+                time=n.time,
+                duration=n.duration,
+                velocity=max(min_vel, min(int(min_vel + (n.velocity / 127.0) * (max_vel - min_vel)), max_vel)),
+                hand=n.hand
+            )
+            for n in notes
+        ]
+        return sorted(notes, key=lambda n: n.time)
+
+    def array_pipeline(bar_arrays):
+        notes = NoteArray.concatenate(a.shifted(i * 4) for i, a in enumerate(bar_arrays))
+        return notes.with_velocity_range(*velocity_range).sorted()
+
+    prebuilt = [NoteArray.from_notes(bar) for bar in bars]
+    methods = (
+        ("list", list_pipeline),
+        ("array", lambda: array_pipeline(prebuilt)),
+        ("array_roundtrip", lambda: array_pipeline([NoteArray.from_notes(bar) for bar in bars]).to_notes()),
+    )
+
+    results = {
+        "num_bars": num_bars,
+        "num_notes": sum(len(bar) for bar in bars),
+        "iterations": iterations,
+    }
+    for name, fn in methods:
+        start = time.perf_counter()
+        for _ in range(iterations):
+            fn()
+        results[f"{name}_ms"] = (time.perf_counter() - start) * 1000 / iterations
+
+    results["speedup"] = results["list_ms"] / results["array_ms"] if results["array_ms"] else float("inf")
+    return results
+
+
+def _split_bars(arrangement: Arrangement, num_bars: int) -> List[List[Note]]:
+    """Re-express an arrangement as bar-relative note lists."""
+    bars: List[List[Note]] = [[] for _ in range(num_bars)]
+    for note in arrangement.left_hand_notes + arrangement.right_hand_notes:
+        bar = min(int(note.time // 4), num_bars - 1) if note.time >= 0 else 0
+        bars[bar].append(Note(
+            pitch=note.pitch,
+            time=note.time - bar * 4,
+            duration=note.duration,
+            velocity=note.velocity,
+            hand=note.hand
+        ))
+    return bars
+
+
+__all__ = [
+    "NOTE_DTYPE",
+    "HAND_LEFT",
+    "HAND_RIGHT",
+    "HAND_NAMES",
+    "HAND_CODES",
+    "NoteArray",
+    "benchmark_note_array",
+]
@@ -8,8 +8,10 @@ Implements traditional gospel, contemporary, and jazz-gospel left hand patterns:
 - Syncopated comping (contemporary Kirk Franklin style)
 """
 
+from functools import partial
 from typing import List, Tuple, Optional
 from app.gospel import Note, ChordContext, HandPattern
+from app.core.arrangers.pattern_templates import PatternTemplateLibrary
 
 
 # MIDI note mappings (C2 = 36 is low C for left hand bass)
@@ -429,6 +431,34 @@ LEFT_HAND_PATTERNS = {
 }
 
 
+def _build_left_hand_pattern(
+    pattern_name: str,
+    context: ChordContext
+) -> HandPattern:
+    """Run the named pattern generator for one chord."""
+    if pattern_name not in LEFT_HAND_PATTERNS:
+        raise ValueError(
+            f"Unknown left hand pattern: {pattern_name}. "
+            f"Available: {list(LEFT_HAND_PATTERNS.keys())}"
+        )
+
+    generator = LEFT_HAND_PATTERNS[pattern_name]
+    return generator(context)
+
+
+# Compiled per chord quality; walking_bass reads next_chord and runs per bar
+LEFT_HAND_TEMPLATES = PatternTemplateLibrary(
+    _build_left_hand_pattern,
+    transposable=[
+        "stride_bass",
+        "alberti_bass",
+        "shell_voicing",
+        "syncopated_comping",
+    ],
+    voicing_tones=partial(get_chord_tones, octave=4)
+)
+
+
 def generate_left_hand_pattern(
     pattern_name: str,
     context: ChordContext
@@ -445,14 +475,7 @@ def generate_left_hand_pattern(
     Raises:
         ValueError: If pattern name is unknown
     """
-    if pattern_name not in LEFT_HAND_PATTERNS:
-        raise ValueError(
-            f"Unknown left hand pattern: {pattern_name}. "
-            f"Available: {list(LEFT_HAND_PATTERNS.keys())}"
-        )
-
-    generator = LEFT_HAND_PATTERNS[pattern_name]
-    return generator(context)
+    return LEFT_HAND_TEMPLATES.generate(pattern_name, context)
 
 
 __all__ = [
@@ -463,4 +486,5 @@ __all__ = [
     "syncopated_comping_pattern",
     "generate_left_hand_pattern",
     "LEFT_HAND_PATTERNS",
+    "LEFT_HAND_TEMPLATES",
 ]
@@ -8,9 +8,10 @@ Implements rhythm transformations for gospel piano:
 These functions transform note timing rather than generating new notes.
 """
 
-from typing import List, Callable
+from typing import List, Callable, Optional
 from app.gospel import Note
 import copy
+import random
 
 
 def apply_gospel_shuffle(notes: List[Note], intensity: float = 0.6) -> List[Note]:
@@ -118,17 +119,22 @@ def apply_backbeat_emphasis(notes: List[Note], emphasis_factor: float = 1.3) ->
     return emphasized_notes
 
 
-def apply_offbeat_syncopation(notes: List[Note], probability: float = 0.3) -> List[Note]:
+def apply_offbeat_syncopation(
+    notes: List[Note],
+    probability: float = 0.3,
+    rng: Optional[random.Random] = None
+) -> List[Note]:
     """Shift some downbeat notes to off-beat positions for syncopation.
 
     Args:
         notes: List of notes to transform
         probability: Probability of syncopating a note (0.0-1.0)
+        rng: Random source (None = the global random module)
 
     Returns:
         New list of notes with syncopation
     """
-    import random
+    rng = rng or random
 
     syncopated_notes = []
 
@@ -139,7 +145,7 @@ def apply_offbeat_syncopation(notes: List[Note], probability: float = 0.3) -> Li
         beat_number = note.time
         is_downbeat = abs(beat_number - round(beat_number)) < 0.1
 
-        if is_downbeat and random.random() < probability:
+        if is_downbeat and rng.random() < probability:
             # Shift to off-beat (anticipate by 0.5 beats)
             new_note.time = max(0, note.time - 0.5)
             # Slightly reduce velocity for off-beat notes
@@ -193,17 +199,22 @@ def apply_cross_rhythm(notes: List[Note], pattern: str = "3over4") -> List[Note]
     return cross_notes
 
 
-def apply_rhythmic_displacement(notes: List[Note], displacement: float = 0.25) -> List[Note]:
+def apply_rhythmic_displacement(
+    notes: List[Note],
+    displacement: float = 0.25,
+    rng: Optional[random.Random] = None
+) -> List[Note]:
     """Displace note timing slightly for humanization or rhythmic variation.
 
     Args:
         notes: List of notes to transform
         displacement: Maximum time displacement in beats (default 0.25 = 16th note)
+        rng: Random source (None = the global random module)
 
     Returns:
         New list of notes with displacement
     """
-    import random
+    rng = rng or random
 
     displaced_notes = []
 
@@ -211,7 +222,7 @@ def apply_rhythmic_displacement(notes: List[Note], displacement: float = 0.25) -
         new_note = copy.deepcopy(note)
 
         # Random displacement between -displacement and +displacement
-        offset = random.uniform(-displacement, displacement)
+        offset = rng.uniform(-displacement, displacement)
         new_note.time = max(0, note.time + offset)
 
         displaced_notes.append(new_note)
@@ -290,7 +301,7 @@ def apply_tempo_rubato(notes: List[Note], rubato_curve: str = "ritardando") -> L
     return rubato_notes
 
 
-def apply_funk_pocket(notes: List[Note]) -> List[Note]:
+def apply_funk_pocket(notes: List[Note], rng: Optional[random.Random] = None) -> List[Note]:
     """Apply funk pocket rhythm (16th-note grid with ghost notes).
 
     Funk: Tight 16th-note grid with emphasis on "the one"
@@ -298,11 +309,12 @@ def apply_funk_pocket(notes: List[Note]) -> List[Note]:
 
     Args:
         notes: List of notes to transform
+        rng: Random source (None = the global random module)
 
     Returns:
         New list of notes with funk pocket
     """
-    import random
+    rng = rng or random
 
     funk_notes = []
 
@@ -317,7 +329,7 @@ def apply_funk_pocket(notes: List[Note]) -> List[Note]:
         if beat_number == 0 and sixteenth_position == 0:
             velocity_adjustment = 20
         # Ghost notes (softer 16th notes between hits)
-        elif random.random() < 0.3:  # 30% chance of ghost note
+        elif rng.random() < 0.3:  # 30% chance of ghost note
             velocity_adjustment = -25
         else:
             velocity_adjustment = 0
@@ -415,10 +427,14 @@ RHYTHM_TRANSFORMATIONS: dict[str, Callable[[List[Note]], List[Note]]] = {
     "call_response": apply_call_response_timing,
 }
 
+# Transformations that draw random numbers and accept an rng
+_RANDOMIZED_TRANSFORMATIONS = {"offbeat_syncopation", "rhythmic_displacement", "funk_pocket"}
+
 
 def apply_rhythm_pattern(
     notes: List[Note],
     pattern_name: str,
+    rng: Optional[random.Random] = None,
     **kwargs
 ) -> List[Note]:
     """Apply a rhythm transformation pattern by name.
@@ -426,6 +442,7 @@ def apply_rhythm_pattern(
     Args:
         notes: List of notes to transform
         pattern_name: Name of rhythm pattern to apply
+        rng: Random source for randomized patterns (None = the global random module)
         **kwargs: Additional arguments for specific patterns
 
     Returns:
@@ -441,6 +458,8 @@ def apply_rhythm_pattern(
         )
 
     transformation = RHYTHM_TRANSFORMATIONS[pattern_name]
+    if rng is not None and pattern_name in _RANDOMIZED_TRANSFORMATIONS:
+        kwargs["rng"] = rng
 
     # Apply transformation with any additional kwargs
     if kwargs:
@@ -8,8 +8,10 @@ Implements gospel right hand patterns for melody, fills, and voicings:
 - Polychord structures
 """
 
+from functools import partial
 from typing import List, Tuple
 from app.gospel import Note, ChordContext, HandPattern
+from app.core.arrangers.pattern_templates import PatternTemplateLibrary
 
 
 # Import chord parsing utilities from left_hand
@@ -330,6 +332,36 @@ RIGHT_HAND_PATTERNS = {
 }
 
 
+def _build_right_hand_pattern(
+    pattern_name: str,
+    context: ChordContext
+) -> HandPattern:
+    """Run the named pattern generator for one chord."""
+    if pattern_name not in RIGHT_HAND_PATTERNS:
+        raise ValueError(
+            f"Unknown right hand pattern: {pattern_name}. "
+            f"Available: {list(RIGHT_HAND_PATTERNS.keys())}"
+        )
+
+    generator = RIGHT_HAND_PATTERNS[pattern_name]
+    return generator(context)
+
+
+# Every pattern depends only on the chord, so all are compiled per chord quality
+RIGHT_HAND_TEMPLATES = PatternTemplateLibrary(
+    _build_right_hand_pattern,
+    transposable=[
+        "melody_with_fills",
+        "chord_fills",
+        "octave_doubling",
+        "block_chord",
+        "polychord",
+        "arpeggiated_voicing",
+    ],
+    voicing_tones=partial(get_chord_tones, octave=5)
+)
+
+
 def generate_right_hand_pattern(
     pattern_name: str,
     context: ChordContext
@@ -346,14 +378,7 @@ def generate_right_hand_pattern(
     Raises:
         ValueError: If pattern name is unknown
     """
-    if pattern_name not in RIGHT_HAND_PATTERNS:
-        raise ValueError(
-            f"Unknown right hand pattern: {pattern_name}. "
-            f"Available: {list(RIGHT_HAND_PATTERNS.keys())}"
-        )
-
-    generator = RIGHT_HAND_PATTERNS[pattern_name]
-    return generator(context)
+    return RIGHT_HAND_TEMPLATES.generate(pattern_name, context)
 
 
 __all__ = [
@@ -365,4 +390,5 @@ __all__ = [
     "arpeggiated_voicing_pattern",
     "generate_right_hand_pattern",
     "RIGHT_HAND_PATTERNS",
+    "RIGHT_HAND_TEMPLATES",
 ]
@@ -101,12 +101,13 @@ class JazzArranger(BaseArranger):
         """
         return generate_jazz_right_hand_pattern(pattern_name, context)
 
-    def _apply_rhythm_transformations(self, notes: List[Note], rhythm_patterns: List[str]) -> List[Note]:
+    def _apply_rhythm_transformations(self, notes: List[Note], rhythm_patterns: List[str], rng: random.Random) -> List[Note]:
         """Apply jazz rhythm transformations (swing).
 
         Args:
             notes: Notes to transform
             rhythm_patterns: List of jazz rhythm pattern names
+            rng: Random source for this arrangement
 
         Returns:
             Transformed notes with swing feel
@@ -120,7 +121,8 @@ class JazzArranger(BaseArranger):
         self,
         context: ChordContext,
         config: dict,
-        position: int
+        position: int,
+        rng: random.Random
     ) -> str:
         """Select appropriate left hand pattern based on context.
 
@@ -133,6 +135,7 @@ class JazzArranger(BaseArranger):
             context: Chord context
             config: Application configuration
             position: Position in progression
+            rng: Random source for this arrangement
 
         Returns:
             Pattern name
@@ -144,7 +147,7 @@ class JazzArranger(BaseArranger):
             # Start phrases with clear root (walking bass or rootless voicing)
             preferred = [p for p in available_patterns if p in ["walking_bass", "rootless_voicing"]]
             if preferred:
-                return random.choice(preferred)
+                return rng.choice(preferred)
 
         elif context.is_phrase_end:
             # End phrases with sustained voicing (rootless)
@@ -153,13 +156,14 @@ class JazzArranger(BaseArranger):
                 return preferred[0]
 
         # Default: random selection
-        return random.choice(available_patterns)
+        return rng.choice(available_patterns)
 
     def _select_right_pattern(
         self,
         context: ChordContext,
         config: dict,
-        position: int
+        position: int,
+        rng: random.Random
     ) -> str:
         """Select appropriate right hand pattern based on context.
 
@@ -172,6 +176,7 @@ class JazzArranger(BaseArranger):
             context: Chord context
             config: Application configuration
             position: Position in progression
+            rng: Random source for this arrangement
 
         Returns:
             Pattern name
@@ -183,22 +188,23 @@ class JazzArranger(BaseArranger):
             # Start with clear statement (chord melody or block chords)
             preferred = [p for p in available_patterns if p in ["chord_melody", "block_chords_locked_hands"]]
             if preferred:
-                return random.choice(preferred)
+                return rng.choice(preferred)
 
         elif context.is_phrase_end:
             # End with resolution (bebop line or chord melody)
             preferred = [p for p in available_patterns if p in ["bebop_line", "chord_melody"]]
             if preferred:
-                return random.choice(preferred)
+                return rng.choice(preferred)
 
         # Default: random selection
-        return random.choice(available_patterns)
+        return rng.choice(available_patterns)
 
     def _add_improvisation(
         self,
         context: ChordContext,
         position: int,
-        application: str
+        application: str,
+        rng: random.Random
     ) -> List[Note]:
         """Add jazz improvisation elements.
 
@@ -211,6 +217,7 @@ class JazzArranger(BaseArranger):
             context: Chord context
             position: Position in progression
             application: Application type
+            rng: Random source for this arrangement
 
         Returns:
             List of improvisation notes
@@ -239,7 +246,7 @@ class JazzArranger(BaseArranger):
             improv_notes.extend(lick)
 
         # Add bebop runs for connection
-        elif context.next_chord and random.random() < 0.3:
+        elif context.next_chord and rng.random() < 0.3:
             run = generate_bebop_run(
                 context,
                 start_time=position * 4 + 2.5,  # Beat 3.5
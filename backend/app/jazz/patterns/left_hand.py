@@ -16,6 +16,7 @@ Key Jazz Concepts:
 
 from typing import List, Tuple, Optional
 from app.gospel import Note, ChordContext, HandPattern
+from app.core.arrangers.pattern_templates import PatternTemplateLibrary
 
 # MIDI note mappings (C2 = 36 is low C for left hand bass)
 NOTE_TO_MIDI = {
@@ -457,6 +458,29 @@ JAZZ_LEFT_HAND_PATTERNS = {
 }
 
 
+def _build_jazz_left_hand_pattern(pattern_name: str, context: ChordContext) -> HandPattern:
+    """Run the named pattern generator for one chord."""
+    if pattern_name not in JAZZ_LEFT_HAND_PATTERNS:
+        raise ValueError(
+            f"Unknown jazz left hand pattern: {pattern_name}. "
+            f"Available: {list(JAZZ_LEFT_HAND_PATTERNS.keys())}"
+        )
+
+    generator = JAZZ_LEFT_HAND_PATTERNS[pattern_name]
+    return generator(context)
+
+
+# Compiled per chord quality; walking_bass and bass_line_chromatic read next_chord and run per bar
+JAZZ_LEFT_HAND_TEMPLATES = PatternTemplateLibrary(
+    _build_jazz_left_hand_pattern,
+    transposable=[
+        "rootless_voicing",
+        "stride_jazz",
+        "comping_syncopated",
+    ]
+)
+
+
 def generate_jazz_left_hand_pattern(pattern_name: str, context: ChordContext) -> HandPattern:
     """Generate a jazz left hand pattern by name.
 
@@ -470,14 +494,7 @@ def generate_jazz_left_hand_pattern(pattern_name: str, context: ChordContext) ->
     Raises:
         ValueError: If pattern name not found
     """
-    if pattern_name not in JAZZ_LEFT_HAND_PATTERNS:
-        raise ValueError(
-            f"Unknown jazz left hand pattern: {pattern_name}. "
-            f"Available: {list(JAZZ_LEFT_HAND_PATTERNS.keys())}"
-        )
-
-    generator = JAZZ_LEFT_HAND_PATTERNS[pattern_name]
-    return generator(context)
+    return JAZZ_LEFT_HAND_TEMPLATES.generate(pattern_name, context)
 
 
 __all__ = [
@@ -485,4 +502,5 @@ __all__ = [
     "JAZZ_LEFT_HAND_PATTERNS",
     "get_rootless_voicing",
     "parse_chord_symbol",
+    "JAZZ_LEFT_HAND_TEMPLATES",
 ]
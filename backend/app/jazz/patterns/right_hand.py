@@ -16,6 +16,7 @@ Key Jazz Concepts:
 
 from typing import List, Tuple
 from app.gospel import Note, ChordContext, HandPattern
+from app.core.arrangers.pattern_templates import PatternTemplateLibrary
 
 # MIDI note mappings
 NOTE_TO_MIDI = {
@@ -351,6 +352,31 @@ JAZZ_RIGHT_HAND_PATTERNS = {
 }
 
 
+def _build_jazz_right_hand_pattern(pattern_name: str, context: ChordContext) -> HandPattern:
+    """Run the named pattern generator for one chord."""
+    if pattern_name not in JAZZ_RIGHT_HAND_PATTERNS:
+        raise ValueError(
+            f"Unknown jazz right hand pattern: {pattern_name}. "
+            f"Available: {list(JAZZ_RIGHT_HAND_PATTERNS.keys())}"
+        )
+
+    generator = JAZZ_RIGHT_HAND_PATTERNS[pattern_name]
+    return generator(context)
+
+
+# Every pattern depends only on the chord, so all are compiled per chord quality
+JAZZ_RIGHT_HAND_TEMPLATES = PatternTemplateLibrary(
+    _build_jazz_right_hand_pattern,
+    transposable=[
+        "bebop_line",
+        "chord_melody",
+        "block_chords_locked_hands",
+        "single_note_improvisation",
+        "upper_structure_triads",
+    ]
+)
+
+
 def generate_jazz_right_hand_pattern(pattern_name: str, context: ChordContext) -> HandPattern:
     """Generate a jazz right hand pattern by name.
 
@@ -364,17 +390,11 @@ def generate_jazz_right_hand_pattern(pattern_name: str, context: ChordContext) -
     Raises:
         ValueError: If pattern name not found
     """
-    if pattern_name not in JAZZ_RIGHT_HAND_PATTERNS:
-        raise ValueError(
-            f"Unknown jazz right hand pattern: {pattern_name}. "
-            f"Available: {list(JAZZ_RIGHT_HAND_PATTERNS.keys())}"
-        )
-
-    generator = JAZZ_RIGHT_HAND_PATTERNS[pattern_name]
-    return generator(context)
+    return JAZZ_RIGHT_HAND_TEMPLATES.generate(pattern_name, context)
 
 
 __all__ = [
     "generate_jazz_right_hand_pattern",
     "JAZZ_RIGHT_HAND_PATTERNS",
+    "JAZZ_RIGHT_HAND_TEMPLATES",
 ]
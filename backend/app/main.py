@@ -1,5 +1,6 @@
 """Main FastAPI application"""
 
+import asyncio
 from contextlib import asynccontextmanager
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
@@ -8,7 +9,7 @@ from fastapi.staticfiles import StaticFiles
 from pathlib import Path
 
 from app.core.config import settings
-from app.api.routes import health, auth, transcribe, jobs, library, practice, snippets, export, analysis, ai, gospel, jazz, neosoul, blues, classical, curriculum, voicing, websocket, realtime_analysis, collections, theory, theory_tools, reggae, latin, rnb, exercises  # audio
+from app.api.routes import health, auth, transcribe, jobs, library, practice, snippets, export, analysis, ai, gospel, jazz, neosoul, blues, classical, curriculum, voicing, websocket, realtime_analysis, collections, theory, theory_tools, reggae, latin, rnb, exercises, batch  # audio
 from app.services.transcription import TranscriptionService
 
 
@@ -39,6 +40,10 @@ async def lifespan(app: FastAPI):
     transcribe.transcription_service = transcription_service
     jobs.transcription_service = transcription_service
 
+    # Job progress streams (relays events from other workers when shared)
+    from app.services.job_events import job_event_broker
+    await job_event_broker.start()
+
     # Initialize music knowledge base
     from app.services.knowledge_base_loader import MusicKnowledgeBase
     music_knowledge_base = MusicKnowledgeBase()
@@ -48,6 +53,12 @@ async def lifespan(app: FastAPI):
     else:
         print("⚠ Music knowledge base empty (run research script to populate)")
 
+    # Preload hinted models (off the event loop; failures are logged and skipped)
+    if settings.model_preload:
+        from app.services.model_registry import model_registry
+        loaded = await asyncio.to_thread(model_registry.preload, settings.model_preload)
+        print(f"✓ Preloaded models: {', '.join(loaded) or 'none'} ({model_registry.used_gb:.1f}/{model_registry.budget_gb:.1f}GB)")
+
     print(f"✓ Started {settings.app_name} v{settings.version}")
     print(f"✓ Upload directory: {settings.UPLOAD_DIR}")
     print(f"✓ Output directory: {settings.OUTPUTS_DIR}")
@@ -55,6 +66,12 @@ async def lifespan(app: FastAPI):
     yield
 
     # Shutdown
+    from app.services.batch_arrangement import batch_arrangement_service
+    batch_arrangement_service.shutdown(wait=False)
+
+    from app.services.job_events import job_event_broker
+    await job_event_broker.stop()
+
     from app.database.session import close_db
     await close_db()
     print(f"✗ Shutting down {settings.app_name}")
@@ -100,6 +117,7 @@ app.include_router(classical.router, prefix=settings.api_v1_prefix)
 app.include_router(reggae.router, prefix=settings.api_v1_prefix)
 app.include_router(latin.router, prefix=settings.api_v1_prefix)
 app.include_router(rnb.router, prefix=settings.api_v1_prefix)
+app.include_router(batch.router, prefix=settings.api_v1_prefix)
 app.include_router(voicing.router, prefix=settings.api_v1_prefix)
 app.include_router(realtime_analysis.router, prefix=settings.api_v1_prefix)
 app.include_router(theory.router, prefix=settings.api_v1_prefix)
@@ -89,26 +89,28 @@ class NeosoulArranger(BaseArranger):
         """
         return generate_neosoul_right_hand_pattern(pattern_name, context, complexity=complexity)
 
-    def _apply_rhythm_transformations(self, notes: List[Note], rhythm_patterns: List[str]) -> List[Note]:
+    def _apply_rhythm_transformations(self, notes: List[Note], rhythm_patterns: List[str], rng: random.Random) -> List[Note]:
         """Apply neo-soul rhythm transformations.
 
         Args:
             notes: Notes to transform
             rhythm_patterns: List of neo-soul rhythm pattern names
+            rng: Random source for this arrangement
 
         Returns:
             Transformed notes with neo-soul feel
         """
         transformed = notes
         for rhythm_pattern in rhythm_patterns:
-            transformed = apply_neosoul_rhythm_pattern(transformed, rhythm_pattern)
+            transformed = apply_neosoul_rhythm_pattern(transformed, rhythm_pattern, rng=rng)
         return transformed
 
     def _select_left_pattern(
         self,
         context: ChordContext,
         config: dict,
-        position: int
+        position: int,
+        rng: random.Random
     ) -> str:
         """Select appropriate left hand pattern based on context.
 
@@ -121,6 +123,7 @@ class NeosoulArranger(BaseArranger):
             context: Chord context
             config: Application configuration
             position: Position in progression
+            rng: Random source for this arrangement
 
         Returns:
             Pattern name
@@ -132,7 +135,7 @@ class NeosoulArranger(BaseArranger):
             # Start phrases with sustained root or pedal
             preferred = [p for p in available_patterns if p in ["sustained_root_with_pedal", "low_interval_voicing"]]
             if preferred:
-                return random.choice(preferred)
+                return rng.choice(preferred)
 
         elif context.is_phrase_end:
             # End phrases with chromatic movement
@@ -141,13 +144,14 @@ class NeosoulArranger(BaseArranger):
                 return preferred[0]
 
         # Default: random selection
-        return random.choice(available_patterns)
+        return rng.choice(available_patterns)
 
     def _select_right_pattern(
         self,
         context: ChordContext,
         config: dict,
-        position: int
+        position: int,
+        rng: random.Random
     ) -> str:
         """Select appropriate right hand pattern based on context.
 
@@ -160,6 +164,7 @@ class NeosoulArranger(BaseArranger):
             context: Chord context
             config: Application configuration
             position: Position in progression
+            rng: Random source for this arrangement
 
         Returns:
             Pattern name
@@ -171,22 +176,23 @@ class NeosoulArranger(BaseArranger):
             # Start with extended voicing or suspended sound
             preferred = [p for p in available_patterns if p in ["extended_chord_voicing", "suspended_melody"]]
             if preferred:
-                return random.choice(preferred)
+                return rng.choice(preferred)
 
         elif context.is_phrase_end:
             # End with chromatic fill or resolution
             preferred = [p for p in available_patterns if p in ["chromatic_fills", "extended_chord_voicing"]]
             if preferred:
-                return random.choice(preferred)
+                return rng.choice(preferred)
 
         # Default: random selection
-        return random.choice(available_patterns)
+        return rng.choice(available_patterns)
 
     def _add_improvisation(
         self,
         context: ChordContext,
         position: int,
-        application: str
+        application: str,
+        rng: random.Random
     ) -> List[Note]:
         """Add neo-soul improvisation elements.
 
@@ -199,6 +205,7 @@ class NeosoulArranger(BaseArranger):
             context: Chord context
             position: Position in progression
             application: Application type
+            rng: Random source for this arrangement
 
         Returns:
             List of improvisation notes
@@ -206,7 +213,7 @@ class NeosoulArranger(BaseArranger):
         improv_notes = []
 
         # Add chromatic fills at phrase ends
-        if context.is_phrase_end and random.random() < 0.4:
+        if context.is_phrase_end and rng.random() < 0.4:
             # Simple chromatic fill (3-note ascending)
             root_midi = 60  # C4
             fill_start = position * 4 + 3.0  # Beat 4
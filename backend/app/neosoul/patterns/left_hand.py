@@ -17,6 +17,7 @@ Key Neo-Soul Concepts:
 
 from typing import List, Tuple
 from app.gospel import Note, ChordContext, HandPattern
+from app.core.arrangers.pattern_templates import PatternTemplateLibrary
 
 # MIDI note mappings (C2 = 36 is low C for left hand bass)
 NOTE_TO_MIDI = {
@@ -455,6 +456,35 @@ NEOSOUL_LEFT_HAND_PATTERNS = {
 }
 
 
+def _build_neosoul_left_hand_pattern(pattern_name: str, context: ChordContext, complexity: int = 5) -> HandPattern:
+    """Run the named pattern generator for one chord."""
+    if pattern_name not in NEOSOUL_LEFT_HAND_PATTERNS:
+        raise ValueError(
+            f"Unknown neo-soul left hand pattern: {pattern_name}. "
+            f"Available: {list(NEOSOUL_LEFT_HAND_PATTERNS.keys())}"
+        )
+
+    generator = NEOSOUL_LEFT_HAND_PATTERNS[pattern_name]
+    # Check if generator accepts complexity (inspect signature or just try/except)
+    # Safer to update all generators to accept **kwargs or similar, but for now strict update
+    try:
+        return generator(context, complexity=complexity)
+    except TypeError:
+        return generator(context)
+
+
+# Compiled per chord quality; chromatic_bass_walk reads next_chord and runs per bar
+NEOSOUL_LEFT_HAND_TEMPLATES = PatternTemplateLibrary(
+    _build_neosoul_left_hand_pattern,
+    transposable=[
+        "broken_chord_arpeggio",
+        "sustained_root_with_pedal",
+        "syncopated_groove",
+        "low_interval_voicing",
+    ]
+)
+
+
 def generate_neosoul_left_hand_pattern(pattern_name: str, context: ChordContext, complexity: int = 5) -> HandPattern:
     """Generate a neo-soul left hand pattern by name.
 
@@ -469,19 +499,7 @@ def generate_neosoul_left_hand_pattern(pattern_name: str, context: ChordContext,
     Raises:
         ValueError: If pattern name not found
     """
-    if pattern_name not in NEOSOUL_LEFT_HAND_PATTERNS:
-        raise ValueError(
-            f"Unknown neo-soul left hand pattern: {pattern_name}. "
-            f"Available: {list(NEOSOUL_LEFT_HAND_PATTERNS.keys())}"
-        )
-
-    generator = NEOSOUL_LEFT_HAND_PATTERNS[pattern_name]
-    # Check if generator accepts complexity (inspect signature or just try/except)
-    # Safer to update all generators to accept **kwargs or similar, but for now strict update
-    try:
-        return generator(context, complexity=complexity)
-    except TypeError:
-        return generator(context)
+    return NEOSOUL_LEFT_HAND_TEMPLATES.generate(pattern_name, context, complexity=complexity)
 
 
 __all__ = [
@@ -489,4 +507,5 @@ __all__ = [
     "NEOSOUL_LEFT_HAND_PATTERNS",
     "parse_chord_symbol",
     "get_extended_voicing",
+    "NEOSOUL_LEFT_HAND_TEMPLATES",
 ]
@@ -13,7 +13,9 @@ Key Concepts:
 - D'Angelo/Questlove-style groove
 """
 
-from typing import List
+from typing import List, Optional
+import random
+
 from app.gospel import Note
 
 
@@ -134,7 +136,7 @@ def apply_syncopation_emphasis(notes: List[Note]) -> List[Note]:
     return syncopated_notes
 
 
-def apply_micro_timing(notes: List[Note]) -> List[Note]:
+def apply_micro_timing(notes: List[Note], rng: Optional[random.Random] = None) -> List[Note]:
     """Apply micro-timing variations.
 
     Slight random variations in timing to humanize.
@@ -142,17 +144,18 @@ def apply_micro_timing(notes: List[Note]) -> List[Note]:
 
     Args:
         notes: Notes to humanize
+        rng: Random source (None = the global random module)
 
     Returns:
         Notes with micro-timing variations
     """
-    import random
+    rng = rng or random
 
     humanized_notes = []
 
     for note in notes:
         # Small random timing variation (-0.02 to +0.02 beats)
-        timing_offset = random.uniform(-0.02, 0.02)
+        timing_offset = rng.uniform(-0.02, 0.02)
 
         humanized_note = Note(
             pitch=note.pitch,
@@ -166,7 +169,11 @@ def apply_micro_timing(notes: List[Note]) -> List[Note]:
     return humanized_notes
 
 
-def apply_neosoul_rhythm_pattern(notes: List[Note], pattern_name: str) -> List[Note]:
+def apply_neosoul_rhythm_pattern(
+    notes: List[Note],
+    pattern_name: str,
+    rng: Optional[random.Random] = None
+) -> List[Note]:
     """Apply neo-soul rhythm pattern transformation.
 
     Args:
@@ -176,6 +183,7 @@ def apply_neosoul_rhythm_pattern(notes: List[Note], pattern_name: str) -> List[N
                      - "laid_back": Behind-the-beat timing
                      - "syncopated": Off-beat emphasis
                      - "humanized": Micro-timing variations
+        rng: Random source for randomized patterns (None = the global random module)
 
     Returns:
         Transformed notes
@@ -190,7 +198,7 @@ def apply_neosoul_rhythm_pattern(notes: List[Note], pattern_name: str) -> List[N
     elif pattern_name == "syncopated":
         return apply_syncopation_emphasis(notes)
     elif pattern_name == "humanized":
-        return apply_micro_timing(notes)
+        return apply_micro_timing(notes, rng=rng)
     else:
         raise ValueError(
             f"Unknown neo-soul rhythm pattern: {pattern_name}. "
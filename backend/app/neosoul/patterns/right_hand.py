@@ -18,6 +18,7 @@ Key Neo-Soul Concepts:
 
 from typing import List, Tuple
 from app.gospel import Note, ChordContext, HandPattern
+from app.core.arrangers.pattern_templates import PatternTemplateLibrary
 
 # MIDI note mappings
 NOTE_TO_MIDI = {
@@ -429,6 +430,34 @@ NEOSOUL_RIGHT_HAND_PATTERNS = {
 }
 
 
+def _build_neosoul_right_hand_pattern(pattern_name: str, context: ChordContext, complexity: int = 5) -> HandPattern:
+    """Run the named pattern generator for one chord."""
+    if pattern_name not in NEOSOUL_RIGHT_HAND_PATTERNS:
+        raise ValueError(
+            f"Unknown neo-soul right hand pattern: {pattern_name}. "
+            f"Available: {list(NEOSOUL_RIGHT_HAND_PATTERNS.keys())}"
+        )
+
+    generator = NEOSOUL_RIGHT_HAND_PATTERNS[pattern_name]
+    try:
+        return generator(context, complexity=complexity)
+    except TypeError:
+        return generator(context)
+
+
+# Every pattern depends only on the chord, so all are compiled per chord quality
+NEOSOUL_RIGHT_HAND_TEMPLATES = PatternTemplateLibrary(
+    _build_neosoul_right_hand_pattern,
+    transposable=[
+        "extended_chord_voicing",
+        "suspended_melody",
+        "chord_stabs_sparse",
+        "arpeggiated_extensions",
+        "chromatic_fills",
+    ]
+)
+
+
 def generate_neosoul_right_hand_pattern(pattern_name: str, context: ChordContext, complexity: int = 5) -> HandPattern:
     """Generate a neo-soul right hand pattern by name.
 
@@ -443,20 +472,11 @@ def generate_neosoul_right_hand_pattern(pattern_name: str, context: ChordContext
     Raises:
         ValueError: If pattern name not found
     """
-    if pattern_name not in NEOSOUL_RIGHT_HAND_PATTERNS:
-        raise ValueError(
-            f"Unknown neo-soul right hand pattern: {pattern_name}. "
-            f"Available: {list(NEOSOUL_RIGHT_HAND_PATTERNS.keys())}"
-        )
-
-    generator = NEOSOUL_RIGHT_HAND_PATTERNS[pattern_name]
-    try:
-        return generator(context, complexity=complexity)
-    except TypeError:
-        return generator(context)
+    return NEOSOUL_RIGHT_HAND_TEMPLATES.generate(pattern_name, context, complexity=complexity)
 
 
 __all__ = [
     "generate_neosoul_right_hand_pattern",
     "NEOSOUL_RIGHT_HAND_PATTERNS",
+    "NEOSOUL_RIGHT_HAND_TEMPLATES",
 ]
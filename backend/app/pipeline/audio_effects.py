@@ -3,10 +3,14 @@
 import asyncio
 from pathlib import Path
 from typing import Optional
-import librosa
 import soundfile as sf
 import numpy as np
 
+from app.core.lazy import lazy_import
+
+# Imported on first use, not at startup
+librosa = lazy_import("librosa")
+
 
 class AudioEffectsError(Exception):
     """Audio effects processing failed"""
@@ -3,11 +3,14 @@
 import asyncio
 from pathlib import Path
 import numpy as np
-import librosa
-from scipy.signal import medfilt
 
+from app.core.lazy import lazy_import
 from app.schemas.transcription import ChordEvent
 
+# Imported on first detection, not at startup
+librosa = lazy_import("librosa")
+scipy_signal = lazy_import("scipy.signal")
+
 
 class ChordDetectionError(Exception):
     """Chord detection failed"""
@@ -79,7 +82,7 @@ async def detect_chords(
             # Median filter to smooth chord sequence
             # This helps remove spurious detections
             chord_indices = [chord_to_index(c) for c in chord_sequence]
-            filtered_indices = medfilt(chord_indices, kernel_size=5).astype(int)
+            filtered_indices = scipy_signal.medfilt(chord_indices, kernel_size=5).astype(int)
             chord_sequence = [index_to_chord(idx) for idx in filtered_indices]
             
             # Convert frame indices to time
@@ -3,9 +3,13 @@
 from pathlib import Path
 from typing import List, Dict, Tuple, Optional
 import numpy as np
-import librosa
 import soundfile as sf
 
+from app.core.lazy import lazy_import
+
+# Imported on first use, not at startup
+librosa = lazy_import("librosa")
+
 # Optional import - crepe requires TensorFlow which doesn't support Python 3.13 yet
 try:
     import crepe
@@ -11,10 +11,13 @@ Uses audio features to classify piano music into genres:
 
 from typing import Dict, List, Tuple
 import numpy as np
-from sklearn.ensemble import RandomForestClassifier
-import librosa
 from pathlib import Path
 
+from app.core.lazy import lazy_import
+
+# Imported on first analysis, not at startup
+librosa = lazy_import("librosa")
+
 
 # Pre-defined genre characteristics
 GENRE_CHARACTERISTICS = {
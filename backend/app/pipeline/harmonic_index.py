@@ -0,0 +1,279 @@
+"""
+Harmonic Index
+
+Transposition-invariant chord n-grams and MinHash signatures used to search
+the song library by harmony:
+- Chord sequences are reduced to (interval from previous root, quality class)
+  tokens, so "Dm7 G7 Cmaj7" and "Em7 A7 Dmaj7" produce the same n-grams
+- N-grams feed an inverted index (see SongHarmonicNgram)
+- MinHash signatures over the n-gram set estimate Jaccard similarity
+  between whole songs without comparing their chord lists
+"""
+
+import hashlib
+import re
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from app.theory.chord_parser import parse_chord_symbol
+from app.theory.interval_utils import NOTE_TO_SEMITONE
+
+
+# N-gram lengths stored in the inverted index
+NGRAM_SIZES = (2, 3, 4)
+
+# N-gram length used as MinHash shingles
+SIGNATURE_NGRAM_SIZE = 3
+
+# Number of hash functions in a MinHash signature
+NUM_PERMUTATIONS = 64
+
+# Largest prime below 2**32; keeps a*x inside uint64
+_MINHASH_PRIME = np.uint64(4294967291)
+
+
+@dataclass(frozen=True)
+class HarmonicToken:
+    """A chord reduced to pitch class + quality class, linked to its source chord"""
+    pitch_class: int
+    quality_class: str
+    chord_index: int      # Index of the first source chord in this run
+    end_chord_index: int  # Index of the last source chord in this run
+    start_time: float
+    end_time: float
+
+
+@dataclass(frozen=True)
+class HarmonicNgram:
+    """A transposition-invariant n-gram located in a chord sequence"""
+    key: str
+    size: int
+    position: int  # Token index of the first chord
+    start_index: int
+    end_index: int
+    start_time: float
+    end_time: float
+
+
+def quality_class(quality: Optional[str]) -> str:
+    """
+    Collapse a chord quality into a coarse harmonic class.
+
+    Chord detectors disagree on extensions (maj vs maj7 vs maj9), so the index
+    keys on function-bearing classes only:
+    M (major), m (minor), 7 (dominant), ø (half-diminished), o (diminished),
+    + (augmented), sus (suspended).
+    """
+    q = (quality or "").strip()
+    lowered = q.lower()
+
+    if q.startswith("ø") or ("b5" in lowered and lowered.startswith(("m", "-")) and not lowered.startswith("maj")):
+        return "ø"
+    if lowered.startswith(("dim", "o", "°")):
+        return "o"
+    if lowered.startswith(("aug", "+")):
+        return "+"
+    if "sus" in lowered:
+        return "sus"
+    if q in ("", "M") or lowered.startswith(("maj", "add", "6", "^")) or q.startswith("M"):
+        return "M"
+    if lowered.startswith(("m", "-")):
+        return "m"
+    if q[:1].isdigit() or lowered.startswith("alt"):
+        return "7"
+    return "M"
+
+
+def tokenize_chords(chords: Sequence) -> List[HarmonicToken]:
+    """
+    Reduce a chord sequence to harmonic tokens.
+
+    Accepts dicts or objects exposing 'root', 'quality', 'time' and 'duration'
+    (SongChord rows and ChordEvent models both qualify). No-chord frames and
+    unparseable roots are skipped, and consecutive repeats of the same chord
+    are merged into a single token.
+    """
+    tokens: List[HarmonicToken] = []
+
+    for index, chord in enumerate(chords):
+        root = _field(chord, "root")
+        if not root or root not in NOTE_TO_SEMITONE:
+            continue
+
+        pitch_class = NOTE_TO_SEMITONE[root]
+        cls = quality_class(_field(chord, "quality"))
+        start = float(_field(chord, "time") or 0.0)
+        end = start + float(_field(chord, "duration") or 0.0)
+
+        if tokens and tokens[-1].pitch_class == pitch_class and tokens[-1].quality_class == cls:
+            previous = tokens[-1]
+            tokens[-1] = HarmonicToken(
+                pitch_class=pitch_class,
+                quality_class=cls,
+                chord_index=previous.chord_index,
+                end_chord_index=index,
+                start_time=previous.start_time,
+                end_time=max(previous.end_time, end),
+            )
+            continue
+
+        tokens.append(HarmonicToken(
+            pitch_class=pitch_class,
+            quality_class=cls,
+            chord_index=index,
+            end_chord_index=index,
+            start_time=start,
+            end_time=end,
+        ))
+
+    return tokens
+
+
+def ngram_key(tokens: Sequence[HarmonicToken]) -> str:
+    """
+    Build the transposition-invariant key for a run of tokens.
+
+    Format: first quality class, then "interval:class" for each following
+    chord, e.g. ii-V-I -> "m|5:7|5:M".
+    """
+    parts = [tokens[0].quality_class]
+    for previous, current in zip(tokens, tokens[1:]):
+        interval = (current.pitch_class - previous.pitch_class) % 12
+        parts.append(f"{interval}:{current.quality_class}")
+    return "|".join(parts)
+
+
+def extract_ngrams(
+    tokens: Sequence[HarmonicToken],
+    sizes: Iterable[int] = NGRAM_SIZES
+) -> List[HarmonicNgram]:
+    """Slide a window of each size across the tokens and emit located n-grams"""
+    ngrams: List[HarmonicNgram] = []
+
+    for size in sizes:
+        for position in range(len(tokens) - size + 1):
+            window = tokens[position:position + size]
+            ngrams.append(HarmonicNgram(
+                key=ngram_key(window),
+                size=size,
+                position=position,
+                start_index=window[0].chord_index,
+                end_index=window[-1].end_chord_index,
+                start_time=window[0].start_time,
+                end_time=window[-1].end_time,
+            ))
+
+    return ngrams
+
+
+def parse_progression_query(query: str) -> List[Dict[str, str]]:
+    """
+    Parse a user query such as "Dm7 G7 Cmaj7 Db7" into chord dicts.
+
+    Chords may be separated by whitespace, commas or bar lines.
+
+    Raises:
+        ValueError: If any symbol does not start with a valid root
+    """
+    symbols = [s for s in re.split(r"[\s,|]+", query.strip()) if s]
+    chords = []
+
+    for symbol in symbols:
+        parsed = parse_chord_symbol(symbol)
+        if parsed["root"] not in NOTE_TO_SEMITONE:
+            raise ValueError(f"Invalid chord symbol: {symbol}")
+        chords.append({"root": parsed["root"], "quality": parsed["quality"]})
+
+    return chords
+
+
+def query_keys(tokens: Sequence[HarmonicToken]) -> List[Tuple[int, str]]:
+    """
+    Split query tokens into indexed n-gram lookups.
+
+    Queries no longer than the largest indexed size map to a single key.
+    Longer queries become overlapping maximal-size n-grams; a song matches at
+    token position p only if every (offset, key) pair is found at p + offset.
+
+    Returns:
+        List of (token offset, n-gram key)
+    """
+    max_size = max(NGRAM_SIZES)
+    if len(tokens) <= max_size:
+        return [(0, ngram_key(tokens))]
+
+    return [
+        (offset, ngram_key(tokens[offset:offset + max_size]))
+        for offset in range(len(tokens) - max_size + 1)
+    ]
+
+
+# ============================================================================
+# MINHASH
+# ============================================================================
+
+def _hash32(value: str) -> int:
+    """Stable 32-bit hash (Python's hash() is salted per process)"""
+    return int.from_bytes(hashlib.blake2b(value.encode("utf-8"), digest_size=4).digest(), "little")
+
+
+def _permutation_params(num_permutations: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Derive (a, b) coefficients deterministically so signatures stay comparable across processes"""
+    a = np.array([_hash32(f"minhash-a-{i}") % (int(_MINHASH_PRIME) - 1) + 1 for i in range(num_permutations)], dtype=np.uint64)
+    b = np.array([_hash32(f"minhash-b-{i}") % int(_MINHASH_PRIME) for i in range(num_permutations)], dtype=np.uint64)
+    return a, b
+
+
+_PERM_A, _PERM_B = _permutation_params(NUM_PERMUTATIONS)
+
+
+def minhash_signature(shingles: Iterable[str]) -> List[int]:
+    """
+    Compute a MinHash signature over a set of n-gram keys.
+
+    All permutations are applied at once as a (permutations x shingles)
+    matrix of universal hashes (a*x + b) mod p.
+
+    Returns:
+        NUM_PERMUTATIONS ints; an empty input yields all-max values
+    """
+    unique = sorted(set(shingles))
+    if not unique:
+        return [int(_MINHASH_PRIME)] * NUM_PERMUTATIONS
+
+    x = np.array([_hash32(s) for s in unique], dtype=np.uint64)
+    hashed = (_PERM_A[:, None] * x[None, :]) % _MINHASH_PRIME
+    hashed = (hashed + _PERM_B[:, None]) % _MINHASH_PRIME
+    return hashed.min(axis=1).astype(np.int64).tolist()
+
+
+def song_signature(tokens: Sequence[HarmonicToken]) -> List[int]:
+    """MinHash signature for a whole song, falling back to shorter shingles for short songs"""
+    size = min(SIGNATURE_NGRAM_SIZE, max(len(tokens), 1))
+    shingles = [n.key for n in extract_ngrams(tokens, sizes=(size,))]
+    return minhash_signature(shingles)
+
+
+def signature_similarity(query: Sequence[int], candidates: np.ndarray) -> np.ndarray:
+    """
+    Estimate Jaccard similarity between one signature and a matrix of signatures.
+
+    Args:
+        query: Signature of length NUM_PERMUTATIONS
+        candidates: Array of shape (n_songs, NUM_PERMUTATIONS)
+
+    Returns:
+        Array of n_songs similarity estimates in [0, 1]
+    """
+    if candidates.size == 0:
+        return np.zeros(0, dtype=np.float64)
+    return (candidates == np.asarray(query, dtype=np.int64)[None, :]).mean(axis=1)
+
+
+def _field(chord, name: str):
+    """Read a field from a dict or attribute-style chord"""
+    if isinstance(chord, dict):
+        return chord.get(name)
+    return getattr(chord, name, None)
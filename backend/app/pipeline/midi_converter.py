@@ -3,39 +3,68 @@ import asyncio
 import logging
 import os
 import time
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
 import numpy as np
-import torch
 
 # GPU utilities
 from app.core.gpu import get_device, is_gpu_available, warmup_device
+from app.core.lazy import lazy_import, module_available
+from app.services.model_registry import model_registry
 
 logger = logging.getLogger(__name__)
 
-# Optional import - torchcrepe for GPU-accelerated pitch detection
-try:
-    import torchcrepe
-    TORCHCREPE_AVAILABLE = True
-except ImportError as e:
-    TORCHCREPE_AVAILABLE = False
-    logger.warning(f"torchcrepe not available: {e}. GPU transcription disabled.")
-except Exception as e:
-    TORCHCREPE_AVAILABLE = False
-    logger.warning(f"Error importing torchcrepe: {e}. GPU transcription disabled.")
-
-# Optional import - basic-pitch requires TensorFlow which doesn't support Python 3.13 yet
-try:
-    from basic_pitch.inference import predict
-    from basic_pitch import ICASSP_2022_MODEL_PATH
-    BASIC_PITCH_AVAILABLE = True
-except ImportError:
-    BASIC_PITCH_AVAILABLE = False
-    logger.info("basic-pitch not available (TensorFlow incompatible). Using alternatives.")
+# Optional - torchcrepe for GPU-accelerated pitch detection (imported on first transcription)
+TORCHCREPE_AVAILABLE = module_available("torchcrepe")
+torchcrepe = lazy_import("torchcrepe")
+if not TORCHCREPE_AVAILABLE:
+    logger.warning("torchcrepe not available. GPU transcription disabled.")
+
+# torchcrepe keeps its network on torchcrepe.infer; the registry accounts for it
+TORCHCREPE_MODEL_KEY = "torchcrepe:full"
+
+
+def _load_torchcrepe_model():
+    torchcrepe.load.model(get_device(), 'full')
+    return torchcrepe.infer.model
+
+
+def _unload_torchcrepe_model(model) -> None:
+    for attr in ("model", "capacity"):
+        if hasattr(torchcrepe.infer, attr):
+            delattr(torchcrepe.infer, attr)
+
+
+if TORCHCREPE_AVAILABLE:
+    model_registry.register(
+        TORCHCREPE_MODEL_KEY,
+        _load_torchcrepe_model,
+        size_gb=0.1,
+        unloader=_unload_torchcrepe_model,
+    )
+
+
+@lru_cache(maxsize=1)
+def _load_basic_pitch() -> Optional[tuple]:
+    """
+    (predict, model path) from basic-pitch, or None if it cannot be imported.
+
+    Imported on first transcription rather than at startup (it pulls in
+    TensorFlow, which doesn't support Python 3.13 yet).
+    """
+    try:
+        from basic_pitch.inference import predict
+        from basic_pitch import ICASSP_2022_MODEL_PATH
+    except ImportError:
+        logger.info("basic-pitch not available (TensorFlow incompatible). Using alternatives.")
+        return None
+    return predict, ICASSP_2022_MODEL_PATH
 
 import pretty_midi
 
+from app.pipeline.tonal_analysis import estimate_key_from_arrays, note_arrays
 from app.schemas.transcription import NoteEvent
 
 
@@ -85,7 +114,7 @@ async def transcribe_audio(
             logger.warning(f"GPU transcription failed, falling back: {e}")
     
     # TensorFlow path (basic-pitch)
-    if BASIC_PITCH_AVAILABLE:
+    if _load_basic_pitch() is not None:
         logger.info("Using basic-pitch (TensorFlow) for transcription")
         return await _transcribe_with_basic_pitch(
             audio_path, midi_output_path, onset_threshold, frame_threshold
@@ -137,18 +166,19 @@ async def _transcribe_with_torchcrepe(
             
             # Run pitch detection
             # Returns: time, frequency, confidence, activation
-            pitch, periodicity = torchcrepe.predict(
-                audio,
-                sr,
-                hop_length=160,  # 10ms hop
-                fmin=50,
-                fmax=2000,
-                model='full',
-                decoder=torchcrepe.decode.weighted_argmax,
-                device=device,
-                return_periodicity=True,
-                batch_size=1024,
-            )
+            with model_registry.use(TORCHCREPE_MODEL_KEY):
+                pitch, periodicity = torchcrepe.predict(
+                    audio,
+                    sr,
+                    hop_length=160,  # 10ms hop
+                    fmin=50,
+                    fmax=2000,
+                    model='full',
+                    decoder=torchcrepe.decode.weighted_argmax,
+                    device=device,
+                    return_periodicity=True,
+                    batch_size=1024,
+                )
             
             # Apply confidence threshold
             pitch = torchcrepe.filter.median(pitch, 3)
@@ -313,11 +343,13 @@ async def _transcribe_with_basic_pitch(
     try:
         midi_output_path.parent.mkdir(parents=True, exist_ok=True)
         
+        predict, model_path = _load_basic_pitch()
+
         def _transcribe():
             # Run basic-pitch prediction
             model_output, midi_data, note_events_data = predict(
                 str(audio_path),
-                ICASSP_2022_MODEL_PATH,
+                model_path,
                 onset_threshold=onset_threshold,
                 frame_threshold=frame_threshold,
             )
@@ -523,40 +555,10 @@ def estimate_key(notes: list[NoteEvent]) -> Optional[str]:
         return None
     
     try:
-        # Count note occurrences (mod 12 for pitch classes)
-        pitch_class_counts = [0] * 12
-        for note in notes:
-            pc = note.pitch % 12
-            duration = note.end_time - note.start_time
-            pitch_class_counts[pc] += duration  # Weight by duration
-        
-        # Major and minor key profiles (Krumhansl-Schmuckler)
-        major_profile = [6.35, 2.23, 3.48, 2.33, 4.38, 4.09, 2.52, 5.19, 2.39, 3.66, 2.29, 2.88]
-        minor_profile = [6.33, 2.68, 3.52, 5.38, 2.60, 3.53, 2.54, 4.75, 3.98, 2.69, 3.34, 3.17]
-        
-        note_names = ['C', 'C#', 'D', 'D#', 'E', 'F', 'F#', 'G', 'G#', 'A', 'A#', 'B']
-        
-        best_correlation = -1
-        best_key = None
-        
-        # Try all 24 keys
-        for shift in range(12):
-            # Rotate pitch class counts
-            rotated = pitch_class_counts[shift:] + pitch_class_counts[:shift]
-            
-            # Correlate with major profile
-            major_corr = np.corrcoef(rotated, major_profile)[0, 1]
-            if major_corr > best_correlation:
-                best_correlation = major_corr
-                best_key = f"{note_names[shift]} major"
-            
-            # Correlate with minor profile
-            minor_corr = np.corrcoef(rotated, minor_profile)[0, 1]
-            if minor_corr > best_correlation:
-                best_correlation = minor_corr
-                best_key = f"{note_names[shift]} minor"
-        
-        return best_key if best_correlation > 0.6 else None
+        pitches, starts, ends, _ = note_arrays(notes)
+        key = estimate_key_from_arrays(pitches, starts, ends)
+
+        return key.name if key and key.correlation > 0.6 else None
         
     except Exception:
         return None
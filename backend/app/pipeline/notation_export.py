@@ -9,10 +9,14 @@ from pathlib import Path
 from typing import Optional, Dict, Any
 import logging
 import pretty_midi
-import music21
+
+from app.core.lazy import lazy_import
 
 logger = logging.getLogger(__name__)
 
+# Imported on first export, not at startup
+music21 = lazy_import("music21")
+
 async def export_to_musicxml(
     midi_path: Path,
     output_path: Path,
@@ -344,19 +344,34 @@ def reharmonize_progression(
 import asyncio
 
 
-async def suggest_reharmonizations_async(chord_dict: Dict, key: str) -> List[ReharmonizationSuggestion]:
+async def suggest_reharmonizations_async(
+    chord_dict: Dict,
+    key: str,
+    previous_chord: Optional[Tuple[str, str]] = None,
+    next_chord: Optional[Tuple[str, str]] = None,
+    mode: str = "major"
+) -> List[Dict]:
     """
     Async wrapper for generating reharmonization suggestions for a single chord.
 
     Args:
         chord_dict: Dict with 'root' and 'quality' keys
-        key: Musical key context
+        key: Key tonic only (e.g. "C", not "C major")
+        previous_chord: Optional (root, quality) for voice leading analysis
+        next_chord: Optional (root, quality) for voice leading analysis
+        mode: "major" or "minor"
 
     Returns:
-        List of reharmonization suggestions
+        List of reharmonization option dicts
     """
     def _suggest():
-        return get_all_reharmonizations_for_chord(chord_dict, key)
+        return get_all_reharmonizations_for_chord(
+            chord_dict,
+            key,
+            previous_chord=previous_chord,
+            next_chord=next_chord,
+            mode=mode
+        )
 
     loop = asyncio.get_event_loop()
     return await loop.run_in_executor(None, _suggest)
@@ -372,7 +387,8 @@ def get_all_reharmonizations_for_chord(
     previous_chord: Optional[Tuple[str, str]] = None,
     next_chord: Optional[Tuple[str, str]] = None,
     genre: str = "jazz",
-    max_options: int = 10
+    max_options: int = 10,
+    mode: str = "major"
 ) -> List[Dict]:
     """
     CRITICAL MISSING FUNCTION - Now implemented via Phase 6 orchestrator.
@@ -383,11 +399,12 @@ def get_all_reharmonizations_for_chord(
 
     Args:
         chord_dict: Dict with 'root' and 'quality' keys
-        key: Musical key context
+        key: Key tonic only (e.g. "C", not "C major")
         previous_chord: Optional (root, quality) for voice leading analysis
         next_chord: Optional (root, quality) for voice leading analysis
         genre: Musical genre for style constraints
         max_options: Maximum number of options to return
+        mode: "major" or "minor"
 
     Returns:
         List of reharmonization option dicts
@@ -401,7 +418,8 @@ def get_all_reharmonizations_for_chord(
             previous_chord=previous_chord,
             next_chord=next_chord,
             genre=genre,
-            max_options=max_options
+            max_options=max_options,
+            mode=mode
         )
     except ImportError:
         # Fallback: use basic reharmonization from this module
@@ -445,43 +463,38 @@ async def reharmonize_progression_globally(
     """
     NEW - Optimize entire progression with global constraints.
 
-    Uses dynamic programming-style optimization to find best combination
-    of substitutions across the entire progression.
+    Builds a lattice of substitution candidates per chord and decodes the
+    best path with Viterbi, so each choice accounts for voice leading and
+    harmonic-function flow into its neighbours (see reharmonization_lattice).
 
     Args:
         progression: List of (root, quality) tuples
         key: Musical key
         genre: Musical genre for constraints
-        preserve_cadences: Maintain authentic/plagal/half cadences
+        preserve_cadences: Maintain authentic/plagal cadences and the final chord
         max_options_per_chord: Max options to consider per chord
 
     Returns:
         Optimized progression with metadata
     """
+    from app.pipeline.reharmonization_lattice import optimize_reharmonization
+
     def _optimize():
-        result = []
+        paths, positions = optimize_reharmonization(
+            progression,
+            key,
+            genre=genre,
+            preserve_cadences=preserve_cadences,
+            max_options_per_chord=max_options_per_chord,
+        )
+        if not paths:
+            return []
 
-        for i, (root, quality) in enumerate(progression):
-            prev_chord = progression[i - 1] if i > 0 else None
-            next_chord = progression[i + 1] if i < len(progression) - 1 else None
-
-            # Get options for this chord
-            chord_dict = {'root': root, 'quality': quality}
-            options = get_all_reharmonizations_for_chord(
-                chord_dict,
-                key,
-                previous_chord=prev_chord,
-                next_chord=next_chord,
-                genre=genre,
-                max_options=max_options_per_chord
-            )
-
-            # Select best option (highest score)
-            best_option = max(options, key=lambda x: x.get('score', 0)) if options else None
-
-            # If preserving cadences and this is end of progression, keep original
-            if preserve_cadences and i == len(progression) - 1:
-                best_option = {
+        result = []
+        for i, ((root, quality), selected) in enumerate(zip(progression, paths[0].chords)):
+            constraint = positions[i]['constraint']
+            if constraint == 'pinned':
+                selected = {
                     'new_root': root,
                     'new_quality': quality,
                     'technique': 'original',
@@ -492,8 +505,9 @@ async def reharmonize_progression_globally(
             result.append({
                 'chord_index': i,
                 'original': (root, quality),
-                'selected': best_option if best_option else {'new_root': root, 'new_quality': quality},
-                'options': options
+                'selected': selected,
+                'options': positions[i]['options'][1:],
+                'constraint': constraint
             })
 
         return result
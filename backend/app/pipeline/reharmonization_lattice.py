@@ -0,0 +1,403 @@
+"""
+Reharmonization Lattice
+
+Whole-progression reharmonization as a shortest-path problem:
+- Nodes: the original chord plus scored substitution candidates at each position
+- Node weights: the orchestrator's per-option quality score
+- Edge weights: pairwise voice-leading smoothness (pitch-class distance) and
+  harmonic-function flow (T/S/D), computed as dense matrices per chord pair
+- Decoding: k-best Viterbi, with cadence arrival chords pinned and cadence
+  approach chords restricted to their original harmonic function
+
+Candidate generation goes through the orchestrator's scored-options cache, so
+repeated chords in a song are scored once instead of once per occurrence.
+"""
+
+import re
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Dict, List, Sequence, Tuple
+
+import numpy as np
+
+from app.pipeline.reharmonization_orchestrator import (
+    _BoundedCache,
+    _copy_option_dict,
+    _get_passing_chord_options,
+    _option_to_dict,
+    _score_reharmonization_option,
+    clear_caches,
+    get_all_reharmonizations_for_chord,
+)
+from app.theory.interval_utils import NOTE_TO_SEMITONE
+
+
+# Score given to keeping the original chord (orchestrator options range ~0.5-0.9)
+ORIGINAL_CHORD_SCORE = 0.7
+
+# Relative weight of node (option quality) vs edge (transition) scores
+NODE_WEIGHT = 1.0
+EDGE_WEIGHTS = {
+    'voice_leading': 0.6,
+    'harmonic_function': 0.4,
+}
+
+# Harmonic function indices for the transition table
+FUNCTION_INDEX = {'T': 0, 'S': 1, 'D': 2, 'C': 3}
+
+# Transition desirability, rows = from, cols = to (T, S, D, chromatic)
+FUNCTION_TRANSITIONS = np.array([
+    [0.7, 0.9, 0.8, 0.6],  # T -> T/S/D/C
+    [0.7, 0.7, 1.0, 0.6],  # S -> ...
+    [1.0, 0.3, 0.7, 0.6],  # D -> T resolves, D -> S is a retrogression
+    [0.6, 0.6, 0.6, 0.6],  # Chromatic chords are neutral
+])
+
+# Fallback interval sets when a quality is not in the chord library
+_QUALITY_INTERVALS_FALLBACK = {
+    'm': (0, 3, 7), 'min': (0, 3, 7), 'dim': (0, 3, 6), 'aug': (0, 4, 8),
+    '7': (0, 4, 7, 10), 'maj7': (0, 4, 7, 11), 'm7': (0, 3, 7, 10),
+    'dim7': (0, 3, 6, 9), 'm7b5': (0, 3, 6, 10), 'sus4': (0, 5, 7),
+}
+
+# Circular pitch-class distance matrix (0-6 semitones)
+_PC = np.arange(12)
+_PC_DISTANCE = np.minimum((_PC[:, None] - _PC[None, :]) % 12, (_PC[None, :] - _PC[:, None]) % 12).astype(np.float64)
+
+
+@dataclass
+class LatticePath:
+    """One decoded reharmonization of the whole progression"""
+    score: float
+    chords: List[Dict[str, Any]] = field(default_factory=list)
+
+
+# ============================================================================
+# MEMOIZED CANDIDATE GENERATION
+# ============================================================================
+
+def _hashable(quality: Any) -> Any:
+    """Some substitution helpers return note lists as the quality; make them cache keys"""
+    return tuple(quality) if isinstance(quality, list) else quality
+
+
+def _candidate_options(root: str, quality: Any, tonic: str, mode: str, genre: str, max_options: int) -> List[Dict]:
+    """Context-free substitution candidates for a chord (cached by the orchestrator, returned as copies)"""
+    quality = list(quality) if isinstance(quality, tuple) else quality
+    return get_all_reharmonizations_for_chord(
+        {'root': root, 'quality': quality},
+        tonic,
+        genre=genre,
+        max_options=max_options,
+        mode=mode,
+    )
+
+
+# Scored passing/approach options per (chord, next chord, key, genre)
+_approach_cache = _BoundedCache(maxsize=2048)
+
+
+def _approach_options(root: str, quality: Any, next_root: str, next_quality: Any, key: str, genre: str) -> List[Dict]:
+    """Passing/approach candidates, which only exist relative to the following chord"""
+    cache_key = (root, quality, next_root, next_quality, key, genre)
+    cached = _approach_cache.get(cache_key)
+    if cached is None:
+        options = _get_passing_chord_options(root, quality, (next_root, next_quality), genre)
+        for option in options:
+            _score_reharmonization_option(
+                option,
+                original=(root, quality),
+                previous_chord=None,
+                next_chord=None,
+                key=key,
+                genre=genre,
+            )
+        cached = tuple(_option_to_dict(option) for option in options)
+        _approach_cache.put(cache_key, cached)
+
+    return [_copy_option_dict(option) for option in cached]
+
+
+@lru_cache(maxsize=4096)
+def _pitch_class_vector(root: str, quality: Any) -> Tuple[float, ...]:
+    """12-dim binary pitch-class vector for a chord"""
+    vector = [0.0] * 12
+
+    # Quality given as explicit notes (e.g. ('G#4', 'B4', 'D5'))
+    if isinstance(quality, tuple):
+        for note in quality:
+            name = re.match(r'^([A-G][#b]?)', str(note))
+            if name and name.group(1) in NOTE_TO_SEMITONE:
+                vector[NOTE_TO_SEMITONE[name.group(1)]] = 1.0
+        if any(vector):
+            return tuple(vector)
+
+    root_pc = NOTE_TO_SEMITONE.get(_clean_root(root))
+    if root_pc is None:
+        return tuple(vector)
+
+    intervals = None
+    try:
+        from app.theory.chord_types import get_chord_type
+        intervals = get_chord_type(quality).intervals
+    except (ValueError, TypeError, AttributeError):
+        intervals = _QUALITY_INTERVALS_FALLBACK.get(quality, (0, 4, 7))
+
+    for interval in intervals:
+        vector[(root_pc + interval) % 12] = 1.0
+    return tuple(vector)
+
+
+@lru_cache(maxsize=4096)
+def _function_index(root: str, quality: Any, tonic: str, mode: str) -> int:
+    """Map a chord to T/S/D/chromatic for the transition table"""
+    from app.pipeline.harmonic_function_analyzer import HarmonicFunction, analyze_chord_function
+
+    if isinstance(quality, tuple) or _clean_root(root) not in NOTE_TO_SEMITONE:
+        return FUNCTION_INDEX['C']
+
+    analysis = analyze_chord_function({'root': _clean_root(root), 'quality': quality}, tonic, mode)
+    return {
+        HarmonicFunction.TONIC: FUNCTION_INDEX['T'],
+        HarmonicFunction.SUBDOMINANT: FUNCTION_INDEX['S'],
+        HarmonicFunction.DOMINANT: FUNCTION_INDEX['D'],
+        HarmonicFunction.SECONDARY_DOMINANT: FUNCTION_INDEX['D'],
+        HarmonicFunction.BORROWED: FUNCTION_INDEX['S'],
+    }.get(analysis.function, FUNCTION_INDEX['C'])
+
+
+def clear_candidate_cache() -> None:
+    """Reset memoized candidates (e.g. after changing scoring weights)"""
+    clear_caches()
+    _approach_cache.clear()
+
+
+# ============================================================================
+# EDGE WEIGHTS
+# ============================================================================
+
+def transition_matrix(
+    prev_pcs: np.ndarray,
+    cur_pcs: np.ndarray,
+    prev_functions: np.ndarray,
+    cur_functions: np.ndarray
+) -> np.ndarray:
+    """
+    Score every (previous candidate, current candidate) transition at once.
+
+    Voice leading: each note moves to the nearest note of the other chord
+    (both directions, averaged), mapped to [0, 1] where 1 = all common tones.
+
+    Args:
+        prev_pcs: (n_prev, 12) binary pitch-class matrix
+        cur_pcs: (n_cur, 12) binary pitch-class matrix
+        prev_functions: (n_prev,) indices into FUNCTION_TRANSITIONS
+        cur_functions: (n_cur,) indices into FUNCTION_TRANSITIONS
+
+    Returns:
+        (n_prev, n_cur) transition scores
+    """
+    # nearest[j, a] = distance from pitch class a to the closest note of chord j
+    nearest_cur = np.where(cur_pcs[:, None, :] > 0, _PC_DISTANCE[None, :, :], np.inf).min(axis=2)
+    nearest_prev = np.where(prev_pcs[:, None, :] > 0, _PC_DISTANCE[None, :, :], np.inf).min(axis=2)
+
+    prev_sizes = np.maximum(prev_pcs.sum(axis=1), 1.0)
+    cur_sizes = np.maximum(cur_pcs.sum(axis=1), 1.0)
+
+    forward = (prev_pcs @ nearest_cur.T) / prev_sizes[:, None]
+    backward = (nearest_prev @ cur_pcs.T) / cur_sizes[None, :]
+    movement = np.nan_to_num((forward + backward) / 2.0, nan=6.0, posinf=6.0)
+    voice_leading = 1.0 - movement / 6.0
+
+    function_flow = FUNCTION_TRANSITIONS[prev_functions[:, None], cur_functions[None, :]]
+
+    return EDGE_WEIGHTS['voice_leading'] * voice_leading + EDGE_WEIGHTS['harmonic_function'] * function_flow
+
+
+# ============================================================================
+# DECODING
+# ============================================================================
+
+def k_best_viterbi(
+    node_scores: Sequence[np.ndarray],
+    edge_scores: Sequence[np.ndarray],
+    k: int = 1
+) -> List[Tuple[float, List[int]]]:
+    """
+    Find the k highest-scoring paths through a layered lattice.
+
+    Args:
+        node_scores: Per-position arrays of node scores, shapes (n_t,)
+        edge_scores: Per-transition arrays, edge_scores[t] has shape (n_t, n_{t+1})
+        k: Number of paths to return
+
+    Returns:
+        List of (total score, node index per position), best first
+    """
+    if not node_scores:
+        return []
+
+    n0 = len(node_scores[0])
+    scores = np.full((n0, k), -np.inf)
+    scores[:, 0] = node_scores[0]
+    backpointers = []
+
+    for t in range(1, len(node_scores)):
+        n_prev, n_cur = scores.shape[0], len(node_scores[t])
+
+        # (n_prev * k, n_cur): every ranked partial path extended by every current node
+        extended = (scores[:, :, None] + edge_scores[t - 1][:, None, :]).reshape(n_prev * k, n_cur)
+        keep = min(k, extended.shape[0])
+        order = np.argsort(-extended, axis=0, kind='stable')[:keep]
+        best = np.take_along_axis(extended, order, axis=0)
+
+        new_scores = np.full((n_cur, k), -np.inf)
+        new_scores[:, :keep] = best.T + node_scores[t][:, None]
+
+        back = np.full((n_cur, k, 2), -1, dtype=np.int64)
+        back[:, :keep, 0] = (order // k).T
+        back[:, :keep, 1] = (order % k).T
+
+        scores = new_scores
+        backpointers.append(back)
+
+    flat = scores.ravel()
+    ranked = [i for i in np.argsort(-flat, kind='stable')[:k] if np.isfinite(flat[i])]
+
+    paths = []
+    for flat_index in ranked:
+        node, rank = divmod(int(flat_index), k)
+        path = [node]
+        for back in reversed(backpointers):
+            node, rank = back[node, rank]
+            path.append(int(node))
+        paths.append((float(flat[flat_index]), path[::-1]))
+
+    return paths
+
+
+# ============================================================================
+# ORCHESTRATION
+# ============================================================================
+
+def optimize_reharmonization(
+    progression: List[Tuple[str, str]],
+    key: str,
+    genre: str = "jazz",
+    preserve_cadences: bool = True,
+    max_options_per_chord: int = 5,
+    k: int = 1
+) -> Tuple[List[LatticePath], List[Dict[str, Any]]]:
+    """
+    Build the reharmonization lattice for a progression and decode the k best paths.
+
+    Args:
+        progression: List of (root, quality) tuples
+        key: Musical key (e.g. "C", "Am", "F# minor")
+        genre: Musical genre for candidate generation and scoring
+        preserve_cadences: Pin cadence arrivals (and the final chord) to the
+            original and keep cadence approach chords in their original function
+        max_options_per_chord: Max substitution candidates per position
+        k: Number of alternative full reharmonizations to return
+
+    Returns:
+        (paths, positions) where positions[i] holds 'options' (all candidates
+        at chord i, original first) and 'constraint' (why it was restricted)
+    """
+    if not progression:
+        return [], []
+
+    tonic, mode = parse_key(key)
+    constraints = _cadence_constraints(progression, tonic) if preserve_cadences else {}
+
+    positions = []
+    node_scores, pcs, functions = [], [], []
+
+    for i, (root, quality) in enumerate(progression):
+        quality_key = _hashable(quality)
+        original = {
+            'new_root': root,
+            'new_quality': quality,
+            'technique': 'original',
+            'score': ORIGINAL_CHORD_SCORE,
+            'explanation': 'Original chord',
+        }
+
+        options = _candidate_options(root, quality_key, tonic, mode, genre, max_options_per_chord)
+        if i < len(progression) - 1:
+            next_root, next_quality = progression[i + 1]
+            options.extend(_approach_options(root, quality_key, next_root, _hashable(next_quality), tonic, genre))
+
+        candidates = [original] + [o for o in options if _clean_root(o.get('new_root', '')) in NOTE_TO_SEMITONE]
+        candidate_functions = [
+            _function_index(c['new_root'], _hashable(c['new_quality']), tonic, mode) for c in candidates
+        ]
+
+        constraint = constraints.get(i)
+        if constraint == 'pinned':
+            keep = [0]
+        elif constraint == 'same_function':
+            keep = [j for j, f in enumerate(candidate_functions) if f == candidate_functions[0]]
+        else:
+            keep = list(range(len(candidates)))
+
+        nodes = [candidates[j] for j in keep]
+        positions.append({'options': candidates, 'constraint': constraint, 'nodes': nodes})
+        node_scores.append(NODE_WEIGHT * np.array([n.get('score', 0.0) for n in nodes], dtype=np.float64))
+        pcs.append(np.array([_pitch_class_vector(_clean_root(n['new_root']), _hashable(n['new_quality'])) for n in nodes]))
+        functions.append(np.array([candidate_functions[j] for j in keep], dtype=np.int64))
+
+    edge_scores = [
+        transition_matrix(pcs[t], pcs[t + 1], functions[t], functions[t + 1])
+        for t in range(len(progression) - 1)
+    ]
+
+    paths = [
+        LatticePath(score=score, chords=[positions[t]['nodes'][node] for t, node in enumerate(path)])
+        for score, path in k_best_viterbi(node_scores, edge_scores, k=k)
+    ]
+
+    for position in positions:
+        del position['nodes']
+
+    return paths, positions
+
+
+def _cadence_constraints(progression: List[Tuple[str, str]], tonic: str) -> Dict[int, str]:
+    """Positions restricted by cadences: arrivals pinned, approaches keep their function"""
+    from app.pipeline.reharmonization_engine import preserve_cadence_structure
+
+    constraints: Dict[int, str] = {}
+    try:
+        cadences = preserve_cadence_structure(
+            [(_clean_root(r), q) for r, q in progression], tonic
+        )['cadences']
+    except ValueError:
+        cadences = []
+
+    for cadence in cadences:
+        if cadence['type'] in ('authentic', 'plagal'):
+            constraints[cadence['position'] + 1] = 'pinned'
+            constraints.setdefault(cadence['position'], 'same_function')
+
+    # The final chord always closes the phrase
+    constraints[len(progression) - 1] = 'pinned'
+    return constraints
+
+
+def parse_key(key: str) -> Tuple[str, str]:
+    """Split "C", "Am", "F# minor", "Eb major" into (tonic, mode)"""
+    match = re.match(r'^\s*([A-Ga-g][#b]?)\s*(.*)$', key or '')
+    if not match:
+        return 'C', 'major'
+
+    tonic = match.group(1)[0].upper() + match.group(1)[1:]
+    rest = match.group(2).strip().lower()
+    mode = 'minor' if rest.startswith(('m', 'min')) and not rest.startswith('maj') else 'major'
+    return tonic, mode
+
+
+def _clean_root(root: str) -> str:
+    """Strip quality markers some helpers leave on the root (e.g. 'D#m' -> 'D#')"""
+    match = re.match(r'^([A-G][#b]?)', root or '')
+    return match.group(1) if match else ''
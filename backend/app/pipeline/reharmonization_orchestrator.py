@@ -11,10 +11,11 @@ This module completes the missing `get_all_reharmonizations_for_chord()` functio
 that reharmonization_engine.py's async wrapper calls.
 """
 
-from typing import List, Dict, Optional, Tuple, Any
-from dataclasses import dataclass, field
+from typing import List, Dict, Optional, Tuple, Any, Hashable
+from dataclasses import dataclass, field, replace
+from collections import OrderedDict
 import asyncio
-from functools import lru_cache
+import threading
 
 from app.theory.interval_utils import note_to_semitone, semitone_to_note
 
@@ -64,7 +65,8 @@ def get_all_reharmonizations_for_chord(
     next_chord: Optional[Tuple[str, str]] = None,
     genre: str = "jazz",
     max_options: int = 10,
-    min_score: float = 0.5
+    min_score: float = 0.5,
+    mode: str = "major"
 ) -> List[Dict[str, Any]]:
     """
     CRITICAL MISSING FUNCTION - Main orchestration entry point.
@@ -74,12 +76,13 @@ def get_all_reharmonizations_for_chord(
 
     Args:
         chord_dict: Dict with 'root' and 'quality' keys
-        key: Musical key context
+        key: Key tonic only (e.g. "C", not "C major"); pass the mode separately
         previous_chord: Optional (root, quality) tuple for voice leading analysis
         next_chord: Optional (root, quality) tuple for voice leading analysis
         genre: Musical genre for style constraints
         max_options: Maximum number of options to return
         min_score: Minimum quality score threshold (0-1)
+        mode: "major" or "minor" (key is the tonic only)
 
     Returns:
         List of dicts with reharmonization options, sorted by score
@@ -90,33 +93,48 @@ def get_all_reharmonizations_for_chord(
     if not root:
         return []
 
-    # Collect options from all Phase 4 categories
-    options = []
-
-    # 1. Modal Interchange
-    options.extend(_get_modal_interchange_options(root, quality, key, genre))
-
-    # 2. Diatonic Substitution
-    options.extend(_get_diatonic_substitution_options(root, quality, key))
+    cache_key = (
+        root,
+        _freeze(quality),
+        key,
+        _freeze(previous_chord),
+        _freeze(next_chord),
+        genre,
+        mode,
+    )
+    ranked = _scored_options_cache.get(cache_key)
+    if ranked is None:
+        ranked = _score_all_options(root, quality, key, previous_chord, next_chord, genre, mode)
+        _scored_options_cache.put(cache_key, ranked)
 
-    # 3. Negative Harmony (if genre allows)
-    if genre in ['jazz', 'neosoul']:
-        options.extend(_get_negative_harmony_options(root, quality, key))
+    # Filter by minimum score and limit results
+    return [_copy_option_dict(opt) for opt in ranked if opt['score'] >= min_score][:max_options]
 
-    # 4. Tritone Substitution (for dominant 7th chords)
-    options.extend(_get_tritone_substitution_options(root, quality))
 
-    # 5. Common Tone Diminished
-    options.extend(_get_common_tone_diminished_options(root, quality))
+def _score_all_options(
+    root: str,
+    quality: str,
+    key: str,
+    previous_chord: Optional[Tuple[str, str]],
+    next_chord: Optional[Tuple[str, str]],
+    genre: str,
+    mode: str = "major"
+) -> Tuple[Dict[str, Any], ...]:
+    """Generate, score and rank every option for a chord in context (uncached)"""
+    # Context-free candidates are shared by every occurrence of the chord
+    candidates_key = (root, _freeze(quality), key, genre, mode)
+    candidates = _candidate_cache.get(candidates_key)
+    if candidates is None:
+        candidates = tuple(_generate_candidates(root, quality, key, genre, mode))
+        _candidate_cache.put(candidates_key, candidates)
+
+    # Copy so scoring never mutates the cached candidates
+    options = [replace(option) for option in candidates]
 
     # 6. Passing/Approach Chords (if next_chord provided)
     if next_chord:
         options.extend(_get_passing_chord_options(root, quality, next_chord, genre))
 
-    # 7. Coltrane Changes (for jazz genre)
-    if genre == 'jazz':
-        options.extend(_get_coltrane_changes_options(root, quality))
-
     # Score all options
     for option in options:
         _score_reharmonization_option(
@@ -128,17 +146,38 @@ def get_all_reharmonizations_for_chord(
             genre=genre
         )
 
-    # Filter by minimum score
-    options = [opt for opt in options if opt.score >= min_score]
-
     # Rank by score (descending)
     options.sort(key=lambda x: x.score, reverse=True)
 
-    # Limit results
-    options = options[:max_options]
-
     # Convert to dict format for API
-    return [_option_to_dict(opt) for opt in options]
+    return tuple(_option_to_dict(opt) for opt in options)
+
+
+def _generate_candidates(root: str, quality: str, key: str, genre: str, mode: str = "major") -> List[ReharmonizationOption]:
+    """Collect options from the Phase 4 categories that don't depend on neighbouring chords"""
+    options = []
+
+    # 1. Modal Interchange
+    options.extend(_get_modal_interchange_options(root, quality, key, genre))
+
+    # 2. Diatonic Substitution
+    options.extend(_get_diatonic_substitution_options(root, quality, key, mode))
+
+    # 3. Negative Harmony (if genre allows)
+    if genre in ['jazz', 'neosoul']:
+        options.extend(_get_negative_harmony_options(root, quality, key, mode))
+
+    # 4. Tritone Substitution (for dominant 7th chords)
+    options.extend(_get_tritone_substitution_options(root, quality))
+
+    # 5. Common Tone Diminished
+    options.extend(_get_common_tone_diminished_options(root, quality))
+
+    # 7. Coltrane Changes (for jazz genre)
+    if genre == 'jazz':
+        options.extend(_get_coltrane_changes_options(root, quality))
+
+    return options
 
 
 def _option_to_dict(option: ReharmonizationOption) -> Dict[str, Any]:
@@ -226,9 +265,10 @@ def _get_modal_interchange_options(
 def _get_diatonic_substitution_options(
     root: str,
     quality: str,
-    key: str
+    key: str,
+    mode: str = "major"
 ) -> List[ReharmonizationOption]:
-    """Get diatonic substitution options from Phase 4"""
+    """Get diatonic substitution options from Phase 4 (key is the tonic only, e.g. "C")"""
     options = []
 
     try:
@@ -255,8 +295,15 @@ def _get_diatonic_substitution_options(
         root_sem = note_to_semitone(root)
         interval = (root_sem - key_sem) % 12
 
-        # I ↔ vi
-        if interval == 0:
+        # I ↔ vi in major, i ↔ bIII in minor
+        if interval == 0 and mode == 'minor':
+            options.append(ReharmonizationOption(
+                new_root=semitone_to_note((key_sem + 3) % 12),
+                new_quality='maj7',
+                technique='diatonic_substitution',
+                explanation="bIII chord (relative major)"
+            ))
+        elif interval == 0:
             options.append(ReharmonizationOption(
                 new_root=semitone_to_note((key_sem + 9) % 12),
                 new_quality='m7',
@@ -270,7 +317,8 @@ def _get_diatonic_substitution_options(
 def _get_negative_harmony_options(
     root: str,
     quality: str,
-    key: str
+    key: str,
+    mode: str = "major"
 ) -> List[ReharmonizationOption]:
     """Get negative harmony options from Phase 4"""
     options = []
@@ -278,7 +326,7 @@ def _get_negative_harmony_options(
     try:
         from app.theory.chord_substitutions import get_negative_harmony_chord
 
-        neg_chord = get_negative_harmony_chord(root, quality, key)
+        neg_chord = get_negative_harmony_chord(root, quality, key, key_quality=mode)
 
         if neg_chord and isinstance(neg_chord, (tuple, list)) and len(neg_chord) >= 2:
             options.append(ReharmonizationOption(
@@ -665,11 +713,84 @@ def _calculate_complexity_score(technique: str) -> float:
 # CACHING
 # ============================================================================
 
-@lru_cache(maxsize=128)
-def _cached_analysis(root: str, quality: str, key: str, context: str) -> Dict:
-    """Cache expensive analysis operations"""
-    # Placeholder for caching layer
-    return {}
+class _BoundedCache:
+    """Thread-safe LRU cache with hit/miss counters"""
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Any:
+        with self._lock:
+            if key in self._data:
+                self._data.move_to_end(key)
+                self.hits += 1
+                return self._data[key]
+            self.misses += 1
+            return None
+
+    def put(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            'size': len(self._data),
+            'maxsize': self.maxsize,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': round(self.hits / lookups, 4) if lookups else 0.0,
+        }
+
+
+# Unscored candidates per (root, quality, key, genre)
+_candidate_cache = _BoundedCache(maxsize=1024)
+
+# Scored, ranked option dicts per (root, quality, key, prev, next, genre)
+_scored_options_cache = _BoundedCache(maxsize=4096)
+
+
+def _freeze(value: Any) -> Hashable:
+    """Make chord tuples/qualities usable as cache keys (some qualities are note lists)"""
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+def _copy_option_dict(option: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy a cached option so callers can mutate the result freely"""
+    return {
+        **option,
+        'scores': dict(option['scores']),
+        'voice_leading': dict(option['voice_leading']),
+    }
+
+
+def get_cache_stats() -> Dict[str, Dict[str, Any]]:
+    """Hit-rate statistics for the reharmonization caches"""
+    return {
+        'candidates': _candidate_cache.stats(),
+        'scored_options': _scored_options_cache.stats(),
+    }
+
+
+def clear_caches() -> None:
+    """Drop all cached candidates and scores (e.g. after changing scoring weights)"""
+    _candidate_cache.clear()
+    _scored_options_cache.clear()
 
 
 # ============================================================================
@@ -679,4 +800,6 @@ def _cached_analysis(root: str, quality: str, key: str, context: str) -> Dict:
 __all__ = [
     'get_all_reharmonizations_for_chord',
     'ReharmonizationOption',
+    'get_cache_stats',
+    'clear_caches',
 ]
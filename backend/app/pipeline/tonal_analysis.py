@@ -0,0 +1,383 @@
+"""
+Tonal Analysis
+
+Fast key and meter estimation from transcribed note arrays:
+- Key: correlation of duration-weighted pitch-class histograms against
+  Krumhansl-Kessler or Temperley key profiles (all 24 keys in one matrix product)
+- Key timeline: the same estimate over sliding windows, merged into segments
+- Meter: autocorrelation of an accent-weighted onset envelope at 2/3/4-beat lags
+
+Replaces a full music21 parse for the pipeline's key/time-signature step;
+music21 remains available as an opt-in deep analysis (see MusicTheoryService).
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+
+NOTE_NAMES = ['C', 'C#', 'D', 'D#', 'E', 'F', 'F#', 'G', 'G#', 'A', 'A#', 'B']
+
+# (major, minor) profiles, index 0 = tonic
+KEY_PROFILES = {
+    'krumhansl': (
+        [6.35, 2.23, 3.48, 2.33, 4.38, 4.09, 2.52, 5.19, 2.39, 3.66, 2.29, 2.88],
+        [6.33, 2.68, 3.52, 5.38, 2.60, 3.53, 2.54, 4.75, 3.98, 2.69, 3.34, 3.17],
+    ),
+    'temperley': (
+        [5.0, 2.0, 3.5, 2.0, 4.5, 4.0, 2.0, 4.5, 2.0, 3.5, 1.5, 4.0],
+        [5.0, 2.0, 3.5, 4.5, 2.0, 4.0, 2.0, 4.5, 3.5, 2.0, 1.5, 4.0],
+    ),
+}
+
+# Onset envelope resolution for meter estimation (seconds)
+ENVELOPE_RESOLUTION = 0.01
+
+# Beat periods considered when no tempo is given (200 - 50 BPM)
+MIN_BEAT_PERIOD = 0.3
+MAX_BEAT_PERIOD = 1.2
+
+
+@dataclass(frozen=True)
+class KeyEstimate:
+    """Best-matching key and its profile correlation"""
+    tonic: str
+    mode: str            # "major" or "minor"
+    correlation: float   # Pearson correlation with the key profile (-1..1)
+
+    @property
+    def name(self) -> str:
+        return f"{self.tonic} {self.mode}"
+
+
+@dataclass(frozen=True)
+class KeySegment:
+    """A stretch of the piece assigned to one key"""
+    start: float
+    end: float
+    key: KeyEstimate
+
+
+@dataclass(frozen=True)
+class MeterEstimate:
+    """Estimated time signature"""
+    beats_per_bar: int
+    beat_unit: int
+    beat_period: float   # Seconds per beat
+    confidence: float    # 0-1, how clearly one grouping beat the other
+
+    @property
+    def time_signature(self) -> str:
+        return f"{self.beats_per_bar}/{self.beat_unit}"
+
+
+# ============================================================================
+# NOTE ARRAYS
+# ============================================================================
+
+def note_arrays(notes: Sequence) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Convert NoteEvents (pitch, start_time, end_time, velocity) to parallel arrays.
+
+    Returns:
+        (pitches, starts, ends, velocities)
+    """
+    count = len(notes)
+    pitches = np.fromiter((n.pitch for n in notes), dtype=np.int64, count=count)
+    starts = np.fromiter((n.start_time for n in notes), dtype=np.float64, count=count)
+    ends = np.fromiter((n.end_time for n in notes), dtype=np.float64, count=count)
+    velocities = np.fromiter((n.velocity for n in notes), dtype=np.float64, count=count)
+    return pitches, starts, ends, velocities
+
+
+# ============================================================================
+# KEY ESTIMATION
+# ============================================================================
+
+def _key_templates(profile: str) -> np.ndarray:
+    """
+    (24, 12) z-normalized templates ordered C major, C minor, C# major, ...
+
+    Interleaving major/minor per tonic keeps the legacy tie-breaking order.
+    """
+    major, minor = KEY_PROFILES[profile]
+    templates = np.array([
+        np.roll(base, shift)
+        for shift in range(12)
+        for base in (major, minor)
+    ], dtype=np.float64)
+    return _zscore(templates)
+
+
+def _zscore(rows: np.ndarray) -> np.ndarray:
+    """Row-wise zero-mean unit-variance; constant rows become zeros"""
+    centered = rows - rows.mean(axis=-1, keepdims=True)
+    std = centered.std(axis=-1, keepdims=True)
+    return np.divide(centered, std, out=np.zeros_like(centered), where=std > 0)
+
+
+def _template_key(index: int, correlation: float) -> KeyEstimate:
+    return KeyEstimate(
+        tonic=NOTE_NAMES[index // 2],
+        mode='major' if index % 2 == 0 else 'minor',
+        correlation=round(float(correlation), 4),
+    )
+
+
+def key_correlations(histograms: np.ndarray, profile: str = 'krumhansl') -> np.ndarray:
+    """
+    Correlate pitch-class histograms with all 24 key profiles.
+
+    Args:
+        histograms: (12,) or (n, 12) pitch-class weights
+        profile: 'krumhansl' or 'temperley'
+
+    Returns:
+        (24,) or (n, 24) Pearson correlations in template order
+    """
+    return _zscore(np.asarray(histograms, dtype=np.float64)) @ _key_templates(profile).T / 12.0
+
+
+def pitch_class_histogram(pitches: np.ndarray, starts: np.ndarray, ends: np.ndarray) -> np.ndarray:
+    """Total sounding time per pitch class"""
+    return np.bincount(pitches % 12, weights=np.maximum(ends - starts, 0.0), minlength=12)
+
+
+def estimate_key_from_arrays(
+    pitches: np.ndarray,
+    starts: np.ndarray,
+    ends: np.ndarray,
+    profile: str = 'krumhansl'
+) -> Optional[KeyEstimate]:
+    """
+    Estimate the global key of a set of notes.
+
+    Returns:
+        Best KeyEstimate, or None if there are no sounding notes
+    """
+    histogram = pitch_class_histogram(pitches, starts, ends)
+    if not histogram.any():
+        return None
+
+    scores = key_correlations(histogram, profile)
+    best = int(np.argmax(scores))
+    return _template_key(best, scores[best])
+
+
+def _cumulative_pitch_class_time(
+    pitches: np.ndarray,
+    starts: np.ndarray,
+    ends: np.ndarray,
+    times: np.ndarray
+) -> np.ndarray:
+    """
+    Sounding time per pitch class accumulated from 0 up to each time.
+
+    For one pitch class, time sounded before t is
+    sum(t - start for starts <= t) - sum(t - end for ends <= t),
+    which sorted starts/ends and prefix sums give for every t at once.
+
+    Returns:
+        (len(times), 12)
+    """
+    result = np.zeros((len(times), 12))
+    pitch_classes = pitches % 12
+
+    for pc in range(12):
+        mask = pitch_classes == pc
+        if not mask.any():
+            continue
+
+        for edges, sign in ((np.sort(starts[mask]), 1.0), (np.sort(ends[mask]), -1.0)):
+            prefix = np.concatenate(([0.0], np.cumsum(edges)))
+            count = np.searchsorted(edges, times, side='right')
+            result[:, pc] += sign * (count * times - prefix[count])
+
+    return result
+
+
+def key_timeline(
+    pitches: np.ndarray,
+    starts: np.ndarray,
+    ends: np.ndarray,
+    window: float = 8.0,
+    hop: float = 2.0,
+    profile: str = 'krumhansl'
+) -> List[KeySegment]:
+    """
+    Estimate the key over time with a sliding window.
+
+    Each hop-length frame takes the key of the window centred on it;
+    consecutive frames with the same key are merged into one segment.
+
+    Args:
+        pitches, starts, ends: Note arrays
+        window: Analysis window length in seconds
+        hop: Frame length in seconds
+        profile: 'krumhansl' or 'temperley'
+
+    Returns:
+        Key segments in time order (frames with no sounding notes are skipped)
+    """
+    if len(pitches) == 0:
+        return []
+
+    total = float(ends.max())
+    frame_starts = np.arange(0.0, total, hop)
+    centers = frame_starts + hop / 2.0
+
+    window_starts = np.clip(centers - window / 2.0, 0.0, None)
+    window_ends = centers + window / 2.0
+    cumulative = _cumulative_pitch_class_time(pitches, starts, ends, np.concatenate([window_starts, window_ends]))
+    histograms = cumulative[len(centers):] - cumulative[:len(centers)]
+
+    scores = key_correlations(histograms, profile)
+    best = scores.argmax(axis=1)
+    sounding = histograms.sum(axis=1) > 0
+
+    segments: List[KeySegment] = []
+    run: Optional[list] = None  # [start, end, template index, frame scores]
+    for i in np.flatnonzero(sounding):
+        frame_start = float(frame_starts[i])
+        frame_end = min(frame_start + hop, total)
+        score = float(scores[i, best[i]])
+
+        if run and run[2] == best[i] and np.isclose(run[1], frame_start):
+            run[1] = frame_end
+            run[3].append(score)
+            continue
+
+        if run:
+            segments.append(KeySegment(run[0], run[1], _template_key(run[2], np.mean(run[3]))))
+        run = [frame_start, frame_end, int(best[i]), [score]]
+
+    if run:
+        segments.append(KeySegment(run[0], run[1], _template_key(run[2], np.mean(run[3]))))
+
+    return segments
+
+
+# ============================================================================
+# METER ESTIMATION
+# ============================================================================
+
+def _onset_envelope(starts: np.ndarray, ends: np.ndarray, velocities: np.ndarray) -> np.ndarray:
+    """Accent-weighted onset envelope: louder and longer notes weigh more"""
+    bins = np.round(starts / ENVELOPE_RESOLUTION).astype(np.int64)
+    weights = (velocities / 127.0) * np.minimum(ends - starts, 2.0)
+    envelope = np.bincount(bins, weights=weights)
+
+    # Tolerate +-20ms timing jitter
+    return np.convolve(envelope, np.ones(5), mode='same')
+
+
+def _autocorrelation(signal: np.ndarray) -> np.ndarray:
+    """Normalized autocorrelation via FFT"""
+    centered = signal - signal.mean()
+    size = 1 << int(np.ceil(np.log2(2 * len(centered))))
+    spectrum = np.fft.rfft(centered, size)
+    ac = np.fft.irfft(spectrum * np.conj(spectrum), size)[:len(centered)]
+    return ac / ac[0] if ac[0] > 0 else ac
+
+
+def _peak_near(ac: np.ndarray, lag: float, tolerance: int = 3) -> float:
+    center = int(round(lag))
+    if center >= len(ac):
+        return 0.0
+    return float(ac[max(center - tolerance, 0):center + tolerance + 1].max())
+
+
+def estimate_meter(
+    starts: np.ndarray,
+    ends: np.ndarray,
+    velocities: np.ndarray,
+    tempo: Optional[float] = None
+) -> Optional[MeterEstimate]:
+    """
+    Estimate beats per bar from note onsets.
+
+    Accented onsets (downbeats) recur every bar, so the onset envelope's
+    autocorrelation peaks at 3 beats for triple meter and at 2/4 beats for
+    duple meter.
+
+    Args:
+        starts, ends, velocities: Note arrays
+        tempo: Known tempo in BPM; estimated from the envelope if omitted
+
+    Returns:
+        MeterEstimate, or None if there are too few notes
+    """
+    if len(starts) < 8:
+        return None
+
+    ac = _autocorrelation(_onset_envelope(starts, ends, velocities))
+
+    if tempo:
+        beat = 60.0 / tempo / ENVELOPE_RESOLUTION
+    else:
+        lo = int(MIN_BEAT_PERIOD / ENVELOPE_RESOLUTION)
+        hi = min(int(MAX_BEAT_PERIOD / ENVELOPE_RESOLUTION), len(ac) - 1)
+        if hi <= lo:
+            return None
+        beat = float(lo + np.argmax(ac[lo:hi + 1]))
+
+    triple = _peak_near(ac, 3 * beat)
+    duple = max(_peak_near(ac, 2 * beat), _peak_near(ac, 4 * beat))
+
+    beats_per_bar = 3 if triple > duple * 1.1 else 4
+    total = abs(triple) + abs(duple)
+    confidence = abs(triple - duple) / total if total > 0 else 0.0
+
+    return MeterEstimate(
+        beats_per_bar=beats_per_bar,
+        beat_unit=4,
+        beat_period=round(beat * ENVELOPE_RESOLUTION, 4),
+        confidence=round(float(confidence), 4),
+    )
+
+
+# ============================================================================
+# PIPELINE ENTRY POINT
+# ============================================================================
+
+def analyze_tonality(
+    notes: Sequence,
+    tempo: Optional[float] = None,
+    profile: str = 'krumhansl'
+) -> Dict[str, Any]:
+    """
+    Key, key timeline and time signature for transcribed notes.
+
+    Result keys match MusicTheoryService.analyze_score so either can feed
+    the transcription pipeline.
+
+    Args:
+        notes: NoteEvents from transcription
+        tempo: Estimated tempo in BPM, if known
+        profile: Key profile, 'krumhansl' or 'temperley'
+
+    Returns:
+        Dict with key, confidence, time_signature, time_signatures, key_timeline
+    """
+    pitches, starts, ends, velocities = note_arrays(notes)
+
+    key = estimate_key_from_arrays(pitches, starts, ends, profile) if len(pitches) else None
+    meter = estimate_meter(starts, ends, velocities, tempo)
+    time_signature = meter.time_signature if meter else "4/4"
+
+    return {
+        "key": key.name if key else None,
+        "confidence": key.correlation if key else 0.0,
+        "time_signature": time_signature,
+        "time_signatures": [time_signature],
+        "key_timeline": [
+            {
+                "start": round(segment.start, 3),
+                "end": round(segment.end, 3),
+                "key": segment.key.name,
+                "confidence": segment.key.correlation,
+            }
+            for segment in key_timeline(pitches, starts, ends, profile=profile)
+        ],
+    }
@@ -5,12 +5,15 @@ Analyzes how chords are actually voiced on piano from MIDI note data.
 Classifies voicing types and identifies chord tones vs extensions.
 """
 
-from typing import List, Dict, Optional, Tuple
+from typing import List, Dict, Optional, Sequence, Tuple, Union
 from dataclasses import dataclass
 from enum import Enum
 import asyncio
 
+import numpy as np
+
 from app.gospel import Note
+from app.gospel.note_array import NoteArray
 from app.schemas.transcription import ChordEvent
 from app.theory.interval_utils import note_to_semitone, get_interval
 from app.theory.chord_library import get_chord_notes
@@ -76,8 +79,7 @@ def group_notes_by_time(notes: List[Note], chord: ChordEvent, window: float = 0.
     """
     chord_notes = []
     # Use start_time/end_time if available, otherwise calculate from time/duration
-    chord_start = chord.start_time if chord.start_time is not None else chord.time
-    chord_end = chord.end_time if chord.end_time is not None else (chord.time + chord.duration)
+    chord_start, chord_end = _chord_bounds(chord)
 
     for note in notes:
         # Note uses time + duration (app.gospel.Note)
@@ -98,6 +100,79 @@ def group_notes_by_time(notes: List[Note], chord: ChordEvent, window: float = 0.
     return sorted(list(set(chord_notes)))
 
 
+def _chord_bounds(chord: ChordEvent) -> Tuple[float, float]:
+    """Chord start/end, preferring explicit start_time/end_time"""
+    chord_start = chord.start_time if chord.start_time is not None else chord.time
+    chord_end = chord.end_time if chord.end_time is not None else (chord.time + chord.duration)
+    return chord_start, chord_end
+
+
+def assign_notes_to_chords(
+    notes: Union[Sequence[Note], NoteArray],
+    chords: Sequence[ChordEvent],
+    window: float = 0.2
+) -> List[List[int]]:
+    """
+    Collect the pitch set sounding in every chord window in one pass.
+
+    Same overlap rule as group_notes_by_time, but notes are sorted by onset
+    once and each chord only inspects the slices of notes that can overlap it
+    (binary search on onsets, bounded by the longest note duration), instead
+    of scanning the whole note list per chord. A NoteArray is read column-wise
+    without building Note objects.
+
+    Args:
+        notes: All MIDI notes from transcription (Note list or NoteArray)
+        chords: Chord events to collect notes for
+        window: Time tolerance in seconds
+
+    Returns:
+        Sorted unique MIDI note numbers for each chord, in chord order
+    """
+    if not len(notes):
+        return [[] for _ in chords]
+
+    if isinstance(notes, NoteArray):
+        starts = notes.time.astype(np.float64)
+        ends = starts + notes.duration
+        pitches = notes.pitch.astype(np.int64)
+    else:
+        starts = np.fromiter((n.time for n in notes), dtype=np.float64, count=len(notes))
+        ends = starts + np.fromiter((n.duration for n in notes), dtype=np.float64, count=len(notes))
+        pitches = np.fromiter((n.pitch for n in notes), dtype=np.int64, count=len(notes))
+
+    order = np.argsort(starts, kind='stable')
+    starts, ends, pitches = starts[order], ends[order], pitches[order]
+    max_duration = float((ends - starts).max())
+
+    bounds = np.array([_chord_bounds(c) for c in chords], dtype=np.float64).reshape(-1, 2)
+    chord_starts, chord_ends = bounds[:, 0], bounds[:, 1]
+
+    # Onset slices per chord:
+    #   [held_lo, near_lo)   started well before the chord, included if still sounding
+    #   [near_lo, end_hi)    started within the window or during the chord, always included
+    #   [end_hi, after_hi)   started just after the chord, included if ended within the window
+    held_lo = np.searchsorted(starts, chord_starts - window - max_duration, side='left')
+    near_lo = np.searchsorted(starts, chord_starts - window, side='left')
+    end_hi = np.searchsorted(starts, chord_ends, side='right')
+    after_hi = np.searchsorted(starts, chord_ends + window, side='right')
+
+    pitch_sets = []
+    for i in range(len(chords)):
+        lo, hi = int(near_lo[i]), max(int(near_lo[i]), int(end_hi[i]))
+        held = slice(int(held_lo[i]), lo)
+        after = slice(hi, max(hi, int(after_hi[i])))
+
+        selected = [
+            pitches[lo:hi],
+            pitches[held][ends[held] >= chord_starts[i]],
+            pitches[after][ends[after] <= chord_ends[i] + window],
+        ]
+        pitch_sets.append(np.unique(np.concatenate(selected)).tolist())
+
+    return pitch_sets
+
+
 def classify_voicing_type(intervals: List[int], width: int, has_root: bool) -> VoicingType:
     """
     Classify the voicing type based on interval patterns.
@@ -273,6 +348,76 @@ def estimate_hand_span(width_semitones: int) -> float:
     return (width_semitones / 12.0) * 6.5
 
 
+def _build_voicing_info(chord: ChordEvent, midi_notes: List[int]) -> Optional[VoicingInfo]:
+    """Analyze one chord's voicing from the sorted MIDI notes assigned to it"""
+    # Parse chord symbol (e.g., "Cmaj7" -> root="C", quality="maj7")
+    chord_symbol = chord.chord
+
+    # Extract root and quality
+    # Simple parsing - assumes format like "Cmaj7", "Dm7", "G7"
+    root = chord_symbol[0]
+    if len(chord_symbol) > 1 and chord_symbol[1] in ['#', 'b']:
+        root = chord_symbol[:2]
+        quality = chord_symbol[2:]
+    else:
+        quality = chord_symbol[1:] if len(chord_symbol) > 1 else ''
+
+    if len(midi_notes) < 2:
+        return None  # Need at least 2 notes to analyze voicing
+
+    # Calculate intervals between consecutive notes
+    intervals = [midi_notes[i+1] - midi_notes[i] for i in range(len(midi_notes) - 1)]
+
+    # Total width
+    width = midi_notes[-1] - midi_notes[0]
+
+    # Identify chord tones and extensions
+    has_root, has_third, has_seventh, extensions = identify_chord_tones(
+        midi_notes, root, quality
+    )
+
+    # Classify voicing type
+    voicing_type = classify_voicing_type(intervals, width, has_root)
+
+    # Determine inversion
+    root_semitone = note_to_semitone(root)
+    bass_note_class = midi_notes[0] % 12
+
+    if bass_note_class == root_semitone:
+        inversion = 0
+    elif bass_note_class == (root_semitone + 4) % 12 or bass_note_class == (root_semitone + 3) % 12:
+        inversion = 1  # 3rd in bass
+    elif bass_note_class == (root_semitone + 7) % 12:
+        inversion = 2  # 5th in bass
+    else:
+        inversion = 1  # Assume some inversion
+
+    # Convert MIDI notes to note names
+    note_names = [midi_to_note_name(n) for n in midi_notes]
+
+    # Calculate complexity
+    complexity = calculate_complexity_score(voicing_type, len(midi_notes), extensions, width)
+
+    # Estimate hand span
+    hand_span = estimate_hand_span(width)
+
+    return VoicingInfo(
+        chord_symbol=chord_symbol,
+        voicing_type=voicing_type,
+        notes=midi_notes,
+        note_names=note_names,
+        intervals=intervals,
+        width_semitones=width,
+        inversion=inversion,
+        has_root=has_root,
+        has_third=has_third,
+        has_seventh=has_seventh,
+        extensions=extensions,
+        complexity_score=complexity,
+        hand_span_inches=hand_span
+    )
+
+
 async def analyze_voicing(
     notes: List[Note],
     chord: ChordEvent
@@ -288,99 +433,30 @@ async def analyze_voicing(
         VoicingInfo with complete analysis, or None if insufficient data
     """
     def _analyze():
-        # Parse chord symbol (e.g., "Cmaj7" -> root="C", quality="maj7")
-        chord_symbol = chord.chord
-
-        # Extract root and quality
-        # Simple parsing - assumes format like "Cmaj7", "Dm7", "G7"
-        root = chord_symbol[0]
-        if len(chord_symbol) > 1 and chord_symbol[1] in ['#', 'b']:
-            root = chord_symbol[:2]
-            quality = chord_symbol[2:]
-        else:
-            quality = chord_symbol[1:] if len(chord_symbol) > 1 else ''
-
-        # Group notes that belong to this chord
-        midi_notes = group_notes_by_time(notes, chord)
-
-        if len(midi_notes) < 2:
-            return None  # Need at least 2 notes to analyze voicing
-
-        # Calculate intervals between consecutive notes
-        intervals = [midi_notes[i+1] - midi_notes[i] for i in range(len(midi_notes) - 1)]
-
-        # Total width
-        width = midi_notes[-1] - midi_notes[0]
-
-        # Identify chord tones and extensions
-        has_root, has_third, has_seventh, extensions = identify_chord_tones(
-            midi_notes, root, quality
-        )
-
-        # Classify voicing type
-        voicing_type = classify_voicing_type(intervals, width, has_root)
-
-        # Determine inversion
-        root_semitone = note_to_semitone(root)
-        bass_note_class = midi_notes[0] % 12
-
-        if bass_note_class == root_semitone:
-            inversion = 0
-        elif bass_note_class == (root_semitone + 4) % 12 or bass_note_class == (root_semitone + 3) % 12:
-            inversion = 1  # 3rd in bass
-        elif bass_note_class == (root_semitone + 7) % 12:
-            inversion = 2  # 5th in bass
-        else:
-            inversion = 1  # Assume some inversion
-
-        # Convert MIDI notes to note names
-        note_names = [midi_to_note_name(n) for n in midi_notes]
-
-        # Calculate complexity
-        complexity = calculate_complexity_score(voicing_type, len(midi_notes), extensions, width)
-
-        # Estimate hand span
-        hand_span = estimate_hand_span(width)
-
-        return VoicingInfo(
-            chord_symbol=chord_symbol,
-            voicing_type=voicing_type,
-            notes=midi_notes,
-            note_names=note_names,
-            intervals=intervals,
-            width_semitones=width,
-            inversion=inversion,
-            has_root=has_root,
-            has_third=has_third,
-            has_seventh=has_seventh,
-            extensions=extensions,
-            complexity_score=complexity,
-            hand_span_inches=hand_span
-        )
+        return _build_voicing_info(chord, group_notes_by_time(notes, chord))
 
     loop = asyncio.get_event_loop()
     return await loop.run_in_executor(None, _analyze)
 
 
 async def analyze_all_voicings(
-    notes: List[Note],
+    notes: Union[List[Note], NoteArray],
     chords: List[ChordEvent]
 ) -> List[VoicingInfo]:
     """
     Analyze voicings for all chords in a progression.
 
     Args:
-        notes: All MIDI notes
+        notes: All MIDI notes (Note list or NoteArray)
         chords: All detected chords
 
     Returns:
         List of voicing analyses
     """
-    voicings = []
-
-    for chord in chords:
-        voicing = await analyze_voicing(notes, chord)
-        if voicing:
-            voicings.append(voicing)
+    def _analyze_all():
+        pitch_sets = assign_notes_to_chords(notes, chords)
+        voicings = (_build_voicing_info(chord, midi_notes) for chord, midi_notes in zip(chords, pitch_sets))
+        return [v for v in voicings if v]
 
-    return voicings
+    loop = asyncio.get_event_loop()
+    return await loop.run_in_executor(None, _analyze_all)
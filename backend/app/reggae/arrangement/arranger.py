@@ -110,43 +110,46 @@ class ReggaeArranger(BaseArranger):
         """
         return apply_reggae_rhythm_pattern(notes, rhythm_name)
 
-    def _select_left_pattern(self, context: ChordContext, config: dict, position: int) -> str:
+    def _select_left_pattern(self, context: ChordContext, config: dict, position: int, rng: random.Random) -> str:
         """Select appropriate left hand pattern based on context.
 
         Args:
             context: Chord context
             config: Application configuration
             position: Position in progression
+            rng: Random source for this arrangement
 
         Returns:
             Pattern name
         """
-        return random.choice(config["left_patterns"])
+        return rng.choice(config["left_patterns"])
 
-    def _select_right_pattern(self, context: ChordContext, config: dict, position: int) -> str:
+    def _select_right_pattern(self, context: ChordContext, config: dict, position: int, rng: random.Random) -> str:
         """Select appropriate right hand pattern based on context.
 
         Args:
             context: Chord context
             config: Application configuration
             position: Position in progression
+            rng: Random source for this arrangement
 
         Returns:
             Pattern name
         """
-        return random.choice(config["right_patterns"])
+        return rng.choice(config["right_patterns"])
 
-    def _select_rhythm_pattern(self, application: str) -> str:
+    def _select_rhythm_pattern(self, application: str, rng: random.Random) -> str:
         """Select appropriate rhythm pattern for application.
 
         Args:
             application: Application type
+            rng: Random source for this arrangement
 
         Returns:
             Rhythm pattern name
         """
         config = self.application_configs.get(application, self.application_configs["roots"])
-        return random.choice(config["rhythm"])
+        return rng.choice(config["rhythm"])
 
     def _get_default_application(self) -> str:
         """Get default application type.
@@ -195,13 +198,14 @@ class ReggaeArranger(BaseArranger):
 
         return adjusted
 
-    def _add_improvisation(self, context: ChordContext, config: dict, position: int) -> List[Note]:
+    def _add_improvisation(self, context: ChordContext, config: dict, position: int, rng: random.Random) -> List[Note]:
         """Add reggae-specific improvisation elements.
 
         Args:
             context: Chord context
             config: Application configuration
             position: Position in progression
+            rng: Random source for this arrangement
 
         Returns:
             List of improvisation notes
@@ -210,12 +214,13 @@ class ReggaeArranger(BaseArranger):
         # Return empty list as reggae focuses on groove and rhythm
         return []
 
-    def _apply_rhythm_transformations(self, notes: List[Note], rhythm_patterns: List[str]) -> List[Note]:
+    def _apply_rhythm_transformations(self, notes: List[Note], rhythm_patterns: List[str], rng: random.Random) -> List[Note]:
         """Apply reggae rhythm transformations.
 
         Args:
             notes: Notes to transform
             rhythm_patterns: List of rhythm pattern names to apply
+            rng: Random source for this arrangement
 
         Returns:
             Transformed notes with reggae rhythm
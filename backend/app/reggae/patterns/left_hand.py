@@ -8,6 +8,7 @@ Implements authentic reggae bass patterns:
 
 from typing import List
 from app.gospel import Note, ChordContext, HandPattern
+from app.core.arrangers.pattern_templates import PatternTemplateLibrary
 from app.gospel.patterns.left_hand import get_chord_tones
 
 
@@ -20,6 +21,31 @@ REGGAE_LEFT_HAND_PATTERNS = [
 ]
 
 
+def _build_reggae_left_hand_pattern(pattern_name: str, context: ChordContext) -> HandPattern:
+    """Run the named pattern generator for one chord."""
+    pattern_map = {
+        "dub_bass": _dub_bass,
+        "walking_bass_reggae": _walking_bass_reggae,
+        "offbeat_bass": _offbeat_bass,
+        "roots_and_fifths": _roots_and_fifths
+    }
+
+    generator = pattern_map.get(pattern_name, _dub_bass)
+    return generator(context)
+
+
+# Every pattern depends only on the chord, so all are compiled per chord quality
+REGGAE_LEFT_HAND_TEMPLATES = PatternTemplateLibrary(
+    _build_reggae_left_hand_pattern,
+    transposable=[
+        "dub_bass",
+        "walking_bass_reggae",
+        "offbeat_bass",
+        "roots_and_fifths",
+    ]
+)
+
+
 def generate_reggae_left_hand_pattern(pattern_name: str, context: ChordContext) -> HandPattern:
     """Generate reggae left hand pattern based on name and context.
 
@@ -30,15 +56,7 @@ def generate_reggae_left_hand_pattern(pattern_name: str, context: ChordContext)
     Returns:
         HandPattern with generated notes
     """
-    pattern_map = {
-        "dub_bass": _dub_bass,
-        "walking_bass_reggae": _walking_bass_reggae,
-        "offbeat_bass": _offbeat_bass,
-        "roots_and_fifths": _roots_and_fifths
-    }
-
-    generator = pattern_map.get(pattern_name, _dub_bass)
-    return generator(context)
+    return REGGAE_LEFT_HAND_TEMPLATES.generate(pattern_name, context)
 
 
 def _dub_bass(context: ChordContext) -> HandPattern:
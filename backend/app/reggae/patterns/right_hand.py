@@ -6,8 +6,10 @@ Implements authentic reggae chord patterns:
 - Double skank (two offbeat hits per bar)
 """
 
+from functools import partial
 from typing import List
 from app.gospel import Note, ChordContext, HandPattern
+from app.core.arrangers.pattern_templates import PatternTemplateLibrary
 from app.gospel.patterns.left_hand import get_chord_tones
 
 
@@ -20,6 +22,32 @@ REGGAE_RIGHT_HAND_PATTERNS = [
 ]
 
 
+def _build_reggae_right_hand_pattern(pattern_name: str, context: ChordContext) -> HandPattern:
+    """Run the named pattern generator for one chord."""
+    pattern_map = {
+        "skank": _skank,
+        "bubble_rhythm": _bubble_rhythm,
+        "double_skank": _double_skank,
+        "sustained_chords": _sustained_chords
+    }
+
+    generator = pattern_map.get(pattern_name, _skank)
+    return generator(context)
+
+
+# Every pattern depends only on the chord, so all are compiled per chord quality
+REGGAE_RIGHT_HAND_TEMPLATES = PatternTemplateLibrary(
+    _build_reggae_right_hand_pattern,
+    transposable=[
+        "skank",
+        "bubble_rhythm",
+        "double_skank",
+        "sustained_chords",
+    ],
+    voicing_tones=partial(get_chord_tones, octave=4)
+)
+
+
 def generate_reggae_right_hand_pattern(pattern_name: str, context: ChordContext) -> HandPattern:
     """Generate reggae right hand pattern based on name and context.
 
@@ -30,15 +58,7 @@ def generate_reggae_right_hand_pattern(pattern_name: str, context: ChordContext)
     Returns:
         HandPattern with generated notes
     """
-    pattern_map = {
-        "skank": _skank,
-        "bubble_rhythm": _bubble_rhythm,
-        "double_skank": _double_skank,
-        "sustained_chords": _sustained_chords
-    }
-
-    generator = pattern_map.get(pattern_name, _skank)
-    return generator(context)
+    return REGGAE_RIGHT_HAND_TEMPLATES.generate(pattern_name, context)
 
 
 def _skank(context: ChordContext) -> HandPattern:
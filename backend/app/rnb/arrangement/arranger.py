@@ -219,15 +219,15 @@ class RnBArranger(BaseArranger):
 
         return notes
 
-    def _select_left_pattern(self, context: ChordContext, config: dict, position: int) -> str:
-        return random.choice(config["left_patterns"])
+    def _select_left_pattern(self, context: ChordContext, config: dict, position: int, rng: random.Random) -> str:
+        return rng.choice(config["left_patterns"])
 
-    def _select_right_pattern(self, context: ChordContext, config: dict, position: int) -> str:
-        return random.choice(config["right_patterns"])
+    def _select_right_pattern(self, context: ChordContext, config: dict, position: int, rng: random.Random) -> str:
+        return rng.choice(config["right_patterns"])
 
-    def _select_rhythm_pattern(self, application: str) -> str:
+    def _select_rhythm_pattern(self, application: str, rng: random.Random) -> str:
         config = self.application_configs.get(application, self.application_configs["groove"])
-        return random.choice(config["rhythm"])
+        return rng.choice(config["rhythm"])
 
     def _get_default_application(self) -> str:
         return "groove"
@@ -245,14 +245,14 @@ class RnBArranger(BaseArranger):
             hand=n.hand
         ) for n in notes]
 
-    def _add_improvisation(self, context: ChordContext, config: dict, position: int) -> List[Note]:
+    def _add_improvisation(self, context: ChordContext, config: dict, position: int, rng: random.Random) -> List[Note]:
         """Add R&B-specific improvisation elements."""
         # R&B focuses on groove and feel rather than complex improvisation
         return []
 
-    def _apply_rhythm_transformations(self, notes: List[Note], rhythm_patterns: List[str]) -> List[Note]:
+    def _apply_rhythm_transformations(self, notes: List[Note], rhythm_patterns: List[str], rng: random.Random) -> List[Note]:
         """Apply rhythm transformations."""
         transformed = notes
         for rhythm in rhythm_patterns:
-            transformed = self._apply_rhythm_pattern(transformed, rhythm)
+            transformed = self._apply_rhythm_pattern(transformed, rhythm, rng=rng)
         return transformed
@@ -0,0 +1,66 @@
+"""Batch Arrangement Generation Schemas"""
+
+from enum import Enum
+from typing import Any, Dict, List, Optional
+from pydantic import BaseModel, Field
+
+
+class BatchGenre(str, Enum):
+    """Genres available to the batch endpoint"""
+    GOSPEL = "gospel"
+    JAZZ = "jazz"
+    BLUES = "blues"
+    NEOSOUL = "neosoul"
+    CLASSICAL = "classical"
+    LATIN = "latin"
+    REGGAE = "reggae"
+    RNB = "rnb"
+
+
+class BatchArrangementItem(BaseModel):
+    """One arrangement spec in a batch"""
+    genre: BatchGenre = Field(..., description="Genre generator to use")
+    request: Dict[str, Any] = Field(
+        ...,
+        description="Body of the genre's /generate request (validated per item)",
+        examples=[{"description": "Slow worship in Eb", "num_bars": 8, "seed": 1}]
+    )
+
+
+class BatchArrangementRequest(BaseModel):
+    """Request for a batch of arrangements across genres"""
+    items: List[BatchArrangementItem] = Field(
+        ...,
+        min_length=1,
+        max_length=500,
+        description="Arrangement specs, generated concurrently"
+    )
+    max_concurrency: Optional[int] = Field(
+        None,
+        ge=1,
+        le=64,
+        description="Items processed at once (default from settings)"
+    )
+    save: bool = Field(
+        False,
+        description="Save each MIDI file under outputs/ and return its path"
+    )
+    include_midi: bool = Field(
+        True,
+        description="Include base64-encoded MIDI in each result"
+    )
+
+
+class BatchArrangementResult(BaseModel):
+    """One streamed batch result (NDJSON line), in completion order"""
+    index: int = Field(..., description="Position of the item in the request")
+    genre: BatchGenre
+    success: bool
+    key: Optional[str] = None
+    tempo: Optional[int] = None
+    chords: List[str] = []
+    midi_filename: Optional[str] = None
+    midi_base64: Optional[str] = None
+    midi_file_path: Optional[str] = None
+    error: Optional[str] = None
+    generation_time_seconds: float = 0.0
@@ -36,6 +36,7 @@ class GenerateBluesRequest(BaseModel):
     num_bars: int = Field(12, ge=4, le=64, description="Number of bars (typically 12)")
     application: BluesApplication = Field(BluesApplication.SHUFFLE, description="Application type")
     include_progression: bool = Field(True, description="Include progression analysis")
+    seed: Optional[int] = Field(None, ge=0, description="Seed for reproducible output (enables result caching)")
 
 
 class ChordAnalysis(BaseModel):
@@ -35,6 +35,7 @@ class GenerateClassicalRequest(BaseModel):
     num_bars: int = Field(8, ge=4, le=64, description="Number of bars")
     application: ClassicalApplication = Field(ClassicalApplication.CLASSICAL, description="Period style")
     include_progression: bool = Field(True, description="Include progression analysis")
+    seed: Optional[int] = Field(None, ge=0, description="Seed for reproducible output (enables result caching)")
     time_signature: tuple = Field((4, 4), description="Time signature (numerator, denominator)")
 
 
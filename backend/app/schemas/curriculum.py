@@ -4,7 +4,7 @@ Defines request/response models for curriculum-related endpoints.
 Enhanced with template-driven exercise library support.
 """
 
-from datetime import datetime
+from datetime import date, datetime
 from typing import Any, Dict, List, Optional
 from enum import Enum
 from pydantic import BaseModel, Field
@@ -325,6 +325,46 @@ class DailyPracticeQueue(BaseModel):
     new_count: int
 
 
+# ============================================================================
+# Review Forecast Schemas
+# ============================================================================
+
+class ReviewForecastRequest(BaseModel):
+    """Parameters for a Monte-Carlo review workload forecast"""
+    days: int = Field(30, ge=1, le=365)
+    simulations: int = Field(200, ge=1, le=1000)
+    new_cards_per_day: int = Field(10, ge=1, le=200)
+    quality_distribution: Optional[List[float]] = Field(
+        None, min_length=6, max_length=6,
+        description="Probability of each 0-5 rating; defaults to the user's history"
+    )
+    seed: Optional[int] = None
+    # SM-2 parameter overrides (defaults match the live scheduler)
+    initial_ease: float = Field(2.5, ge=1.3, le=5.0)
+    min_ease: float = Field(1.3, ge=1.0, le=5.0)
+    first_interval: float = Field(1.0, gt=0)
+    second_interval: float = Field(6.0, gt=0)
+    fail_interval: float = Field(1.0, gt=0)
+    interval_modifier: float = Field(1.0, gt=0, le=5.0)
+    max_interval: Optional[float] = Field(None, gt=0)
+
+
+class ReviewForecastDay(BaseModel):
+    """Projected reviews for one day"""
+    date: date
+    mean: float
+    p10: float
+    p90: float
+
+
+class ReviewForecastResponse(BaseModel):
+    """Projected review-count curve"""
+    card_count: int
+    quality_distribution: List[float]
+    total_expected_reviews: float
+    days: List[ReviewForecastDay]
+
+
 # ============================================================================
 # Assessment Schemas
 # ============================================================================
@@ -65,3 +65,30 @@ class SongChordResponse(BaseModel):
     root: str
     quality: str
     bass_note: Optional[str] = None
+
+
+class HarmonicMatchPosition(BaseModel):
+    """Location of a progression match within a song's chord list"""
+    start_index: int = Field(..., description="Index of the first matching chord")
+    end_index: int = Field(..., description="Index of the last matching chord")
+    start_time: float
+    end_time: float
+
+
+class HarmonicSearchResult(BaseModel):
+    """Song containing a searched progression"""
+    song_id: str
+    title: Optional[str] = None
+    artist: Optional[str] = None
+    key_signature: Optional[str] = None
+    occurrences: int
+    matches: list[HarmonicMatchPosition]
+
+
+class SimilarSongResult(BaseModel):
+    """Song ranked by harmonic similarity"""
+    song_id: str
+    title: Optional[str] = None
+    artist: Optional[str] = None
+    key_signature: Optional[str] = None
+    similarity: float = Field(..., ge=0.0, le=1.0, description="Estimated n-gram Jaccard similarity")
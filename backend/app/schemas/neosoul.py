@@ -54,6 +54,11 @@ class GenerateNeosoulRequest(BaseModel):
         True,
         description="Include chord progression analysis in response"
     )
+    seed: Optional[int] = Field(
+        None,
+        ge=0,
+        description="Random seed for reproducible arrangements. Identical seeded requests return the same MIDI (and are served from cache)"
+    )
 
 
 class ChordAnalysis(BaseModel):
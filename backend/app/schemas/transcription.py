@@ -2,7 +2,7 @@
 
 from datetime import datetime
 from enum import Enum
-from typing import Optional
+from typing import Dict, Optional
 from uuid import UUID
 
 from pydantic import BaseModel, Field, field_validator
@@ -106,6 +106,7 @@ class TranscriptionOptions(BaseModel):
     detect_chords: bool = Field(True, description="Perform chord detection")
     detect_tempo: bool = Field(True, description="Estimate tempo")
     detect_key: bool = Field(True, description="Detect musical key")
+    deep_theory_analysis: bool = Field(False, description="Also run full music21 analysis (slow)")
     start_time: Optional[float] = Field(None, ge=0, description="Process from this timestamp (seconds)")
     end_time: Optional[float] = Field(None, gt=0, description="Process until this timestamp (seconds)")
 
@@ -143,6 +144,24 @@ class TranscriptionJob(BaseModel):
     created_at: datetime = Field(default_factory=datetime.now, description="Job creation time")
     started_at: Optional[datetime] = Field(None, description="Processing start time")
     completed_at: Optional[datetime] = Field(None, description="Processing completion time")
+    stage_timings: Dict[str, float] = Field(
+        default_factory=dict, description="Seconds spent in each finished step"
+    )
+
+
+class JobEvent(BaseModel):
+    """Progress update pushed on job event streams"""
+    job_id: str = Field(..., description="Job ID")
+    event: str = Field(
+        ...,
+        description="snapshot, queued, stage, progress, complete, error, cancelled or deleted"
+    )
+    status: JobStatus = Field(..., description="Job status after this event")
+    progress: int = Field(0, ge=0, le=100, description="Progress percentage")
+    current_step: Optional[str] = Field(None, description="Current processing step")
+    stage_timings: Dict[str, float] = Field(default_factory=dict, description="Seconds spent in each finished step")
+    error_message: Optional[str] = Field(None, description="Error message if failed")
+    timestamp: datetime = Field(default_factory=datetime.now, description="Event time")
 
 
 class TranscribeUrlRequest(BaseModel):
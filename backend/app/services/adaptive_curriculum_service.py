@@ -8,9 +8,9 @@ import json
 import logging
 from dataclasses import dataclass, asdict
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional
+from typing import Any, List, Dict, Optional, Tuple
 
-from sqlalchemy import select, and_, func
+from sqlalchemy import Interval, select, update, and_, or_, case, func
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database.curriculum_models import (
@@ -90,123 +90,199 @@ class AdaptiveCurriculumService:
                 logger.warning(f"No active curriculum for user {user_id}")
                 return self._get_default_analysis()
 
-            # Get all exercises in the curriculum
-            result = await self.db.execute(
-                select(CurriculumExercise)
-                .join(CurriculumLesson)
-                .join(CurriculumModule)
-                .where(CurriculumModule.curriculum_id == curriculum.id)
-            )
-            exercises = result.scalars().all()
+            analyses = await self.analyze_curricula([curriculum.id], lookback_days=lookback_days)
+            return analyses.get(curriculum.id) or self._get_default_analysis()
 
-            if not exercises:
-                return self._get_default_analysis()
+        except Exception as e:
+            logger.error(f"Failed to analyze performance for user {user_id}: {e}")
+            return self._get_default_analysis()
 
-            # Analyze exercises
-            cutoff_date = datetime.utcnow() - timedelta(days=lookback_days)
+    async def analyze_curricula(
+        self,
+        curriculum_ids: List[str],
+        lookback_days: int = 7
+    ) -> Dict[str, PerformanceAnalysis]:
+        """Analyze many curricula at once with grouped SQL aggregates
 
-            total_exercises = len(exercises)
-            reviewed_exercises = sum(
-                1 for ex in exercises
-                if ex.last_reviewed_at and ex.last_reviewed_at >= cutoff_date
-            )
+        Runs a fixed number of queries however many curricula and exercises
+        are involved; per-curriculum statistics (completion, ease, skill
+        areas, trends) are computed in the database.
 
-            completion_rate = reviewed_exercises / total_exercises if total_exercises > 0 else 0.0
+        Args:
+            curriculum_ids: Curricula to analyze
+            lookback_days: Days to look back for practice data
 
-            # Calculate average quality score from ease_factor
-            ease_factors = [ex.ease_factor for ex in exercises if ex.ease_factor]
-            avg_quality_score = sum(ease_factors) / len(ease_factors) if ease_factors else 2.5
+        Returns:
+            Curriculum ID -> PerformanceAnalysis (curricula without exercises are omitted)
+        """
+        if not curriculum_ids:
+            return {}
+
+        cutoff_date = datetime.utcnow() - timedelta(days=lookback_days)
+
+        exercises = (
+            select(
+                CurriculumModule.curriculum_id.label("curriculum_id"),
+                CurriculumExercise.id.label("exercise_id"),
+                CurriculumExercise.exercise_type,
+                CurriculumExercise.ease_factor,
+                CurriculumExercise.last_reviewed_at,
+                CurriculumExercise.is_mastered,
+                CurriculumExercise.repetition_count,
+                CurriculumModule.order_index.label("module_order"),
+                CurriculumLesson.week_number,
+                CurriculumExercise.order_index.label("exercise_order"),
+            )
+            .join(CurriculumLesson, CurriculumExercise.lesson_id == CurriculumLesson.id)
+            .join(CurriculumModule, CurriculumLesson.module_id == CurriculumModule.id)
+            .where(CurriculumModule.curriculum_id.in_(curriculum_ids))
+            .cte("curriculum_exercise")
+        )
+        ex = exercises.c
+        struggling = ex.ease_factor < self.STRUGGLING_EASE_THRESHOLD
+        mastered = or_(
+            ex.is_mastered == True,  # noqa: E712
+            and_(ex.ease_factor > self.MASTERY_EASE_THRESHOLD, ex.repetition_count > 3)
+        )
+        recent = ex.last_reviewed_at >= cutoff_date
+
+        def count_where(condition):
+            return func.sum(case((condition, 1), else_=0))
+
+        # 1. Totals per curriculum
+        totals = await self.db.execute(
+            select(
+                ex.curriculum_id,
+                func.count().label("total"),
+                count_where(recent).label("reviewed"),
+                func.avg(ex.ease_factor).label("avg_ease"),
+                count_where(struggling).label("struggling"),
+                count_where(mastered).label("mastered"),
+            )
+            .group_by(ex.curriculum_id)
+        )
 
-            # Identify struggling exercises
-            struggling_exercises = [
-                ex.id for ex in exercises
-                if ex.ease_factor < self.STRUGGLING_EASE_THRESHOLD
-            ]
+        # 2. Per skill area: average ease plus first/second half (curriculum order) for the trend
+        typed = select(
+            ex.curriculum_id,
+            ex.exercise_type,
+            ex.ease_factor,
+            func.row_number().over(
+                partition_by=(ex.curriculum_id, ex.exercise_type),
+                order_by=(ex.module_order, ex.week_number, ex.exercise_order, ex.exercise_id)
+            ).label("position"),
+            func.count().over(partition_by=(ex.curriculum_id, ex.exercise_type)).label("size"),
+        ).subquery()
+        skill_rows = await self.db.execute(
+            select(
+                typed.c.curriculum_id,
+                typed.c.exercise_type,
+                func.avg(typed.c.ease_factor).label("avg_ease"),
+                func.count().label("size"),
+                func.avg(case((typed.c.position * 2 <= typed.c.size, typed.c.ease_factor))).label("first_half"),
+                func.avg(case((typed.c.position * 2 > typed.c.size, typed.c.ease_factor))).label("second_half"),
+            )
+            .group_by(typed.c.curriculum_id, typed.c.exercise_type)
+        )
 
-            # Identify mastered exercises
-            mastered_exercises = [
-                ex.id for ex in exercises
-                if ex.is_mastered or (ex.ease_factor > self.MASTERY_EASE_THRESHOLD and ex.repetition_count > 3)
-            ]
+        # 3. Recent reviews in time order: trend and trailing run of struggles
+        reviewed = select(
+            ex.curriculum_id,
+            ex.ease_factor,
+            func.row_number().over(
+                partition_by=ex.curriculum_id,
+                order_by=(ex.last_reviewed_at, ex.exercise_id)
+            ).label("position"),
+            func.count().over(partition_by=ex.curriculum_id).label("size"),
+        ).where(recent).subquery()
+        trend_rows = await self.db.execute(
+            select(
+                reviewed.c.curriculum_id,
+                func.max(reviewed.c.size).label("size"),
+                func.avg(case((reviewed.c.position * 2 <= reviewed.c.size, reviewed.c.ease_factor))).label("first_half"),
+                func.avg(case((reviewed.c.position * 2 > reviewed.c.size, reviewed.c.ease_factor))).label("second_half"),
+                func.max(case((
+                    reviewed.c.ease_factor >= self.STRUGGLING_EASE_THRESHOLD, reviewed.c.position
+                ))).label("last_ok_position"),
+            )
+            .group_by(reviewed.c.curriculum_id)
+        )
+
+        # 4. Struggling / mastered exercise IDs (recorded in the adaptation history)
+        flagged = await self.db.execute(
+            select(
+                ex.curriculum_id,
+                ex.exercise_id,
+                struggling.label("is_struggling"),
+                mastered.label("is_mastered"),
+            )
+            .where(or_(struggling, mastered))
+        )
 
-            # Analyze by exercise type
-            skill_performance = {}
-            for ex in exercises:
-                if ex.exercise_type not in skill_performance:
-                    skill_performance[ex.exercise_type] = []
-                skill_performance[ex.exercise_type].append(ex.ease_factor)
+        skills: Dict[str, List[Any]] = {}
+        for row in skill_rows:
+            skills.setdefault(row.curriculum_id, []).append(row)
+        trends = {row.curriculum_id: row for row in trend_rows}
+        flagged_ids: Dict[str, Tuple[List[str], List[str]]] = {}
+        for row in flagged:
+            struggling_ids, mastered_ids = flagged_ids.setdefault(row.curriculum_id, ([], []))
+            if row.is_struggling:
+                struggling_ids.append(row.exercise_id)
+            if row.is_mastered:
+                mastered_ids.append(row.exercise_id)
+
+        analyses = {}
+        for row in totals:
+            completion_rate = row.reviewed / row.total if row.total else 0.0
+            avg_quality_score = row.avg_ease if row.avg_ease is not None else 2.5
 
             weak_skill_areas = []
             strong_skill_areas = []
             skill_area_trends = {}
-
-            for skill_type, scores in skill_performance.items():
-                avg_score = sum(scores) / len(scores) if scores else 2.5
+            for skill in skills.get(row.curriculum_id, []):
+                avg_score = skill.avg_ease if skill.avg_ease is not None else 2.5
                 if avg_score < self.STRUGGLING_EASE_THRESHOLD:
-                    weak_skill_areas.append(skill_type)
+                    weak_skill_areas.append(skill.exercise_type)
                 elif avg_score > self.MASTERY_EASE_THRESHOLD:
-                    strong_skill_areas.append(skill_type)
-
-                # Calculate trend for this skill area (if enough data)
-                if len(scores) >= 3:
-                    mid = len(scores) // 2
-                    first_half = sum(scores[:mid]) / mid
-                    second_half = sum(scores[mid:]) / (len(scores) - mid)
-                    trend_score = (second_half - first_half) / 5.0  # Normalize to -1 to 1
-                    skill_area_trends[skill_type] = min(1.0, max(-1.0, trend_score))
+                    strong_skill_areas.append(skill.exercise_type)
 
-            # Calculate recent performance trend and consecutive struggles
-            recent_exercises = [ex for ex in exercises if ex.last_reviewed_at and ex.last_reviewed_at >= cutoff_date]
-            recent_exercises.sort(key=lambda x: x.last_reviewed_at)
+                if skill.size >= 3:
+                    trend_score = (skill.second_half - skill.first_half) / 5.0  # Normalize to -1 to 1
+                    skill_area_trends[skill.exercise_type] = min(1.0, max(-1.0, trend_score))
 
             recent_performance_trend = 'stable'
             consecutive_struggles = 0
-
-            if len(recent_exercises) >= 3:
-                recent_scores = [ex.ease_factor for ex in recent_exercises]
-                mid = len(recent_scores) // 2
-                first_half_avg = sum(recent_scores[:mid]) / mid if mid > 0 else 2.5
-                second_half_avg = sum(recent_scores[mid:]) / (len(recent_scores) - mid)
-
-                if second_half_avg - first_half_avg > 0.3:
+            trend = trends.get(row.curriculum_id)
+            if trend is not None and trend.size >= 3:
+                if trend.second_half - trend.first_half > 0.3:
                     recent_performance_trend = 'improving'
-                elif second_half_avg - first_half_avg < -0.3:
+                elif trend.second_half - trend.first_half < -0.3:
                     recent_performance_trend = 'declining'
+                consecutive_struggles = trend.size - (trend.last_ok_position or 0)
 
-                # Count consecutive low-quality completions
-                for ex in reversed(recent_exercises):
-                    if ex.ease_factor < self.STRUGGLING_EASE_THRESHOLD:
-                        consecutive_struggles += 1
-                    else:
-                        break
-
-            # Generate recommendations
-            recommended_actions = self._generate_recommendations(
+            struggling_ids, mastered_ids = flagged_ids.get(row.curriculum_id, ([], []))
+            analyses[row.curriculum_id] = PerformanceAnalysis(
                 completion_rate=completion_rate,
                 avg_quality_score=avg_quality_score,
-                weak_skill_areas=weak_skill_areas,
-                struggling_count=len(struggling_exercises),
-                mastered_count=len(mastered_exercises)
-            )
-
-            return PerformanceAnalysis(
-                completion_rate=completion_rate,
-                avg_quality_score=avg_quality_score,
-                struggling_exercises=struggling_exercises,
-                mastered_exercises=mastered_exercises,
+                struggling_exercises=struggling_ids,
+                mastered_exercises=mastered_ids,
                 weak_skill_areas=weak_skill_areas,
                 strong_skill_areas=strong_skill_areas,
-                recommended_actions=recommended_actions,
-                total_exercises=total_exercises,
-                reviewed_exercises=reviewed_exercises,
+                recommended_actions=self._generate_recommendations(
+                    completion_rate=completion_rate,
+                    avg_quality_score=avg_quality_score,
+                    weak_skill_areas=weak_skill_areas,
+                    struggling_count=row.struggling,
+                    mastered_count=row.mastered
+                ),
+                total_exercises=row.total,
+                reviewed_exercises=row.reviewed,
                 recent_performance_trend=recent_performance_trend,
                 consecutive_struggles=consecutive_struggles,
                 skill_area_trends=skill_area_trends
             )
 
-        except Exception as e:
-            logger.error(f"Failed to analyze performance for user {user_id}: {e}")
-            return self._get_default_analysis()
+        return analyses
 
     def _generate_recommendations(
         self,
@@ -276,45 +352,11 @@ class AdaptiveCurriculumService:
             if not curriculum:
                 raise ValueError(f"Curriculum not found: {curriculum_id}")
 
-            changes = []
-
-            for action in analysis.recommended_actions:
-                if action == "reduce_daily_load":
-                    await self._adjust_srs_intervals(curriculum_id, factor=1.2)
-                    changes.append("Reduced daily exercise load by 20%")
-
-                elif action == "increase_daily_load":
-                    await self._adjust_srs_intervals(curriculum_id, factor=0.8)
-                    changes.append("Increased daily exercise load by 20%")
-
-                elif action == "reduce_difficulty":
-                    # This would require regenerating exercises - log for now
-                    changes.append("Recommended: Reduce exercise difficulty")
-
-                elif action == "increase_difficulty":
-                    changes.append("Recommended: Increase exercise difficulty")
-
-                elif action.startswith("add_remedial_"):
-                    skill_area = action.replace("add_remedial_", "")
-                    # This would generate new exercises - log for now
-                    changes.append(f"Recommended: Add remedial exercises for {skill_area}")
-
-                elif action == "unlock_advanced_content":
-                    changes.append("Recommended: Unlock advanced content")
-
-            # Log adaptation
-            adaptation_log = {
-                "timestamp": datetime.utcnow().isoformat(),
-                "analysis": asdict(analysis),
-                "changes": changes
-            }
-
-            # Update curriculum
-            history = json.loads(curriculum.adaptation_history_json)
-            history.append(adaptation_log)
-            curriculum.adaptation_history_json = json.dumps(history)
-            curriculum.last_adapted_at = datetime.utcnow()
+            factor, changes = self._plan_adaptations(analysis.recommended_actions)
+            if factor != 1.0:
+                await self._scale_srs_intervals([curriculum_id], factor)
 
+            self._log_adaptation(curriculum, analysis, changes)
             await self.db.commit()
 
             logger.info(f"Applied {len(changes)} adaptations to curriculum {curriculum_id}")
@@ -329,34 +371,178 @@ class AdaptiveCurriculumService:
             logger.error(f"Failed to apply adaptations to curriculum {curriculum_id}: {e}")
             raise e
 
-    async def _adjust_srs_intervals(self, curriculum_id: str, factor: float):
-        """Adjust SRS review intervals for all exercises
+    async def adapt_curricula(
+        self,
+        curriculum_ids: List[str],
+        lookback_days: int = 7
+    ) -> Dict[str, int]:
+        """Analyze and adapt many curricula in one transaction
+
+        Analysis is set-based (analyze_curricula); interval changes are one
+        bulk UPDATE per distinct factor rather than one per exercise.
 
         Args:
-            curriculum_id: Curriculum ID
-            factor: Multiplier for intervals (>1 = slower, <1 = faster)
+            curriculum_ids: Curricula to adapt
+            lookback_days: Days to look back for practice data
+
+        Returns:
+            Dict with analyzed/adapted curricula and rescheduled exercise counts
         """
-        try:
-            # Get all exercises
+        analyses = await self.analyze_curricula(curriculum_ids, lookback_days=lookback_days)
+        plans = {
+            curriculum_id: self._plan_adaptations(analysis.recommended_actions)
+            for curriculum_id, analysis in analyses.items()
+            if analysis.recommended_actions
+        }
+
+        by_factor: Dict[float, List[str]] = {}
+        for curriculum_id, (factor, _) in plans.items():
+            if factor != 1.0:
+                by_factor.setdefault(factor, []).append(curriculum_id)
+
+        rescheduled = 0
+        for factor, ids in by_factor.items():
+            rescheduled += await self._scale_srs_intervals(ids, factor)
+
+        if plans:
             result = await self.db.execute(
-                select(CurriculumExercise)
-                .join(CurriculumLesson)
-                .join(CurriculumModule)
-                .where(CurriculumModule.curriculum_id == curriculum_id)
+                select(Curriculum).where(Curriculum.id.in_(list(plans)))
             )
-            exercises = result.scalars().all()
+            for curriculum in result.scalars():
+                self._log_adaptation(curriculum, analyses[curriculum.id], plans[curriculum.id][1])
+
+        await self.db.commit()
+
+        return {
+            "analyzed": len(curriculum_ids),
+            "adapted": len(plans),
+            "exercises_rescheduled": rescheduled
+        }
+
+    def _plan_adaptations(self, actions: List[str]) -> Tuple[float, List[str]]:
+        """Turn recommended actions into an SRS interval factor and a change log
+
+        Returns:
+            (interval factor, 1.0 = unchanged; list of change descriptions)
+        """
+        factor = 1.0
+        changes = []
 
-            # Adjust intervals
-            for exercise in exercises:
-                exercise.interval_days *= factor
+        for action in actions:
+            if action == "reduce_daily_load":
+                factor *= 1.2
+                changes.append("Reduced daily exercise load by 20%")
 
-                # Recalculate next_review_at if it exists
-                if exercise.last_reviewed_at:
-                    exercise.next_review_at = exercise.last_reviewed_at + timedelta(days=exercise.interval_days)
+            elif action == "increase_daily_load":
+                factor *= 0.8
+                changes.append("Increased daily exercise load by 20%")
 
+            elif action == "reduce_difficulty":
+                # This would require regenerating exercises - log for now
+                changes.append("Recommended: Reduce exercise difficulty")
+
+            elif action == "increase_difficulty":
+                changes.append("Recommended: Increase exercise difficulty")
+
+            elif action.startswith("add_remedial_"):
+                skill_area = action.replace("add_remedial_", "")
+                # This would generate new exercises - log for now
+                changes.append(f"Recommended: Add remedial exercises for {skill_area}")
+
+            elif action == "unlock_advanced_content":
+                changes.append("Recommended: Unlock advanced content")
+
+        return factor, changes
+
+    def _log_adaptation(
+        self,
+        curriculum: Curriculum,
+        analysis: PerformanceAnalysis,
+        changes: List[str]
+    ) -> None:
+        """Append an adaptation entry to the curriculum history (caller commits)"""
+        adaptation_log = {
+            "timestamp": datetime.utcnow().isoformat(),
+            "analysis": asdict(analysis),
+            "changes": changes
+        }
+
+        history = json.loads(curriculum.adaptation_history_json)
+        history.append(adaptation_log)
+        curriculum.adaptation_history_json = json.dumps(history)
+        curriculum.last_adapted_at = datetime.utcnow()
+
+    async def _scale_srs_intervals(self, curriculum_ids: List[str], factor: float) -> int:
+        """Multiply SRS intervals for every exercise in the curricula (one UPDATE, caller commits)
+
+        next_review_at is moved to last_reviewed_at + the new interval in SQL
+        on SQLite and PostgreSQL; other backends compute it per row.
+
+        Returns:
+            Number of exercises updated
+        """
+        in_curricula = CurriculumExercise.lesson_id.in_(
+            select(CurriculumLesson.id)
+            .join(CurriculumModule, CurriculumLesson.module_id == CurriculumModule.id)
+            .where(CurriculumModule.curriculum_id.in_(curriculum_ids))
+        )
+        new_interval = CurriculumExercise.interval_days * factor
+        next_review = _add_days(
+            CurriculumExercise.last_reviewed_at, new_interval, self.db.get_bind().dialect.name
+        )
+        if next_review is None:
+            return await self._scale_srs_intervals_per_row(in_curricula, factor)
+
+        result = await self.db.execute(
+            update(CurriculumExercise)
+            .where(in_curricula)
+            .values(
+                interval_days=new_interval,
+                next_review_at=case(
+                    (CurriculumExercise.last_reviewed_at.isnot(None), next_review),
+                    else_=CurriculumExercise.next_review_at
+                )
+            )
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount
+
+    async def _scale_srs_intervals_per_row(self, in_curricula, factor: float) -> int:
+        """_scale_srs_intervals for backends without a date arithmetic expression"""
+        rows = (await self.db.execute(
+            select(
+                CurriculumExercise.id,
+                CurriculumExercise.interval_days,
+                CurriculumExercise.last_reviewed_at,
+                CurriculumExercise.next_review_at,
+            ).where(in_curricula)
+        )).all()
+        if rows:
+            await self.db.execute(update(CurriculumExercise), [
+                {
+                    "id": row.id,
+                    "interval_days": row.interval_days * factor,
+                    "next_review_at": (
+                        row.last_reviewed_at + timedelta(days=row.interval_days * factor)
+                        if row.last_reviewed_at is not None else row.next_review_at
+                    ),
+                }
+                for row in rows
+            ])
+        return len(rows)
+
+    async def _adjust_srs_intervals(self, curriculum_id: str, factor: float):
+        """Adjust SRS review intervals for all exercises
+
+        Args:
+            curriculum_id: Curriculum ID
+            factor: Multiplier for intervals (>1 = slower, <1 = faster)
+        """
+        try:
+            updated = await self._scale_srs_intervals([curriculum_id], factor)
             await self.db.commit()
 
-            logger.info(f"Adjusted SRS intervals by {factor}x for {len(exercises)} exercises")
+            logger.info(f"Adjusted SRS intervals by {factor}x for {updated} exercises")
 
         except Exception as e:
             logger.error(f"Failed to adjust SRS intervals: {e}")
@@ -563,3 +749,12 @@ class AdaptiveCurriculumService:
         except Exception as e:
             logger.error(f"Failed to auto-adjust difficulty for user {user_id}: {e}")
             return {"adjusted": False, "reason": str(e)}
+
+
+def _add_days(timestamp, days, dialect_name: str):
+    """timestamp + a fractional number of days as a SQL expression (None if the dialect has none here)"""
+    if dialect_name == "sqlite":
+        return func.datetime(timestamp, func.printf('%+.6f days', days))
+    if dialect_name == "postgresql":
+        return timestamp + func.make_interval(0, 0, 0, 0, 0, 0, days * 86400, type_=Interval)
+    return None
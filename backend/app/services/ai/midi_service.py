@@ -2,8 +2,11 @@
 import logging
 from typing import List, Union, Optional
 from pathlib import Path
-from miditok import REMI, TokenizerConfig
-from miditok import TokSequence
+
+from app.core.lazy import lazy_import, lazy_service
+
+# MidiTok pulls in torch; imported when the tokenizer is first built
+miditok = lazy_import("miditok")
 
 logger = logging.getLogger(__name__)
 
@@ -14,13 +17,13 @@ class MidiService:
     
     def __init__(self):
         # Configure REMI tokenizer - good for pop/gospel/piano
-        config = TokenizerConfig(
+        config = miditok.TokenizerConfig(
             pitch_range=(21, 108),  # Piano range
             beat_res={(0, 4): 8, (4, 12): 4},  # Resolution
             num_velocities=32,
             special_tokens=["PAD", "BOS", "EOS", "MASK"]
         )
-        self.tokenizer = REMI(config)
+        self.tokenizer = miditok.REMI(config)
 
     def tokenize_midi_file(self, midi_path: str) -> List[int]:
         """
@@ -55,4 +58,4 @@ class MidiService:
             logger.error(f"Error creating MIDI from tokens: {e}")
             raise e
 
-midi_service = MidiService()
+midi_service = lazy_service("midi_tokenizer", MidiService)
@@ -13,6 +13,7 @@ import json
 from typing import List, Optional, Dict, Any
 from pydantic import BaseModel
 
+from app.core.lazy import lazy_service
 from app.services.multi_model_service import multi_model_service
 from app.schemas.music_generation import (
     MusicKey,
@@ -107,7 +108,7 @@ class MusicTheoryGenerator:
             )
 
             # Complexity 6: Medium task (uses Qwen 2.5-14B)
-            response_text = self.llm.generate(
+            response_text = await self.llm.agenerate(
                 prompt=prompt,
                 complexity=6,
                 max_tokens=1024,
@@ -370,5 +371,5 @@ Generate the melody:"""
         return scale[:3]
 
 
-# Global singleton instance
-music_theory_generator = MusicTheoryGenerator()
+# Global singleton instance (built on first use; __init__ probes the local LLM)
+music_theory_generator = lazy_service("music_theory_generator", MusicTheoryGenerator)
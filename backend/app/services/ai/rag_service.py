@@ -1,7 +1,11 @@
 import logging
 from typing import List, Dict, Any
-import chromadb
-from chromadb.utils import embedding_functions
+
+from app.core.lazy import lazy_import, lazy_service
+
+# Imported when the service is first built
+chromadb = lazy_import("chromadb")
+embedding_functions = lazy_import("chromadb.utils.embedding_functions")
 
 logger = logging.getLogger(__name__)
 
@@ -51,5 +55,5 @@ class RagService:
             logger.error(f"Error retrieving context: {e}")
             return []
 
-# Singleton instance
-rag_service = RagService()
+# Singleton instance (opens the Chroma store on first use)
+rag_service = lazy_service("rag", RagService)
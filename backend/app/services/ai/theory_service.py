@@ -2,8 +2,11 @@
 import logging
 from typing import Optional, List, Dict, Any
 from pathlib import Path
-import mlx.core as mx
-from mlx_lm import load, generate
+
+from app.core.lazy import lazy_import
+
+# Imported when the model is first loaded
+mlx_lm = lazy_import("mlx_lm")
 
 # Configure logger
 logger = logging.getLogger(__name__)
@@ -32,7 +35,7 @@ class TheoryService:
         try:
             logger.info(f"Loading MLX model: {self.MODEL_PATH}...")
             # load() returns (model, tokenizer)
-            self.model, self.tokenizer = load(self.MODEL_PATH)
+            self.model, self.tokenizer = mlx_lm.load(self.MODEL_PATH)
             self.is_loaded = True
             logger.info("✅ MLX Model loaded successfully.")
         except Exception as e:
@@ -74,7 +77,7 @@ class TheoryService:
         
         try:
             prompt = self.tokenizer.apply_chat_template(messages, tokenize=False, add_generation_prompt=True)
-            response = generate(
+            response = mlx_lm.generate(
                 self.model, 
                 self.tokenizer, 
                 prompt=prompt, 
@@ -102,7 +105,7 @@ class TheoryService:
         messages = [{"role": "user", "content": prompt}]
         formatted_prompt = self.tokenizer.apply_chat_template(messages, tokenize=False, add_generation_prompt=True)
 
-        return generate(
+        return mlx_lm.generate(
             self.model, 
             self.tokenizer, 
             prompt=formatted_prompt, 
@@ -8,13 +8,13 @@ import base64
 from pathlib import Path
 from typing import Optional
 
-import google.generativeai as genai
-from anthropic import Anthropic
-try:
-    from mlx_lm import load, generate
-    MLX_AVAILABLE = True
-except ImportError:
-    MLX_AVAILABLE = False
+from app.core.lazy import lazy_import, lazy_service, module_available
+
+# Provider SDKs are imported on first use, not at startup
+genai = lazy_import("google.generativeai")
+anthropic = lazy_import("anthropic")
+mlx_lm = lazy_import("mlx_lm")
+MLX_AVAILABLE = module_available("mlx_lm")
 
 from app.schemas.ai import (
     ProgressionRequest, ProgressionResponse, ChordInfo,
@@ -59,11 +59,6 @@ from app.services.template_loader import template_loader
 
 
 
-# Configure Gemini
-if settings.google_api_key:
-    genai.configure(api_key=settings.google_api_key)
-
-
 # Note to MIDI mapping
 NOTE_TO_MIDI = {
     'C': 60, 'C#': 61, 'Db': 61, 'D': 62, 'D#': 63, 'Eb': 63,
@@ -135,7 +130,7 @@ class AIGeneratorService:
         self.claude_api_available = False
         if settings.anthropic_api_key:
             try:
-                self.claude = Anthropic(api_key=settings.anthropic_api_key)
+                self.claude = anthropic.Anthropic(api_key=settings.anthropic_api_key)
                 self.claude_api_available = True
             except Exception as e:
                 print(f"Warning: Claude API initialization failed: {e}")
@@ -886,7 +881,7 @@ Return ONLY the JSON, no other text"""
         """Lazy load MLX model"""
         if not self.mlx_model and self.mlx_available:
             print(f"Loading local MLX model: {self.mlx_model_path}...")
-            self.mlx_model, self.mlx_tokenizer = load(self.mlx_model_path)
+            self.mlx_model, self.mlx_tokenizer = mlx_lm.load(self.mlx_model_path)
             print("✅ MLX model loaded")
 
     def _generate_with_mlx(self, prompt: str) -> dict:
@@ -905,7 +900,7 @@ Return ONLY the JSON, no other text"""
             add_generation_prompt=True
         )
         
-        response = generate(
+        response = mlx_lm.generate(
             self.mlx_model, 
             self.mlx_tokenizer, 
             prompt=formatted_prompt, 
@@ -1327,5 +1322,5 @@ Return ONLY the JSON, no other text."""
             return ArrangeResponse(success=False, error=str(e))
 
 
-# Global service instance
-ai_generator_service = AIGeneratorService()
+# Global service instance (built on first use)
+ai_generator_service = lazy_service("ai_generator", AIGeneratorService)
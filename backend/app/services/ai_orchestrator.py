@@ -8,15 +8,18 @@ import hashlib
 import json
 import logging
 import os
-from datetime import datetime, timedelta
 from enum import Enum
 from typing import Any, Dict, List, Optional
 
-import google.generativeai as genai
 from app.core.config import settings
+from app.core.lazy import lazy_import, lazy_service
+from app.services.ai_response_cache import ai_response_cache
 
 logger = logging.getLogger(__name__)
 
+# Gemini SDK is imported and configured when the orchestrator is first built
+genai = lazy_import("google.generativeai")
+
 # Validate GEMINI_API_KEY before configuration
 _gemini_api_key = os.environ.get("GEMINI_API_KEY")
 if not _gemini_api_key:
@@ -24,18 +27,24 @@ if not _gemini_api_key:
         "GEMINI_API_KEY not set. AI features will be unavailable. "
         "Set GEMINI_API_KEY environment variable to enable AI curriculum generation."
     )
-else:
+
+
+def _configure_gemini() -> bool:
+    """Configure the Gemini SDK with GEMINI_API_KEY (False if unset or it fails)"""
+    if not _gemini_api_key:
+        return False
     try:
         genai.configure(api_key=_gemini_api_key)
         logger.info("✅ Gemini API configured successfully")
+        return True
     except Exception as e:
         logger.error(f"Failed to configure Gemini API: {e}")
-        _gemini_api_key = None
+        return False
 
 # Import multi-model local LLM service (M4 Neural Engine)
 try:
     from app.services.multi_model_service import multi_model_service, MLX_AVAILABLE
-    LOCAL_LLM_ENABLED = MLX_AVAILABLE and multi_model_service and multi_model_service.is_available()
+    LOCAL_LLM_ENABLED = MLX_AVAILABLE and multi_model_service is not None
 except ImportError:
     multi_model_service = None
     LOCAL_LLM_ENABLED = False
@@ -89,32 +98,12 @@ class BudgetMode(Enum):
     QUALITY = "quality"    # Prioritize best quality
 
 
-# Simple in-memory cache (in production, use Redis)
-_cache: Dict[str, tuple] = {}  # key -> (value, expiry_time)
-
-
 def _get_cache_key(task_type: str, prompt: str) -> str:
     """Generate cache key from task type and prompt hash"""
     prompt_hash = hashlib.sha256(prompt.encode()).hexdigest()[:16]
     return f"{task_type}:{prompt_hash}"
 
 
-def _cache_get(key: str) -> Optional[Any]:
-    """Get value from cache if not expired"""
-    if key in _cache:
-        value, expiry = _cache[key]
-        if datetime.now() < expiry:
-            return value
-        del _cache[key]
-    return None
-
-
-def _cache_set(key: str, value: Any, ttl_hours: int = 24) -> None:
-    """Set value in cache with TTL"""
-    expiry = datetime.now() + timedelta(hours=ttl_hours)
-    _cache[key] = (value, expiry)
-
-
 class AIOrchestrator:
     """
     Orchestrates AI tasks across multiple models.
@@ -173,7 +162,7 @@ class AIOrchestrator:
         self.initialization_errors = []
 
         # Only initialize if API key is configured
-        if not _gemini_api_key:
+        if not _configure_gemini():
             self.initialization_errors.append("GEMINI_API_KEY not configured")
             logger.warning("Skipping Gemini initialization - API key not set")
         else:
@@ -223,6 +212,7 @@ class AIOrchestrator:
         if LOCAL_LLM_ENABLED and self.multi_llm:
             status["multi_model_info"] = self.multi_llm.get_model_info()
 
+        status["cache"] = ai_response_cache.stats()
         return status
 
     def route_task(self, task_type: TaskType, complexity: int = None) -> ModelType:
@@ -297,13 +287,24 @@ class AIOrchestrator:
         Generate AI content with automatic fallback chain.
 
         Fallback order: Local LLM (M4) → Pro/Ultra → Flash → Error
+
+        Responses are cached per (task type, prompt); concurrent identical
+        prompts share a single generation.
         """
-        # Check cache
         cache_key = _get_cache_key(task_type.value, prompt)
-        cached = _cache_get(cache_key)
-        if cached:
-            return cached
+        return await ai_response_cache.get_or_create(
+            cache_key,
+            lambda: self._generate_uncached(prompt, task_type, generation_config),
+            ttl_seconds=cache_ttl_hours * 3600
+        )
 
+    async def _generate_uncached(
+        self,
+        prompt: str,
+        task_type: TaskType,
+        generation_config: Optional[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """Run the fallback chain without consulting the cache."""
         # Default generation config
         if generation_config is None:
             generation_config = {
@@ -327,7 +328,7 @@ class AIOrchestrator:
                 # Use local M4 Neural Engine (FREE and FAST!)
                 # Automatically selects Phi-3.5 (1-4) or Llama 3.3 70B (5-10) based on complexity
                 logger.info(f"🤖 Using local multi-model LLM for {task_type.value} (complexity {complexity})")
-                result = self.multi_llm.generate_structured(
+                result = await self.multi_llm.agenerate_structured(
                     prompt=prompt,
                     schema={},  # Let LLM infer structure
                     complexity=complexity,  # Pass complexity for model selection
@@ -336,7 +337,6 @@ class AIOrchestrator:
                     force_local=settings.force_local_llm,  # Allow 8-10 complexity on local
                 )
                 logger.info(f"✅ Local LLM succeeded for {task_type.value}")
-                _cache_set(cache_key, result, ttl_hours=cache_ttl_hours)
                 return result
             except Exception as local_error:
                 # Fallback to Gemini if local LLM fails
@@ -379,7 +379,6 @@ class AIOrchestrator:
                 )
                 raise
 
-            _cache_set(cache_key, result, ttl_hours=cache_ttl_hours)
             return result
         except Exception as primary_error:
             error_details = {
@@ -395,7 +394,6 @@ class AIOrchestrator:
                     flash_model = self.gemini_models[GeminiModel.FLASH]
                     response = await flash_model.generate_content_async(prompt, generation_config=generation_config)
                     result = json.loads(response.text)
-                    _cache_set(cache_key, result, ttl_hours=cache_ttl_hours)
                     return result
                 except Exception:
                     pass  # Fall through to template generation
@@ -813,13 +811,9 @@ Each exercise MUST have COMPLETE, DETAILED content:
     ) -> Dict[str, Any]:
         """Generate content for a specific exercise type"""
         cache_key = _get_cache_key(f"exercise_{exercise_type}", json.dumps(context, sort_keys=True))
-        cached = _cache_get(cache_key)
-        if cached:
-            return cached
-        
         prompt = self._build_exercise_prompt(exercise_type, context)
-        
-        try:
+
+        async def generate() -> Dict[str, Any]:
             response = await self.gemini_model.generate_content_async(
                 prompt,
                 generation_config={
@@ -828,11 +822,10 @@ Each exercise MUST have COMPLETE, DETAILED content:
                     "response_mime_type": "application/json",
                 }
             )
-            
-            result = json.loads(response.text)
-            _cache_set(cache_key, result, ttl_hours=72)
-            return result
-            
+            return json.loads(response.text)
+
+        try:
+            return await ai_response_cache.get_or_create(cache_key, generate, ttl_seconds=72 * 3600)
         except Exception:
             return self._generate_fallback_exercise(exercise_type, context)
     
@@ -1142,4 +1135,4 @@ Be specific to the exercise type and performance level."""
 
 
 # Global service instance
-ai_orchestrator = AIOrchestrator()
+ai_orchestrator = lazy_service("ai_orchestrator", AIOrchestrator)
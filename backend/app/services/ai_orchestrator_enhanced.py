@@ -197,7 +197,7 @@ class EnhancedAIOrchestrator(BaseOrchestrator):
                     }
                 )
 
-                result = multi_model_service.generate_structured(
+                result = await multi_model_service.agenerate_structured(
                     prompt=prompt,
                     schema={},
                     complexity=complexity,
@@ -0,0 +1,332 @@
+"""
+Shared cache for AI responses (Gemini and local LLM).
+
+The orchestrator and the genre generators cache model output here instead
+of in their own dicts:
+
+- Bounded: an in-memory LRU capped at settings.ai_cache_max_entries
+- TTL: every entry expires; expired entries are dropped on access
+- Shared: an optional SQLite or Redis store (settings.ai_cache_backend)
+  lets every worker process reuse responses generated by the others
+- Single-flight: concurrent requests for the same key await one generation
+
+Async callers wrap the generation:
+
+    result = await ai_response_cache.get_or_create(key, generate, ttl_seconds=3600)
+
+Values written to the shared store must be JSON-serialisable; anything else
+is cached in memory only.
+"""
+
+import asyncio
+import json
+import logging
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from functools import partial
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class SQLiteCacheStore:
+    """JSON entries in a SQLite file, shared by processes on one host."""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS ai_cache ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL NOT NULL)"
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.path, timeout=5.0)
+
+    def get(self, key: str) -> Optional[Tuple[str, float]]:
+        """Return (json, expires_at) for a live entry."""
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT value, expires_at FROM ai_cache WHERE key = ? AND expires_at > ?",
+                (key, time.time())
+            ).fetchone()
+        return (row[0], row[1]) if row else None
+
+    def set(self, key: str, value: str, expires_at: float) -> None:
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO ai_cache (key, value, expires_at) VALUES (?, ?, ?)",
+                (key, value, expires_at)
+            )
+            conn.execute("DELETE FROM ai_cache WHERE expires_at <= ?", (time.time(),))
+
+    def clear(self, prefix: str = "") -> None:
+        with self._connect() as conn:
+            conn.execute("DELETE FROM ai_cache WHERE substr(key, 1, ?) = ?", (len(prefix), prefix))
+
+
+class RedisCacheStore:
+    """JSON entries in Redis (native expiry), shared by every host."""
+
+    NAMESPACE = "ai_cache:"
+
+    def __init__(self, url: str):
+        import redis
+
+        self._client = redis.Redis.from_url(url, decode_responses=True)
+
+    def get(self, key: str) -> Optional[Tuple[str, float]]:
+        name = self.NAMESPACE + key
+        pipe = self._client.pipeline()
+        pipe.get(name)
+        pipe.pttl(name)
+        value, ttl_ms = pipe.execute()
+        if value is None or ttl_ms is None or ttl_ms <= 0:
+            return None
+        return value, time.time() + ttl_ms / 1000
+
+    def set(self, key: str, value: str, expires_at: float) -> None:
+        ttl_ms = int((expires_at - time.time()) * 1000)
+        if ttl_ms > 0:
+            self._client.set(self.NAMESPACE + key, value, px=ttl_ms)
+
+    def clear(self, prefix: str = "") -> None:
+        names = list(self._client.scan_iter(match=f"{self.NAMESPACE}{prefix}*"))
+        if names:
+            self._client.delete(*names)
+
+
+class AIResponseCache:
+    """
+    Bounded TTL LRU with an optional shared store and single-flight loads.
+
+    Args:
+        maxsize: In-memory entries (default: settings.ai_cache_max_entries)
+        store: SQLiteCacheStore / RedisCacheStore, or None for memory only
+    """
+
+    def __init__(self, maxsize: Optional[int] = None, store: Any = None):
+        self.maxsize = maxsize if maxsize is not None else settings.ai_cache_max_entries
+        self.store = store
+        self._entries: "OrderedDict[str, Tuple[Any, float]]" = OrderedDict()  # key -> (value, expires_at)
+        self._lock = threading.Lock()
+        self._in_flight: Dict[str, asyncio.Task] = {}
+        self._reset_stats()
+
+    # =====================================================================
+    # SYNC ACCESS
+    # =====================================================================
+
+    def get(self, key: str) -> Optional[Any]:
+        """Look up a live entry in memory, then in the shared store."""
+        value = self._memory_get(key)
+        if value is not None:
+            return value
+        value = self._store_get(key)
+        with self._lock:
+            self._stats["misses" if value is None else "store_hits"] += 1
+        return value
+
+    def set(self, key: str, value: Any, ttl_seconds: float) -> None:
+        """Store an entry in memory and in the shared store."""
+        expires_at = time.time() + ttl_seconds
+        self._remember(key, value, expires_at)
+        self._store_set(key, value, expires_at)
+
+    def clear(self, prefix: str = "") -> None:
+        """Drop entries whose key starts with prefix (all by default)."""
+        with self._lock:
+            for key in [k for k in self._entries if k.startswith(prefix)]:
+                del self._entries[key]
+            if not prefix:
+                self._reset_stats()
+        if self.store is not None:
+            try:
+                self.store.clear(prefix)
+            except Exception as e:
+                logger.warning(f"Could not clear shared AI cache: {e}")
+
+    def count(self, prefix: str = "") -> int:
+        """In-memory entries whose key starts with prefix."""
+        with self._lock:
+            return sum(1 for k in self._entries if k.startswith(prefix))
+
+    # =====================================================================
+    # ASYNC SINGLE-FLIGHT
+    # =====================================================================
+
+    async def get_or_create(
+        self,
+        key: str,
+        factory: Callable[[], Awaitable[Any]],
+        ttl_seconds: float
+    ) -> Any:
+        """
+        Return the cached value for key, generating it with factory on a miss.
+
+        Concurrent callers with the same key share one factory call. It runs
+        in a task no caller owns, so a cancelled caller stops waiting without
+        cancelling the generation for the others. Failures propagate to every
+        waiter and are not cached.
+        """
+        value = self._memory_get(key)
+        if value is not None:
+            return value
+
+        task = self._in_flight.get(key)
+        if task is not None:
+            with self._lock:
+                self._stats["coalesced"] += 1
+        else:
+            task = asyncio.ensure_future(self._load(key, factory, ttl_seconds))
+            self._in_flight[key] = task
+            task.add_done_callback(partial(self._load_done, key))
+        return await asyncio.shield(task)
+
+    async def _load(self, key: str, factory: Callable[[], Awaitable[Any]], ttl_seconds: float) -> Any:
+        value = await asyncio.to_thread(self._store_get, key) if self.store is not None else None
+        if value is not None:
+            with self._lock:
+                self._stats["store_hits"] += 1
+            return value
+
+        with self._lock:
+            self._stats["misses"] += 1
+        started = time.perf_counter()
+        value = await factory()
+        self._record_generation(time.perf_counter() - started)
+        expires_at = time.time() + ttl_seconds
+        self._remember(key, value, expires_at)
+        if self.store is not None:
+            await asyncio.to_thread(self._store_set, key, value, expires_at)
+        return value
+
+    def _load_done(self, key: str, task: asyncio.Task) -> None:
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+        if not task.cancelled():
+            task.exception()  # Retrieved here so failures nobody awaited are not logged as unhandled
+
+    # =====================================================================
+    # METRICS
+    # =====================================================================
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            s = self._stats
+            lookups = s["hits"] + s["store_hits"] + s["misses"]
+            return {
+                "backend": type(self.store).__name__ if self.store is not None else "memory",
+                "entries": len(self._entries),
+                "maxsize": self.maxsize,
+                "in_flight": len(self._in_flight),
+                "hits": s["hits"],
+                "store_hits": s["store_hits"],
+                "misses": s["misses"],
+                "coalesced": s["coalesced"],
+                "evictions": s["evictions"],
+                "expired": s["expired"],
+                "store_errors": s["store_errors"],
+                "hit_rate": round((s["hits"] + s["store_hits"]) / lookups, 4) if lookups else 0.0,
+                "avg_generation_ms": (
+                    round(s["generation_seconds"] / s["generations"] * 1000, 1) if s["generations"] else 0.0
+                ),
+                "max_generation_ms": round(s["max_generation_seconds"] * 1000, 1),
+            }
+
+    # =====================================================================
+    # INTERNALS
+    # =====================================================================
+
+    def _reset_stats(self) -> None:
+        self._stats = {
+            "hits": 0, "store_hits": 0, "misses": 0, "coalesced": 0,
+            "evictions": 0, "expired": 0, "store_errors": 0,
+            "generations": 0, "generation_seconds": 0.0, "max_generation_seconds": 0.0,
+        }
+
+    def _memory_get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            value, expires_at = entry
+            if expires_at <= time.time():
+                del self._entries[key]
+                self._stats["expired"] += 1
+                return None
+            self._entries.move_to_end(key)
+            self._stats["hits"] += 1
+            return value
+
+    def _remember(self, key: str, value: Any, expires_at: float) -> None:
+        with self._lock:
+            self._entries[key] = (value, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self._stats["evictions"] += 1
+
+    def _store_get(self, key: str) -> Optional[Any]:
+        if self.store is None:
+            return None
+        try:
+            entry = self.store.get(key)
+        except Exception as e:
+            self._store_failed("read", e)
+            return None
+        if entry is None:
+            return None
+        raw, expires_at = entry
+        value = json.loads(raw)
+        self._remember(key, value, expires_at)
+        return value
+
+    def _store_set(self, key: str, value: Any, expires_at: float) -> None:
+        if self.store is None:
+            return
+        try:
+            raw = json.dumps(value)
+        except (TypeError, ValueError):
+            return  # Not JSON-serialisable: memory only
+        try:
+            self.store.set(key, raw, expires_at)
+        except Exception as e:
+            self._store_failed("write", e)
+
+    def _store_failed(self, action: str, error: Exception) -> None:
+        with self._lock:
+            self._stats["store_errors"] += 1
+        logger.warning(f"AI cache store {action} failed: {error}")
+
+    def _record_generation(self, seconds: float) -> None:
+        with self._lock:
+            self._stats["generations"] += 1
+            self._stats["generation_seconds"] += seconds
+            self._stats["max_generation_seconds"] = max(self._stats["max_generation_seconds"], seconds)
+
+
+def _build_store() -> Any:
+    backend = settings.ai_cache_backend.lower()
+    try:
+        if backend == "sqlite":
+            return SQLiteCacheStore(settings.ai_cache_sqlite_path or settings.OUTPUTS_DIR / "ai_cache.sqlite3")
+        if backend == "redis":
+            return RedisCacheStore(settings.redis_url)
+    except Exception as e:
+        logger.warning(f"AI cache backend '{backend}' unavailable, using memory only: {e}")
+        return None
+    if backend != "memory":
+        logger.warning(f"Unknown ai_cache_backend '{backend}', using memory only")
+    return None
+
+
+# Shared by the AI orchestrator and every genre generator in the process
+ai_response_cache = AIResponseCache(store=_build_store())
@@ -0,0 +1,211 @@
+"""
+Result cache for seeded genre arrangements.
+
+A seeded request is fully reproducible, so the arrangement and its rendered
+MIDI can be reused for any identical request. Entries live in a bounded
+in-memory LRU, backed by a bounded on-disk store under outputs/ so they
+survive restarts.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+from app.core.config import settings
+from app.gospel import Arrangement, Note
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CachedRender:
+    """Arrangement plus its encoded MIDI bytes."""
+    arrangement: Arrangement
+    midi_bytes: bytes
+
+
+class ArrangementCache:
+    """
+    Bounded LRU of rendered arrangements, keyed by request fingerprint.
+
+    Memory holds the most recent entries; disk holds a larger window as
+    <key>.mid / <key>.json pairs, trimmed oldest-first by mtime.
+    """
+
+    def __init__(
+        self,
+        maxsize: Optional[int] = None,
+        max_disk_entries: Optional[int] = None,
+        cache_dir: Optional[Path] = None
+    ):
+        self.maxsize = maxsize if maxsize is not None else settings.arrangement_cache_size
+        self.max_disk_entries = (
+            max_disk_entries if max_disk_entries is not None else settings.arrangement_cache_disk_entries
+        )
+        self._cache_dir = cache_dir
+        self._entries: "OrderedDict[str, CachedRender]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    @property
+    def cache_dir(self) -> Path:
+        return self._cache_dir or settings.OUTPUTS_DIR / "arrangement_cache"
+
+    @staticmethod
+    def make_key(
+        genre: str,
+        chords: Sequence[str],
+        key: str,
+        tempo: int,
+        application: Optional[str],
+        complexity: Optional[int],
+        seed: int,
+        **extra: Any
+    ) -> str:
+        """Stable fingerprint for an arrangement request."""
+        payload = {
+            "genre": genre.lower(),
+            "chords": list(chords),
+            "key": key,
+            "tempo": tempo,
+            "application": application,
+            "complexity": complexity,
+            "seed": seed,
+            **extra,
+        }
+        data = json.dumps(payload, sort_keys=True, default=str)
+        return hashlib.sha256(data.encode()).hexdigest()
+
+    def get(self, key: str) -> Optional[CachedRender]:
+        """Look up an entry in memory, then on disk (promoting disk hits)."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry
+
+        entry = self._read_disk(key)
+        with self._lock:
+            if entry is None:
+                self.misses += 1
+                return None
+            self.disk_hits += 1
+            self._remember(key, entry)
+        return entry
+
+    def put(self, key: str, arrangement: Arrangement, midi_bytes: bytes) -> None:
+        """Store an entry in memory and on disk."""
+        entry = CachedRender(arrangement=arrangement, midi_bytes=midi_bytes)
+        with self._lock:
+            self._remember(key, entry)
+
+        try:
+            self._write_disk(key, entry)
+        except OSError as e:
+            logger.warning(f"Could not persist arrangement cache entry {key[:12]}: {e}")
+
+    def clear(self, disk: bool = False) -> None:
+        """Drop in-memory entries (and on-disk files if requested)."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.disk_hits = self.misses = 0
+
+        if disk and self.cache_dir.exists():
+            for path in self.cache_dir.iterdir():
+                if path.suffix in (".mid", ".json"):
+                    path.unlink(missing_ok=True)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.disk_hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "maxsize": self.maxsize,
+                "hits": self.hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "hit_rate": round((self.hits + self.disk_hits) / lookups, 4) if lookups else 0.0,
+            }
+
+    # Internals
+
+    def _remember(self, key: str, entry: CachedRender) -> None:
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def _read_disk(self, key: str) -> Optional[CachedRender]:
+        midi_path = self.cache_dir / f"{key}.mid"
+        meta_path = self.cache_dir / f"{key}.json"
+        try:
+            meta = json.loads(meta_path.read_text())
+            midi_bytes = midi_path.read_bytes()
+        except (OSError, ValueError):
+            return None
+
+        os.utime(midi_path)  # Refresh for oldest-first trimming
+        return CachedRender(arrangement=_arrangement_from_dict(meta), midi_bytes=midi_bytes)
+
+    def _write_disk(self, key: str, entry: CachedRender) -> None:
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        _atomic_write(self.cache_dir / f"{key}.json", json.dumps(_arrangement_to_dict(entry.arrangement)).encode())
+        _atomic_write(self.cache_dir / f"{key}.mid", entry.midi_bytes)
+        self._trim_disk()
+
+    def _trim_disk(self) -> None:
+        midi_files = sorted(self.cache_dir.glob("*.mid"), key=lambda p: p.stat().st_mtime)
+        for path in midi_files[:max(0, len(midi_files) - self.max_disk_entries)]:
+            path.unlink(missing_ok=True)
+            path.with_suffix(".json").unlink(missing_ok=True)
+
+
+def _atomic_write(path: Path, data: bytes) -> None:
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    tmp.write_bytes(data)
+    tmp.replace(path)
+
+
+def _notes_to_rows(notes: List[Note]) -> List[list]:
+    return [[n.pitch, n.time, n.duration, n.velocity, n.hand] for n in notes]
+
+
+def _rows_to_notes(rows: List[list]) -> List[Note]:
+    return [Note(pitch=p, time=t, duration=d, velocity=v, hand=h) for p, t, d, v, h in rows]
+
+
+def _arrangement_to_dict(arrangement: Arrangement) -> Dict[str, Any]:
+    return {
+        "left_hand_notes": _notes_to_rows(arrangement.left_hand_notes),
+        "right_hand_notes": _notes_to_rows(arrangement.right_hand_notes),
+        "tempo": arrangement.tempo,
+        "time_signature": list(arrangement.time_signature),
+        "key": arrangement.key,
+        "total_bars": arrangement.total_bars,
+        "application": arrangement.application,
+    }
+
+
+def _arrangement_from_dict(data: Dict[str, Any]) -> Arrangement:
+    return Arrangement(
+        left_hand_notes=_rows_to_notes(data["left_hand_notes"]),
+        right_hand_notes=_rows_to_notes(data["right_hand_notes"]),
+        tempo=data["tempo"],
+        time_signature=tuple(data["time_signature"]),
+        key=data["key"],
+        total_bars=data["total_bars"],
+        application=data["application"],
+    )
+
+
+# Shared by all genre generators (genre is part of the key)
+arrangement_cache = ArrangementCache()
@@ -16,6 +16,7 @@ from app.database.curriculum_models import CurriculumExercise
 from app.services.stable_audio_service import stable_audio_service
 from app.services.midi_generation_service import midi_generation_service
 from app.core.config import settings
+from app.core.lazy import lazy_service
 
 logger = logging.getLogger(__name__)
 
@@ -302,7 +303,7 @@ class AudioPipelineService:
             Text prompt string
         """
         try:
-            content = json.loads(exercise.content_json)
+            content = json.loads(exercise.effective_content_json)
             exercise_type = exercise.exercise_type
 
             # Base prompt
@@ -360,7 +361,7 @@ class AudioPipelineService:
             Duration in seconds
         """
         try:
-            content = json.loads(exercise.content_json)
+            content = json.loads(exercise.effective_content_json)
             exercise_type = exercise.exercise_type
             bpm = exercise.target_bpm or 90
 
@@ -391,5 +392,5 @@ class AudioPipelineService:
             return 10.0  # Safe default
 
 
-# Singleton instance
-audio_pipeline_service = AudioPipelineService()
+# Singleton instance (probes FluidSynth on first use)
+audio_pipeline_service = lazy_service("audio_pipeline", AudioPipelineService)
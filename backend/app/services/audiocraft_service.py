@@ -3,6 +3,8 @@ from pathlib import Path
 import logging
 import asyncio
 
+from app.services.model_registry import model_registry
+
 logger = logging.getLogger(__name__)
 
 class AudioCraftService:
@@ -10,24 +12,41 @@ class AudioCraftService:
     Service for generative audio using Meta's AudioCraft (MusicGen).
     """
     
+    # Approximate resident size per MusicGen checkpoint (incl. T5 + EnCodec)
+    MODEL_SIZES_GB = {"small": 2.0, "medium": 6.0, "large": 13.0}
+
     def __init__(self):
-        self.model = None
         self._model_name = 'small' # Default to small for lighter resource usage
-        
+        self.registry_key = f"musicgen:{self._model_name}"
+        model_registry.register(
+            self.registry_key,
+            self._build_model,
+            size_gb=self.MODEL_SIZES_GB.get(self._model_name, 2.0)
+        )
+
+    @property
+    def model(self):
+        """Resident MusicGen model, or None if not loaded (or evicted)."""
+        return model_registry.get(self.registry_key)
+
     def _load_model(self):
-        """Lazy load the model to save resources until needed."""
-        if self.model is None:
-            try:
-                from audiocraft.models import MusicGen
-                logger.info(f"Loading MusicGen model: {self._model_name}")
-                self.model = MusicGen.get_pretrained(f'facebook/musicgen-{self._model_name}')
-                self.model.set_generation_params(duration=10) # Default 10s
-            except ImportError:
-                logger.error("AudioCraft not installed.")
-                raise ImportError("AudioCraft library is not available.")
-            except Exception as e:
-                logger.error(f"Failed to load MusicGen: {e}")
-                raise e
+        """Lazy load the model through the shared model registry."""
+        return model_registry.load(self.registry_key)
+
+    def _build_model(self):
+        """Registry loader: fetch the pretrained MusicGen checkpoint."""
+        try:
+            from audiocraft.models import MusicGen
+            logger.info(f"Loading MusicGen model: {self._model_name}")
+            model = MusicGen.get_pretrained(f'facebook/musicgen-{self._model_name}')
+            model.set_generation_params(duration=10) # Default 10s
+            return model
+        except ImportError:
+            logger.error("AudioCraft not installed.")
+            raise ImportError("AudioCraft library is not available.")
+        except Exception as e:
+            logger.error(f"Failed to load MusicGen: {e}")
+            raise e
 
     async def generate_music(self, prompt: str, duration: int = 15, output_path: Path = None) -> Path:
         """
@@ -38,9 +57,11 @@ class AudioCraftService:
             loop = asyncio.get_event_loop()
             
             def _generate():
-                self._load_model()
-                self.model.set_generation_params(duration=duration)
-                wav = self.model.generate([prompt])
+                # Pinned so the registry cannot evict it mid-run
+                with model_registry.use(self.registry_key) as model:
+                    model.set_generation_params(duration=duration)
+                    wav = model.generate([prompt])
+                    sample_rate = model.sample_rate
                 
                 # Save to file
                 from audiocraft.data.audio import audio_write
@@ -48,7 +69,7 @@ class AudioCraftService:
                     # AudioCraft adds extension automatically, strip it if present?
                     # audio_write expects path without extension
                     stem_path = str(output_path.with_suffix(''))
-                    audio_write(stem_path, wav[0].cpu(), self.model.sample_rate, strategy="loudness", loudness_compressor=True)
+                    audio_write(stem_path, wav[0].cpu(), sample_rate, strategy="loudness", loudness_compressor=True)
                     return output_path
                 return None
 
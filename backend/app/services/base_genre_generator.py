@@ -23,25 +23,32 @@ Usage:
             )
 """
 
+import asyncio
 import base64
+import random
 import re
 from abc import ABC, abstractmethod
+from concurrent.futures import Executor
 from pathlib import Path
 from typing import Type, Optional, List, Tuple, Dict, Any
-import google.generativeai as genai
 
 from app.core.config import settings
+from app.core.lazy import lazy_import
+from app.services.arrangement_cache import ArrangementCache, arrangement_cache
 from app.services.generator_utils import (
+    RenderJob,
     parse_json_from_response,
-    export_to_midi,
+    midi_filename,
+    render_midi,
+    run_render_job,
+    save_midi,
     get_notes_preview,
     parse_description_fallback
 )
+from app.services.humanizer import ArrangementHumanizer
 
-
-# Configure Gemini globally
-if settings.google_api_key:
-    genai.configure(api_key=settings.google_api_key)
+# Gemini SDK is imported when a generator first initializes it
+genai = lazy_import("google.generativeai")
 
 
 class BaseGenreGenerator(ABC):
@@ -67,7 +74,8 @@ class BaseGenreGenerator(ABC):
         response_schema: Type,
         status_schema: Type,
         default_tempo: int = 120,
-        output_subdir: str = "generated"
+        output_subdir: str = "generated",
+        humanization_amount: float = 0.3
     ):
         """
         Initialize base generator with genre-specific configuration.
@@ -80,6 +88,7 @@ class BaseGenreGenerator(ABC):
             status_schema: Pydantic schema for status
             default_tempo: Default BPM if not specified
             output_subdir: Subdirectory under outputs/ for MIDI files
+            humanization_amount: Groove humanization applied at export (0.0-1.0)
         """
         self.genre_name = genre_name
         self.request_schema = request_schema
@@ -87,6 +96,7 @@ class BaseGenreGenerator(ABC):
         self.status_schema = status_schema
         self.default_tempo = default_tempo
         self.output_subdir = output_subdir
+        self.humanization_amount = humanization_amount
 
         # Initialize Gemini model
         self.gemini_model = self._init_gemini()
@@ -103,6 +113,7 @@ class BaseGenreGenerator(ABC):
         """
         if settings.google_api_key:
             try:
+                genai.configure(api_key=settings.google_api_key)
                 model = genai.GenerativeModel('gemini-1.5-flash')
                 print(f"✅ Gemini API initialized for {self.genre_name}")
                 return model
@@ -193,57 +204,236 @@ class BaseGenreGenerator(ABC):
             Response schema instance (genre-specific)
         """
         try:
-            # Step 1: Generate chord progression
-            if self.gemini_model and request.include_progression:
-                print(f"🎵 Generating {self.genre_name} chord progression with Gemini...")
-                chords, key, tempo, analysis = await self._generate_progression_with_gemini(
-                    request.description,
-                    request.key,
-                    request.tempo,
-                    request.num_bars,
-                    getattr(request, 'complexity', 5),
-                    getattr(request, 'style', '')
-                )
-            else:
-                print(f"📝 Using fallback progression for {self.genre_name}...")
-                chords, key, tempo = self._parse_description_with_fallback(
-                    request.description,
-                    request.key,
-                    request.tempo
-                )
-                analysis = []
+            # Steps 1-3: Chord progression, arrangement, MIDI export
+            arrangement, analysis, midi_bytes, _, midi_path = await self._render_arrangement(
+                request, persist=True
+            )
+
+            # Step 4: Build response
+            return self._build_success_response(
+                midi_path=midi_path,
+                midi_base64=base64.b64encode(midi_bytes).decode('utf-8'),
+                arrangement=arrangement,
+                analysis=analysis,
+                request=request
+            )
+
+        except Exception as e:
+            print(f"❌ {self.genre_name} generation failed: {e}")
+            import traceback
+            traceback.print_exc()
+            return self._build_error_response(str(e))
+
+    async def generate_midi(self, request, persist: bool = False) -> Tuple[bytes, str]:
+        """
+        Generate an arrangement and return raw MIDI bytes for streaming.
+
+        Same pipeline as generate_arrangement, without the base64/JSON
+        response. Errors propagate to the caller.
+
+        Args:
+            request: Request schema instance (genre-specific)
+            persist: Also save the file under outputs/ for /download
+
+        Returns:
+            Tuple of (midi_bytes, filename)
+        """
+        _, _, midi_bytes, filename, _ = await self._render_arrangement(request, persist=persist)
+        return midi_bytes, filename
+
+    def _create_humanizer(self, seed: Optional[int] = None) -> ArrangementHumanizer:
+        """
+        Create the shared groove humanizer for this genre.
+
+        A fresh instance per request keeps random state independent
+        across concurrent generations.
+        """
+        return ArrangementHumanizer(self.genre_name, seed=seed)
+
+    async def _render_arrangement(
+        self,
+        request,
+        persist: bool
+    ) -> Tuple[Any, List, bytes, str, Optional[Path]]:
+        """
+        Run steps 1-3 of the pipeline, reusing cached renders for seeded requests.
+
+        Args:
+            request: Request schema instance (genre-specific)
+            persist: Save the MIDI file under outputs/
+
+        Returns:
+            Tuple of (arrangement, analysis, midi_bytes, filename, midi_path or None)
+        """
+        # Step 1: Generate chord progression
+        chords, key, tempo, analysis = await self._prepare_progression(request)
+
+        # Steps 2-3: Arrangement and MIDI export
+        arrangement, midi_bytes, filename, midi_path = await self._render_progression(
+            chords, key, tempo, request, persist=persist
+        )
+        return arrangement, analysis, midi_bytes, filename, midi_path
 
+    async def _render_progression(
+        self,
+        chords: List[str],
+        key: str,
+        tempo: int,
+        request: Any,
+        persist: bool,
+        executor: Optional[Executor] = None
+    ) -> Tuple[Any, bytes, str, Optional[Path]]:
+        """
+        Run steps 2-3 of the pipeline for a chord progression.
+
+        With request.seed set, the arranger, humanizer and encoder are all
+        seeded, so the result is keyed by (genre, chords, key, tempo,
+        application, complexity, seed) in the shared arrangement cache.
+
+        Args:
+            chords: Chord symbols from step 1
+            key: Musical key
+            tempo: BPM
+            request: Request schema instance (genre-specific)
+            persist: Save the MIDI file under outputs/
+            executor: Process pool for the CPU-bound work (None = in-process)
+
+        Returns:
+            Tuple of (arrangement, midi_bytes, filename, midi_path or None)
+        """
+        seed = getattr(request, 'seed', None)
+        cache_key = self._arrangement_cache_key(chords, key, tempo, request)
+        if cache_key is not None:
+            cached = await asyncio.to_thread(arrangement_cache.get, cache_key)
+            if cached is not None:
+                print(f"⚡ Reusing cached {self.genre_name} arrangement (seed={seed})")
+                filename = midi_filename(cached.arrangement, self.genre_name.lower())
+                midi_path = (
+                    await save_midi(cached.midi_bytes, self.output_subdir, filename)
+                    if persist else None
+                )
+                return cached.arrangement, cached.midi_bytes, filename, midi_path
+
+        job = self._render_job(chords, key, tempo, request) if executor is not None else None
+        if job is not None:
+            # Steps 2-3 in a worker process
+            loop = asyncio.get_running_loop()
+            arrangement, midi_bytes = await loop.run_in_executor(executor, run_render_job, job)
+            filename = midi_filename(arrangement, self.genre_name.lower())
+            midi_path = await save_midi(midi_bytes, self.output_subdir, filename) if persist else None
+        else:
             # Step 2: Generate MIDI arrangement
             print(f"🎹 Generating {self.genre_name} arrangement...")
             arrangement = self._create_arrangement(
                 chords=chords,
                 key=key,
                 tempo=tempo,
-                request=request
+                request=request,
+                rng=random.Random(seed)
             )
 
             # Step 3: Export to MIDI
             print(f"💾 Exporting {self.genre_name} MIDI...")
-            midi_path, midi_base64 = export_to_midi(
+            midi_bytes, filename, midi_path = await render_midi(
                 arrangement,
                 self.output_subdir,
-                self.genre_name.lower()
+                self.genre_name.lower(),
+                persist=persist,
+                humanizer=self._create_humanizer(seed),
+                humanization_amount=self.humanization_amount,
+                seed=seed
             )
 
-            # Step 4: Build response
-            return self._build_success_response(
-                midi_path=midi_path,
-                midi_base64=midi_base64,
-                arrangement=arrangement,
-                analysis=analysis,
-                request=request
+        if cache_key is not None:
+            await asyncio.to_thread(arrangement_cache.put, cache_key, arrangement, midi_bytes)
+
+        return arrangement, midi_bytes, filename, midi_path
+
+    def _render_job(
+        self,
+        chords: List[str],
+        key: str,
+        tempo: int,
+        request: Any
+    ) -> Optional[RenderJob]:
+        """
+        Describe steps 2-3 as a picklable job for a worker process.
+
+        Returns None when the arrangement cannot leave this process:
+        AI-blended arrangements (ai_percentage > 0) need the loaded model.
+        """
+        if getattr(request, 'ai_percentage', 0.0) > 0:
+            return None
+
+        return RenderJob(
+            arranger_class=type(self.arranger),
+            arrange_params=self._arrange_params(chords, key, tempo, request),
+            genre=self.genre_name,
+            humanization_amount=self.humanization_amount,
+            seed=getattr(request, 'seed', None)
+        )
+
+    def uses_llm_progression(self, request) -> bool:
+        """Whether step 1 calls an LLM for this request (for rate limiting)."""
+        return bool(self.gemini_model and request.include_progression)
+
+    async def _prepare_progression(self, request) -> Tuple[List[str], str, int, List]:
+        """
+        Run step 1 of the pipeline: chord progression (Gemini or fallback).
+
+        Args:
+            request: Request schema instance (genre-specific)
+
+        Returns:
+            Tuple of (chords, key, tempo, analysis)
+        """
+        if self.gemini_model and request.include_progression:
+            print(f"🎵 Generating {self.genre_name} chord progression with Gemini...")
+            return await self._generate_progression_with_gemini(
+                request.description,
+                request.key,
+                request.tempo,
+                request.num_bars,
+                getattr(request, 'complexity', 5),
+                getattr(request, 'style', '')
             )
 
-        except Exception as e:
-            print(f"❌ {self.genre_name} generation failed: {e}")
-            import traceback
-            traceback.print_exc()
-            return self._build_error_response(str(e))
+        print(f"📝 Using fallback progression for {self.genre_name}...")
+        chords, key, tempo = self._parse_description_with_fallback(
+            request.description,
+            request.key,
+            request.tempo
+        )
+        return chords, key, tempo, []
+
+    def _arrangement_cache_key(
+        self,
+        chords: List[str],
+        key: str,
+        tempo: int,
+        request: Any
+    ) -> Optional[str]:
+        """
+        Cache key for a seeded request, or None if the result is not reproducible.
+
+        Unseeded requests draw fresh randomness, and AI-blended arrangements
+        (ai_percentage > 0) sample from a model outside the seeded state.
+        """
+        seed = getattr(request, 'seed', None)
+        if seed is None or getattr(request, 'ai_percentage', 0.0) > 0:
+            return None
+
+        application = getattr(request, 'application', None)
+        return ArrangementCache.make_key(
+            genre=self.genre_name,
+            chords=chords,
+            key=key,
+            tempo=tempo,
+            application=getattr(application, 'value', application),
+            complexity=getattr(request, 'complexity', None),
+            seed=seed,
+            humanization_amount=self.humanization_amount
+        )
 
     # =====================================================================
     # PROGRESSION GENERATION - Gemini-powered or fallback
@@ -303,8 +493,8 @@ Return ONLY valid JSON with this exact structure:
 
 Generate {num_bars} chords total. Each chord should have symbol, function, notes, and comment."""
 
-        # Call Gemini
-        response = self.gemini_model.generate_content(prompt)
+        # Call Gemini (async client keeps concurrent generations off the event loop)
+        response = await self.gemini_model.generate_content_async(prompt)
 
         # Parse JSON response using shared utility
         data = parse_json_from_response(response.text.strip())
@@ -391,7 +581,8 @@ Generate {num_bars} chords total. Each chord should have symbol, function, notes
         chords: List[str],
         key: str,
         tempo: int,
-        request: Any
+        request: Any,
+        rng: Optional[random.Random] = None
     ) -> Any:
         """
         Create MIDI arrangement using genre-specific arranger.
@@ -401,10 +592,41 @@ Generate {num_bars} chords total. Each chord should have symbol, function, notes
             key: Musical key
             tempo: BPM
             request: Original request (for additional parameters)
+            rng: Per-request random source, random.Random(seed) for seeded
+                requests (None = unseeded)
 
         Returns:
             Arrangement object
         """
+        if hasattr(request, 'ai_percentage'):
+            # For hybrid arrangers that support AI blending
+            if hasattr(self.arranger, 'set_ai_percentage'):
+                self.arranger.set_ai_percentage(request.ai_percentage)
+
+        return self.arranger.arrange_progression(
+            **self._arrange_params(chords, key, tempo, request),
+            rng=rng
+        )
+
+    def _arrange_params(
+        self,
+        chords: List[str],
+        key: str,
+        tempo: int,
+        request: Any
+    ) -> Dict[str, Any]:
+        """
+        Keyword arguments for the arranger's arrange_progression().
+
+        Args:
+            chords: List of chord symbols
+            key: Musical key
+            tempo: BPM
+            request: Original request (for additional parameters)
+
+        Returns:
+            Dict of arrange_progression() arguments
+        """
         # Standard arrangement parameters
         arrange_params = {
             "chords": chords,
@@ -420,12 +642,7 @@ Generate {num_bars} chords total. Each chord should have symbol, function, notes
         if hasattr(request, 'complexity'):
             arrange_params['complexity'] = request.complexity
 
-        if hasattr(request, 'ai_percentage'):
-            # For hybrid arrangers that support AI blending
-            if hasattr(self.arranger, 'set_ai_percentage'):
-                self.arranger.set_ai_percentage(request.ai_percentage)
-
-        return self.arranger.arrange_progression(**arrange_params)
+        return arrange_params
 
     # =====================================================================
     # RESPONSE BUILDING - Constructs success/error responses
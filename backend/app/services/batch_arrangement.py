@@ -0,0 +1,212 @@
+"""
+Batch arrangement generation across genres.
+
+Each item runs the normal genre pipeline, split by the kind of work it does:
+
+1. Chord progression - LLM calls fan out concurrently on the event loop,
+   bounded by a shared AsyncRateLimiter (requests/minute + in-flight cap)
+2. Arrangement + MIDI encoding - CPU-bound, submitted to a process pool
+   so batches use every core instead of serializing on the GIL
+3. Results are yielded as they complete, not in request order
+
+Seeded items still go through the shared arrangement cache, and an item
+that fails is reported in its result without aborting the batch.
+"""
+
+import asyncio
+import base64
+import importlib
+import logging
+import multiprocessing
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import AsyncIterator, Dict, Optional, Sequence, Tuple
+
+from pydantic import ValidationError
+
+from app.core.config import settings
+from app.schemas.batch import BatchArrangementItem, BatchArrangementResult
+from app.services.base_genre_generator import BaseGenreGenerator
+from app.utils.rate_limiter import AsyncRateLimiter
+
+logger = logging.getLogger(__name__)
+
+
+# genre -> (module, singleton); imported on first use so loading this
+# module does not initialize every generator
+GENRE_GENERATORS: Dict[str, Tuple[str, str]] = {
+    "gospel": ("app.services.gospel_generator", "gospel_generator_service"),
+    "jazz": ("app.services.jazz_generator", "jazz_generator_service"),
+    "blues": ("app.services.blues_generator", "blues_generator_service"),
+    "neosoul": ("app.services.neosoul_generator", "neosoul_generator_service"),
+    "classical": ("app.services.classical_generator", "classical_generator_service"),
+    "latin": ("app.services.latin_generator", "latin_generator_service"),
+    "reggae": ("app.services.reggae_generator", "reggae_generator_service"),
+    "rnb": ("app.services.rnb_generator", "rnb_generator_service"),
+}
+
+
+class BatchArrangementService:
+    """
+    Generates many arrangements concurrently and streams the results.
+
+    Args:
+        max_workers: Worker processes for arrangement + encoding
+        llm_requests_per_minute: Progression LLM calls allowed per minute
+        llm_max_concurrency: Progression LLM calls in flight at once
+        executor: Executor for CPU work (default: lazily created process pool)
+        generators: genre -> generator overrides (default: genre singletons)
+    """
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        llm_requests_per_minute: Optional[int] = None,
+        llm_max_concurrency: Optional[int] = None,
+        executor: Optional[Executor] = None,
+        generators: Optional[Dict[str, BaseGenreGenerator]] = None
+    ):
+        self.max_workers = max_workers or settings.batch_max_workers
+        self.llm_requests_per_minute = llm_requests_per_minute or settings.batch_llm_requests_per_minute
+        self.llm_max_concurrency = llm_max_concurrency or settings.batch_llm_max_concurrency
+        self._executor = executor
+        self._owns_executor = executor is None
+        self._generators: Dict[str, BaseGenreGenerator] = dict(generators or {})
+        self._limiter: Optional[AsyncRateLimiter] = None
+        self._limiter_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    @property
+    def executor(self) -> Executor:
+        """Process pool for CPU work (spawned workers, created on first use)."""
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn")
+            )
+        return self._executor
+
+    @property
+    def llm_limiter(self) -> AsyncRateLimiter:
+        """Rate limiter shared by every batch on the running event loop."""
+        loop = asyncio.get_running_loop()
+        if self._limiter is None or self._limiter_loop is not loop:
+            self._limiter = AsyncRateLimiter(
+                max_calls=self.llm_requests_per_minute,
+                period=60.0,
+                max_concurrent=self.llm_max_concurrency
+            )
+            self._limiter_loop = loop
+        return self._limiter
+
+    def get_generator(self, genre: str) -> BaseGenreGenerator:
+        """Genre generator singleton, imported on first use."""
+        generator = self._generators.get(genre)
+        if generator is None:
+            if genre not in GENRE_GENERATORS:
+                raise ValueError(f"Unknown genre: {genre}")
+            module_name, attr = GENRE_GENERATORS[genre]
+            generator = getattr(importlib.import_module(module_name), attr)
+            self._generators[genre] = generator
+        return generator
+
+    async def generate(
+        self,
+        items: Sequence[BatchArrangementItem],
+        max_concurrency: Optional[int] = None,
+        persist: bool = False,
+        include_midi: bool = True
+    ) -> AsyncIterator[BatchArrangementResult]:
+        """
+        Generate every item, yielding each result as soon as it completes.
+
+        Args:
+            items: Arrangement specs
+            max_concurrency: Items processed at once (default from settings)
+            persist: Save each MIDI file under outputs/
+            include_midi: Include base64 MIDI in results
+
+        Yields:
+            BatchArrangementResult per item, in completion order
+        """
+        semaphore = asyncio.Semaphore(max_concurrency or settings.batch_max_concurrency)
+        limiter = self.llm_limiter
+
+        async def run(index: int, item: BatchArrangementItem) -> BatchArrangementResult:
+            async with semaphore:
+                return await self._generate_item(index, item, limiter, persist, include_midi)
+
+        tasks = [asyncio.create_task(run(i, item)) for i, item in enumerate(items)]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            # Client disconnected or caller stopped iterating
+            for task in tasks:
+                task.cancel()
+
+    async def _generate_item(
+        self,
+        index: int,
+        item: BatchArrangementItem,
+        limiter: AsyncRateLimiter,
+        persist: bool,
+        include_midi: bool
+    ) -> BatchArrangementResult:
+        """Run one item through the pipeline; failures become error results."""
+        start = time.perf_counter()
+        genre = item.genre.value
+
+        try:
+            generator = self.get_generator(genre)
+            request = generator.request_schema(**item.request)
+
+            # Step 1: Chord progression (rate limited when it calls the LLM)
+            if generator.uses_llm_progression(request):
+                async with limiter:
+                    chords, key, tempo, _ = await generator._prepare_progression(request)
+            else:
+                chords, key, tempo, _ = await generator._prepare_progression(request)
+
+            # Steps 2-3: Arrangement + MIDI in the worker pool
+            arrangement, midi_bytes, filename, midi_path = await generator._render_progression(
+                chords, key, tempo, request, persist=persist, executor=self.executor
+            )
+        except asyncio.CancelledError:
+            raise
+        except ValidationError as e:
+            return self._failed(index, genre, f"Invalid request: {e}", start)
+        except Exception as e:
+            logger.warning("Batch item %d (%s) failed: %s", index, genre, e)
+            return self._failed(index, genre, str(e), start)
+
+        return BatchArrangementResult(
+            index=index,
+            genre=genre,
+            success=True,
+            key=arrangement.key,
+            tempo=arrangement.tempo,
+            chords=chords,
+            midi_filename=filename,
+            midi_base64=base64.b64encode(midi_bytes).decode('utf-8') if include_midi else None,
+            midi_file_path=str(midi_path) if midi_path else None,
+            generation_time_seconds=time.perf_counter() - start
+        )
+
+    @staticmethod
+    def _failed(index: int, genre: str, error: str, start: float) -> BatchArrangementResult:
+        return BatchArrangementResult(
+            index=index,
+            genre=genre,
+            success=False,
+            error=error,
+            generation_time_seconds=time.perf_counter() - start
+        )
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the worker pool (if this service created it)."""
+        if self._executor is not None and self._owns_executor:
+            self._executor.shutdown(wait=wait, cancel_futures=True)
+            self._executor = None
+
+
+batch_arrangement_service = BatchArrangementService()
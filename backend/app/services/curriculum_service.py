@@ -5,13 +5,15 @@ Manages curriculum generation, CRUD operations, progress tracking, and adaptive
 
 import json
 import logging
+import threading
+import time
 import uuid
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 
-from sqlalchemy import select, and_, or_
+from sqlalchemy import select, insert, update, func, literal, values, column, union_all, String, and_, or_, case
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import aliased, selectinload
 
 logger = logging.getLogger(__name__)
 
@@ -23,6 +25,7 @@ from app.database.curriculum_models import (
     CurriculumExercise,
     Assessment,
 )
+from app.core.config import settings
 from app.database.models import User
 from app.services.ai_orchestrator import ai_orchestrator
 from app.services.curriculum_defaults import DEFAULT_CURRICULUMS
@@ -34,6 +37,64 @@ from app.services.template_loader import template_loader
 logger = logging.getLogger(__name__)
 
 
+class _PracticeQueueCache:
+    """
+    Short-lived per-user cache of ranked daily practice queues.
+
+    Entries are plain dicts (exercise id, lesson/module title, priority),
+    never ORM instances; get_daily_practice reloads the exercises in the
+    caller's session on every hit. Completing an exercise here drops every
+    cached queue that lists it. Changes made by other workers show up when
+    the reloaded exercise no longer qualifies, or once the entry expires
+    (settings.daily_practice_cache_seconds).
+    """
+
+    def __init__(self):
+        # user_id -> (expires_at, limit queried, rows)
+        self._entries: Dict[int, Tuple[float, int, List[Dict[str, Any]]]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, user_id: int, limit: int) -> Optional[List[Dict[str, Any]]]:
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry is None:
+                return None
+            expires_at, cached_limit, items = entry
+            if expires_at <= time.monotonic():
+                del self._entries[user_id]
+                return None
+            # A shorter query only covers this one if it returned the whole queue
+            if cached_limit < limit and len(items) == cached_limit:
+                return None
+            return items[:limit]
+
+    def set(self, user_id: int, limit: int, items: List[Dict[str, Any]]) -> None:
+        ttl = settings.daily_practice_cache_seconds
+        if ttl > 0:
+            with self._lock:
+                self._entries[user_id] = (time.monotonic() + ttl, limit, items)
+
+    def invalidate_user(self, user_id: int) -> None:
+        with self._lock:
+            self._entries.pop(user_id, None)
+
+    def invalidate_exercise(self, exercise_id: str) -> None:
+        with self._lock:
+            stale = [
+                user_id for user_id, (_, _, items) in self._entries.items()
+                if any(item['exercise_id'] == exercise_id for item in items)
+            ]
+            for user_id in stale:
+                del self._entries[user_id]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+practice_queue_cache = _PracticeQueueCache()
+
+
 class CurriculumService:
     """
     Service for managing curriculum generation, tracking, and adaptation.
@@ -423,7 +484,9 @@ class CurriculumService:
             )
             self.db.add(module)
             
-            for lesson_data in module_data.get('lessons', []):
+            lessons_data = module_data.get('lessons', [])
+            module.lessons_total = len(lessons_data)
+            for lesson_data in lessons_data:
                 lesson = CurriculumLesson(
                     id=str(uuid.uuid4()),
                     module_id=module.id,
@@ -433,6 +496,7 @@ class CurriculumService:
                     theory_content_json=json.dumps(lesson_data.get('theory_content', {})),
                     concepts_json=json.dumps(lesson_data.get('concepts', [])),
                     estimated_duration_minutes=lesson_data.get('estimated_duration_minutes', 60),
+                    exercises_total=len(lesson_data.get('exercises', [])),
                 )
                 self.db.add(lesson)
                 
@@ -467,6 +531,8 @@ class CurriculumService:
         )
         curriculum = result.scalar_one()
 
+        practice_queue_cache.invalidate_user(user_id)
+
         # Queue audio generation for all exercises (Phase 1)
         await self._queue_curriculum_audio_generation(curriculum.id)
 
@@ -479,31 +545,26 @@ class CurriculumService:
             curriculum_id: Curriculum ID
         """
         try:
-            from app.tasks.audio_generation import generate_exercise_audio_task
+            from app.tasks.audio_generation import queue_exercise_audio
 
-            # Get all exercises in the curriculum
+            # Get all exercise ids in the curriculum
             result = await self.db.execute(
-                select(CurriculumExercise)
+                select(CurriculumExercise.id)
                 .join(CurriculumLesson)
                 .join(CurriculumModule)
                 .join(Curriculum)
                 .where(Curriculum.id == curriculum_id)
             )
-            exercises = result.scalars().all()
-
-            logger.info(f"Queueing audio generation for {len(exercises)} exercises in curriculum {curriculum_id}")
+            exercise_ids = list(result.scalars().all())
 
-            # Queue a task for each exercise with staggered countdown
-            for idx, exercise in enumerate(exercises):
-                # Stagger tasks every 10 seconds to avoid overwhelming the system
-                countdown_seconds = idx * 10
-
-                generate_exercise_audio_task.apply_async(
-                    args=[exercise.id, "both"],  # Generate both FluidSynth and Stable Audio
-                    countdown=countdown_seconds
-                )
+            # Batches are rate limited by the worker, and identical content
+            # is rendered once across curricula
+            task_ids = queue_exercise_audio(exercise_ids, "both")  # FluidSynth and Stable Audio
 
-            logger.info(f"Successfully queued {len(exercises)} audio generation tasks")
+            logger.info(
+                f"Queued audio generation for {len(exercise_ids)} exercises in curriculum "
+                f"{curriculum_id} as {len(task_ids)} batch tasks"
+            )
 
         except Exception as e:
             logger.error(f"Failed to queue audio generation for curriculum {curriculum_id}: {e}")
@@ -634,13 +695,11 @@ class CurriculumService:
     # Curriculum Retrieval Methods
     # =========================================================================
     
-    async def get_active_curriculum(self, user_id: int) -> Optional[Curriculum]:
-        """Get user's active curriculum with modules (returns most recent if multiple exist)"""
-        result = await self.db.execute(
+    @staticmethod
+    def _active_curriculum_query(user_id: int):
+        """Most recently updated active/completed curriculum for a user"""
+        return (
             select(Curriculum)
-            .options(
-                selectinload(Curriculum.modules).selectinload(CurriculumModule.lessons)
-            )
             .where(
                 and_(
                     Curriculum.user_id == user_id,
@@ -650,6 +709,22 @@ class CurriculumService:
             .order_by(Curriculum.updated_at.desc())
             .limit(1)
         )
+
+    async def get_active_curriculum(self, user_id: int, load_modules: bool = True) -> Optional[Curriculum]:
+        """
+        Get user's active curriculum (returns most recent if multiple exist).
+
+        Args:
+            user_id: Owner
+            load_modules: Eagerly load modules and lessons (skip when only
+                the curriculum row is needed)
+        """
+        query = self._active_curriculum_query(user_id)
+        if load_modules:
+            query = query.options(
+                selectinload(Curriculum.modules).selectinload(CurriculumModule.lessons)
+            )
+        result = await self.db.execute(query)
         return result.unique().scalars().first()
     
     async def get_curriculum_with_details(self, curriculum_id: str) -> Optional[Curriculum]:
@@ -704,15 +779,9 @@ class CurriculumService:
         Make a curriculum active. 
         If it belongs to another user (Global Admin), CLONE it first.
         """
-        # Get the curriculum provided
+        # Get the curriculum provided (the clone copies its tree in SQL)
         result = await self.db.execute(
-            select(Curriculum)
-            .options(
-                selectinload(Curriculum.modules)
-                .selectinload(CurriculumModule.lessons)
-                .selectinload(CurriculumLesson.exercises)
-            )
-            .where(Curriculum.id == curriculum_id)
+            select(Curriculum).where(Curriculum.id == curriculum_id)
         )
         target = result.scalar_one_or_none()
         
@@ -724,6 +793,7 @@ class CurriculumService:
             target.updated_at = datetime.utcnow()
             target.status = 'active'
             await self.db.commit()
+            practice_queue_cache.invalidate_user(user_id)
             await self.db.refresh(target)
             return target
             
@@ -731,97 +801,211 @@ class CurriculumService:
         # Verify it is indeed global (optional check, but good for security)
         # For now, if it exists and not ours, we assume we can clone it if we can see it.
         
-        return await self._clone_curriculum(target, user_id)
+        return await self._clone_curriculum(
+            target, user_id, share_content=settings.curriculum_clone_share_content
+        )
 
-    async def _clone_curriculum(self, source: Curriculum, new_owner_id: int) -> Curriculum:
-        """Deep clone a curriculum for a new owner"""
+    async def _clone_curriculum(
+        self,
+        source: Curriculum,
+        new_owner_id: int,
+        share_content: bool = False
+    ) -> Curriculum:
+        """
+        Deep clone a curriculum for a new owner.
+
+        Modules, lessons and exercises are copied level by level with
+        INSERT ... SELECT, joined to a precomputed old id -> new id mapping, so
+        the clone takes a fixed number of statements however large the
+        template is. Progress and SRS state are reset; generated audio/MIDI
+        paths are kept (the files are static).
+
+        Args:
+            source: Curriculum to copy (its tree does not need to be loaded)
+            new_owner_id: User who owns the clone
+            share_content: Point cloned exercises at the template's content
+                (content_source_id) instead of duplicating content_json
+        """
         logger.info(f"Cloning curriculum {source.id} for user {new_owner_id}")
+        now = datetime.utcnow()
         
         # 1. Clone Curriculum Root
         new_curriculum = Curriculum(
             id=str(uuid.uuid4()),
             user_id=new_owner_id,
-            title=source.title, # Keep name or add (Copy)? Keep name for standard paths.
+            title=source.title,  # Keep name for standard paths
             description=source.description,
             duration_weeks=source.duration_weeks,
             current_week=1,
-            status='active', # Activate immediately
+            status='active',  # Activate immediately
             ai_model_used=source.ai_model_used,
-            created_at=datetime.utcnow(),
-            updated_at=datetime.utcnow()
+            created_at=now,
+            updated_at=now
         )
         self.db.add(new_curriculum)
+        await self.db.flush()
         
-        # 2. Clone Modules
-        # Ensure we sort by order_index
-        sorted_modules = sorted(source.modules, key=lambda m: m.order_index)
+        # 2. Map every source module/lesson/exercise id to a fresh one
+        source_modules = select(CurriculumModule.id).where(CurriculumModule.curriculum_id == source.id)
+        source_lessons = select(CurriculumLesson.id).where(CurriculumLesson.module_id.in_(source_modules))
+        source_exercises = select(CurriculumExercise.id).where(CurriculumExercise.lesson_id.in_(source_lessons))
+        old_ids = (await self.db.execute(
+            union_all(source_modules, source_lessons, source_exercises)
+        )).scalars().all()
         
-        for mod in sorted_modules:
-            new_mod = CurriculumModule(
-                id=str(uuid.uuid4()),
-                curriculum_id=new_curriculum.id,
-                title=mod.title,
-                description=mod.description,
-                theme=mod.theme,
-                order_index=mod.order_index,
-                start_week=mod.start_week,
-                end_week=mod.end_week,
-                # JSON fields might need parsing/serializing loop but simple assign works
-                prerequisites_json=mod.prerequisites_json,
-                outcomes_json=mod.outcomes_json,
-                completion_percentage=0.0
+        if old_ids:
+            new_id = (
+                values(column("old_id", String), column("new_id", String), name="id_map")
+                .data([(old_id, str(uuid.uuid4())) for old_id in old_ids])
+                .cte("new_id")
             )
-            self.db.add(new_mod)
+            parent_id = new_id.alias("parent_id")
             
-            # 3. Clone Lessons
-            sorted_lessons = sorted(mod.lessons, key=lambda l: l.week_number)
-            for lesson in sorted_lessons:
-                new_lesson = CurriculumLesson(
-                    id=str(uuid.uuid4()),
-                    module_id=new_mod.id,
-                    title=lesson.title,
-                    description=lesson.description,
-                    week_number=lesson.week_number,
-                    theory_content_json=lesson.theory_content_json,
-                    concepts_json=lesson.concepts_json,
-                    estimated_duration_minutes=lesson.estimated_duration_minutes,
-                    is_completed=False
+            # 3. Clone Modules
+            lesson_count = (
+                select(func.count(CurriculumLesson.id))
+                .where(CurriculumLesson.module_id == CurriculumModule.id)
+                .scalar_subquery()
+            )
+            await self.db.execute(
+                insert(CurriculumModule).from_select(
+                    [
+                        "id", "curriculum_id", "title", "description", "theme", "order_index",
+                        "start_week", "end_week", "prerequisites_json", "outcomes_json",
+                        "completion_percentage", "lessons_total", "lessons_completed", "created_at",
+                    ],
+                    select(
+                        new_id.c.new_id, literal(new_curriculum.id), CurriculumModule.title,
+                        CurriculumModule.description, CurriculumModule.theme, CurriculumModule.order_index,
+                        CurriculumModule.start_week, CurriculumModule.end_week,
+                        CurriculumModule.prerequisites_json, CurriculumModule.outcomes_json,
+                        literal(0.0), lesson_count, literal(0), literal(now),
+                    )
+                    .join(new_id, new_id.c.old_id == CurriculumModule.id)
+                    .where(CurriculumModule.curriculum_id == source.id)
                 )
-                self.db.add(new_lesson)
-                
-                # 4. Clone Exercises
-                sorted_exercises = sorted(lesson.exercises, key=lambda e: e.order_index)
-                for ex in sorted_exercises:
-                    new_ex = CurriculumExercise(
-                        id=str(uuid.uuid4()),
-                        lesson_id=new_lesson.id,
-                        title=ex.title,
-                        description=ex.description,
-                        order_index=ex.order_index,
-                        exercise_type=ex.exercise_type,
-                        content_json=ex.content_json,
-                        difficulty=ex.difficulty,
-                        estimated_duration_minutes=ex.estimated_duration_minutes,
-                        target_bpm=ex.target_bpm,
-                        # Reset Tracking
-                        practice_count=0,
-                        is_mastered=False,
-                        # Reset Stats
-                        next_review_at=datetime.utcnow(), # Start fresh
-                        # Copy Audio Data?
-                        # Crucial decision: Do we re-generate audio or point to same files?
-                        # Since audio files are static (midi_file_path), we can copy the path!
-                        # This saves massive re-generation time.
-                        midi_file_path=ex.midi_file_path,
-                        audio_files_json=ex.audio_files_json,
-                        audio_generation_status=ex.audio_generation_status,
+            )
+            
+            # 4. Clone Lessons (module_id remapped through the parent alias)
+            exercise_count = (
+                select(func.count(CurriculumExercise.id))
+                .where(CurriculumExercise.lesson_id == CurriculumLesson.id)
+                .scalar_subquery()
+            )
+            await self.db.execute(
+                insert(CurriculumLesson).from_select(
+                    [
+                        "id", "module_id", "title", "description", "week_number",
+                        "theory_content_json", "concepts_json", "estimated_duration_minutes",
+                        "is_completed", "exercises_total", "exercises_mastered", "created_at",
+                    ],
+                    select(
+                        new_id.c.new_id, parent_id.c.new_id, CurriculumLesson.title,
+                        CurriculumLesson.description, CurriculumLesson.week_number,
+                        CurriculumLesson.theory_content_json, CurriculumLesson.concepts_json,
+                        CurriculumLesson.estimated_duration_minutes,
+                        literal(False), exercise_count, literal(0), literal(now),
                     )
-                    self.db.add(new_ex)
+                    .join(new_id, new_id.c.old_id == CurriculumLesson.id)
+                    .join(parent_id, parent_id.c.old_id == CurriculumLesson.module_id)
+                )
+            )
+            
+            # 5. Clone Exercises (reset tracking, keep static audio/MIDI paths)
+            if share_content:
+                content_columns = [
+                    literal("{}"),
+                    func.coalesce(CurriculumExercise.content_source_id, CurriculumExercise.id),
+                ]
+            else:
+                content_columns = [
+                    CurriculumExercise.content_json,
+                    CurriculumExercise.content_source_id,
+                ]
+            await self.db.execute(
+                insert(CurriculumExercise).from_select(
+                    [
+                        "id", "lesson_id", "title", "description", "order_index", "exercise_type",
+                        "content_json", "content_source_id", "difficulty",
+                        "estimated_duration_minutes", "target_bpm", "practice_count", "is_mastered",
+                        "next_review_at", "midi_file_path", "audio_files_json",
+                        "audio_generation_status", "created_at",
+                    ],
+                    select(
+                        new_id.c.new_id, parent_id.c.new_id, CurriculumExercise.title,
+                        CurriculumExercise.description, CurriculumExercise.order_index,
+                        CurriculumExercise.exercise_type, *content_columns,
+                        CurriculumExercise.difficulty, CurriculumExercise.estimated_duration_minutes,
+                        CurriculumExercise.target_bpm, literal(0), literal(False),
+                        literal(now),  # Start fresh
+                        CurriculumExercise.midi_file_path, CurriculumExercise.audio_files_json,
+                        CurriculumExercise.audio_generation_status, literal(now),
+                    )
+                    .join(new_id, new_id.c.old_id == CurriculumExercise.id)
+                    .join(parent_id, parent_id.c.old_id == CurriculumExercise.lesson_id)
+                )
+            )
         
         await self.db.commit()
         await self.db.refresh(new_curriculum)
+        practice_queue_cache.invalidate_user(new_owner_id)
         return new_curriculum
-    
+
+    async def _materialize_shared_content(self, curriculum_id: str) -> int:
+        """
+        Copy content into every clone that shares it from this curriculum.
+
+        Clones made with share_content point at the template's exercises
+        (content_source_id, RESTRICT). Before those exercises can be deleted
+        each dependent clone gets its own content_json and drops the pointer.
+
+        Returns:
+            Number of cloned exercises updated
+        """
+        source = aliased(CurriculumExercise)
+        source_exercises = (
+            select(CurriculumExercise.id)
+            .join(CurriculumLesson, CurriculumLesson.id == CurriculumExercise.lesson_id)
+            .join(CurriculumModule, CurriculumModule.id == CurriculumLesson.module_id)
+            .where(CurriculumModule.curriculum_id == curriculum_id)
+        )
+        result = await self.db.execute(
+            update(CurriculumExercise)
+            .where(CurriculumExercise.content_source_id.in_(source_exercises))
+            .values(
+                content_json=(
+                    select(source.content_json)
+                    .where(source.id == CurriculumExercise.content_source_id)
+                    .scalar_subquery()
+                ),
+                content_source_id=None,
+            )
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount
+
+    async def delete_curriculum(self, curriculum_id: str) -> bool:
+        """
+        Delete a curriculum and its modules, lessons and exercises.
+
+        Clones sharing this curriculum's exercise content keep a copy of it.
+
+        Returns:
+            False if the curriculum does not exist
+        """
+        curriculum = await self.get_curriculum_with_details(curriculum_id)
+        if curriculum is None:
+            return False
+
+        materialized = await self._materialize_shared_content(curriculum_id)
+        if materialized:
+            logger.info(f"Copied shared content into {materialized} cloned exercises of {curriculum_id}")
+
+        await self.db.delete(curriculum)
+        await self.db.commit()
+        practice_queue_cache.invalidate_user(curriculum.user_id)
+        return True
+
     async def get_module(self, module_id: str) -> Optional[CurriculumModule]:
         """Get a module with its lessons"""
         result = await self.db.execute(
@@ -855,61 +1039,101 @@ class CurriculumService:
         1. Overdue exercises (past next_review_at)
         2. Due today exercises
         3. New exercises not yet practiced
+
+        One query joins exercises to their lesson and module and ranks them
+        in SQL. The ranking is cached per user for a few seconds; cached
+        exercises are reloaded by primary key so their attributes are current.
         """
-        curriculum = await self.get_active_curriculum(user_id)
-        if not curriculum:
-            return []
-        
         now = datetime.utcnow()
-        today_end = datetime.utcnow().replace(hour=23, minute=59, second=59)
-        
-        # Get exercises from active curriculum
+        today_end = now.replace(hour=23, minute=59, second=59)
+
+        cached = practice_queue_cache.get(user_id, limit)
+        if cached is not None:
+            return await self._load_practice_items(cached, today_end)
+
+        priority = case(
+            (CurriculumExercise.next_review_at < now, 1),  # Overdue
+            (CurriculumExercise.next_review_at <= today_end, 2),  # Due today
+            else_=3,  # New
+        ).label("priority")
+        active_curriculum_id = (
+            self._active_curriculum_query(user_id)
+            .with_only_columns(Curriculum.id)
+            .scalar_subquery()
+        )
+
         result = await self.db.execute(
-            select(CurriculumExercise)
-            .join(CurriculumLesson)
-            .join(CurriculumModule)
-            .where(CurriculumModule.curriculum_id == curriculum.id)
+            select(
+                CurriculumExercise,
+                CurriculumLesson.title.label("lesson_title"),
+                CurriculumModule.title.label("module_title"),
+                priority,
+            )
+            .join(CurriculumLesson, CurriculumExercise.lesson_id == CurriculumLesson.id)
+            .join(CurriculumModule, CurriculumLesson.module_id == CurriculumModule.id)
+            .where(CurriculumModule.curriculum_id == active_curriculum_id)
+            .where(CurriculumExercise.is_mastered == False)  # noqa: E712
             .where(
                 or_(
                     CurriculumExercise.next_review_at <= today_end,
                     CurriculumExercise.next_review_at.is_(None)
                 )
             )
-            .where(CurriculumExercise.is_mastered == False)  # noqa: E712
-            .order_by(CurriculumExercise.next_review_at.asc().nullsfirst())
+            .order_by(
+                priority,
+                CurriculumExercise.next_review_at.asc(),
+                CurriculumModule.order_index,
+                CurriculumLesson.week_number,
+                CurriculumExercise.order_index,
+            )
             .limit(limit)
         )
-        exercises = result.scalars().all()
-        
-        # Build response with context
-        practice_items = []
-        for ex in exercises:
-            # Get lesson and module for context
-            lesson_result = await self.db.execute(
-                select(CurriculumLesson)
-                .options(selectinload(CurriculumLesson.module))
-                .where(CurriculumLesson.id == ex.lesson_id)
-            )
-            lesson = lesson_result.scalar_one_or_none()
-            
-            if ex.next_review_at and ex.next_review_at < now:
-                priority = 1  # Overdue
-            elif ex.next_review_at and ex.next_review_at <= today_end:
-                priority = 2  # Due today
-            else:
-                priority = 3  # New
-            
-            practice_items.append({
-                'exercise': ex,
-                'lesson_title': lesson.title if lesson else 'Unknown',
-                'module_title': lesson.module.title if lesson and lesson.module else 'Unknown',
-                'priority': priority,
-            })
-        
-        # Sort by priority
-        practice_items.sort(key=lambda x: x['priority'])
-        
+
+        practice_items = [
+            {
+                'exercise': row.CurriculumExercise,
+                'lesson_title': row.lesson_title,
+                'module_title': row.module_title,
+                'priority': row.priority,
+            }
+            for row in result.all()
+        ]
+        practice_queue_cache.set(user_id, limit, [
+            {
+                'exercise_id': item['exercise'].id,
+                'lesson_title': item['lesson_title'],
+                'module_title': item['module_title'],
+                'priority': item['priority'],
+            }
+            for item in practice_items
+        ])
         return practice_items
+
+    async def _load_practice_items(
+        self, rows: List[Dict[str, Any]], today_end: datetime
+    ) -> List[Dict[str, Any]]:
+        """Rebuild cached queue rows with exercises from this session, dropping any that left the queue"""
+        result = await self.db.execute(
+            select(CurriculumExercise)
+            .where(CurriculumExercise.id.in_([row['exercise_id'] for row in rows]))
+            .execution_options(populate_existing=True)
+        )
+        exercises = {exercise.id: exercise for exercise in result.scalars()}
+
+        items = []
+        for row in rows:
+            exercise = exercises.get(row['exercise_id'])
+            if exercise is None or exercise.is_mastered:
+                continue
+            if exercise.next_review_at is not None and exercise.next_review_at > today_end:
+                continue
+            items.append({
+                'exercise': exercise,
+                'lesson_title': row['lesson_title'],
+                'module_title': row['module_title'],
+                'priority': row['priority'],
+            })
+        return items
     
     # =========================================================================
     # Progress Tracking
@@ -963,50 +1187,142 @@ class CurriculumService:
         
         # Check for mastery (high quality multiple times)
         if quality >= 4 and exercise.repetition_count >= 5:
+            newly_mastered = not exercise.is_mastered
             exercise.is_mastered = True
             exercise.mastered_at = datetime.utcnow()
+            
+            # Update lesson/module completion in the same transaction
+            if newly_mastered:
+                await self._record_mastery(exercise.lesson_id)
         
         await self.db.commit()
         await self.db.refresh(exercise)
-        
-        # Update lesson/module completion
-        await self._update_completion_stats(exercise)
+        practice_queue_cache.invalidate_exercise(exercise.id)
         
         return exercise
     
-    async def _update_completion_stats(self, exercise: CurriculumExercise) -> None:
-        """Update lesson and module completion percentages"""
-        # Get lesson
-        lesson_result = await self.db.execute(
-            select(CurriculumLesson)
-            .options(selectinload(CurriculumLesson.exercises))
-            .where(CurriculumLesson.id == exercise.lesson_id)
+    async def _record_mastery(self, lesson_id: str) -> None:
+        """
+        Count a newly mastered exercise towards its lesson and module.
+
+        Counters are bumped with UPDATE ... SET x = x + 1 (no lesson or module
+        rows are loaded), so the cost does not grow with curriculum size.
+        The caller commits.
+        """
+        await self.db.execute(
+            update(CurriculumLesson)
+            .where(CurriculumLesson.id == lesson_id)
+            .values(exercises_mastered=CurriculumLesson.exercises_mastered + 1)
+            .execution_options(synchronize_session=False)
         )
-        lesson = lesson_result.scalar_one_or_none()
         
-        if lesson:
-            # Calculate lesson completion
-            total_exercises = len(lesson.exercises)
-            mastered_exercises = sum(1 for ex in lesson.exercises if ex.is_mastered)
-            
-            if mastered_exercises == total_exercises:
-                lesson.is_completed = True
-                lesson.completed_at = datetime.utcnow()
-            
-            # Get module and update completion
-            module_result = await self.db.execute(
-                select(CurriculumModule)
-                .options(selectinload(CurriculumModule.lessons))
-                .where(CurriculumModule.id == lesson.module_id)
+        # Complete the lesson once every exercise is mastered (only the first
+        # time); a lesson with no counted exercises is never complete, matching
+        # recompute_completion_counters
+        completed = await self.db.execute(
+            update(CurriculumLesson)
+            .where(CurriculumLesson.id == lesson_id)
+            .where(CurriculumLesson.is_completed == False)  # noqa: E712
+            .where(CurriculumLesson.exercises_total > 0)
+            .where(CurriculumLesson.exercises_mastered >= CurriculumLesson.exercises_total)
+            .values(is_completed=True, completed_at=datetime.utcnow())
+            .execution_options(synchronize_session=False)
+        )
+        if completed.rowcount != 1:
+            return
+        
+        module_id = (
+            select(CurriculumLesson.module_id)
+            .where(CurriculumLesson.id == lesson_id)
+            .scalar_subquery()
+        )
+        lessons_completed = CurriculumModule.lessons_completed + 1
+        await self.db.execute(
+            update(CurriculumModule)
+            .where(CurriculumModule.id == module_id)
+            .values(
+                lessons_completed=lessons_completed,
+                completion_percentage=case(
+                    (CurriculumModule.lessons_total > 0,
+                     lessons_completed * 100.0 / CurriculumModule.lessons_total),
+                    else_=0.0,
+                ),
             )
-            module = module_result.scalar_one_or_none()
-            
-            if module:
-                total_lessons = len(module.lessons)
-                completed_lessons = sum(1 for l in module.lessons if l.is_completed)
-                module.completion_percentage = (completed_lessons / total_lessons) * 100 if total_lessons > 0 else 0
-            
-            await self.db.commit()
+            .execution_options(synchronize_session=False)
+        )
+    
+    async def recompute_completion_counters(self, curriculum_id: Optional[str] = None) -> Dict[str, int]:
+        """
+        Rebuild lesson and module completion counters from the exercise rows.
+
+        Repairs drift after manual edits, imports or bulk changes. Runs as a
+        handful of set-based UPDATEs over every curriculum (or one).
+
+        Returns:
+            Number of lessons and modules updated
+        """
+        module_scope = [] if curriculum_id is None else [CurriculumModule.curriculum_id == curriculum_id]
+        lesson_scope = [] if curriculum_id is None else [
+            CurriculumLesson.module_id.in_(select(CurriculumModule.id).where(*module_scope))
+        ]
+        
+        def count_exercises(*criteria):
+            return (
+                select(func.count(CurriculumExercise.id))
+                .where(CurriculumExercise.lesson_id == CurriculumLesson.id, *criteria)
+                .scalar_subquery()
+            )
+        
+        def count_lessons(*criteria):
+            return (
+                select(func.count(CurriculumLesson.id))
+                .where(CurriculumLesson.module_id == CurriculumModule.id, *criteria)
+                .scalar_subquery()
+            )
+        
+        lessons = await self.db.execute(
+            update(CurriculumLesson)
+            .where(*lesson_scope)
+            .values(
+                exercises_total=count_exercises(),
+                exercises_mastered=count_exercises(CurriculumExercise.is_mastered == True),  # noqa: E712
+            )
+            .execution_options(synchronize_session=False)
+        )
+        await self.db.execute(
+            update(CurriculumLesson)
+            .where(*lesson_scope)
+            .where(CurriculumLesson.is_completed == False)  # noqa: E712
+            .where(CurriculumLesson.exercises_total > 0)
+            .where(CurriculumLesson.exercises_mastered >= CurriculumLesson.exercises_total)
+            .values(is_completed=True, completed_at=datetime.utcnow())
+            .execution_options(synchronize_session=False)
+        )
+        
+        modules = await self.db.execute(
+            update(CurriculumModule)
+            .where(*module_scope)
+            .values(
+                lessons_total=count_lessons(),
+                lessons_completed=count_lessons(CurriculumLesson.is_completed == True),  # noqa: E712
+            )
+            .execution_options(synchronize_session=False)
+        )
+        await self.db.execute(
+            update(CurriculumModule)
+            .where(*module_scope)
+            .values(
+                completion_percentage=case(
+                    (CurriculumModule.lessons_total > 0,
+                     CurriculumModule.lessons_completed * 100.0 / CurriculumModule.lessons_total),
+                    else_=0.0,
+                )
+            )
+            .execution_options(synchronize_session=False)
+        )
+        
+        await self.db.commit()
+        return {"lessons": lessons.rowcount, "modules": modules.rowcount}
     
     # =========================================================================
     # Assessment Methods
@@ -2,11 +2,12 @@ from typing import Dict, Any, Optional
 from pathlib import Path
 import logging
 
-try:
-    import essentia.standard as es
-    ESSENTIA_AVAILABLE = True
-except ImportError:
-    ESSENTIA_AVAILABLE = False
+from app.core.lazy import lazy_import, lazy_service, module_available
+
+# Imported on first analysis, not at startup
+ESSENTIA_AVAILABLE = module_available("essentia")
+es = lazy_import("essentia.standard")
+if not ESSENTIA_AVAILABLE:
     print("Essentia not found. Audio analysis features will be limited.")
 
 logger = logging.getLogger(__name__)
@@ -54,4 +55,4 @@ class EssentiaService:
             logger.error(f"Essentia analysis failed: {e}")
             return {"error": str(e)}
 
-essentia_service = EssentiaService()
+essentia_service = lazy_service("essentia", EssentiaService)
@@ -0,0 +1,261 @@
+"""
+Content-addressed cache of rendered exercise audio.
+
+Exercises with identical musical content (the same template cloned to many
+users, or the same lick added twice) render to interchangeable MIDI and
+audio, so artifacts are stored once per content hash under outputs/ and
+every matching exercise points at them.
+
+In-flight renders are claimed with a lock file per hash, so concurrent
+workers on one host never render the same content twice; a worker that
+finds a hash claimed defers those exercises instead of waiting.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.database.curriculum_models import CurriculumExercise
+
+logger = logging.getLogger(__name__)
+
+
+class ExerciseAudioCache:
+    """
+    On-disk store of rendered MIDI/audio keyed by exercise content hash.
+
+    Layout: <cache_dir>/<key>/manifest.json plus the artifact files it lists;
+    <cache_dir>/<key>.lock marks a render in progress.
+    """
+
+    def __init__(self, cache_dir: Optional[Path] = None, lock_timeout: Optional[float] = None):
+        self._cache_dir = cache_dir
+        self.lock_timeout = lock_timeout if lock_timeout is not None else settings.audio_generation_timeout
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.renders = 0
+        self.deferred = 0
+
+    @property
+    def cache_dir(self) -> Path:
+        return self._cache_dir or settings.OUTPUTS_DIR / "exercises" / "audio_cache"
+
+    @staticmethod
+    def make_key(exercise: CurriculumExercise, method: str) -> str:
+        """Fingerprint of everything the MIDI and audio renderers read."""
+        try:
+            content = json.loads(exercise.effective_content_json or "{}")
+        except ValueError:
+            content = exercise.effective_content_json
+        payload = {
+            "exercise_type": exercise.exercise_type,
+            "content": content,
+            "target_bpm": exercise.target_bpm,
+            "difficulty": exercise.difficulty,
+            "estimated_duration_minutes": exercise.estimated_duration_minutes,
+            "method": method,
+        }
+        data = json.dumps(payload, sort_keys=True, default=str)
+        return hashlib.sha256(data.encode()).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Manifest ({"midi_path", "audio_files"}) for a rendered key, if present."""
+        manifest = self.peek(key)
+        with self._lock:
+            if manifest is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return manifest
+
+    def put(self, key: str, midi_path: Path, audio_paths: Dict[str, Optional[Path]]) -> Dict[str, Any]:
+        """
+        Move freshly rendered files into the cache and write the manifest.
+
+        Each file and the manifest are replaced atomically, so re-rendering
+        an existing key never leaves readers pointing at missing files.
+        """
+        entry_dir = self.cache_dir / key
+        entry_dir.mkdir(parents=True, exist_ok=True)
+
+        manifest = {
+            "midi_path": str(_move_into(Path(midi_path), entry_dir / f"exercise{Path(midi_path).suffix}")),
+            "audio_files": {
+                name: str(_move_into(Path(path), entry_dir / f"{name}{Path(path).suffix}"))
+                for name, path in audio_paths.items()
+                if path
+            },
+        }
+        _atomic_write(entry_dir / "manifest.json", json.dumps(manifest).encode())
+
+        with self._lock:
+            self.renders += 1
+        return manifest
+
+    def claim(self, key: str) -> bool:
+        """Take the render lock for a key; False if another worker holds it."""
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        lock_path = self.cache_dir / f"{key}.lock"
+        try:
+            fd = os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+        except FileExistsError:
+            # Break locks left behind by a crashed worker
+            try:
+                expired = time.time() - lock_path.stat().st_mtime > self.lock_timeout
+                if expired:
+                    lock_path.unlink(missing_ok=True)
+            except OSError:
+                expired = False
+            if expired:
+                return self.claim(key)
+            with self._lock:
+                self.deferred += 1
+            return False
+
+        with os.fdopen(fd, "w") as f:
+            f.write(str(os.getpid()))
+        return True
+
+    def peek(self, key: str) -> Optional[Dict[str, Any]]:
+        """Like get(), without counting a hit or miss."""
+        try:
+            return json.loads((self.cache_dir / key / "manifest.json").read_text())
+        except (OSError, ValueError):
+            return None
+
+    def release(self, key: str) -> None:
+        (self.cache_dir / f"{key}.lock").unlink(missing_ok=True)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "renders": self.renders,
+                "deferred": self.deferred,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            }
+
+
+async def render_exercise_batch(
+    db: AsyncSession,
+    exercise_ids: Sequence[str],
+    method: str = "both",
+    force: bool = False,
+    cache: Optional[ExerciseAudioCache] = None,
+) -> Dict[str, Any]:
+    """
+    Render audio for many exercises in one pass.
+
+    Exercises are grouped by content hash: each distinct hash is looked up
+    in the cache and rendered at most once, then every exercise in the
+    group is pointed at the shared artifacts.
+
+    Args:
+        db: Database session
+        exercise_ids: Exercises to render
+        method: Audio generation method ("fluidsynth", "stable_audio", "both")
+        force: Re-render even if a cached artifact exists
+        cache: Artifact cache (default: exercise_audio_cache)
+
+    Returns:
+        Dict with counts (rendered, cached, failed) and ids of exercises
+        deferred because another worker is rendering the same content
+    """
+    from app.services.audio_pipeline_service import audio_pipeline_service
+    from app.services.midi_generation_service import midi_generation_service
+
+    cache = cache or exercise_audio_cache
+    result = await db.execute(
+        select(CurriculumExercise).where(CurriculumExercise.id.in_(exercise_ids))
+    )
+    groups: Dict[str, List[CurriculumExercise]] = {}
+    for exercise in result.scalars().all():
+        groups.setdefault(cache.make_key(exercise, method), []).append(exercise)
+
+    summary: Dict[str, Any] = {"rendered": 0, "cached": 0, "failed": 0, "deferred": []}
+
+    for key, exercises in groups.items():
+        manifest = None if force else cache.get(key)
+
+        if manifest is None:
+            if not cache.claim(key):
+                summary["deferred"].extend(ex.id for ex in exercises)
+                continue
+            try:
+                # Another worker may have finished between get() and claim()
+                manifest = None if force else cache.peek(key)
+                if manifest is None:
+                    for exercise in exercises:
+                        exercise.audio_generation_status = "generating"
+                    await db.commit()
+
+                    leader = exercises[0]
+                    logger.info(
+                        f"Rendering audio for {len(exercises)} exercise(s) with content {key[:12]} using {method}"
+                    )
+                    midi_path = await midi_generation_service.generate_exercise_midi(leader)
+                    audio_paths = await audio_pipeline_service.generate_exercise_audio(
+                        exercise=leader,
+                        method=method,
+                        midi_path=midi_path
+                    )
+                    manifest = cache.put(key, midi_path, audio_paths)
+                    summary["rendered"] += 1
+                else:
+                    summary["cached"] += len(exercises)
+
+            except Exception as e:
+                logger.error(f"Audio generation failed for content {key[:12]}: {e}")
+                # A failed commit leaves the session unusable until rolled back;
+                # the rollback expires the batch, so reload it before marking
+                await db.rollback()
+                await db.execute(select(CurriculumExercise).where(CurriculumExercise.id.in_(exercise_ids)))
+                for exercise in exercises:
+                    exercise.audio_generation_status = "failed"
+                await db.commit()
+                summary["failed"] += len(exercises)
+                continue
+
+            finally:
+                cache.release(key)
+        else:
+            summary["cached"] += len(exercises)
+
+        now = datetime.utcnow()
+        for exercise in exercises:
+            exercise.midi_file_path = manifest["midi_path"]
+            exercise.audio_files_json = json.dumps(manifest["audio_files"])
+            exercise.audio_generation_status = "complete"
+            exercise.audio_generated_at = now
+        await db.commit()
+
+    return summary
+
+
+def _move_into(source: Path, target: Path) -> Path:
+    if source.resolve() != target.resolve():
+        os.replace(source, target)
+    return target
+
+
+def _atomic_write(path: Path, data: bytes) -> None:
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    tmp.write_bytes(data)
+    tmp.replace(path)
+
+
+# Shared by the audio generation tasks
+exercise_audio_cache = ExerciseAudioCache()
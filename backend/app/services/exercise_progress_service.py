@@ -14,6 +14,7 @@ from sqlalchemy import select, update, func, and_
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database.models import UserExerciseProgress, ExerciseLibrary
+from app.services.exercise_recommendation_service import mark_recommendations_stale
 
 
 class ExerciseProgressService:
@@ -65,6 +66,39 @@ class ExerciseProgressService:
             )
             self.db.add(progress)
 
+        await self.apply_practice_session(progress, duration_seconds, score, quality_rating)
+        await mark_recommendations_stale(self.db, user_id)
+
+        await self.db.commit()
+        await self.db.refresh(progress)
+
+        return {
+            "user_id": progress.user_id,
+            "exercise_id": progress.exercise_id,
+            "times_practiced": progress.times_practiced,
+            "total_practice_time": progress.total_practice_time_seconds,
+            "best_score": progress.best_score,
+            "avg_score": progress.avg_score,
+            "is_mastered": progress.is_mastered,
+            "mastered_at": progress.mastered_at,
+            "updated_at": progress.updated_at
+        }
+
+    async def apply_practice_session(
+        self,
+        progress: UserExerciseProgress,
+        duration_seconds: int,
+        score: Optional[float] = None,
+        quality_rating: Optional[int] = None
+    ) -> None:
+        """Apply one practice session to a progress record (caller commits)
+
+        Args:
+            progress: Progress record to update
+            duration_seconds: Time spent practicing
+            score: Performance score (0-100)
+            quality_rating: Spaced repetition quality (0-5)
+        """
         # 2-3. Increment times_practiced and add to total_practice_time
         progress.times_practiced += 1
         progress.total_practice_time_seconds += duration_seconds
@@ -89,26 +123,11 @@ class ExerciseProgressService:
 
             # 7. Check for mastery
             if not progress.is_mastered:
-                is_mastered = await self.check_for_mastery(user_id, exercise_id, ratings)
+                is_mastered = await self.check_for_mastery(progress.user_id, progress.exercise_id, ratings)
                 if is_mastered:
                     progress.is_mastered = True
                     progress.mastered_at = datetime.utcnow()
 
-        await self.db.commit()
-        await self.db.refresh(progress)
-
-        return {
-            "user_id": progress.user_id,
-            "exercise_id": progress.exercise_id,
-            "times_practiced": progress.times_practiced,
-            "total_practice_time": progress.total_practice_time_seconds,
-            "best_score": progress.best_score,
-            "avg_score": progress.avg_score,
-            "is_mastered": progress.is_mastered,
-            "mastered_at": progress.mastered_at,
-            "updated_at": progress.updated_at
-        }
-
     async def get_user_progress(
         self,
         user_id: int,
@@ -282,6 +301,7 @@ class ExerciseProgressService:
                 mastered_at=datetime.utcnow()
             )
         )
+        await mark_recommendations_stale(self.db, user_id)
         await self.db.commit()
 
     async def get_progress_stats(
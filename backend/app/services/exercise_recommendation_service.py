@@ -8,14 +8,96 @@ Intelligent recommendation system that suggests exercises based on:
 - Genre/style preferences
 """
 
+import json
+import logging
+import threading
 from datetime import datetime, timedelta
 from typing import List, Optional, Dict, Any
-from sqlalchemy import select, and_
+from sqlalchemy import select, update, and_, or_, case, func
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.database.models import UserExerciseProgress, ExerciseLibrary, CurriculumLibrary
+from app.core.config import settings
+from app.database.models import (
+    UserExerciseProgress,
+    ExerciseLibrary,
+    CurriculumLibrary,
+    UserRecommendationSnapshot,
+)
 from app.schemas.curriculum import ExerciseTypeEnum, DifficultyLevelEnum
 
+logger = logging.getLogger(__name__)
+
+
+class _SnapshotStats:
+    """
+    Per-process counters for recommendation snapshot reads.
+
+    A hit is a read served from a fresh snapshot; every other read is
+    counted by reason. A missing snapshot is built inline; a stale or
+    expired one is still served while a rebuild is queued.
+    """
+
+    REBUILD_REASONS = ("missing", "stale", "expired")
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.hits = 0
+            self.rebuilds = dict.fromkeys(self.REBUILD_REASONS, 0)
+            self.background_refreshes = 0
+            self._age_total = 0.0
+            self._age_max = 0.0
+
+    def record_hit(self, age_seconds: float) -> None:
+        with self._lock:
+            self.hits += 1
+            self._age_total += age_seconds
+            self._age_max = max(self._age_max, age_seconds)
+
+    def record_rebuild(self, reason: str) -> None:
+        with self._lock:
+            self.rebuilds[reason] += 1
+
+    def record_background_refresh(self, count: int) -> None:
+        with self._lock:
+            self.background_refreshes += count
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            misses = sum(self.rebuilds.values())
+            lookups = self.hits + misses
+            return {
+                "hits": self.hits,
+                "misses": misses,
+                "rebuilds": dict(self.rebuilds),
+                "background_refreshes": self.background_refreshes,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+                "avg_served_age_seconds": round(self._age_total / self.hits, 1) if self.hits else 0.0,
+                "max_served_age_seconds": round(self._age_max, 1),
+            }
+
+
+recommendation_snapshot_stats = _SnapshotStats()
+
+
+async def mark_recommendations_stale(db: AsyncSession, user_id: int) -> None:
+    """Flag a user's recommendation snapshot for rebuild (caller commits)
+
+    Args:
+        db: Database session
+        user_id: User whose progress changed
+    """
+    await db.execute(
+        update(UserRecommendationSnapshot)
+        .where(UserRecommendationSnapshot.user_id == user_id)
+        .values(is_stale=True)
+        .execution_options(synchronize_session=False)
+    )
+
 
 class ExerciseRecommendationService:
     """Service for generating personalized exercise recommendations"""
@@ -37,43 +119,254 @@ class ExerciseRecommendationService:
     ) -> List[Dict[str, Any]]:
         """Get personalized exercise recommendations
 
+        Served from the user's precomputed snapshot (one primary-key read).
+        A missing snapshot is built inline. One marked stale by a progress
+        change, or older than settings.recommendation_snapshot_ttl_seconds,
+        is served as is and a rebuild is queued on the worker.
+        With a genre, snapshot candidates are filtered by their library's
+        genre and topped up with unpracticed exercises from that genre.
+
         Args:
             user_id: User ID
             limit: Maximum recommendations
-            genre: Optional genre filter
+            genre: Optional genre filter (case-insensitive substring match)
 
         Returns:
             List of recommended exercises with reasoning
         """
+        now = datetime.utcnow()
+        result = await self.db.execute(
+            select(UserRecommendationSnapshot)
+            .where(UserRecommendationSnapshot.user_id == user_id)
+            .execution_options(populate_existing=True)
+        )
+        snapshot = result.scalar_one_or_none()
+
+        if snapshot is None:
+            recommendation_snapshot_stats.record_rebuild("missing")
+            snapshot = await self.refresh_snapshot(user_id)
+        elif snapshot.is_stale:
+            recommendation_snapshot_stats.record_rebuild("stale")
+            self._schedule_refresh(user_id)
+        elif self._is_expired(snapshot, now):
+            recommendation_snapshot_stats.record_rebuild("expired")
+            self._schedule_refresh(user_id)
+        else:
+            recommendation_snapshot_stats.record_hit((now - snapshot.refreshed_at).total_seconds())
+
+        recommendations = self._select_recommendations(
+            json.loads(snapshot.pools_json), limit, datetime.utcnow(), genre
+        )
+        if genre and len(recommendations) < limit:
+            seen = {rec["exercise_id"] for rec in recommendations}
+            extra = await self.recommend_by_genre(user_id, genre, limit)
+            recommendations.extend(rec for rec in extra if rec["exercise_id"] not in seen)
+        return recommendations[:limit]
+
+    async def build_candidate_pools(self, user_id: int) -> Dict[str, List[Dict[str, Any]]]:
+        """Compute every recommendation pool for a user
+
+        The review pool also holds exercises coming due before the snapshot
+        expires; they are filtered by due date when the snapshot is read.
+
+        Args:
+            user_id: User ID
+
+        Returns:
+            Dict of pool name -> ordered candidates
+        """
+        pool_size = settings.recommendation_pool_size
+        review_until = datetime.utcnow() + timedelta(seconds=settings.recommendation_snapshot_ttl_seconds)
+
+        pools = {
+            "review": await self._get_spaced_repetition_recommendations(user_id, pool_size, until=review_until),
+            "weak": await self._get_weak_area_recommendations(user_id, pool_size),
+            "new": await self._get_new_content_recommendations(user_id, pool_size),
+            "variety": await self._get_variety_recommendations(user_id, pool_size),
+        }
+
+        # Library genre per candidate, for genre-filtered reads
+        exercise_ids = {c["exercise_id"] for pool in pools.values() for c in pool}
+        result = await self.db.execute(
+            select(ExerciseLibrary.id, CurriculumLibrary.genre)
+            .join(CurriculumLibrary, ExerciseLibrary.curriculum_id == CurriculumLibrary.id)
+            .where(ExerciseLibrary.id.in_(exercise_ids))
+        )
+        genres = dict(result.all())
+        for pool in pools.values():
+            for candidate in pool:
+                candidate["genre"] = genres.get(candidate["exercise_id"])
+
+        return pools
+
+    async def refresh_snapshot(self, user_id: int) -> UserRecommendationSnapshot:
+        """Rebuild and store a user's recommendation snapshot
+
+        Args:
+            user_id: User ID
+
+        Returns:
+            The refreshed snapshot
+        """
+        pools = await self.build_candidate_pools(user_id)
+        for candidate in pools["review"]:
+            candidate["next_review"] = candidate["next_review"].isoformat()
+
+        pools_json = json.dumps(pools)
+
+        snapshot = await self.db.get(UserRecommendationSnapshot, user_id)
+        if snapshot is None:
+            snapshot = UserRecommendationSnapshot(user_id=user_id)
+            self.db.add(snapshot)
+        self._fill_snapshot(snapshot, pools_json)
+        try:
+            await self.db.commit()
+        except IntegrityError:
+            # A concurrent first read inserted this user's snapshot; update that row
+            await self.db.rollback()
+            snapshot = await self.db.get(UserRecommendationSnapshot, user_id, populate_existing=True)
+            self._fill_snapshot(snapshot, pools_json)
+            await self.db.commit()
+        return snapshot
+
+    async def refresh_snapshot_if_outdated(self, user_id: int) -> bool:
+        """Rebuild a user's snapshot unless it is already fresh
+
+        Run by the worker for rebuilds queued from reads; a queued rebuild
+        that another one beat to it is a no-op.
+
+        Args:
+            user_id: User ID
+
+        Returns:
+            True if the snapshot was rebuilt
+        """
+        snapshot = await self.db.get(UserRecommendationSnapshot, user_id, populate_existing=True)
+        if snapshot is not None and not snapshot.is_stale and not self._is_expired(snapshot, datetime.utcnow()):
+            return False
+        await self.refresh_snapshot(user_id)
+        recommendation_snapshot_stats.record_background_refresh(1)
+        return True
+
+    @staticmethod
+    def _schedule_refresh(user_id: int) -> None:
+        """Queue a background rebuild of a user's snapshot"""
+        try:
+            from app.tasks.curriculum_adaptation import refresh_user_recommendation_snapshot_task
+
+            refresh_user_recommendation_snapshot_task.apply_async(args=[user_id])
+        except Exception as e:
+            # The periodic refresh task picks the snapshot up later
+            logger.error(f"Failed to queue recommendation snapshot refresh for user {user_id}: {e}")
+
+    @staticmethod
+    def _is_expired(snapshot: UserRecommendationSnapshot, now: datetime) -> bool:
+        return (now - snapshot.refreshed_at).total_seconds() > settings.recommendation_snapshot_ttl_seconds
+
+    @staticmethod
+    def _fill_snapshot(snapshot: UserRecommendationSnapshot, pools_json: str) -> None:
+        snapshot.pools_json = pools_json
+        snapshot.is_stale = False
+        snapshot.refreshed_at = datetime.utcnow()
+
+    async def refresh_stale_snapshots(self, batch_size: Optional[int] = None) -> int:
+        """Rebuild stale or expired snapshots, oldest first
+
+        Args:
+            batch_size: Maximum snapshots to rebuild (default from settings)
+
+        Returns:
+            Number of snapshots rebuilt
+        """
+        expired_before = datetime.utcnow() - timedelta(seconds=settings.recommendation_snapshot_ttl_seconds)
+        result = await self.db.execute(
+            select(UserRecommendationSnapshot.user_id)
+            .where(
+                or_(
+                    UserRecommendationSnapshot.is_stale == True,  # noqa: E712
+                    UserRecommendationSnapshot.refreshed_at < expired_before
+                )
+            )
+            .order_by(UserRecommendationSnapshot.refreshed_at.asc())
+            .limit(batch_size or settings.recommendation_refresh_batch_size)
+        )
+        user_ids = result.scalars().all()
+
+        for user_id in user_ids:
+            await self.refresh_snapshot(user_id)
+        recommendation_snapshot_stats.record_background_refresh(len(user_ids))
+        return len(user_ids)
+
+    async def get_snapshot_metrics(self) -> Dict[str, Any]:
+        """Snapshot hit rate (this process) and staleness (database-wide)
+
+        Returns:
+            Counters from recommendation_snapshot_stats plus snapshot totals
+        """
+        now = datetime.utcnow()
+        result = await self.db.execute(
+            select(
+                func.count().label("snapshots"),
+                func.sum(case((UserRecommendationSnapshot.is_stale == True, 1), else_=0)).label("stale"),  # noqa: E712
+                func.min(UserRecommendationSnapshot.refreshed_at).label("oldest"),
+            )
+        )
+        row = result.one()
+        oldest = row.oldest
+        if isinstance(oldest, str):  # SQLite returns aggregates over DATETIME as text
+            oldest = datetime.fromisoformat(oldest)
+
+        return {
+            **recommendation_snapshot_stats.stats(),
+            "snapshots": row.snapshots,
+            "stale_snapshots": row.stale or 0,
+            "oldest_snapshot_age_seconds": round((now - oldest).total_seconds(), 1) if oldest else 0.0,
+        }
+
+    def _select_recommendations(
+        self,
+        pools: Dict[str, List[Dict[str, Any]]],
+        limit: int,
+        now: datetime,
+        genre: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """Fill the weighted quotas from snapshot pools
+
+        Args:
+            pools: Candidate pools from build_candidate_pools
+            limit: Maximum recommendations
+            now: Current time (review candidates must be due)
+            genre: Keep only candidates whose library genre contains this
+
+        Returns:
+            Deduplicated recommendations
+        """
+        if genre:
+            genre = genre.lower()
+            pools = {
+                name: [c for c in pool if genre in (c.get("genre") or "").lower()]
+                for name, pool in pools.items()
+            }
+
         recommendations = []
 
         # 1. Spaced repetition recommendations (40%)
-        sr_limit = int(limit * self.weight_spaced_repetition)
-        sr_recommendations = await self._get_spaced_repetition_recommendations(
-            user_id, sr_limit
-        )
-        recommendations.extend(sr_recommendations)
+        due = []
+        for candidate in pools["review"]:
+            next_review = datetime.fromisoformat(candidate["next_review"])
+            if next_review <= now:
+                due.append(self._review_recommendation(candidate, next_review, now))
+        recommendations.extend(due[:int(limit * self.weight_spaced_repetition)])
 
         # 2. Weak area recommendations (30%)
-        weak_limit = int(limit * self.weight_weak_areas)
-        weak_recommendations = await self._get_weak_area_recommendations(
-            user_id, weak_limit
-        )
-        recommendations.extend(weak_recommendations)
+        recommendations.extend(pools["weak"][:int(limit * self.weight_weak_areas)])
 
         # 3. New content recommendations (20%)
-        new_limit = int(limit * self.weight_new_content)
-        new_recommendations = await self._get_new_content_recommendations(
-            user_id, new_limit, genre
-        )
-        recommendations.extend(new_recommendations)
+        recommendations.extend(pools["new"][:int(limit * self.weight_new_content)])
 
         # 4. Variety recommendations (10%)
         variety_limit = max(1, limit - len(recommendations))
-        variety_recommendations = await self._get_variety_recommendations(
-            user_id, variety_limit
-        )
-        recommendations.extend(variety_recommendations)
+        recommendations.extend(pools["variety"][:variety_limit])
 
         # Deduplicate and limit
         seen = set()
@@ -86,16 +379,37 @@ class ExerciseRecommendationService:
 
         return unique_recommendations[:limit]
 
+    @staticmethod
+    def _review_recommendation(
+        candidate: Dict[str, Any],
+        next_review: datetime,
+        now: datetime
+    ) -> Dict[str, Any]:
+        """Format a due review, with urgency relative to now"""
+        overdue_days = (now - next_review).days
+        return {
+            "exercise_id": candidate["exercise_id"],
+            "exercise_type": candidate["exercise_type"],
+            "difficulty": candidate["difficulty"],
+            "reason": f"Due for review ({overdue_days} days overdue)" if overdue_days > 0 else "Due for review today",
+            "priority": "urgent" if overdue_days > 3 else "high",
+            "next_review": next_review,
+            "repetitions": candidate["repetitions"],
+            "genre": candidate.get("genre"),
+        }
+
     async def _get_spaced_repetition_recommendations(
         self,
         user_id: int,
-        limit: int
+        limit: int,
+        until: Optional[datetime] = None
     ) -> List[Dict[str, Any]]:
         """Get exercises due for review
 
         Args:
             user_id: User ID
             limit: Maximum recommendations
+            until: Include exercises due up to this time (default: now)
 
         Returns:
             List of due exercises with reasoning
@@ -108,7 +422,7 @@ class ExerciseRecommendationService:
             .where(
                 and_(
                     UserExerciseProgress.user_id == user_id,
-                    UserExerciseProgress.next_review <= now
+                    UserExerciseProgress.next_review <= (until or now)
                 )
             )
             .order_by(UserExerciseProgress.next_review.asc())
@@ -118,20 +432,19 @@ class ExerciseRecommendationService:
         result = await self.db.execute(stmt)
         due_exercises = result.all()
 
-        recommendations = []
-        for progress, exercise in due_exercises:
-            overdue_days = (now - progress.next_review).days if progress.next_review else 0
-            recommendations.append({
-                "exercise_id": exercise.id,
-                "exercise_type": exercise.exercise_type,
-                "difficulty": exercise.difficulty,
-                "reason": f"Due for review ({overdue_days} days overdue)" if overdue_days > 0 else "Due for review today",
-                "priority": "urgent" if overdue_days > 3 else "high",
-                "next_review": progress.next_review,
-                "repetitions": progress.repetitions
-            })
-
-        return recommendations
+        return [
+            self._review_recommendation(
+                {
+                    "exercise_id": exercise.id,
+                    "exercise_type": exercise.exercise_type,
+                    "difficulty": exercise.difficulty,
+                    "repetitions": progress.repetitions,
+                },
+                progress.next_review,
+                now
+            )
+            for progress, exercise in due_exercises
+        ]
 
     async def _get_weak_area_recommendations(
         self,
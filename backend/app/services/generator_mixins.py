@@ -11,10 +11,12 @@ Provides optional features that can be mixed into BaseGenreGenerator:
 import logging
 import hashlib
 import time
-from typing import Optional, Dict, Any
+from typing import Any, Dict, List, Optional, Tuple
 from functools import wraps
 from datetime import datetime, timedelta
 
+from app.services.ai_response_cache import ai_response_cache
+
 
 # Configure logger
 logger = logging.getLogger(__name__)
@@ -24,66 +26,74 @@ class CachingMixin:
     """
     Adds caching capability to generators.
 
-    Caches Gemini API responses to reduce API calls and costs.
+    Caches Gemini progressions to reduce API calls and costs. Entries live
+    in the shared AI response cache, namespaced by genre, so identical
+    requests share one generation (across workers when the cache has a
+    shared store). Chord analysis is cached as plain dicts and rebuilt
+    with _build_chord_analysis.
     """
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self._cache: Dict[str, tuple] = {}  # key -> (response, timestamp)
         self._cache_ttl_seconds = 3600  # 1 hour default
 
-    def _cache_key(self, description: str, key: Optional[str], tempo: Optional[int], num_bars: int) -> str:
-        """Generate cache key from request parameters."""
-        data = f"{self.genre_name}|{description}|{key}|{tempo}|{num_bars}"
-        return hashlib.md5(data.encode()).hexdigest()
+    @property
+    def _cache_prefix(self) -> str:
+        return f"progression:{self.genre_name}:"
 
-    def _get_cached_progression(
+    def _cache_key(
         self,
         description: str,
         key: Optional[str],
         tempo: Optional[int],
-        num_bars: int
-    ) -> Optional[tuple]:
-        """Get cached progression if available and not expired."""
-        cache_key = self._cache_key(description, key, tempo, num_bars)
-
-        if cache_key in self._cache:
-            response, timestamp = self._cache[cache_key]
-
-            # Check if cache is still valid
-            if time.time() - timestamp < self._cache_ttl_seconds:
-                logger.info(f"Cache hit for {self.genre_name} progression")
-                return response
-            else:
-                # Expired, remove from cache
-                del self._cache[cache_key]
-                logger.debug(f"Cache expired for {cache_key}")
-
-        return None
-
-    def _set_cached_progression(
+        num_bars: int,
+        complexity: int,
+        style: str
+    ) -> str:
+        """Generate cache key from request parameters."""
+        data = f"{self.genre_name}|{description}|{key}|{tempo}|{num_bars}|{complexity}|{style}"
+        return self._cache_prefix + hashlib.md5(data.encode()).hexdigest()
+
+    async def _generate_progression_with_gemini(
         self,
         description: str,
         key: Optional[str],
         tempo: Optional[int],
         num_bars: int,
-        response: tuple
-    ):
-        """Store progression in cache."""
-        cache_key = self._cache_key(description, key, tempo, num_bars)
-        self._cache[cache_key] = (response, time.time())
-        logger.debug(f"Cached {self.genre_name} progression: {cache_key}")
+        complexity: int = 5,
+        style: str = ""
+    ) -> Tuple[List[str], str, int, List]:
+        """Generate a progression, reusing a cached one for identical requests."""
+        generate_uncached = super()._generate_progression_with_gemini
+
+        async def generate() -> Dict[str, Any]:
+            chords, generated_key, generated_tempo, analysis = await generate_uncached(
+                description, key, tempo, num_bars, complexity, style
+            )
+            return {
+                "chords": chords,
+                "key": generated_key,
+                "tempo": generated_tempo,
+                "analysis": [a.model_dump() if hasattr(a, "model_dump") else a for a in analysis],
+            }
+
+        cached = await ai_response_cache.get_or_create(
+            self._cache_key(description, key, tempo, num_bars, complexity, style),
+            generate,
+            ttl_seconds=self._cache_ttl_seconds
+        )
+        return list(cached["chords"]), cached["key"], cached["tempo"], self._build_chord_analysis(cached["analysis"])
 
     def clear_cache(self):
         """Clear all cached progressions."""
-        count = len(self._cache)
-        self._cache.clear()
+        count = ai_response_cache.count(self._cache_prefix)
+        ai_response_cache.clear(self._cache_prefix)
         logger.info(f"Cleared {count} cached progressions")
 
     def get_cache_stats(self) -> Dict[str, Any]:
         """Get cache statistics."""
         return {
-            "cached_items": len(self._cache),
+            "cached_items": ai_response_cache.count(self._cache_prefix),
             "ttl_seconds": self._cache_ttl_seconds,
             "genre": self.genre_name
         }
@@ -5,16 +5,21 @@ This module consolidates duplicate logic found across multiple generator files,
 following the DRY principle.
 """
 
+import asyncio
 import json
+import random
 import re
 import base64
+import time
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple, Type
 
 from app.core.config import settings
 from app.gospel import Arrangement
-from app.gospel.midi.enhanced_exporter import export_enhanced_midi
+from app.gospel.midi.smf_encoder import encode_arrangement
 from app.schemas.gospel import MIDINoteInfo
+from app.services.humanizer import ArrangementHumanizer
 
 
 def parse_json_from_response(text: str) -> Dict:
@@ -84,6 +89,12 @@ def note_to_midi(note: str, octave: int = 4) -> int:
     return 60  # Default to middle C
 
 
+def midi_filename(arrangement: Arrangement, filename_prefix: str) -> str:
+    """Build the standard generated-MIDI filename for an arrangement."""
+    timestamp = int(time.time())
+    return f"{filename_prefix}_{arrangement.key}_{arrangement.tempo}bpm_{timestamp}.mid"
+
+
 def export_to_midi(
     arrangement: Arrangement,
     output_subdir: str,
@@ -102,21 +113,144 @@ def export_to_midi(
     """
     output_dir = settings.OUTPUTS_DIR / output_subdir
     output_dir.mkdir(parents=True, exist_ok=True)
+    midi_path = output_dir / midi_filename(arrangement, filename_prefix)
 
-    import time
-    timestamp = int(time.time())
-    filename = f"{filename_prefix}_{arrangement.key}_{arrangement.tempo}bpm_{timestamp}.mid"
-    midi_path = output_dir / filename
+    # Encode in memory; base64 comes from the same bytes (no read-back)
+    midi_bytes = encode_arrangement(arrangement)
+    midi_path.write_bytes(midi_bytes)
+
+    return midi_path, base64.b64encode(midi_bytes).decode('utf-8')
+
+
+def encode_midi(
+    arrangement: Arrangement,
+    humanizer: Optional[ArrangementHumanizer] = None,
+    humanization_amount: float = 0.3,
+    seed: Optional[int] = None
+) -> bytes:
+    """
+    Encode arrangement to MIDI bytes (CPU-only, safe to run in a worker process).
+
+    Args:
+        arrangement: Arrangement object to encode
+        humanizer: Groove humanizer to apply before encoding; replaces the
+            encoder's built-in tick jitter (None = encoder jitter only)
+        humanization_amount: Amount passed to the humanizer (0.0-1.0)
+        seed: Seed for the encoder's jitter when no humanizer is given
+
+    Returns:
+        Standard MIDI file bytes
+    """
+    if humanizer is not None:
+        arrangement = humanizer.humanize_arrangement(arrangement, humanization_amount)
+        return encode_arrangement(arrangement, humanize=False)
+    return encode_arrangement(arrangement, seed=seed)
+
+
+@dataclass
+class RenderJob:
+    """
+    Picklable arrangement + MIDI encoding job for a worker process.
+
+    Attributes:
+        arranger_class: Genre arranger class (constructed once per worker)
+        arrange_params: Keyword arguments for arrange_progression()
+        genre: Genre name for the groove humanizer
+        humanization_amount: Amount passed to the humanizer (0.0-1.0)
+        seed: Request seed (None = unseeded)
+    """
+    arranger_class: Type
+    arrange_params: Dict[str, Any] = field(default_factory=dict)
+    genre: str = "gospel"
+    humanization_amount: float = 0.3
+    seed: Optional[int] = None
+
+
+_worker_arrangers: Dict[Type, Any] = {}
+
+
+def run_render_job(job: RenderJob) -> Tuple[Arrangement, bytes]:
+    """
+    Arrange a progression and encode it to MIDI (steps 2-3 of the pipeline).
+
+    Mirrors the in-process path in BaseGenreGenerator: the arrangement draws
+    from random.Random(seed) and is encoded with a seeded genre humanizer.
+
+    Args:
+        job: Render job description
+
+    Returns:
+        Tuple of (arrangement, midi_bytes)
+    """
+    arranger = _worker_arrangers.get(job.arranger_class)
+    if arranger is None:
+        arranger = _worker_arrangers[job.arranger_class] = job.arranger_class()
+
+    arrangement = arranger.arrange_progression(**job.arrange_params, rng=random.Random(job.seed))
+
+    humanizer = ArrangementHumanizer(job.genre, seed=job.seed)
+    midi_bytes = encode_midi(arrangement, humanizer, job.humanization_amount, job.seed)
+    return arrangement, midi_bytes
+
+
+async def render_midi(
+    arrangement: Arrangement,
+    output_subdir: str,
+    filename_prefix: str,
+    persist: bool = True,
+    humanizer: Optional[ArrangementHumanizer] = None,
+    humanization_amount: float = 0.3,
+    seed: Optional[int] = None
+) -> Tuple[bytes, str, Optional[Path]]:
+    """
+    Encode arrangement to MIDI bytes, optionally saving a copy to disk.
 
-    # Export to MIDI file
-    export_enhanced_midi(arrangement, midi_path)
+    The disk write runs in a worker thread so the event loop is not blocked.
+
+    Args:
+        arrangement: Arrangement object to export
+        output_subdir: Subdirectory under outputs/ (e.g., 'gospel_generated')
+        filename_prefix: Prefix for filename (e.g., 'gospel')
+        persist: Write the file under outputs/ (needed for /download links)
+        humanizer: Groove humanizer to apply before encoding; replaces the
+            encoder's built-in tick jitter (None = encoder jitter only)
+        humanization_amount: Amount passed to the humanizer (0.0-1.0)
+        seed: Seed for the encoder's jitter when no humanizer is given
+
+    Returns:
+        Tuple of (midi_bytes, filename, midi_path or None if not persisted)
+    """
+    midi_bytes = encode_midi(arrangement, humanizer, humanization_amount, seed)
+    filename = midi_filename(arrangement, filename_prefix)
+
+    if not persist:
+        return midi_bytes, filename, None
+
+    midi_path = await save_midi(midi_bytes, output_subdir, filename)
+    return midi_bytes, filename, midi_path
+
+
+async def save_midi(midi_bytes: bytes, output_subdir: str, filename: str) -> Path:
+    """
+    Write MIDI bytes under outputs/ in a worker thread.
+
+    Args:
+        midi_bytes: Encoded MIDI file
+        output_subdir: Subdirectory under outputs/ (e.g., 'gospel_generated')
+        filename: File name within the subdirectory
+
+    Returns:
+        Path to the written file
+    """
+    output_dir = settings.OUTPUTS_DIR / output_subdir
+    midi_path = output_dir / filename
 
-    # Read and encode as base64
-    with open(midi_path, 'rb') as f:
-        midi_bytes = f.read()
-        midi_base64 = base64.b64encode(midi_bytes).decode('utf-8')
+    def _write():
+        output_dir.mkdir(parents=True, exist_ok=True)
+        midi_path.write_bytes(midi_bytes)
 
-    return midi_path, midi_base64
+    await asyncio.to_thread(_write)
+    return midi_path
 
 
 def get_notes_preview(arrangement: Arrangement, bars: int = 4) -> List[Dict]:
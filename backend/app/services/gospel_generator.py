@@ -4,8 +4,9 @@ Significantly reduced from 382 lines to ~120 lines by using BaseGenreGenerator.
 All duplicate logic eliminated through inheritance.
 """
 
-from typing import Any, List, Optional
+from typing import Any, Dict, List, Optional
 from pathlib import Path
+import random
 
 from app.services.base_genre_generator import BaseGenreGenerator
 from app.services.local_llm_generator_mixin import LocalLLMGeneratorMixin
@@ -143,7 +144,14 @@ class GospelGeneratorService(
     # GOSPEL-SPECIFIC OVERRIDES - Hybrid arranger support
     # =====================================================================
 
-    def _create_arrangement(self, chords: List[str], key: str, tempo: int, request: Any):
+    def _create_arrangement(
+        self,
+        chords: List[str],
+        key: str,
+        tempo: int,
+        request: Any,
+        rng: Optional[random.Random] = None
+    ):
         """
         Override to support hybrid AI+rules arrangement.
 
@@ -154,13 +162,17 @@ class GospelGeneratorService(
         arranger = self._get_arranger(request.ai_percentage)
 
         # Create arrangement
-        return arranger.arrange_progression(
-            chords=chords,
-            key=key,
-            bpm=tempo,
-            application=request.application.value,
-            time_signature=(4, 4)
-        )
+        return arranger.arrange_progression(**self._arrange_params(chords, key, tempo, request), rng=rng)
+
+    def _arrange_params(self, chords: List[str], key: str, tempo: int, request: Any) -> Dict[str, Any]:
+        """Gospel arrangers take no complexity parameter."""
+        return {
+            "chords": chords,
+            "key": key,
+            "bpm": tempo,
+            "application": request.application.value,
+            "time_signature": (4, 4)
+        }
 
     def _get_arranger(self, ai_percentage: float):
         """
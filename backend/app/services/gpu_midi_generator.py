@@ -15,15 +15,14 @@ import pretty_midi
 
 from app.core.config import settings
 from app.core.gpu import get_device, is_gpu_available
+from app.core.lazy import lazy_import, lazy_service, module_available
 
 logger = logging.getLogger(__name__)
 
-# Optional MLX import (Apple Silicon optimized)
-try:
-    import mlx.core as mx
-    MLX_AVAILABLE = True
-except ImportError:
-    MLX_AVAILABLE = False
+# Optional MLX (Apple Silicon optimized), imported on first use
+MLX_AVAILABLE = module_available("mlx")
+mx = lazy_import("mlx.core")
+if not MLX_AVAILABLE:
     logger.info("MLX not available. Using numpy fallback for matrix operations.")
 
 VoicingStyle = Literal["closed", "open", "drop2", "drop3", "quartet", "shell"]
@@ -457,4 +456,4 @@ class GPUMIDIGenerator:
 
 
 # Singleton instance
-gpu_midi_generator = GPUMIDIGenerator()
+gpu_midi_generator = lazy_service("gpu_midi_generator", GPUMIDIGenerator)
@@ -0,0 +1,239 @@
+"""Harmonic Search Service
+
+Maintains the library-wide harmonic index (chord n-gram inverted index plus
+MinHash signatures) and answers progression and similarity queries against it,
+without loading Song objects or re-running progression detection.
+"""
+
+import json
+from collections import defaultdict
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+from sqlalchemy import delete, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database.models import Song, SongChord, SongHarmonicNgram, SongHarmonicSignature
+from app.pipeline.harmonic_index import (
+    extract_ngrams,
+    parse_progression_query,
+    query_keys,
+    signature_similarity,
+    song_signature,
+    tokenize_chords,
+)
+
+
+class HarmonicSearchService:
+    """Service for indexing and searching songs by harmonic content"""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def index_song(self, song_id: str, chords: Sequence) -> int:
+        """
+        (Re)build index entries for one song.
+
+        Safe to call repeatedly; existing entries for the song are replaced.
+        Does not commit - callers control the transaction.
+
+        Args:
+            song_id: Song ID
+            chords: Chords ordered by time (SongChord rows, ChordEvents or dicts)
+
+        Returns:
+            Number of n-gram entries written
+        """
+        await self.remove_song(song_id)
+
+        tokens = tokenize_chords(chords)
+        ngrams = extract_ngrams(tokens)
+
+        if ngrams:
+            await self.db.execute(
+                insert(SongHarmonicNgram),
+                [
+                    {
+                        "ngram": n.key,
+                        "song_id": song_id,
+                        "size": n.size,
+                        "position": n.position,
+                        "start_index": n.start_index,
+                        "end_index": n.end_index,
+                        "start_time": n.start_time,
+                        "end_time": n.end_time,
+                    }
+                    for n in ngrams
+                ],
+            )
+
+        await self.db.execute(
+            insert(SongHarmonicSignature).values(
+                song_id=song_id,
+                signature_json=json.dumps(song_signature(tokens)),
+                token_count=len(tokens),
+            )
+        )
+
+        return len(ngrams)
+
+    async def remove_song(self, song_id: str) -> None:
+        """Delete all index entries for a song"""
+        await self.db.execute(delete(SongHarmonicNgram).where(SongHarmonicNgram.song_id == song_id))
+        await self.db.execute(delete(SongHarmonicSignature).where(SongHarmonicSignature.song_id == song_id))
+
+    async def rebuild_index(self) -> int:
+        """
+        Rebuild the index for every song from stored SongChord rows.
+
+        Returns:
+            Number of songs indexed
+        """
+        result = await self.db.execute(
+            select(SongChord.song_id, SongChord.root, SongChord.quality, SongChord.time, SongChord.duration)
+            .order_by(SongChord.song_id, SongChord.time)
+        )
+
+        chords_by_song: Dict[str, List[Dict]] = defaultdict(list)
+        for row in result.all():
+            chords_by_song[row.song_id].append({
+                "root": row.root,
+                "quality": row.quality,
+                "time": row.time,
+                "duration": row.duration,
+            })
+
+        await self.db.execute(delete(SongHarmonicNgram))
+        await self.db.execute(delete(SongHarmonicSignature))
+
+        for song_id, chords in chords_by_song.items():
+            await self.index_song(song_id, chords)
+
+        await self.db.commit()
+        return len(chords_by_song)
+
+    async def search_progression(self, query: str, limit: int = 20) -> List[Dict[str, Any]]:
+        """
+        Find songs containing a chord progression in any key.
+
+        Args:
+            query: Chord symbols, e.g. "Dm7 G7 Cmaj7 Db7"
+            limit: Maximum songs to return
+
+        Returns:
+            Songs ranked by number of occurrences, each with match positions
+
+        Raises:
+            ValueError: If the query is unparseable or shorter than two chords
+        """
+        tokens = tokenize_chords(parse_progression_query(query))
+        if len(tokens) < 2:
+            raise ValueError("Progression query needs at least two distinct chords")
+
+        lookups = query_keys(tokens)
+        keys = {key for _, key in lookups}
+
+        result = await self.db.execute(
+            select(
+                SongHarmonicNgram.ngram,
+                SongHarmonicNgram.song_id,
+                SongHarmonicNgram.position,
+                SongHarmonicNgram.start_index,
+                SongHarmonicNgram.end_index,
+                SongHarmonicNgram.start_time,
+                SongHarmonicNgram.end_time,
+            ).where(SongHarmonicNgram.ngram.in_(keys))
+        )
+
+        # song_id -> ngram key -> position -> row
+        postings: Dict[str, Dict[str, Dict[int, Any]]] = defaultdict(lambda: defaultdict(dict))
+        for row in result.all():
+            postings[row.song_id][row.ngram][row.position] = row
+
+        matches_by_song: Dict[str, List[Dict[str, Any]]] = {}
+        for song_id, by_key in postings.items():
+            _, first_key = lookups[0]
+            last_offset, last_key = lookups[-1]
+            matches = []
+
+            for position, first_row in sorted(by_key.get(first_key, {}).items()):
+                if all(position + offset in by_key.get(key, {}) for offset, key in lookups[1:]):
+                    last_row = by_key[last_key][position + last_offset]
+                    matches.append({
+                        "start_index": first_row.start_index,
+                        "end_index": last_row.end_index,
+                        "start_time": first_row.start_time,
+                        "end_time": last_row.end_time,
+                    })
+
+            if matches:
+                matches_by_song[song_id] = matches
+
+        if not matches_by_song:
+            return []
+
+        songs = await self._load_song_summaries(list(matches_by_song))
+        ranked = sorted(
+            matches_by_song.items(),
+            key=lambda item: (-len(item[1]), item[1][0]["start_time"])
+        )[:limit]
+
+        return [
+            {
+                **songs.get(song_id, {"song_id": song_id}),
+                "occurrences": len(matches),
+                "matches": matches,
+            }
+            for song_id, matches in ranked
+        ]
+
+    async def find_similar(self, song_id: str, limit: int = 10) -> Optional[List[Dict[str, Any]]]:
+        """
+        Rank other songs by estimated harmonic (n-gram Jaccard) similarity.
+
+        Returns:
+            Ranked songs with 'similarity' in [0, 1], or None if the song is not indexed
+        """
+        target = await self.db.get(SongHarmonicSignature, song_id)
+        if target is None:
+            return None
+
+        result = await self.db.execute(
+            select(SongHarmonicSignature.song_id, SongHarmonicSignature.signature_json)
+            .where(SongHarmonicSignature.song_id != song_id)
+            .where(SongHarmonicSignature.token_count > 0)
+        )
+        rows = result.all()
+        if not rows:
+            return []
+
+        candidate_ids = [row.song_id for row in rows]
+        signatures = np.array([json.loads(row.signature_json) for row in rows], dtype=np.int64)
+        scores = signature_similarity(json.loads(target.signature_json), signatures)
+
+        order = np.argsort(-scores, kind="stable")[:limit]
+        top = [(candidate_ids[i], float(scores[i])) for i in order if scores[i] > 0]
+
+        songs = await self._load_song_summaries([sid for sid, _ in top])
+        return [
+            {**songs.get(sid, {"song_id": sid}), "similarity": round(score, 4)}
+            for sid, score in top
+        ]
+
+    async def _load_song_summaries(self, song_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Fetch display fields for songs without loading their relationships"""
+        if not song_ids:
+            return {}
+
+        result = await self.db.execute(
+            select(Song.id, Song.title, Song.artist, Song.key_signature).where(Song.id.in_(song_ids))
+        )
+        return {
+            row.id: {
+                "song_id": row.id,
+                "title": row.title,
+                "artist": row.artist,
+                "key_signature": row.key_signature,
+            }
+            for row in result.all()
+        }
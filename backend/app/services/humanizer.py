@@ -10,12 +10,19 @@ Features:
 - Ghost notes for groove
 - Beat emphasis patterns (backbeat for gospel, swing for jazz)
 - Phrase-level dynamics (build, peak, resolve)
+
+All variations are computed over whole note arrays with a seeded
+numpy.random.Generator, so a given seed reproduces the same performance.
 """
 
-import random
-from typing import Optional
+from typing import List, Optional, Tuple
 from dataclasses import dataclass
 
+import numpy as np
+
+from app.gospel import Arrangement
+from app.gospel.note_array import HAND_CODES, HAND_LEFT, HAND_RIGHT, NOTE_DTYPE, NoteArray
+
 
 @dataclass
 class Note:
@@ -77,273 +84,367 @@ GROOVE_PROFILES = {
         "push_beats": [],
         "lay_back_beats": [],
     },
+    "rnb": {
+        "timing_style": "behind_beat",
+        "beat_emphasis": [1, 3],
+        "swing_amount": 0.1,             # Light 16th swing
+        "ghost_note_probability": 0.1,
+        "velocity_variance": 10,
+        "push_beats": [],
+        "lay_back_beats": [1, 3],        # Backbeat sits back
+    },
+    "latin": {
+        "timing_style": "straight",
+        "beat_emphasis": [0, 2],         # Clave-driven downbeats
+        "swing_amount": 0.0,             # Straight montuno eighths
+        "ghost_note_probability": 0.05,
+        "velocity_variance": 10,
+        "push_beats": [1, 3],            # Anticipated offbeats
+        "lay_back_beats": [],
+    },
+    "reggae": {
+        "timing_style": "behind_beat",
+        "beat_emphasis": [1, 3],         # Skank on 2 and 4
+        "swing_amount": 0.05,
+        "ghost_note_probability": 0.05,
+        "velocity_variance": 8,
+        "push_beats": [],
+        "lay_back_beats": [1, 3],
+    },
+}
+
+# Alternate spellings used by generator display names
+_GENRE_ALIASES = {
+    "neo-soul": "neo_soul",
+    "neosoul": "neo_soul",
+    "r&b": "rnb",
 }
 
 
 class ArrangementHumanizer:
     """
     Post-process AI-generated arrangements to sound more human.
-    
+
     Applies subtle timing, velocity, and articulation variations
     that give the music a performed, rather than programmed, feel.
     """
-    
-    def __init__(self, genre: str = "gospel"):
+
+    def __init__(self, genre: str = "gospel", seed: Optional[int] = None):
         """
         Initialize humanizer with genre-specific groove profile.
-        
+
         Args:
-            genre: One of 'gospel', 'jazz', 'neo_soul', 'blues', 'classical'
+            genre: One of GROOVE_PROFILES (unknown genres use 'gospel')
+            seed: Seed for the random generator (None = non-deterministic)
         """
-        self.genre = genre.lower()
+        genre = genre.lower()
+        self.genre = _GENRE_ALIASES.get(genre, genre)
         self.profile = GROOVE_PROFILES.get(self.genre, GROOVE_PROFILES["gospel"])
-    
+        self.rng = np.random.default_rng(seed)
+
     def humanize(
         self,
-        notes: list[Note],
+        notes: list,
         humanization_amount: float = 0.5,
         apply_phrase_dynamics: bool = True
-    ) -> list[Note]:
+    ) -> List[Note]:
         """
         Apply humanization to a list of notes.
-        
+
         Args:
-            notes: Input notes from arranger
+            notes: Input notes from arranger (Note-like objects or dicts)
             humanization_amount: 0.0 = robotic, 1.0 = heavily humanized
             apply_phrase_dynamics: Apply crescendo/decrescendo over phrases
-        
+
         Returns:
             Humanized notes with natural feel
         """
         if not notes:
             return notes
-        
-        humanized = []
-        
-        # Calculate phrase boundaries for dynamics
-        total_duration = max(n.time + n.duration for n in notes)
-        
-        for note in notes:
-            humanized_note = Note(
-                pitch=note.pitch,
-                time=self._humanize_timing(note.time, humanization_amount),
-                duration=self._humanize_duration(note.duration, humanization_amount),
-                velocity=self._humanize_velocity(
-                    note, 
-                    humanization_amount,
-                    total_duration if apply_phrase_dynamics else None
-                ),
-                hand=note.hand
-            )
-            humanized.append(humanized_note)
-        
+
+        humanized = self.humanize_array(_to_note_array(notes), humanization_amount, apply_phrase_dynamics)
+        return [
+            Note(pitch=n.pitch, time=n.time, duration=n.duration, velocity=n.velocity, hand=n.hand)
+            for n in humanized.to_notes()
+        ]
+
+    def humanize_arrangement(
+        self,
+        arrangement: Arrangement,
+        humanization_amount: float = 0.5,
+        apply_phrase_dynamics: bool = True
+    ) -> Arrangement:
+        """
+        Humanize both hands of an arrangement in one pass.
+
+        Phrase dynamics span the whole piece, as when humanizing the
+        combined note list.
+
+        Returns:
+            New Arrangement with humanized notes (input is unchanged)
+        """
+        notes = NoteArray.concatenate([
+            NoteArray.from_notes(arrangement.left_hand_notes),
+            NoteArray.from_notes(arrangement.right_hand_notes),
+        ])
+        humanized = self.humanize_array(notes, humanization_amount, apply_phrase_dynamics)
+
+        return Arrangement(
+            left_hand_notes=humanized.for_hand("left").to_notes(),
+            right_hand_notes=humanized.for_hand("right").to_notes(),
+            tempo=arrangement.tempo,
+            time_signature=arrangement.time_signature,
+            key=arrangement.key,
+            total_bars=arrangement.total_bars,
+            application=arrangement.application
+        )
+
+    def humanize_array(
+        self,
+        notes: NoteArray,
+        humanization_amount: float = 0.5,
+        apply_phrase_dynamics: bool = True
+    ) -> NoteArray:
+        """
+        Vectorized humanization over a NoteArray.
+
+        Returns:
+            Humanized notes plus any ghost notes, stably sorted by time
+        """
+        if not len(notes):
+            return notes
+
+        amount = humanization_amount
+        time = notes.time
+        beat_in_bar = time.astype(np.int64) % 4
+
+        total_duration = notes.end_time if apply_phrase_dynamics else None
+
+        humanized = notes.data.copy()
+        humanized["time"] = np.maximum(0.0, time + self._timing_offsets(time, beat_in_bar, amount))
+        humanized["duration"] = self._humanized_durations(notes.duration, amount)
+        humanized["velocity"] = self._humanized_velocities(notes, beat_in_bar, amount, total_duration)
+
         # Add ghost notes for groove (genre-specific)
-        if humanization_amount > 0.3:
-            ghost_notes = self._generate_ghost_notes(humanized, humanization_amount)
-            humanized.extend(ghost_notes)
-        
+        if amount > 0.3:
+            ghosts = self._ghost_notes(humanized, amount)
+            humanized = np.concatenate([humanized, ghosts])
+
         # Sort by time
-        humanized.sort(key=lambda n: n.time)
-        
-        return humanized
-    
-    def _humanize_timing(self, time: float, amount: float) -> float:
+        humanized = humanized[np.argsort(humanized["time"], kind="stable")]
+        return NoteArray(humanized, validate=False)
+
+    def _timing_offsets(self, time: np.ndarray, beat_in_bar: np.ndarray, amount: float) -> np.ndarray:
         """
-        Add micro-timing variations based on beat position.
-        
+        Micro-timing offsets based on beat position.
+
         Different genres have different "pocket" feels:
         - Gospel: Push beat 2, lay back on beat 4
         - Jazz: Swing on off-beats
         - Neo-soul: Everything slightly behind
         """
-        beat_in_bar = int(time) % 4
-        fractional_beat = time - int(time)
-        
         # Base random variation (Gaussian for natural feel)
-        base_offset = random.gauss(0, 0.015) * amount
-        
-        # Genre-specific timing adjustments
-        if beat_in_bar in self.profile["push_beats"]:
-            # Push this beat slightly ahead
-            base_offset += 0.025 * amount
-        elif beat_in_bar in self.profile["lay_back_beats"]:
-            # Lay back on this beat
-            base_offset -= 0.03 * amount
-        
-        # Apply swing to off-beats
-        if fractional_beat > 0.4 and fractional_beat < 0.6:  # "And" of the beat
-            swing_offset = self.profile["swing_amount"] * amount
-            if self.profile["timing_style"] == "shuffle":
-                base_offset += swing_offset
-            elif self.profile["timing_style"] == "swing":
-                base_offset += swing_offset * 0.67  # Triplet-based swing
-        
-        # Ensure time doesn't go negative
-        return max(0, time + base_offset)
-    
-    def _humanize_duration(self, duration: float, amount: float) -> float:
+        offsets = self.rng.normal(0, 0.015, len(time)) * amount
+
+        # Per-beat pocket: push wins over lay back when a beat is in both
+        pocket = np.zeros(4)
+        pocket[self.profile["lay_back_beats"]] = -0.03
+        pocket[self.profile["push_beats"]] = 0.025
+        offsets += pocket[beat_in_bar] * amount
+
+        # Apply swing to off-beats ("and" of the beat)
+        fractional_beat = time - time.astype(np.int64)
+        off_beat = (fractional_beat > 0.4) & (fractional_beat < 0.6)
+        swing_offset = self.profile["swing_amount"] * amount
+        if self.profile["timing_style"] == "shuffle":
+            offsets[off_beat] += swing_offset
+        elif self.profile["timing_style"] == "swing":
+            offsets[off_beat] += swing_offset * 0.67  # Triplet-based swing
+
+        return offsets
+
+    def _humanized_durations(self, duration: np.ndarray, amount: float) -> np.ndarray:
         """
-        Add subtle duration variations.
-        
+        Subtle duration variations.
+
         Shorter notes get slightly shorter, longer notes slightly longer
         for a more natural feel.
         """
-        # Small random variation
-        variance = random.gauss(0, 0.03) * amount
-        
-        # Tendency: short notes get shorter, long notes get longer
-        if duration < 0.5:
-            variance -= 0.02 * amount
-        elif duration > 2.0:
-            variance += 0.03 * amount
-        
-        return max(0.1, duration * (1 + variance))
-    
-    def _humanize_velocity(
-        self, 
-        note: Note, 
+        variance = self.rng.normal(0, 0.03, len(duration)) * amount
+        variance -= np.where(duration < 0.5, 0.02 * amount, 0.0)
+        variance += np.where(duration > 2.0, 0.03 * amount, 0.0)
+        return np.maximum(0.1, duration * (1 + variance))
+
+    def _humanized_velocities(
+        self,
+        notes: NoteArray,
+        beat_in_bar: np.ndarray,
         amount: float,
         total_duration: Optional[float] = None
-    ) -> int:
+    ) -> np.ndarray:
         """
-        Apply dynamic velocity curves.
-        
+        Dynamic velocity curves.
+
         Includes:
         - Beat emphasis (backbeat for gospel/jazz)
         - Random variation
         - Phrase-level dynamics (optional)
-        - Hand-specific adjustments
+        - Hand-specific adjustments (left hand slightly softer)
         """
-        base_velocity = note.velocity
-        beat_in_bar = int(note.time) % 4
-        
-        # Beat emphasis
-        if beat_in_bar in self.profile["beat_emphasis"]:
-            beat_boost = int(12 * amount)
-        else:
-            beat_boost = 0
-        
-        # Random variation
+        n = len(notes)
+        velocity = notes.velocity.astype(np.int64)
+
+        emphasis = np.zeros(4, dtype=np.int64)
+        emphasis[self.profile["beat_emphasis"]] = int(12 * amount)
+        velocity += emphasis[beat_in_bar]
+
+        # Gaussian for more natural center-weighted variation
         variance = self.profile["velocity_variance"]
-        # Gaussian distribution for more natural center-weighted variation
-        random_variation = int(random.gauss(0, variance / 2.0) * amount)
-        
-        # Phrase dynamics (build toward middle, resolve at end)
-        phrase_adjustment = 0
+        velocity += np.trunc(self.rng.normal(0, variance / 2.0, n) * amount).astype(np.int64)
+
         if total_duration and total_duration > 0:
-            position_ratio = note.time / total_duration
-            if position_ratio < 0.3:
-                # Beginning: building
-                phrase_adjustment = int((position_ratio / 0.3) * 8 * amount)
-            elif position_ratio < 0.7:
-                # Middle/climax: full intensity
-                phrase_adjustment = int(10 * amount)
-            else:
-                # Ending: resolving
-                phrase_adjustment = int((1 - (position_ratio - 0.7) / 0.3) * 8 * amount)
-        
-        # Hand-specific adjustments
-        hand_adjustment = 0
-        if note.hand == "left":
-            # Left hand typically slightly softer (supporting role)
-            hand_adjustment = -5
-        
-        # Calculate final velocity
-        final_velocity = (
-            base_velocity 
-            + beat_boost 
-            + random_variation 
-            + phrase_adjustment 
-            + hand_adjustment
-        )
-        
+            velocity += _phrase_curve(notes.time / total_duration, amount)
+
+        velocity -= np.where(notes.hand == HAND_LEFT, 5, 0)
+
         # Clamp to valid MIDI range
-        return max(20, min(127, final_velocity))
-    
-    def _generate_ghost_notes(
-        self, 
-        notes: list[Note], 
-        amount: float
-    ) -> list[Note]:
+        return np.clip(velocity, 20, 127)
+
+    def _ghost_notes(self, humanized: np.ndarray, amount: float) -> np.ndarray:
         """
-        Add subtle ghost notes for groove.
-        
+        Soft ghost notes (left hand) and grace notes (right hand).
+
         Ghost notes are very soft notes that fill in the groove
         without being heard as distinct musical events.
         """
-        ghost_notes = []
+        n = len(humanized)
         ghost_probability = self.profile["ghost_note_probability"] * amount
-        
-        for note in notes:
-            if note.hand == "left" and random.random() < ghost_probability:
-                # Add ghost note slightly before the main note
-                ghost_time = note.time - random.uniform(0.15, 0.25)
-                if ghost_time >= 0:
-                    ghost = Note(
-                        pitch=note.pitch,
-                        time=ghost_time,
-                        duration=0.1,
-                        velocity=random.randint(25, 40),  # Very soft
-                        hand="left"
-                    )
-                    ghost_notes.append(ghost)
-            
-            # Occasional right-hand grace notes
-            if note.hand == "right" and random.random() < ghost_probability * 0.5:
-                grace_pitch = note.pitch - random.choice([1, 2])  # Half/whole step below
-                grace_time = note.time - 0.08
-                if grace_time >= 0:
-                    grace = Note(
-                        pitch=grace_pitch,
-                        time=grace_time,
-                        duration=0.06,
-                        velocity=note.velocity - 20,
-                        hand="right"
-                    )
-                    ghost_notes.append(grace)
-        
-        return ghost_notes
-    
+        left = humanized["hand"] == HAND_LEFT
+        right = humanized["hand"] == HAND_RIGHT
+
+        # Left hand: same pitch, slightly before the main note
+        ghost_time = humanized["time"] - self.rng.uniform(0.15, 0.25, n)
+        ghost_mask = left & (self.rng.random(n) < ghost_probability) & (ghost_time >= 0)
+        ghosts = np.empty(int(ghost_mask.sum()), dtype=NOTE_DTYPE)
+        ghosts["pitch"] = humanized["pitch"][ghost_mask]
+        ghosts["time"] = ghost_time[ghost_mask]
+        ghosts["duration"] = 0.1
+        ghosts["velocity"] = self.rng.integers(25, 41, len(ghosts))  # Very soft
+        ghosts["hand"] = HAND_LEFT
+
+        # Right hand: half/whole step grace note below
+        grace_time = humanized["time"] - 0.08
+        grace_mask = right & (self.rng.random(n) < ghost_probability * 0.5) & (grace_time >= 0)
+        graces = np.empty(int(grace_mask.sum()), dtype=NOTE_DTYPE)
+        graces["pitch"] = np.maximum(0, humanized["pitch"][grace_mask] - self.rng.choice([1, 2], len(graces)))
+        graces["time"] = grace_time[grace_mask]
+        graces["duration"] = 0.06
+        graces["velocity"] = np.maximum(1, humanized["velocity"][grace_mask] - 20)
+        graces["hand"] = HAND_RIGHT
+
+        return np.concatenate([ghosts, graces])
+
     def set_groove_profile(self, profile: dict) -> None:
         """
         Set a custom groove profile.
-        
+
         Args:
             profile: Dict with timing_style, beat_emphasis, swing_amount, etc.
         """
         self.profile = {**GROOVE_PROFILES["gospel"], **profile}
 
 
+def jitter_performance(
+    starts: np.ndarray,
+    durations: np.ndarray,
+    velocities: np.ndarray,
+    rng: np.random.Generator,
+    timing_variance: float,
+    duration_variance: float,
+    velocity_variance: int,
+    chord_index: Optional[np.ndarray] = None,
+    stagger_range: Tuple[float, float] = (0.005, 0.015)
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Uniform timing/duration/velocity jitter for exercise playback.
+
+    Works in whatever time unit the caller uses (seconds for pretty_midi).
+
+    Args:
+        starts: Note onsets
+        durations: Note lengths
+        velocities: Base velocities
+        rng: Random generator
+        timing_variance: Max onset shift either way
+        duration_variance: Max relative duration change either way
+        velocity_variance: Max velocity change either way
+        chord_index: Position of each note within its chord; onsets are
+            rolled by chord_index * uniform(stagger_range), ends are not
+        stagger_range: Per-note stagger step
+
+    Returns:
+        Tuple of (onsets, offsets, velocities)
+    """
+    n = len(starts)
+    onsets = np.maximum(0.0, starts + rng.uniform(-timing_variance, timing_variance, n))
+    offsets = onsets + durations * (1.0 + rng.uniform(-duration_variance, duration_variance, n))
+    velocities = np.clip(
+        velocities + rng.integers(-velocity_variance, velocity_variance + 1, n), 1, 127
+    )
+
+    if chord_index is not None:
+        onsets = onsets + chord_index * rng.uniform(*stagger_range, n)
+
+    return onsets, offsets, velocities
+
+
+def _phrase_curve(position_ratio: np.ndarray, amount: float) -> np.ndarray:
+    """Build toward the middle, full intensity at the climax, resolve at the end"""
+    building = np.trunc((position_ratio / 0.3) * 8 * amount)
+    resolving = np.trunc((1 - (position_ratio - 0.7) / 0.3) * 8 * amount)
+    curve = np.where(
+        position_ratio < 0.3,
+        building,
+        np.where(position_ratio < 0.7, int(10 * amount), resolving)
+    )
+    return curve.astype(np.int64)
+
+
+def _to_note_array(notes: list) -> NoteArray:
+    """Columns from Note-like objects or dicts (hand defaults to 'right')."""
+    def field(n, name, default):
+        if isinstance(n, dict):
+            return n.get(name, default)
+        return getattr(n, name, default)
+
+    return NoteArray.from_columns(
+        pitch=[field(n, "pitch", 60) for n in notes],
+        time=[field(n, "time", 0.0) for n in notes],
+        duration=[field(n, "duration", 1.0) for n in notes],
+        velocity=[field(n, "velocity", 80) for n in notes],
+        hand=[HAND_CODES[field(n, "hand", "right")] for n in notes],
+    )
+
+
 def humanize_arrangement(
     notes: list,
     genre: str = "gospel",
-    amount: float = 0.5
+    amount: float = 0.5,
+    seed: Optional[int] = None
 ) -> list:
     """
     Convenience function to humanize an arrangement.
-    
+
     Args:
-        notes: List of Note-like objects with pitch, time, duration, velocity, hand
+        notes: List of Note-like objects or dicts with pitch, time, duration, velocity, hand
         genre: Genre for groove profile
         amount: Humanization amount (0.0-1.0)
-    
+        seed: Seed for reproducible output
+
     Returns:
         List of humanized notes
     """
-    humanizer = ArrangementHumanizer(genre)
-    
-    # Convert to internal Note format if needed
-    internal_notes = []
-    for n in notes:
-        internal_notes.append(Note(
-            pitch=getattr(n, 'pitch', n.get('pitch', 60)),
-            time=getattr(n, 'time', n.get('time', 0.0)),
-            duration=getattr(n, 'duration', n.get('duration', 1.0)),
-            velocity=getattr(n, 'velocity', n.get('velocity', 80)),
-            hand=getattr(n, 'hand', n.get('hand', 'right'))
-        ))
-    
-    return humanizer.humanize(internal_notes, amount)
+    return ArrangementHumanizer(genre, seed=seed).humanize(notes, amount)
 
 
 # =============================================================================
@@ -353,6 +454,7 @@ def humanize_arrangement(
 __all__ = [
     "ArrangementHumanizer",
     "humanize_arrangement",
+    "jitter_performance",
     "GROOVE_PROFILES",
     "Note",
 ]
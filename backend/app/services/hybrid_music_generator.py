@@ -17,6 +17,7 @@ from typing import Optional, Dict, Any, List
 import mido
 import random
 
+from app.core.lazy import lazy_service
 from app.services.ai.chord_service import chord_service
 from app.services.ai.music_theory_generator import music_theory_generator
 from app.services.ai.midi_service import midi_service
@@ -87,7 +88,7 @@ class HybridMusicGenerator:
             if not request.template_data:
                 logger.info(f"🎹 Generating dynamic {request.genre.value} progression with LLM")
                 # Generate a dynamic template with LLM-based chord progressions
-                request.template_data = self._generate_dynamic_progression_template(
+                request.template_data = await self._generate_dynamic_progression_template(
                     genre=request.genre,
                     num_bars=request.num_bars,
                     key=request.key,
@@ -502,7 +503,7 @@ Provide a brief music theory analysis covering:
 
 Keep analysis concise (3-4 sentences)."""
 
-            analysis = self.llm.generate(
+            analysis = await self.llm.agenerate(
                 prompt=prompt,
                 complexity=6,  # Medium complexity
                 max_tokens=256,
@@ -515,7 +516,7 @@ Keep analysis concise (3-4 sentences)."""
             logger.error(f"Theory analysis failed: {e}")
             return f"Analysis failed: {str(e)}"
 
-    def _generate_dynamic_progression_template(
+    async def _generate_dynamic_progression_template(
         self,
         genre: MusicGenre,
         num_bars: int,
@@ -595,7 +596,7 @@ Generate now:"""
                 logger.info("🤖 Using local LLM to generate chord progression...")
                 
                 # Force local model even for high complexity, use HIGH temperature
-                response = self.llm.generate(
+                response = await self.llm.agenerate(
                     prompt=llm_prompt,
                     complexity=min(complexity, 7),  # Cap for model routing
                     max_tokens=256,
@@ -625,7 +626,7 @@ Generate now:"""
             # One more attempt with simplified prompt
             try:
                 simple_prompt = f"Generate exactly {num_bars} {genre.value} chords in key of {key.value}. Output ONLY a JSON array like [\"Cmaj7\",\"Am7\",...]"
-                response = self.llm.generate(
+                response = await self.llm.agenerate(
                     prompt=simple_prompt,
                     complexity=5,
                     max_tokens=256,
@@ -1102,5 +1103,5 @@ Generate now:"""
         return events
 
 
-# Global singleton instance
-hybrid_music_generator = HybridMusicGenerator()
+# Global singleton instance (built on first use)
+hybrid_music_generator = lazy_service("hybrid_music_generator", HybridMusicGenerator)
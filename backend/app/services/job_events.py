@@ -0,0 +1,273 @@
+"""
+Pub/sub for job progress events.
+
+Job pipelines publish an event for every stage transition and progress
+update; SSE and WebSocket endpoints subscribe and push them to clients, so
+browsers no longer poll GET /jobs to watch a job move.
+
+- In-process: each subscriber gets a bounded queue; when a slow client
+  falls behind, its oldest events are dropped (later events supersede them)
+- Shared: with settings.job_events_backend = "redis", events are also
+  published on a Redis channel and relayed into every API process, so a
+  client connected to one worker sees jobs running on another
+
+Endpoints follow a job (or every job) with:
+
+    async for event in job_event_broker.stream(job_id, snapshot):
+        ...  # None means "idle, send a heartbeat"
+
+Events are JSON-serialisable dicts with at least "job_id" and "event".
+"""
+
+import asyncio
+import json
+import logging
+import threading
+import uuid
+from collections import defaultdict
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Callable, Dict, Iterable, Optional, Set, Tuple
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Events after which a job's stream ends
+TERMINAL_EVENTS = frozenset({"complete", "error", "cancelled", "deleted"})
+
+
+class RedisJobEventBackend:
+    """Relays events between API processes over a Redis pub/sub channel."""
+
+    CHANNEL = "job_events"
+
+    def __init__(self, url: str):
+        import redis.asyncio as redis
+
+        self._client = redis.Redis.from_url(url, decode_responses=True)
+
+    async def publish(self, message: str) -> None:
+        await self._client.publish(self.CHANNEL, message)
+
+    async def listen(self) -> AsyncIterator[str]:
+        pubsub = self._client.pubsub()
+        await pubsub.subscribe(self.CHANNEL)
+        try:
+            async for message in pubsub.listen():
+                if message["type"] == "message":
+                    yield message["data"]
+        finally:
+            await pubsub.aclose()
+
+    async def close(self) -> None:
+        await self._client.aclose()
+
+
+class JobEventBroker:
+    """
+    Fan-out of job events to in-process subscribers, optionally shared.
+
+    Args:
+        queue_size: Buffered events per subscriber (default: settings.job_events_queue_size)
+        backend: RedisJobEventBackend, or None for this process only
+    """
+
+    def __init__(self, queue_size: Optional[int] = None, backend: Any = None):
+        self.queue_size = queue_size if queue_size is not None else settings.job_events_queue_size
+        self.backend = backend
+        self.origin = uuid.uuid4().hex
+        # job_id (None = every job) -> subscriber queues and the loop that owns each
+        self._subscribers: Dict[Optional[str], Set[Tuple[asyncio.Queue, asyncio.AbstractEventLoop]]] = defaultdict(set)
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._relay_task: Optional[asyncio.Task] = None
+        self._pending: Set[asyncio.Future] = set()
+        self._reset_stats()
+
+    # =====================================================================
+    # PUBLISH
+    # =====================================================================
+
+    def publish(self, event: Dict[str, Any]) -> None:
+        """Deliver an event to local subscribers and forward it to the shared backend."""
+        with self._lock:
+            self._stats["published"] += 1
+        self._deliver(event)
+
+        if self.backend is not None:
+            self._forward(json.dumps({**event, "origin": self.origin}, default=str))
+
+    def _forward(self, message: str) -> None:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+
+        if loop is not None and (self._loop is None or loop is self._loop):
+            future = loop.create_task(self.backend.publish(message))
+        elif self._loop is not None and not self._loop.is_closed():
+            future = asyncio.run_coroutine_threadsafe(self.backend.publish(message), self._loop)
+        else:
+            return
+        self._pending.add(future)
+        future.add_done_callback(self._forwarded)
+
+    def _forwarded(self, future) -> None:
+        self._pending.discard(future)
+        if not future.cancelled() and future.exception() is not None:
+            with self._lock:
+                self._stats["backend_errors"] += 1
+            logger.warning(f"Job event publish failed: {future.exception()}")
+
+    def _deliver(self, event: Dict[str, Any]) -> None:
+        with self._lock:
+            targets = list(self._subscribers.get(event.get("job_id"), ())) + list(self._subscribers.get(None, ()))
+
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+
+        for queue, loop in targets:
+            if loop is running:
+                self._put(queue, event)
+            elif not loop.is_closed():
+                loop.call_soon_threadsafe(self._put, queue, event)
+
+    def _put(self, queue: asyncio.Queue, event: Dict[str, Any]) -> None:
+        if queue.full():
+            # Slow client: a later event supersedes the oldest one
+            queue.get_nowait()
+            with self._lock:
+                self._stats["dropped"] += 1
+        queue.put_nowait(event)
+        with self._lock:
+            self._stats["delivered"] += 1
+
+    # =====================================================================
+    # SUBSCRIBE
+    # =====================================================================
+
+    @asynccontextmanager
+    async def subscribe(self, job_id: Optional[str] = None) -> AsyncIterator[asyncio.Queue]:
+        """Queue receiving events for one job (or every job while subscribed)."""
+        entry = (asyncio.Queue(maxsize=self.queue_size), asyncio.get_running_loop())
+        with self._lock:
+            self._subscribers[job_id].add(entry)
+        try:
+            yield entry[0]
+        finally:
+            with self._lock:
+                self._subscribers[job_id].discard(entry)
+                if not self._subscribers[job_id]:
+                    del self._subscribers[job_id]
+
+    async def stream(
+        self,
+        job_id: Optional[str] = None,
+        snapshot: Optional[Callable[[], Iterable[Dict[str, Any]]]] = None,
+        heartbeat: Optional[float] = None,
+    ) -> AsyncIterator[Optional[Dict[str, Any]]]:
+        """
+        Follow one job (or every job) as an async iterator.
+
+        Subscribes before taking the snapshot, so no event falls between the
+        two. A single-job stream ends after the job's terminal event.
+
+        Args:
+            job_id: Job to follow, or None for every job
+            snapshot: Returns the current state as events, sent first
+            heartbeat: Seconds of silence before yielding None (default: settings.job_events_heartbeat_seconds)
+
+        Yields:
+            Event dicts, or None when the stream has been idle for `heartbeat` seconds
+        """
+        heartbeat = heartbeat if heartbeat is not None else settings.job_events_heartbeat_seconds
+
+        async with self.subscribe(job_id) as queue:
+            for event in (snapshot() if snapshot else ()):
+                yield event
+                if job_id is not None and event["event"] in TERMINAL_EVENTS:
+                    return
+
+            while True:
+                try:
+                    event = await asyncio.wait_for(queue.get(), heartbeat)
+                except asyncio.TimeoutError:
+                    yield None
+                    continue
+                yield event
+                if job_id is not None and event["event"] in TERMINAL_EVENTS:
+                    return
+
+    # =====================================================================
+    # SHARED BACKEND
+    # =====================================================================
+
+    async def start(self) -> None:
+        """Start relaying events published by other processes (no-op without a backend)."""
+        self._loop = asyncio.get_running_loop()
+        if self.backend is not None and self._relay_task is None:
+            self._relay_task = asyncio.create_task(self._relay())
+
+    async def stop(self) -> None:
+        if self._relay_task is not None:
+            self._relay_task.cancel()
+            try:
+                await self._relay_task
+            except asyncio.CancelledError:
+                pass
+            self._relay_task = None
+        if self.backend is not None:
+            await self.backend.close()
+        self._loop = None
+
+    async def _relay(self) -> None:
+        while True:
+            try:
+                async for message in self.backend.listen():
+                    event = json.loads(message)
+                    if event.pop("origin", None) == self.origin:
+                        continue  # Already delivered locally
+                    with self._lock:
+                        self._stats["relayed"] += 1
+                    self._deliver(event)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                with self._lock:
+                    self._stats["backend_errors"] += 1
+                logger.warning(f"Job event relay failed, reconnecting: {e}")
+                await asyncio.sleep(1.0)
+
+    # =====================================================================
+    # STATS
+    # =====================================================================
+
+    def _reset_stats(self) -> None:
+        self._stats = {"published": 0, "delivered": 0, "dropped": 0, "relayed": 0, "backend_errors": 0}
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                **self._stats,
+                "subscribers": sum(len(entries) for entries in self._subscribers.values()),
+                "backend": type(self.backend).__name__ if self.backend is not None else "memory",
+            }
+
+
+def _build_backend() -> Any:
+    backend = settings.job_events_backend.lower()
+    try:
+        if backend == "redis":
+            return RedisJobEventBackend(settings.redis_url)
+    except Exception as e:
+        logger.warning(f"Job events backend '{backend}' unavailable, using this process only: {e}")
+        return None
+    if backend != "memory":
+        logger.warning(f"Unknown job_events_backend '{backend}', using this process only")
+    return None
+
+
+# Shared by the job pipelines and the event stream endpoints
+job_event_broker = JobEventBroker(backend=_build_backend())
@@ -0,0 +1,466 @@
+"""Local LLM Inference Worker
+
+Runs blocking local-model inference (MLX) on one dedicated thread so async
+request handlers never stall the event loop:
+
+- Async submit API: await worker.submit(request) / async for chunk in worker.stream(request)
+- Priority queue: interactive requests jump ahead of background work
+- Timeouts: a request that times out (or is cancelled) before it starts is skipped
+- Micro-batching: requests already waiting for the same model tier are
+  dispatched together, so the worker serves one tier at a time instead of
+  switching models between interleaved requests
+- Token streaming: chunks are pushed back to the caller as they are generated
+
+One inference thread is deliberate: MLX models are not safe to call from
+several threads, and the GPU is saturated by one generation anyway.
+
+Backends implement InferenceBackend. StubInferenceBackend answers without a
+model for tests and machines without MLX.
+"""
+
+import asyncio
+import heapq
+import itertools
+import logging
+import queue
+import threading
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from enum import IntEnum
+from typing import Any, AsyncIterator, Callable, Dict, Hashable, Iterator, List, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+
+class InferencePriority(IntEnum):
+    """Queue priority (lower runs first)"""
+    INTERACTIVE = 0   # User is waiting on the response
+    NORMAL = 1
+    BACKGROUND = 2    # Batch jobs, pre-generation
+
+
+@dataclass
+class InferenceRequest:
+    """Arguments of one local LLM generation."""
+    prompt: str
+    complexity: int = 5
+    max_tokens: int = 1024
+    temperature: float = 0.7
+    system_prompt: Optional[str] = None
+    force_local: bool = False
+
+
+class InferenceBackend(ABC):
+    """Blocking model backend driven by the worker thread."""
+
+    @abstractmethod
+    def select_tier(self, request: InferenceRequest) -> Hashable:
+        """Model tier for a request (requests batch only within a tier).
+
+        Raises:
+            ValueError: If no local model can serve the request
+        """
+
+    @abstractmethod
+    def generate(self, tier: Hashable, request: InferenceRequest) -> str:
+        """Generate the full response for one request."""
+
+    def generate_batch(
+        self,
+        tier: Hashable,
+        requests: List[InferenceRequest]
+    ) -> List[Union[str, Exception]]:
+        """Generate responses for requests sharing a tier.
+
+        Per-request failures are returned in place of the response so one
+        bad prompt does not fail the rest of the batch.
+        """
+        results: List[Union[str, Exception]] = []
+        for request in requests:
+            try:
+                results.append(self.generate(tier, request))
+            except Exception as e:
+                results.append(e)
+        return results
+
+    def stream(self, tier: Hashable, request: InferenceRequest) -> Iterator[str]:
+        """Yield response chunks as they are generated (default: one chunk)."""
+        yield self.generate(tier, request)
+
+
+class StubInferenceBackend(InferenceBackend):
+    """Model-free backend for tests and development.
+
+    Args:
+        respond: Maps a request to its response (default: echoes the prompt)
+        delay: Seconds each generation blocks, to simulate model latency
+    """
+
+    def __init__(
+        self,
+        respond: Optional[Callable[[InferenceRequest], str]] = None,
+        delay: float = 0.0
+    ):
+        self.respond = respond or (lambda request: f"echo: {request.prompt}")
+        self.delay = delay
+        self.batches: List[List[InferenceRequest]] = []
+
+    def select_tier(self, request: InferenceRequest) -> Hashable:
+        if request.complexity > 7 and not request.force_local:
+            raise ValueError(f"Task complexity {request.complexity} too high for local models.")
+        return "small" if request.complexity <= 4 else "medium"
+
+    def generate(self, tier: Hashable, request: InferenceRequest) -> str:
+        if self.delay:
+            time.sleep(self.delay)
+        return self.respond(request)
+
+    def generate_batch(self, tier, requests):
+        self.batches.append(list(requests))
+        return super().generate_batch(tier, requests)
+
+    def stream(self, tier: Hashable, request: InferenceRequest) -> Iterator[str]:
+        for word in self.generate(tier, request).split(" "):
+            yield word + " "
+
+
+_STOP = object()
+_STREAM_END = object()
+
+
+@dataclass
+class _Job:
+    request: InferenceRequest
+    tier: Hashable
+    loop: asyncio.AbstractEventLoop
+    future: asyncio.Future
+    chunks: Optional[asyncio.Queue] = None
+
+
+class LLMInferenceWorker:
+    """
+    Single-thread inference worker with an async front end.
+
+    Args:
+        backend: Model backend (called only from the worker thread)
+        max_batch_size: Most requests dispatched together for one tier
+        batch_window: Seconds to wait for more same-tier requests before
+            dispatching a partial batch (0 = only batch what is already queued)
+        max_queue_size: Outstanding requests allowed before submit() rejects
+        default_timeout: Seconds a request may wait + run (None = no limit)
+    """
+
+    def __init__(
+        self,
+        backend: InferenceBackend,
+        max_batch_size: int = 4,
+        batch_window: float = 0.01,
+        max_queue_size: int = 256,
+        default_timeout: Optional[float] = None,
+        name: str = "llm-inference"
+    ):
+        self.backend = backend
+        self.max_batch_size = max(1, max_batch_size)
+        self.batch_window = batch_window
+        self.max_queue_size = max_queue_size
+        self.default_timeout = default_timeout
+        self.name = name
+
+        self._inbox: "queue.Queue[Any]" = queue.Queue()
+        self._backlog: List[Any] = []  # heap of (priority, seq, job), worker thread only
+        self._seq = itertools.count()
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._stopping = False
+        self._outstanding = 0
+        self._stats = {
+            "submitted": 0,
+            "completed": 0,
+            "failed": 0,
+            "skipped": 0,
+            "rejected": 0,
+            "batches": 0,
+            "batched_requests": 0,
+            "largest_batch": 0,
+        }
+
+    # =====================================================================
+    # ASYNC API
+    # =====================================================================
+
+    async def submit(
+        self,
+        request: InferenceRequest,
+        priority: InferencePriority = InferencePriority.NORMAL,
+        timeout: Optional[float] = None
+    ) -> str:
+        """
+        Queue a generation and wait for its response.
+
+        Args:
+            request: Generation arguments
+            priority: Queue priority
+            timeout: Seconds to wait in total (default: default_timeout)
+
+        Returns:
+            Generated text
+
+        Raises:
+            ValueError: If no local model tier can serve the request
+            RuntimeError: If the queue is full or the worker is stopped
+            asyncio.TimeoutError: If the response does not arrive in time
+        """
+        job = self._enqueue(request, priority, stream=False)
+        timeout = timeout if timeout is not None else self.default_timeout
+        # wait_for cancels the future on timeout, so the worker skips the job
+        # if it has not started yet
+        return await asyncio.wait_for(job.future, timeout)
+
+    async def stream(
+        self,
+        request: InferenceRequest,
+        priority: InferencePriority = InferencePriority.NORMAL,
+        timeout: Optional[float] = None
+    ) -> AsyncIterator[str]:
+        """
+        Queue a generation and yield its chunks as they are produced.
+
+        Streaming requests are never batched. Closing the iterator early
+        stops generation after the current chunk.
+
+        Raises:
+            Same as submit(); the timeout covers the whole stream.
+        """
+        job = self._enqueue(request, priority, stream=True)
+        timeout = timeout if timeout is not None else self.default_timeout
+        deadline = time.monotonic() + timeout if timeout is not None else None
+
+        try:
+            while True:
+                remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+                chunk = await asyncio.wait_for(job.chunks.get(), remaining)
+                if chunk is _STREAM_END:
+                    return
+                if isinstance(chunk, BaseException):
+                    raise chunk
+                yield chunk
+        finally:
+            if not job.future.done():
+                job.future.cancel()
+
+    def stats(self) -> Dict[str, Any]:
+        """Queue and batching counters."""
+        with self._lock:
+            stats = dict(self._stats)
+            stats["outstanding"] = self._outstanding
+        stats["average_batch_size"] = (
+            stats["batched_requests"] / stats["batches"] if stats["batches"] else 0.0
+        )
+        stats["running"] = self._thread is not None and self._thread.is_alive()
+        return stats
+
+    def stop(self, timeout: Optional[float] = 5.0) -> None:
+        """Stop the worker thread after the request it is running."""
+        thread = self._thread
+        if thread is None:
+            return
+        self._inbox.put(_STOP)
+        thread.join(timeout)
+        self._thread = None
+
+    # =====================================================================
+    # QUEUEING (event loop side)
+    # =====================================================================
+
+    def _enqueue(self, request: InferenceRequest, priority: InferencePriority, stream: bool) -> _Job:
+        tier = self.backend.select_tier(request)
+        loop = asyncio.get_running_loop()
+        job = _Job(
+            request=request,
+            tier=tier,
+            loop=loop,
+            future=loop.create_future(),
+            chunks=asyncio.Queue() if stream else None
+        )
+
+        with self._lock:
+            if self._outstanding >= self.max_queue_size:
+                self._stats["rejected"] += 1
+                raise RuntimeError(
+                    f"Local LLM queue is full ({self.max_queue_size} requests outstanding)"
+                )
+            self._outstanding += 1
+            self._stats["submitted"] += 1
+
+        self._ensure_started()
+        self._inbox.put((int(priority), next(self._seq), job))
+        return job
+
+    def _ensure_started(self) -> None:
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._stopping = False
+                self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+                self._thread.start()
+
+    # =====================================================================
+    # WORKER THREAD
+    # =====================================================================
+
+    def _run(self) -> None:
+        while not self._stopping or self._backlog:
+            if not self._backlog:
+                item = self._inbox.get()
+                if item is _STOP:
+                    break
+                heapq.heappush(self._backlog, item)
+            self._drain_inbox()
+
+            _, _, job = heapq.heappop(self._backlog)
+            if not self._claim(job):
+                continue
+
+            if job.chunks is not None:
+                self._run_stream(job)
+            else:
+                self._run_batch(self._collect_batch(job))
+
+        # Fail whatever is left so no caller waits forever
+        for _, _, job in self._backlog:
+            self._finish(job, error=RuntimeError("Local LLM worker stopped"))
+        self._backlog = []
+
+    def _drain_inbox(self) -> None:
+        while True:
+            try:
+                item = self._inbox.get_nowait()
+            except queue.Empty:
+                return
+            if item is _STOP:
+                self._stopping = True
+            else:
+                heapq.heappush(self._backlog, item)
+
+    def _claim(self, job: _Job) -> bool:
+        """Whether a job should still run (its caller may have timed out)."""
+        if job.future.done():
+            self._finish(job, skipped=True)
+            return False
+        return True
+
+    def _collect_batch(self, first: _Job) -> List[_Job]:
+        """Gather queued requests for first's tier, waiting up to batch_window."""
+        batch = [first]
+        deadline = time.monotonic() + self.batch_window
+
+        while len(batch) < self.max_batch_size:
+            self._take_same_tier(first.tier, batch)
+            remaining = deadline - time.monotonic()
+            if len(batch) >= self.max_batch_size or remaining <= 0:
+                break
+            try:
+                item = self._inbox.get(timeout=remaining)
+            except queue.Empty:
+                break
+            if item is _STOP:
+                self._stopping = True
+                break
+            heapq.heappush(self._backlog, item)
+
+        return batch
+
+    def _take_same_tier(self, tier: Hashable, batch: List[_Job]) -> None:
+        keep = []
+        for item in sorted(self._backlog):
+            job = item[2]
+            if len(batch) < self.max_batch_size and job.chunks is None and job.tier == tier:
+                if self._claim(job):
+                    batch.append(job)
+            else:
+                keep.append(item)
+        self._backlog = keep  # sorted list is a valid heap
+
+    def _run_batch(self, batch: List[_Job]) -> None:
+        with self._lock:
+            self._stats["batches"] += 1
+            self._stats["batched_requests"] += len(batch)
+            self._stats["largest_batch"] = max(self._stats["largest_batch"], len(batch))
+
+        try:
+            results = self.backend.generate_batch(batch[0].tier, [job.request for job in batch])
+        except Exception as e:
+            logger.error(f"❌ Local LLM batch ({len(batch)} requests) failed: {e}")
+            results = [e] * len(batch)
+
+        for job, result in zip(batch, results):
+            if isinstance(result, Exception):
+                self._finish(job, error=result)
+            else:
+                self._finish(job, result=result)
+
+    def _run_stream(self, job: _Job) -> None:
+        try:
+            for chunk in self.backend.stream(job.tier, job.request):
+                # Stop when the consumer went away or its loop closed
+                if job.future.done() or not _post(job, job.chunks.put_nowait, chunk):
+                    break
+            else:
+                _post(job, job.chunks.put_nowait, _STREAM_END)
+        except Exception as e:
+            _post(job, job.chunks.put_nowait, e)
+            self._finish(job, error=e)
+            return
+        self._finish(job)
+
+    def _finish(
+        self,
+        job: _Job,
+        result: Optional[str] = None,
+        error: Optional[BaseException] = None,
+        skipped: bool = False
+    ) -> None:
+        with self._lock:
+            self._outstanding -= 1
+            if skipped:
+                self._stats["skipped"] += 1
+            elif error is not None:
+                self._stats["failed"] += 1
+            else:
+                self._stats["completed"] += 1
+
+        if skipped:
+            return
+        if job.chunks is not None:
+            # Stream errors travel through the chunk queue; the future only
+            # marks the job finished
+            result, error = None, None
+        _post(job, _resolve, job.future, result, error)
+
+
+def _post(job: _Job, callback: Callable[..., Any], *args: Any) -> bool:
+    """Schedule callback on the caller's loop; False if that loop has closed."""
+    try:
+        job.loop.call_soon_threadsafe(callback, *args)
+        return True
+    except RuntimeError:
+        # Caller's event loop already closed; must not kill the worker thread
+        return False
+
+
+def _resolve(future: asyncio.Future, result: Optional[str], error: Optional[BaseException]) -> None:
+    if future.done():
+        return
+    if error is not None:
+        future.set_exception(error)
+    else:
+        future.set_result(result)
+
+
+__all__ = [
+    "InferenceBackend",
+    "InferencePriority",
+    "InferenceRequest",
+    "LLMInferenceWorker",
+    "StubInferenceBackend",
+]
@@ -19,7 +19,7 @@ logger = logging.getLogger(__name__)
 # Import multi-model service
 try:
     from app.services.multi_model_service import multi_model_service, MLX_AVAILABLE
-    LOCAL_LLM_ENABLED = MLX_AVAILABLE and multi_model_service.is_available()
+    LOCAL_LLM_ENABLED = MLX_AVAILABLE and multi_model_service is not None
 except ImportError:
     multi_model_service = None
     LOCAL_LLM_ENABLED = False
@@ -129,7 +129,7 @@ class LocalLLMGeneratorMixin:
             try:
                 logger.info(f"🤖 Using local LLM (complexity {complexity}) for progression generation")
 
-                response = multi_model_service.generate(
+                response = await multi_model_service.agenerate(
                     prompt=prompt,
                     complexity=complexity,
                     max_tokens=1024,
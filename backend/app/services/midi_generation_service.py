@@ -6,20 +6,24 @@ Supports various exercise types with intelligent voicing and arrangement.
 
 import json
 import logging
-import random
 from pathlib import Path
 from typing import Dict, List, Optional
 from datetime import datetime
 
+import numpy as np
 import pretty_midi
 import musicpy as mp
-from music21 import note, chord as m21_chord, scale, stream, tempo
 
 from app.database.curriculum_models import CurriculumExercise
 from app.core.config import settings
+from app.core.lazy import lazy_import
+from app.services.humanizer import jitter_performance
 
 logger = logging.getLogger(__name__)
 
+# Imported on first scale generation, not at startup
+music21 = lazy_import("music21")
+
 
 class MIDIGenerationService:
     """Service for generating MIDI files from curriculum exercises
@@ -40,22 +44,7 @@ class MIDIGenerationService:
         self.velocity_variance = 8      # ±8 from base velocity
         self.timing_variance_ms = 15    # ±15ms timing offset
         self.duration_variance = 0.05   # ±5% duration variation
-    
-    def _humanize_velocity(self, base_velocity: int = None) -> int:
-        """Add human-like velocity variation"""
-        base = base_velocity or self.default_velocity
-        humanized = base + random.randint(-self.velocity_variance, self.velocity_variance)
-        return max(1, min(127, humanized))  # Clamp to valid MIDI range
-    
-    def _humanize_timing(self, base_time: float) -> float:
-        """Add subtle timing variation (in seconds)"""
-        offset = random.uniform(-self.timing_variance_ms, self.timing_variance_ms) / 1000.0
-        return max(0.0, base_time + offset)
-    
-    def _humanize_duration(self, base_duration: float) -> float:
-        """Add duration variation"""
-        variance = random.uniform(-self.duration_variance, self.duration_variance)
-        return base_duration * (1.0 + variance)
+        self.rng = np.random.default_rng()
 
         # Note mappings
         self.note_to_midi = {
@@ -64,6 +53,39 @@ class MIDIGenerationService:
             'Ab': 68, 'A': 69, 'A#': 70, 'Bb': 70, 'B': 71
         }
 
+    def _humanized_notes(
+        self,
+        pitches: List[int],
+        starts: List[float],
+        durations: List[float],
+        chord_index: Optional[List[int]] = None
+    ) -> List[pretty_midi.Note]:
+        """Build pretty_midi notes with shared vectorized humanization
+
+        Args:
+            pitches: MIDI note numbers
+            starts: Onsets in seconds
+            durations: Lengths in seconds
+            chord_index: Position within each chord, for a rolled stagger
+
+        Returns:
+            Humanized notes in input order
+        """
+        onsets, offsets, velocities = jitter_performance(
+            np.asarray(starts, dtype=np.float64),
+            np.asarray(durations, dtype=np.float64),
+            np.full(len(pitches), self.default_velocity),
+            self.rng,
+            timing_variance=self.timing_variance_ms / 1000.0,
+            duration_variance=self.duration_variance,
+            velocity_variance=self.velocity_variance,
+            chord_index=None if chord_index is None else np.asarray(chord_index),
+        )
+        return [
+            pretty_midi.Note(velocity=v, pitch=p, start=start, end=end)
+            for p, start, end, v in zip(pitches, onsets.tolist(), offsets.tolist(), velocities.tolist())
+        ]
+
     async def generate_exercise_midi(
         self,
         exercise: CurriculumExercise
@@ -77,7 +99,7 @@ class MIDIGenerationService:
             Path to generated MIDI file
         """
         try:
-            content = json.loads(exercise.content_json)
+            content = json.loads(exercise.effective_content_json)
             exercise_type = exercise.exercise_type
 
             # Route to appropriate generator based on exercise type
@@ -149,6 +171,7 @@ class MIDIGenerationService:
         current_time = 0.0
         beat_duration = 60.0 / bpm
         chord_duration = beat_duration * beats_per_chord
+        pitches, starts, chord_index = [], [], []
 
         for chord_symbol in chords:
             try:
@@ -158,23 +181,9 @@ class MIDIGenerationService:
                 # Get MIDI note numbers for the chord
                 midi_notes = [n.degree for n in musicpy_chord.notes]
 
-                # Add notes to MIDI with humanization for dynamic output
-                for i, midi_note in enumerate(midi_notes):
-                    # Humanize each note slightly differently
-                    humanized_start = self._humanize_timing(current_time)
-                    humanized_duration = self._humanize_duration(chord_duration)
-                    humanized_velocity = self._humanize_velocity()
-                    
-                    # Slight stagger for chord notes (more realistic)
-                    stagger = i * random.uniform(0.005, 0.015)
-                    
-                    note = pretty_midi.Note(
-                        velocity=humanized_velocity,
-                        pitch=midi_note,
-                        start=humanized_start + stagger,
-                        end=humanized_start + humanized_duration
-                    )
-                    piano.notes.append(note)
+                pitches.extend(midi_notes)
+                starts.extend([current_time] * len(midi_notes))
+                chord_index.extend(range(len(midi_notes)))
 
                 current_time += chord_duration
 
@@ -182,6 +191,10 @@ class MIDIGenerationService:
                 logger.warning(f"Failed to parse chord {chord_symbol}: {e}")
                 continue
 
+        # Humanize all notes at once, with a slight roll across each chord
+        piano.notes.extend(self._humanized_notes(
+            pitches, starts, [chord_duration] * len(pitches), chord_index
+        ))
         midi.instruments.append(piano)
 
         # Save MIDI file
@@ -216,16 +229,16 @@ class MIDIGenerationService:
         # Use music21 to generate scale
         try:
             if scale_name.lower() == "major":
-                m21_scale = scale.MajorScale(key)
+                m21_scale = music21.scale.MajorScale(key)
             elif scale_name.lower() == "minor":
-                m21_scale = scale.MinorScale(key)
+                m21_scale = music21.scale.MinorScale(key)
             elif scale_name.lower() == "dorian":
-                m21_scale = scale.DorianScale(key)
+                m21_scale = music21.scale.DorianScale(key)
             elif scale_name.lower() == "mixolydian":
-                m21_scale = scale.MixolydianScale(key)
+                m21_scale = music21.scale.MixolydianScale(key)
             else:
                 # Default to major
-                m21_scale = scale.MajorScale(key)
+                m21_scale = music21.scale.MajorScale(key)
 
             # Get scale pitches
             pitches = []
@@ -242,17 +255,10 @@ class MIDIGenerationService:
             # Generate notes
             beat_duration = 60.0 / bpm
             note_duration = beat_duration / 2  # Eighth notes
-            current_time = 0.0
-
-            for pitch in pitches:
-                note = pretty_midi.Note(
-                    velocity=self._humanize_velocity(),
-                    pitch=pitch,
-                    start=self._humanize_timing(current_time),
-                    end=self._humanize_timing(current_time) + self._humanize_duration(note_duration)
-                )
-                piano.notes.append(note)
-                current_time += note_duration
+            starts = [i * note_duration for i in range(len(pitches))]
+            piano.notes.extend(self._humanized_notes(
+                pitches, starts, [note_duration] * len(pitches)
+            ))
 
         except Exception as e:
             logger.error(f"Failed to generate scale: {e}")
@@ -314,16 +320,13 @@ class MIDIGenerationService:
         beat_duration = 60.0 / bpm
         chord_duration = beat_duration * 4
 
-        for i, midi_note in enumerate(midi_notes):
-            # Add human-like stagger to chord notes
-            stagger = i * random.uniform(0.005, 0.015)
-            note = pretty_midi.Note(
-                velocity=self._humanize_velocity(),
-                pitch=midi_note,
-                start=stagger,
-                end=self._humanize_duration(chord_duration)
-            )
-            piano.notes.append(note)
+        # Add human-like stagger to chord notes
+        piano.notes.extend(self._humanized_notes(
+            midi_notes,
+            [0.0] * len(midi_notes),
+            [chord_duration] * len(midi_notes),
+            list(range(len(midi_notes)))
+        ))
 
         midi.instruments.append(piano)
 
@@ -356,22 +359,19 @@ class MIDIGenerationService:
         piano = pretty_midi.Instrument(program=self.piano_program)
 
         current_time = 0.0
+        pitches, starts, durations = [], [], []
 
         for note_info in pattern:
             note_name = note_info.get("note", "C")
             duration = note_info.get("duration", 0.5)
 
-            midi_note = self._note_name_to_midi(note_name)
-
-            note = pretty_midi.Note(
-                velocity=self._humanize_velocity(),
-                pitch=midi_note,
-                start=self._humanize_timing(current_time),
-                end=self._humanize_timing(current_time) + self._humanize_duration(duration)
-            )
-            piano.notes.append(note)
+            pitches.append(self._note_name_to_midi(note_name))
+            starts.append(current_time)
+            durations.append(duration)
             current_time += duration
 
+        piano.notes.extend(self._humanized_notes(pitches, starts, durations))
+
         midi.instruments.append(piano)
 
         # Save MIDI file
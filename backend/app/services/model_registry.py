@@ -0,0 +1,370 @@
+"""
+Process-wide registry for large in-memory models.
+
+Local LLM tiers, the MLX gospel generator, Stable Audio, MusicGen and the
+torchcrepe pitch model all load through one registry so their combined
+footprint stays under a memory budget:
+
+- Size accounting: each model declares its approximate resident size
+- Budget: loading a model first evicts least-recently-used idle models;
+  its size is reserved while the weights load, so concurrent loads
+  cannot overshoot the budget together
+- Reference counting: models in use by a generation are never evicted
+- Idle timeout: models unused for a while are unloaded in the background
+- Preloading: settings.model_preload names models to load at startup
+
+Services register a loader once and then wrap each use:
+
+    model_registry.register("stable-audio", loader, size_gb=5.0)
+    with model_registry.use("stable-audio") as pipeline:
+        pipeline(prompt=...)
+"""
+
+import gc
+import logging
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class ModelBudgetError(RuntimeError):
+    """A model cannot fit in the memory budget (everything else is in use)."""
+
+
+@dataclass
+class ModelSpec:
+    """How to load and unload a registered model."""
+    key: str
+    loader: Callable[[], Any]
+    size_gb: float
+    unloader: Optional[Callable[[Any], None]] = None
+
+
+@dataclass
+class _Resident:
+    model: Any
+    size_gb: float
+    loaded_at: float
+    last_used: float
+    refs: int = 0
+
+
+class ModelRegistry:
+    """
+    Memory-budgeted LRU of loaded models, shared by every service.
+
+    Args:
+        budget_gb: Total declared size allowed to be resident
+            (default: settings.model_memory_budget_gb)
+        idle_timeout: Seconds after last use before an idle model is
+            unloaded (default: settings.model_idle_timeout_seconds;
+            0 = only evict under budget pressure)
+    """
+
+    def __init__(self, budget_gb: Optional[float] = None, idle_timeout: Optional[float] = None):
+        self.budget_gb = budget_gb if budget_gb is not None else settings.model_memory_budget_gb
+        self.idle_timeout = idle_timeout if idle_timeout is not None else settings.model_idle_timeout_seconds
+        self._specs: Dict[str, ModelSpec] = {}
+        self._resident: Dict[str, _Resident] = {}
+        self._reserved: Dict[str, float] = {}  # key -> size_gb of loads in progress
+        self._lock = threading.RLock()
+        self._load_locks: Dict[str, threading.Lock] = {}
+        self._reaper: Optional[threading.Thread] = None
+        self._stats = {"loads": 0, "hits": 0, "evictions": 0, "idle_evictions": 0}
+
+    # =====================================================================
+    # REGISTRATION
+    # =====================================================================
+
+    def register(
+        self,
+        key: str,
+        loader: Callable[[], Any],
+        size_gb: float,
+        unloader: Optional[Callable[[Any], None]] = None
+    ) -> None:
+        """
+        Declare a loadable model (does not load it).
+
+        Args:
+            key: Registry key (e.g. "llm:<hf repo>"); services loading the
+                same weights should use the same key to share one copy
+            loader: Loads and returns the model (may be slow)
+            size_gb: Approximate resident size, counted against the budget
+            unloader: Releases library-held state (e.g. a module-level cache)
+        """
+        with self._lock:
+            self._specs[key] = ModelSpec(key, loader, size_gb, unloader)
+
+    def is_registered(self, key: str) -> bool:
+        return key in self._specs
+
+    # =====================================================================
+    # ACCESS
+    # =====================================================================
+
+    def load(self, key: str) -> Any:
+        """
+        Return a registered model, loading it if needed (not pinned).
+
+        Raises:
+            KeyError: If key was never registered
+            ModelBudgetError: If it cannot fit beside the models in use
+        """
+        with self._lock:
+            resident = self._touch(key)
+            if resident is not None:
+                return resident.model
+            spec = self._specs[key]
+            load_lock = self._load_locks.setdefault(key, threading.Lock())
+
+        # Per-model lock: concurrent callers wait for one load
+        with load_lock:
+            with self._lock:
+                resident = self._touch(key)
+                if resident is not None:
+                    return resident.model
+                evicted = self._make_room(spec.size_gb, exclude=key)
+                self._reserved[key] = spec.size_gb
+
+            if evicted:
+                _release_memory()
+
+            logger.info(f"📥 Loading model {key} (~{spec.size_gb:.1f}GB)")
+            try:
+                model = spec.loader()
+            except BaseException:
+                with self._lock:
+                    self._reserved.pop(key, None)
+                raise
+
+            now = time.monotonic()
+            with self._lock:
+                self._reserved.pop(key, None)
+                self._resident[key] = _Resident(model, spec.size_gb, now, now)
+                self._stats["loads"] += 1
+            logger.info(f"✅ Model {key} resident ({self.used_gb:.1f}/{self.budget_gb:.1f}GB)")
+
+        self._start_reaper()
+        return model
+
+    @contextmanager
+    def use(self, key: str) -> Iterator[Any]:
+        """Load a model and pin it (not evictable) for the with-block."""
+        while True:
+            model = self.load(key)
+            with self._lock:
+                resident = self._resident.get(key)
+                # Retry if another thread evicted it between load and pin
+                if resident is not None and resident.model is model:
+                    resident.refs += 1
+                    break
+
+        try:
+            yield model
+        finally:
+            with self._lock:
+                resident.refs -= 1
+                resident.last_used = time.monotonic()
+
+    def get(self, key: str) -> Optional[Any]:
+        """Resident model or None (never loads)."""
+        with self._lock:
+            resident = self._resident.get(key)
+            return resident.model if resident else None
+
+    def is_loaded(self, key: str) -> bool:
+        with self._lock:
+            return key in self._resident
+
+    def loaded_keys(self) -> List[str]:
+        """Resident models, least recently used first."""
+        with self._lock:
+            return sorted(self._resident, key=lambda k: self._resident[k].last_used)
+
+    @property
+    def used_gb(self) -> float:
+        with self._lock:
+            return sum(r.size_gb for r in self._resident.values())
+
+    # =====================================================================
+    # EVICTION
+    # =====================================================================
+
+    def unload(self, key: str) -> bool:
+        """Unload a model unless it is in use. Returns whether it was unloaded."""
+        with self._lock:
+            resident = self._resident.get(key)
+            if resident is None or resident.refs > 0:
+                return False
+            self._evict(key)
+        _release_memory()
+        return True
+
+    def evict_idle(self, idle_for: Optional[float] = None) -> List[str]:
+        """Unload models unused for idle_for seconds (default: idle_timeout)."""
+        if idle_for is None:
+            if not self.idle_timeout:
+                return []
+            idle_for = self.idle_timeout
+
+        cutoff = time.monotonic() - idle_for
+        with self._lock:
+            stale = [
+                key for key, r in self._resident.items()
+                if r.refs == 0 and r.last_used <= cutoff
+            ]
+            for key in stale:
+                self._evict(key)
+                self._stats["idle_evictions"] += 1
+        if stale:
+            logger.info(f"🧹 Unloaded idle models: {', '.join(stale)}")
+            _release_memory()
+        return stale
+
+    def clear(self) -> None:
+        """Unload every model that is not in use."""
+        for key in self.loaded_keys():
+            self.unload(key)
+
+    def preload(self, keys: Iterable[str]) -> List[str]:
+        """
+        Load models ahead of first use (startup hints).
+
+        Unknown keys and models that fail to load or do not fit are logged
+        and skipped. Returns the keys that are resident afterwards.
+        """
+        loaded = []
+        for key in keys:
+            if key not in self._specs:
+                logger.warning(f"⚠️ Preload skipped, model not registered: {key}")
+                continue
+            try:
+                self.load(key)
+                loaded.append(key)
+            except Exception as e:
+                logger.warning(f"⚠️ Preload of {key} failed: {e}")
+        return loaded
+
+    def stats(self) -> Dict[str, Any]:
+        """Budget usage and per-model residency."""
+        now = time.monotonic()
+        with self._lock:
+            return {
+                "budget_gb": self.budget_gb,
+                "used_gb": round(sum(r.size_gb for r in self._resident.values()), 2),
+                "reserved_gb": round(sum(self._reserved.values()), 2),
+                "idle_timeout_seconds": self.idle_timeout,
+                "registered": sorted(self._specs),
+                "resident": {
+                    key: {
+                        "size_gb": r.size_gb,
+                        "in_use": r.refs,
+                        "idle_seconds": round(now - r.last_used, 1),
+                    }
+                    for key, r in self._resident.items()
+                },
+                **self._stats,
+            }
+
+    # =====================================================================
+    # INTERNALS (call with self._lock held)
+    # =====================================================================
+
+    def _touch(self, key: str) -> Optional[_Resident]:
+        resident = self._resident.get(key)
+        if resident is not None:
+            resident.last_used = time.monotonic()
+            self._stats["hits"] += 1
+        return resident
+
+    def _make_room(self, size_gb: float, exclude: str) -> bool:
+        """Evict idle models until size_gb fits; returns whether any were evicted."""
+        if size_gb > self.budget_gb:
+            raise ModelBudgetError(
+                f"Model {exclude} (~{size_gb:.1f}GB) exceeds the {self.budget_gb:.1f}GB model budget"
+            )
+
+        evicted = False
+        while self._committed_gb() + size_gb > self.budget_gb:
+            idle = [k for k, r in self._resident.items() if r.refs == 0 and k != exclude]
+            if not idle:
+                in_use = ", ".join([*self._resident, *(f"{k} (loading)" for k in self._reserved)]) or "none"
+                raise ModelBudgetError(
+                    f"Cannot load {exclude} (~{size_gb:.1f}GB): "
+                    f"{self.budget_gb:.1f}GB budget is held by models in use ({in_use})"
+                )
+            victim = min(idle, key=lambda k: self._resident[k].last_used)
+            logger.info(f"♻️ Evicting {victim} to make room for {exclude}")
+            self._evict(victim)
+            self._stats["evictions"] += 1
+            evicted = True
+
+        return evicted
+
+    def _committed_gb(self) -> float:
+        """Resident models plus loads in progress"""
+        return sum(r.size_gb for r in self._resident.values()) + sum(self._reserved.values())
+
+    def _evict(self, key: str) -> None:
+        resident = self._resident.pop(key)
+        spec = self._specs.get(key)
+        if spec is not None and spec.unloader is not None:
+            try:
+                spec.unloader(resident.model)
+            except Exception as e:
+                logger.warning(f"⚠️ Unloader for {key} failed: {e}")
+
+    def _start_reaper(self) -> None:
+        if not self.idle_timeout:
+            return
+        with self._lock:
+            if self._reaper is not None and self._reaper.is_alive():
+                return
+            self._reaper = threading.Thread(target=self._reap, name="model-reaper", daemon=True)
+            self._reaper.start()
+
+    def _reap(self) -> None:
+        interval = min(60.0, max(1.0, self.idle_timeout / 4))
+        while True:
+            time.sleep(interval)
+            self.evict_idle()
+            with self._lock:
+                if not self._resident:
+                    self._reaper = None
+                    return
+
+
+def _release_memory() -> None:
+    """Collect dropped models and return cached accelerator memory."""
+    gc.collect()
+
+    # Only touch frameworks that are already imported
+    torch = sys.modules.get("torch")
+    if torch is not None:
+        try:
+            if torch.cuda.is_available():
+                torch.cuda.empty_cache()
+            if hasattr(torch, "mps") and torch.backends.mps.is_available():
+                torch.mps.empty_cache()
+        except Exception:
+            pass
+
+    mx = sys.modules.get("mlx.core")
+    if mx is not None:
+        try:
+            clear_cache = getattr(mx, "clear_cache", None) or mx.metal.clear_cache
+            clear_cache()
+        except Exception:
+            pass
+
+
+# Shared by every model-loading service in the process
+model_registry = ModelRegistry()
@@ -20,11 +20,20 @@ SAFETY NOTE: 70B models require 64GB+ RAM. Using 7B default for safety.
 
 import logging
 from enum import Enum
-from typing import Dict, Any, Optional, Tuple
+from functools import partial
+from typing import AsyncIterator, Dict, Any, Hashable, Iterator, Optional, Tuple
 from pathlib import Path
 import json
 
 from app.core.config import settings
+from app.core.lazy import lazy_import, lazy_service, module_available
+from app.services.model_registry import model_registry
+from app.services.llm_worker import (
+    InferenceBackend,
+    InferencePriority,
+    InferenceRequest,
+    LLMInferenceWorker,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -36,17 +45,18 @@ except ImportError:
     MEMORY_CHECK_AVAILABLE = False
     logger.warning("⚠️ Memory check utility not available")
 
-# Try to import MLX
-try:
-    from mlx_lm import load, generate
-    from mlx_lm.sample_utils import make_sampler  # For temperature-controlled sampling
-    MLX_AVAILABLE = True
-    logger.info("✅ MLX framework loaded (M4 Neural Engine enabled)")
-except ImportError:
-    MLX_AVAILABLE = False
+# MLX is imported on first model load, not at startup
+MLX_AVAILABLE = module_available("mlx_lm")
+mlx_lm = lazy_import("mlx_lm")
+mlx_sample_utils = lazy_import("mlx_lm.sample_utils")  # make_sampler for temperature-controlled sampling
+if not MLX_AVAILABLE:
     logger.warning("⚠️ MLX not available, local LLM disabled")
 
 
+class UnsafeModelError(RuntimeError):
+    """Not enough free system memory to load a model tier."""
+
+
 class LocalModelTier(Enum):
     """Model tiers for task complexity routing"""
     SMALL = "small"      # Phi-3.5 Mini (3.8B) - complexity 1-4
@@ -63,15 +73,18 @@ class MultiModelLLMService:
     - Complex tasks (8-10) → Raise error (caller should use Gemini)
 
     Features:
-    - Lazy loading: Models loaded on first use
+    - Lazy loading: Models loaded on first use, through the shared model
+      registry (memory budget, LRU/idle eviction, pinned while generating)
     - Memory safety: Checks system RAM before loading large models
     - Automatic fallback: Falls back to smaller model if larger fails or RAM insufficient
     - Structured output: JSON generation with validation
+    - Non-blocking: agenerate()/agenerate_structured()/astream() run on a
+      dedicated inference worker thread (use these from async code)
     """
 
     def __init__(self):
-        self.models: Dict[LocalModelTier, Tuple[Any, Any]] = {}
         self.active_model: Optional[LocalModelTier] = None
+        self._worker: Optional[LLMInferenceWorker] = None
 
         # Model configurations
         self.model_configs = {
@@ -79,6 +92,7 @@ class MultiModelLLMService:
                 "name": "mlx-community/Phi-3.5-mini-instruct-4bit",
                 "max_tokens": 2048,
                 "chat_template": "chatml",  # <|user|>, <|assistant|>, <|end|>
+                "ram_required_gb": 3,
             },
             LocalModelTier.MEDIUM: {
                 "name": "mlx-community/Qwen2.5-7B-Instruct-4bit",
@@ -90,13 +104,46 @@ class MultiModelLLMService:
 
         self.loaded = MLX_AVAILABLE
 
-        # Pre-load Phi-3.5 Mini (already used in production)
+        if self.loaded:
+            for tier, config in self.model_configs.items():
+                model_registry.register(
+                    self._registry_key(tier),
+                    loader=partial(self._load_weights, tier),
+                    size_gb=config["ram_required_gb"],
+                )
+
+        # Tiers load on first use; list them in settings.model_preload to load at startup
         if self.loaded:
             logger.info("🚀 Initializing multi-model LLM service")
-            self._load_model(LocalModelTier.SMALL)
+
+    def _registry_key(self, tier: LocalModelTier) -> str:
+        """Model registry key (shared with other services loading the same weights)"""
+        return f"llm:{self.model_configs[tier]['name']}"
+
+    @property
+    def models(self) -> Dict[LocalModelTier, Tuple[Any, Any]]:
+        """Currently resident tiers (the registry may evict idle ones)"""
+        resident = {}
+        for tier in self.model_configs:
+            loaded = model_registry.get(self._registry_key(tier))
+            if loaded is not None:
+                resident[tier] = loaded
+        return resident
+
+    def _load_weights(self, tier: LocalModelTier) -> Tuple[Any, Any]:
+        """Registry loader: safety-checked MLX load of a tier's weights"""
+        name = self.model_configs[tier]["name"]
+        if MEMORY_CHECK_AVAILABLE:
+            is_safe, safety_msg = is_model_safe(name)
+            if not is_safe:
+                raise UnsafeModelError(f"Cannot load model: {safety_msg}")
+            logger.info(safety_msg)
+
+        # Load model using MLX (cached after first download)
+        return mlx_lm.load(name)
 
     def _load_model(self, tier: LocalModelTier) -> Tuple[Any, Any]:
-        """Load a model tier (with caching)
+        """Load a model tier (with caching in the model registry)
 
         Args:
             tier: Model tier to load
@@ -104,9 +151,10 @@ class MultiModelLLMService:
         Returns:
             Tuple of (model, tokenizer)
         """
-        if tier in self.models:
+        key = self._registry_key(tier)
+        if model_registry.is_loaded(key):
             logger.info(f"✅ Model {tier.value} already loaded")
-            return self.models[tier]
+            return model_registry.load(key)
 
         try:
             config = self.model_configs[tier]
@@ -117,22 +165,16 @@ class MultiModelLLMService:
             elif tier == LocalModelTier.MEDIUM:
                 logger.info("⏳ Loading Qwen2.5-7B (~6GB RAM, cached after first download)")
             
-            # Memory safety check before loading
-            if MEMORY_CHECK_AVAILABLE:
-                is_safe, safety_msg = is_model_safe(config["name"])
-                if not is_safe:
-                    logger.warning(f"⚠️ {safety_msg}")
-                    if tier == LocalModelTier.MEDIUM:
-                        logger.warning("🔄 Falling back to SMALL tier (Phi-3.5 Mini)")
-                        return self._load_model(LocalModelTier.SMALL)
-                    raise RuntimeError(f"Cannot load model: {safety_msg}")
-                else:
-                    logger.info(safety_msg)
-
-            # Load model using MLX (cached after first download)
-            model, tokenizer = load(config["name"])
-
-            self.models[tier] = (model, tokenizer)
+            # Evicts idle models if the memory budget requires it; the
+            # registry loader (_load_weights) runs the memory safety check
+            try:
+                model, tokenizer = model_registry.load(key)
+            except UnsafeModelError as e:
+                logger.warning(f"⚠️ {e}")
+                if tier == LocalModelTier.MEDIUM:
+                    logger.warning("🔄 Falling back to SMALL tier (Phi-3.5 Mini)")
+                    return self._load_model(LocalModelTier.SMALL)
+                raise
 
             logger.info(f"✅ {tier.value} model loaded successfully")
             logger.info(f"   Model: {config['name']}")
@@ -237,30 +279,9 @@ class MultiModelLLMService:
             RuntimeError: If no local model can handle this complexity
             ValueError: If task too complex for local models (8-10) and not forced
         """
-        if not self.loaded:
-            raise RuntimeError("MLX not available, use Gemini API instead")
-
-        # Select appropriate model tier
-        tier = self.select_model(complexity, force_local=force_local)
-
-        if tier is None:
-            raise ValueError(
-                f"Task complexity {complexity} too high for local models. "
-                "Use Gemini API for complexity 8-10 tasks."
-            )
-
-        # Load model if not already loaded
-        if tier not in self.models:
-            logger.info(f"🔄 Loading {tier.value} model for complexity {complexity} task")
-            self._load_model(tier)
-
-        # Switch active model if needed
-        if self.active_model != tier:
-            logger.info(f"🔄 Switching from {self.active_model} to {tier.value} model")
-            self.active_model = tier
+        tier = self._activate_tier(complexity, force_local)
 
         try:
-            model, tokenizer = self.models[tier]
             config = self.model_configs[tier]
 
             # Format prompt for this model's chat template
@@ -272,17 +293,19 @@ class MultiModelLLMService:
             logger.info(f"🤖 Generating with {tier.value} model (complexity {complexity}, temp={temperature})")
 
             # Create sampler with temperature for randomness
-            sampler = make_sampler(temp=temperature)
-
-            # Generate using MLX (runs on M4 Neural Engine)
-            response = generate(
-                model=model,
-                tokenizer=tokenizer,
-                prompt=formatted_prompt,
-                max_tokens=max_tokens,
-                sampler=sampler,  # Use sampler for temperature-controlled randomness
-                verbose=False,
-            )
+            sampler = mlx_sample_utils.make_sampler(temp=temperature)
+
+            # Pinned in the registry so it cannot be evicted mid-generation
+            with model_registry.use(self._registry_key(tier)) as (model, tokenizer):
+                # Generate using MLX (runs on M4 Neural Engine)
+                response = mlx_lm.generate(
+                    model=model,
+                    tokenizer=tokenizer,
+                    prompt=formatted_prompt,
+                    max_tokens=max_tokens,
+                    sampler=sampler,  # Use sampler for temperature-controlled randomness
+                    verbose=False,
+                )
 
             return response.strip()
 
@@ -302,6 +325,76 @@ class MultiModelLLMService:
 
             raise e
 
+    def _activate_tier(self, complexity: int, force_local: bool = False) -> LocalModelTier:
+        """Select, load and activate the model tier for a task
+
+        Raises:
+            RuntimeError: If MLX is not available
+            ValueError: If task too complex for local models (8-10) and not forced
+        """
+        if not self.loaded:
+            raise RuntimeError("MLX not available, use Gemini API instead")
+
+        # Select appropriate model tier
+        tier = self.select_model(complexity, force_local=force_local)
+
+        if tier is None:
+            raise ValueError(
+                f"Task complexity {complexity} too high for local models. "
+                "Use Gemini API for complexity 8-10 tasks."
+            )
+
+        # Load model if not already loaded
+        if not model_registry.is_loaded(self._registry_key(tier)):
+            logger.info(f"🔄 Loading {tier.value} model for complexity {complexity} task")
+            self._load_model(tier)
+            if not model_registry.is_loaded(self._registry_key(tier)):
+                # _load_model fell back to the small tier (not enough memory)
+                tier = LocalModelTier.SMALL
+
+        # Switch active model if needed
+        if self.active_model != tier:
+            logger.info(f"🔄 Switching from {self.active_model} to {tier.value} model")
+            self.active_model = tier
+
+        return tier
+
+    def stream_generate(
+        self,
+        prompt: str,
+        complexity: int,
+        max_tokens: int = 1024,
+        temperature: float = 0.7,
+        system_prompt: Optional[str] = None,
+        force_local: bool = False,
+    ) -> Iterator[str]:
+        """Generate text chunk by chunk (blocking; use astream() from async code)
+
+        Falls back to a single chunk from generate() if this mlx_lm version
+        has no stream_generate.
+
+        Yields:
+            Generated text fragments
+        """
+        stream_generate = getattr(mlx_lm, "stream_generate", None)
+        if stream_generate is None:
+            yield self.generate(prompt, complexity, max_tokens, temperature, system_prompt, force_local)
+            return
+
+        tier = self._activate_tier(complexity, force_local)
+        config = self.model_configs[tier]
+
+        with model_registry.use(self._registry_key(tier)) as (model, tokenizer):
+            for chunk in stream_generate(
+                model,
+                tokenizer,
+                prompt=self._format_prompt(prompt, tier, system_prompt),
+                max_tokens=min(max_tokens, config["max_tokens"]),
+                sampler=mlx_sample_utils.make_sampler(temp=temperature),
+            ):
+                # Newer mlx_lm yields GenerationResponse objects, older yields str
+                yield getattr(chunk, "text", chunk)
+
     def generate_structured(
         self,
         prompt: str,
@@ -327,22 +420,30 @@ class MultiModelLLMService:
         Raises:
             ValueError: If JSON parsing fails
         """
-        # Add JSON formatting instructions
-        json_prompt = f"""{prompt}
-
-Respond with ONLY valid JSON matching this structure:
-{json.dumps(schema, indent=2)}
-
-JSON Response:"""
-
         response = self.generate(
-            prompt=json_prompt,
+            prompt=self._structured_prompt(prompt, schema),
             complexity=complexity,
             max_tokens=max_tokens,
             temperature=temperature,
             force_local=force_local,
         )
+        return self._parse_structured(response)
+
+    def _structured_prompt(self, prompt: str, schema: Dict[str, Any]) -> str:
+        """Add JSON formatting instructions to a prompt"""
+        return f"""{prompt}
+
+Respond with ONLY valid JSON matching this structure:
+{json.dumps(schema, indent=2)}
 
+JSON Response:"""
+
+    def _parse_structured(self, response: str) -> Dict[str, Any]:
+        """Parse a structured-output response
+
+        Raises:
+            ValueError: If JSON parsing fails
+        """
         # Extract JSON from response
         json_text = self._extract_json(response)
 
@@ -355,6 +456,91 @@ JSON Response:"""
             logger.error(f"Extracted JSON text: {json_text}")
             raise ValueError(f"Invalid JSON from local LLM: {e}")
 
+    # =====================================================================
+    # NON-BLOCKING API - runs inference on the worker thread
+    # =====================================================================
+
+    @property
+    def worker(self) -> LLMInferenceWorker:
+        """Inference worker (thread starts on first request)"""
+        if self._worker is None:
+            self._worker = LLMInferenceWorker(
+                MultiModelBackend(self),
+                max_batch_size=settings.local_llm_max_batch_size,
+                batch_window=settings.local_llm_batch_window_ms / 1000,
+                max_queue_size=settings.local_llm_max_queue_size,
+                default_timeout=settings.local_llm_request_timeout,
+            )
+        return self._worker
+
+    async def agenerate(
+        self,
+        prompt: str,
+        complexity: int,
+        max_tokens: int = 1024,
+        temperature: float = 0.7,
+        system_prompt: Optional[str] = None,
+        force_local: bool = False,
+        priority: InferencePriority = InferencePriority.NORMAL,
+        timeout: Optional[float] = None,
+    ) -> str:
+        """Async generate(): queued on the inference worker
+
+        Args:
+            priority: Queue priority (INTERACTIVE for user-facing requests)
+            timeout: Seconds to wait (default: settings.local_llm_request_timeout)
+            (other arguments as generate())
+
+        Raises:
+            asyncio.TimeoutError: If the response does not arrive in time
+            (and everything generate() raises)
+        """
+        request = InferenceRequest(prompt, complexity, max_tokens, temperature, system_prompt, force_local)
+        return await self.worker.submit(request, priority=priority, timeout=timeout)
+
+    async def agenerate_structured(
+        self,
+        prompt: str,
+        schema: Dict[str, Any],
+        complexity: int,
+        max_tokens: int = 1024,
+        temperature: float = 0.3,
+        force_local: bool = False,
+        priority: InferencePriority = InferencePriority.NORMAL,
+        timeout: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """Async generate_structured(): queued on the inference worker
+
+        Raises:
+            ValueError: If JSON parsing fails
+        """
+        response = await self.agenerate(
+            prompt=self._structured_prompt(prompt, schema),
+            complexity=complexity,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            force_local=force_local,
+            priority=priority,
+            timeout=timeout,
+        )
+        return self._parse_structured(response)
+
+    async def astream(
+        self,
+        prompt: str,
+        complexity: int,
+        max_tokens: int = 1024,
+        temperature: float = 0.7,
+        system_prompt: Optional[str] = None,
+        force_local: bool = False,
+        priority: InferencePriority = InferencePriority.INTERACTIVE,
+        timeout: Optional[float] = None,
+    ) -> AsyncIterator[str]:
+        """Async stream_generate(): yields text fragments as they are generated"""
+        request = InferenceRequest(prompt, complexity, max_tokens, temperature, system_prompt, force_local)
+        async for chunk in self.worker.stream(request, priority=priority, timeout=timeout):
+            yield chunk
+
     def _extract_json(self, response: str) -> str:
         """Extract JSON from model response (handles markdown, extra tokens, etc.)
 
@@ -427,8 +613,52 @@ JSON Response:"""
                 }
                 for tier, config in self.model_configs.items()
             },
+            "model_registry": model_registry.stats(),
         }
 
 
+class MultiModelBackend(InferenceBackend):
+    """Inference worker backend backed by MultiModelLLMService
+
+    Requests are grouped by LocalModelTier; each batch runs back to back on
+    the loaded model, so interleaved small/medium requests do not force
+    model switches between every generation.
+    """
+
+    def __init__(self, service: MultiModelLLMService):
+        self.service = service
+
+    def select_tier(self, request: InferenceRequest) -> Hashable:
+        if not self.service.loaded:
+            raise RuntimeError("MLX not available, use Gemini API instead")
+        tier = self.service.select_model(request.complexity, force_local=request.force_local)
+        if tier is None:
+            raise ValueError(
+                f"Task complexity {request.complexity} too high for local models. "
+                "Use Gemini API for complexity 8-10 tasks."
+            )
+        return tier
+
+    def generate(self, tier: Hashable, request: InferenceRequest) -> str:
+        return self.service.generate(
+            prompt=request.prompt,
+            complexity=request.complexity,
+            max_tokens=request.max_tokens,
+            temperature=request.temperature,
+            system_prompt=request.system_prompt,
+            force_local=request.force_local,
+        )
+
+    def stream(self, tier: Hashable, request: InferenceRequest) -> Iterator[str]:
+        return self.service.stream_generate(
+            prompt=request.prompt,
+            complexity=request.complexity,
+            max_tokens=request.max_tokens,
+            temperature=request.temperature,
+            system_prompt=request.system_prompt,
+            force_local=request.force_local,
+        )
+
+
 # Global instance
-multi_model_service = MultiModelLLMService() if MLX_AVAILABLE else None
+multi_model_service = lazy_service("multi_model_llm", MultiModelLLMService) if MLX_AVAILABLE else None
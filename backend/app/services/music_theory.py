@@ -1,15 +1,23 @@
 """Music Theory Service using music21"""
 
-import music21
+import asyncio
 from pathlib import Path
 from typing import Optional, Dict, Any
 
 class MusicTheoryService:
     """Service for advanced music theory analysis"""
 
+    async def analyze_score_async(self, midi_file_path: Path) -> Dict[str, Any]:
+        """Run analyze_score in a worker thread (music21 parsing is slow and blocking)"""
+        return await asyncio.to_thread(self.analyze_score, midi_file_path)
+
     def analyze_score(self, midi_file_path: Path) -> Dict[str, Any]:
         """
         Analyze a MIDI file to extract key, time signature, and other metadata.
+
+        Deep analysis: parses the whole file with music21. The transcription
+        pipeline uses app.pipeline.tonal_analysis by default and only calls this
+        when deep_theory_analysis is requested.
         
         Args:
             midi_file_path: Path to the MIDI file
@@ -18,6 +26,8 @@ class MusicTheoryService:
             Dictionary containing analysis results
         """
         try:
+            import music21
+
             # Parse MIDI file
             score = music21.converter.parse(str(midi_file_path))
             
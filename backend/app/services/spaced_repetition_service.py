@@ -8,10 +8,11 @@ Algorithm: https://www.supermemo.com/en/archives1990-2015/english/ol/sm2
 
 from datetime import datetime, timedelta
 from typing import List, Optional, Dict, Any, Tuple
-from sqlalchemy import select, update, func, and_
+from sqlalchemy import select, update, func, and_, case
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database.models import UserExerciseProgress
+from app.services.exercise_recommendation_service import mark_recommendations_stale
 
 
 class SpacedRepetitionService:
@@ -51,11 +52,48 @@ class SpacedRepetitionService:
         # Get current progress
         progress = await self._get_progress(user_id, exercise_id)
 
-        # Get current values or defaults
-        ease_factor = progress.get("ease_factor", self.initial_ease_factor)
-        interval = progress.get("interval", self.initial_interval)
-        repetitions = progress.get("repetitions", 0)
+        # SM-2 step from current values or defaults
+        ease_factor, interval, repetitions = self._next_schedule(
+            ease_factor=progress.get("ease_factor", self.initial_ease_factor),
+            interval=progress.get("interval", self.initial_interval),
+            repetitions=progress.get("repetitions", 0),
+            quality=quality
+        )
+
+        # Calculate next review date
+        next_review = datetime.utcnow() + timedelta(days=interval)
+
+        # Update database
+        await self._update_progress(
+            user_id=user_id,
+            exercise_id=exercise_id,
+            ease_factor=ease_factor,
+            interval=interval,
+            repetitions=repetitions,
+            last_reviewed=datetime.utcnow(),
+            next_review=next_review
+        )
+
+        return {
+            "ease_factor": ease_factor,
+            "interval": interval,
+            "repetitions": repetitions,
+            "next_review": next_review,
+            "quality": quality
+        }
 
+    def _next_schedule(
+        self,
+        ease_factor: float,
+        interval: int,
+        repetitions: int,
+        quality: int
+    ) -> Tuple[float, int, int]:
+        """Apply one SM-2 step
+
+        Returns:
+            (ease_factor, interval, repetitions) after the review
+        """
         # SM-2 algorithm
         if quality < 3:
             # Failed review - reset
@@ -78,27 +116,7 @@ class SpacedRepetitionService:
         # Constrain ease factor
         ease_factor = max(self.ease_factor_min, min(self.ease_factor_max, ease_factor))
 
-        # Calculate next review date
-        next_review = datetime.utcnow() + timedelta(days=interval)
-
-        # Update database
-        await self._update_progress(
-            user_id=user_id,
-            exercise_id=exercise_id,
-            ease_factor=ease_factor,
-            interval=interval,
-            repetitions=repetitions,
-            last_reviewed=datetime.utcnow(),
-            next_review=next_review
-        )
-
-        return {
-            "ease_factor": ease_factor,
-            "interval": interval,
-            "repetitions": repetitions,
-            "next_review": next_review,
-            "quality": quality
-        }
+        return ease_factor, interval, repetitions
 
     async def get_due_exercises(
         self,
@@ -196,41 +214,32 @@ class SpacedRepetitionService:
         """
         now = datetime.utcnow()
         week_from_now = now + timedelta(days=7)
+        next_review = UserExerciseProgress.next_review
 
-        # Get all progress records
-        stmt = select(UserExerciseProgress).where(UserExerciseProgress.user_id == user_id)
-        result = await self.db.execute(stmt)
-        all_progress = result.scalars().all()
-
-        if not all_progress:
-            return {
-                "total_due_today": 0,
-                "total_upcoming_week": 0,
-                "total_overdue": 0,
-                "avg_ease_factor": 0.0,
-                "avg_interval": 0.0,
-                "total_repetitions": 0,
-            }
-
-        total_due_today = sum(1 for p in all_progress if p.next_review and p.next_review <= now)
-        total_upcoming_week = sum(1 for p in all_progress if p.next_review and now < p.next_review <= week_from_now)
-        total_overdue = sum(1 for p in all_progress if p.next_review and p.next_review < now)
-
-        ease_factors = [p.ease_factor for p in all_progress if p.ease_factor]
-        avg_ease_factor = sum(ease_factors) / len(ease_factors) if ease_factors else 0.0
+        def count_where(condition):
+            return func.coalesce(func.sum(case((condition, 1), else_=0)), 0)
 
-        intervals = [p.interval for p in all_progress if p.interval]
-        avg_interval = sum(intervals) / len(intervals) if intervals else 0.0
-
-        total_repetitions = sum(p.repetitions for p in all_progress)
+        # One aggregate over the user's rows (served by the (user_id, next_review) index)
+        stmt = (
+            select(
+                count_where(next_review <= now).label("due_today"),
+                count_where(and_(next_review > now, next_review <= week_from_now)).label("upcoming_week"),
+                count_where(next_review < now).label("overdue"),
+                func.avg(case((UserExerciseProgress.ease_factor != 0, UserExerciseProgress.ease_factor))).label("avg_ease_factor"),
+                func.avg(case((UserExerciseProgress.interval != 0, UserExerciseProgress.interval))).label("avg_interval"),
+                func.coalesce(func.sum(UserExerciseProgress.repetitions), 0).label("total_repetitions"),
+            )
+            .where(UserExerciseProgress.user_id == user_id)
+        )
+        stats = (await self.db.execute(stmt)).one()
 
         return {
-            "total_due_today": total_due_today,
-            "total_upcoming_week": total_upcoming_week,
-            "total_overdue": total_overdue,
-            "avg_ease_factor": avg_ease_factor,
-            "avg_interval": avg_interval,
-            "total_repetitions": total_repetitions,
+            "total_due_today": stats.due_today,
+            "total_upcoming_week": stats.upcoming_week,
+            "total_overdue": stats.overdue,
+            "avg_ease_factor": float(stats.avg_ease_factor or 0.0),
+            "avg_interval": float(stats.avg_interval or 0.0),
+            "total_repetitions": stats.total_repetitions,
         }
 
     async def mark_as_reviewed(
@@ -270,6 +279,88 @@ class SpacedRepetitionService:
 
         return schedule
 
+    async def mark_as_reviewed_many(
+        self,
+        user_id: int,
+        reviews: List[Tuple[str, int]]
+    ) -> List[Dict[str, Any]]:
+        """Mark several exercises as reviewed in one transaction
+
+        Use this to finish a practice session. Loads all progress rows in one
+        query, applies SM-2 and the practice-session update to each, and
+        commits once.
+
+        Args:
+            user_id: User ID
+            reviews: (exercise_id, quality) pairs in the order they were practiced
+
+        Returns:
+            Updated scheduling information, one entry per review
+        """
+        if not reviews:
+            return []
+
+        from app.services.exercise_progress_service import get_exercise_progress_service
+        progress_service = get_exercise_progress_service(self.db)
+
+        exercise_ids = {exercise_id for exercise_id, _ in reviews}
+        result = await self.db.execute(
+            select(UserExerciseProgress).where(
+                and_(
+                    UserExerciseProgress.user_id == user_id,
+                    UserExerciseProgress.exercise_id.in_(exercise_ids)
+                )
+            )
+        )
+        progress_by_exercise = {p.exercise_id: p for p in result.scalars().all()}
+
+        now = datetime.utcnow()
+        schedules = []
+        for exercise_id, quality in reviews:
+            progress = progress_by_exercise.get(exercise_id)
+            if progress is None:
+                progress = UserExerciseProgress(
+                    user_id=user_id,
+                    exercise_id=exercise_id,
+                    times_practiced=0,
+                    total_practice_time_seconds=0,
+                    ease_factor=self.initial_ease_factor,
+                    interval=self.initial_interval,
+                    repetitions=0
+                )
+                self.db.add(progress)
+                progress_by_exercise[exercise_id] = progress
+
+            progress.ease_factor, progress.interval, progress.repetitions = self._next_schedule(
+                ease_factor=progress.ease_factor,
+                interval=progress.interval,
+                repetitions=progress.repetitions,
+                quality=quality
+            )
+            progress.last_reviewed = now
+            progress.next_review = now + timedelta(days=progress.interval)
+
+            # Same practice-session bookkeeping as mark_as_reviewed
+            await progress_service.apply_practice_session(
+                progress,
+                duration_seconds=0,
+                score=(quality / 5.0) * 100,
+                quality_rating=quality
+            )
+
+            schedules.append({
+                "exercise_id": exercise_id,
+                "ease_factor": progress.ease_factor,
+                "interval": progress.interval,
+                "repetitions": progress.repetitions,
+                "next_review": progress.next_review,
+                "quality": quality
+            })
+
+        await mark_recommendations_stale(self.db, user_id)
+        await self.db.commit()
+        return schedules
+
     async def reset_exercise(
         self,
         user_id: int,
@@ -383,6 +474,7 @@ class SpacedRepetitionService:
             progress.last_reviewed = last_reviewed
             progress.next_review = next_review
 
+        await mark_recommendations_stale(self.db, user_id)
         await self.db.commit()
 
     def get_quality_description(self, quality: int) -> str:
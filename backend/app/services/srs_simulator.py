@@ -0,0 +1,336 @@
+"""SM-2 Simulator
+
+NumPy-vectorized SuperMemo-2 scheduling. Advances whole arrays of cards
+(ease, interval, repetitions, due day) per step instead of one card at a
+time, so it can:
+
+- replay recorded review histories under different SM-2 parameters, and
+- Monte-Carlo forecast daily review load for a user or cohort from their
+  historical quality-rating distribution.
+
+With default parameters a step is identical to SRSService.calculate_next_review.
+"""
+
+import asyncio
+import json
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database.models import UserExerciseProgress
+from app.database.curriculum_models import (
+    Curriculum,
+    CurriculumModule,
+    CurriculumLesson,
+    CurriculumExercise,
+)
+
+# Used when a user has no recorded ratings yet (mostly passing reviews)
+DEFAULT_QUALITY_DISTRIBUTION = (0.02, 0.03, 0.05, 0.20, 0.40, 0.30)
+
+# Upper bound on simulations x cards held in memory at once
+_MAX_BATCH_ELEMENTS = 2_000_000
+
+
+@dataclass(frozen=True)
+class SM2Parameters:
+    """Tunable SM-2 constants (defaults match SRSService)"""
+    initial_ease: float = 2.5
+    min_ease: float = 1.3
+    first_interval: float = 1.0  # Days after the first successful review
+    second_interval: float = 6.0  # Days after the second successful review
+    fail_interval: float = 1.0  # Days after a failed review (quality < 3)
+    interval_modifier: float = 1.0  # Multiplier on grown intervals (reps >= 3)
+    max_interval: Optional[float] = None  # Cap on any interval, in days
+
+
+@dataclass
+class CardStates:
+    """SM-2 state for a set of cards, one array element per card"""
+    ease: np.ndarray
+    interval: np.ndarray
+    repetitions: np.ndarray
+    due: np.ndarray  # Day offset of the next review (0 = today)
+
+    @classmethod
+    def new(cls, count: int, params: SM2Parameters = SM2Parameters()) -> "CardStates":
+        """Unreviewed cards, all due today"""
+        return cls(
+            ease=np.full(count, params.initial_ease),
+            interval=np.zeros(count),
+            repetitions=np.zeros(count, dtype=np.int64),
+            due=np.zeros(count),
+        )
+
+    def __len__(self) -> int:
+        return len(self.ease)
+
+
+def sm2_step(
+    ease: np.ndarray,
+    interval: np.ndarray,
+    repetitions: np.ndarray,
+    quality: np.ndarray,
+    params: SM2Parameters = SM2Parameters(),
+):
+    """
+    Apply one SM-2 review to every element of the input arrays.
+
+    Args:
+        ease: Current ease factors
+        interval: Current intervals in days
+        repetitions: Current successful repetition counts
+        quality: 0-5 ratings for this review
+        params: SM-2 constants
+
+    Returns:
+        Tuple of (new_interval, new_ease, new_repetitions) arrays
+    """
+    quality = np.asarray(quality)
+    passed = quality >= 3
+    lapse = 5 - quality
+
+    new_repetitions = np.where(passed, repetitions + 1, 0)
+    new_ease = np.where(
+        passed,
+        np.maximum(params.min_ease, ease + 0.1 - lapse * (0.08 + lapse * 0.02)),
+        ease,
+    )
+    new_interval = np.select(
+        [~passed, new_repetitions == 1, new_repetitions == 2],
+        [params.fail_interval, params.first_interval, params.second_interval],
+        interval * new_ease * params.interval_modifier,
+    )
+    if params.max_interval is not None:
+        new_interval = np.minimum(new_interval, params.max_interval)
+
+    return new_interval, new_ease, new_repetitions
+
+
+def replay(qualities: np.ndarray, params: SM2Parameters = SM2Parameters()) -> CardStates:
+    """
+    Replay recorded review histories from scratch under the given parameters.
+
+    Args:
+        qualities: (cards, reviews) matrix of 0-5 ratings in review order,
+            right-padded with -1 for cards with shorter histories
+        params: SM-2 constants to evaluate
+
+    Returns:
+        Final card states; ``due`` holds the total days scheduled across
+        each card's history plus its final interval
+    """
+    qualities = np.atleast_2d(np.asarray(qualities))
+    states = CardStates.new(qualities.shape[0], params)
+
+    for column in qualities.T:
+        reviewed = column >= 0
+        interval, ease, repetitions = sm2_step(
+            states.ease[reviewed],
+            states.interval[reviewed],
+            states.repetitions[reviewed],
+            column[reviewed],
+            params,
+        )
+        states.due[reviewed] += interval
+        states.interval[reviewed] = interval
+        states.ease[reviewed] = ease
+        states.repetitions[reviewed] = repetitions
+
+    return states
+
+
+def pad_histories(histories: Sequence[Sequence[int]]) -> np.ndarray:
+    """Stack ragged rating lists into a -1 padded matrix for replay()"""
+    width = max((len(h) for h in histories), default=0)
+    matrix = np.full((len(histories), width), -1, dtype=np.int64)
+    for row, history in enumerate(histories):
+        matrix[row, :len(history)] = history
+    return matrix
+
+
+def quality_distribution(ratings: Sequence[int]) -> np.ndarray:
+    """
+    Empirical probability of each 0-5 rating.
+
+    Falls back to DEFAULT_QUALITY_DISTRIBUTION when there are no ratings.
+    """
+    ratings = np.asarray(ratings, dtype=np.int64)
+    ratings = ratings[(ratings >= 0) & (ratings <= 5)]
+    if ratings.size == 0:
+        return np.asarray(DEFAULT_QUALITY_DISTRIBUTION)
+    counts = np.bincount(ratings, minlength=6).astype(float)
+    return counts / counts.sum()
+
+
+def forecast_workload(
+    cards: CardStates,
+    quality_probs: Sequence[float],
+    days: int,
+    simulations: int = 200,
+    params: SM2Parameters = SM2Parameters(),
+    seed: Optional[int] = None,
+) -> Dict[str, np.ndarray]:
+    """
+    Monte-Carlo forecast of reviews per day.
+
+    Every simulation reviews each card on its due day, draws a rating from
+    ``quality_probs`` and reschedules it with SM-2. Simulations are run side
+    by side as a (simulations, cards) array, in batches to bound memory.
+
+    Args:
+        cards: Starting card states (``due`` <= 0 means due today)
+        quality_probs: Probability of each 0-5 rating
+        days: Forecast horizon in days
+        simulations: Number of Monte-Carlo runs
+        params: SM-2 constants
+        seed: Random seed for reproducible forecasts
+
+    Returns:
+        Dict of per-day arrays: ``mean``, ``p10``, ``p90``
+    """
+    probs = np.asarray(quality_probs, dtype=float)
+    probs = probs / probs.sum()
+    rng = np.random.default_rng(seed)
+    counts = np.zeros((simulations, days), dtype=np.int64)
+
+    batch = max(1, _MAX_BATCH_ELEMENTS // max(len(cards), 1))
+    for start in range(0, simulations, batch):
+        stop = min(start + batch, simulations)
+        shape = (stop - start, len(cards))
+        ease = np.broadcast_to(cards.ease, shape).copy()
+        interval = np.broadcast_to(cards.interval, shape).copy()
+        repetitions = np.broadcast_to(cards.repetitions, shape).copy()
+        due = np.broadcast_to(np.maximum(cards.due, 0), shape).copy()
+
+        for day in range(days):
+            mask = due <= day
+            counts[start:stop, day] = mask.sum(axis=1)
+            quality = rng.choice(6, size=int(counts[start:stop, day].sum()), p=probs)
+            interval[mask], ease[mask], repetitions[mask] = sm2_step(
+                ease[mask], interval[mask], repetitions[mask], quality, params
+            )
+            due[mask] = day + interval[mask]
+
+    return {
+        "mean": counts.mean(axis=0),
+        "p10": np.percentile(counts, 10, axis=0),
+        "p90": np.percentile(counts, 90, axis=0),
+    }
+
+
+class ReviewForecastService:
+    """Loads a user's (or cohort's) cards and rating history and forecasts review load"""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def load_cards(
+        self,
+        user_ids: Sequence[int],
+        new_cards_per_day: int = 10,
+        now: Optional[datetime] = None,
+    ) -> CardStates:
+        """
+        Current SM-2 state of unmastered exercises in the users' active curricula.
+
+        Unscheduled (new) exercises are introduced ``new_cards_per_day`` at a
+        time in curriculum order rather than all landing on day 0.
+        """
+        today = (now or datetime.utcnow()).replace(hour=0, minute=0, second=0, microsecond=0)
+        result = await self.db.execute(
+            select(
+                CurriculumExercise.ease_factor,
+                CurriculumExercise.interval_days,
+                CurriculumExercise.repetition_count,
+                CurriculumExercise.next_review_at,
+            )
+            .join(CurriculumLesson, CurriculumExercise.lesson_id == CurriculumLesson.id)
+            .join(CurriculumModule, CurriculumLesson.module_id == CurriculumModule.id)
+            .join(Curriculum, CurriculumModule.curriculum_id == Curriculum.id)
+            .where(Curriculum.user_id.in_(user_ids))
+            .where(Curriculum.status == "active")
+            .where(CurriculumExercise.is_mastered == False)  # noqa: E712
+            .order_by(
+                Curriculum.id,
+                CurriculumModule.order_index,
+                CurriculumLesson.week_number,
+                CurriculumExercise.order_index,
+            )
+        )
+        rows = result.all()
+
+        due = np.empty(len(rows))
+        new_rank = 0
+        for i, row in enumerate(rows):
+            if row.next_review_at is None:
+                due[i] = new_rank // max(new_cards_per_day, 1)
+                new_rank += 1
+            else:
+                due[i] = np.floor((row.next_review_at - today) / timedelta(days=1))
+
+        return CardStates(
+            ease=np.array([row.ease_factor for row in rows], dtype=float),
+            interval=np.array([row.interval_days for row in rows], dtype=float),
+            repetitions=np.array([row.repetition_count for row in rows], dtype=np.int64),
+            due=due,
+        )
+
+    async def load_quality_ratings(self, user_ids: Sequence[int]) -> List[int]:
+        """All recorded 0-5 ratings for the users"""
+        result = await self.db.execute(
+            select(UserExerciseProgress.quality_ratings_json)
+            .where(UserExerciseProgress.user_id.in_(user_ids))
+            .where(UserExerciseProgress.quality_ratings_json.is_not(None))
+        )
+        ratings: List[int] = []
+        for raw in result.scalars():
+            ratings.extend(json.loads(raw))
+        return ratings
+
+    async def forecast(
+        self,
+        user_ids: Sequence[int],
+        days: int = 30,
+        simulations: int = 200,
+        quality_probs: Optional[Sequence[float]] = None,
+        params: SM2Parameters = SM2Parameters(),
+        new_cards_per_day: int = 10,
+        seed: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """
+        Project the daily review-count curve for the next ``days`` days.
+
+        Uses the users' historical rating distribution unless
+        ``quality_probs`` is given. The simulation runs in a worker thread.
+        """
+        now = datetime.utcnow()
+        cards = await self.load_cards(user_ids, new_cards_per_day, now)
+        if quality_probs is None:
+            quality_probs = quality_distribution(await self.load_quality_ratings(user_ids))
+        probs = np.asarray(quality_probs, dtype=float)
+        probs = probs / probs.sum()
+
+        curve = await asyncio.to_thread(
+            forecast_workload, cards, probs, days, simulations, params, seed
+        )
+
+        today = now.date()
+        return {
+            "card_count": len(cards),
+            "quality_distribution": probs.tolist(),
+            "total_expected_reviews": float(curve["mean"].sum()),
+            "days": [
+                {
+                    "date": today + timedelta(days=day),
+                    "mean": float(curve["mean"][day]),
+                    "p10": float(curve["p10"][day]),
+                    "p90": float(curve["p90"][day]),
+                }
+                for day in range(days)
+            ],
+        }
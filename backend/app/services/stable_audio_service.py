@@ -5,6 +5,8 @@ import asyncio
 import torch
 import scipy
 
+from app.services.model_registry import model_registry
+
 try:
     from diffusers import StableAudioPipeline
     STABLE_AUDIO_AVAILABLE = True
@@ -22,46 +24,59 @@ class StableAudioService:
     Uses Hugging Face Diffusers library.
     """
     
+    # Approximate resident size of the pipeline (1.2B params incl. T5 encoder)
+    MODEL_SIZE_GB = 5.0
+
     def __init__(self):
-        self.pipeline = None
         self.model_id = "stabilityai/stable-audio-open-1.0"
-        
+        self.registry_key = f"stable-audio:{self.model_id}"
+        model_registry.register(self.registry_key, self._build_pipeline, size_gb=self.MODEL_SIZE_GB)
+
+    @property
+    def pipeline(self):
+        """Resident pipeline, or None if not loaded (or evicted)."""
+        return model_registry.get(self.registry_key)
+
     def _load_model(self):
-        """Lazy load the model to save resources until needed."""
-        if self.pipeline is None:
-            if not STABLE_AUDIO_AVAILABLE:
-                raise ImportError("diffusers library not installed")
-                
-            try:
-                logger.info(f"Loading Stable Audio model: {self.model_id}")
-                
-                # Detect available device
-                if torch.cuda.is_available():
-                    device = "cuda"
-                    dtype = torch.float16
-                    logger.info("Using CUDA GPU acceleration")
-                elif torch.backends.mps.is_available():
-                    device = "mps"
-                    dtype = torch.float32  # MPS works better with float32
-                    logger.info("Using Apple Silicon (MPS) GPU acceleration")
-                else:
-                    device = "cpu"
-                    dtype = torch.float32
-                    logger.info("Using CPU (no GPU detected)")
-                
-                self.pipeline = StableAudioPipeline.from_pretrained(
-                    self.model_id,
-                    torch_dtype=dtype
-                )
-                
-                # Move to detected device
-                self.pipeline = self.pipeline.to(device)
-                    
-                logger.info(f"Stable Audio model loaded successfully on {device}")
+        """Lazy load the model through the shared model registry."""
+        return model_registry.load(self.registry_key)
+
+    def _build_pipeline(self):
+        """Registry loader: build the pipeline on the best available device."""
+        if not STABLE_AUDIO_AVAILABLE:
+            raise ImportError("diffusers library not installed")
+
+        try:
+            logger.info(f"Loading Stable Audio model: {self.model_id}")
+            
+            # Detect available device
+            if torch.cuda.is_available():
+                device = "cuda"
+                dtype = torch.float16
+                logger.info("Using CUDA GPU acceleration")
+            elif torch.backends.mps.is_available():
+                device = "mps"
+                dtype = torch.float32  # MPS works better with float32
+                logger.info("Using Apple Silicon (MPS) GPU acceleration")
+            else:
+                device = "cpu"
+                dtype = torch.float32
+                logger.info("Using CPU (no GPU detected)")
+            
+            pipeline = StableAudioPipeline.from_pretrained(
+                self.model_id,
+                torch_dtype=dtype
+            )
+            
+            # Move to detected device
+            pipeline = pipeline.to(device)
                 
-            except Exception as e:
-                logger.error(f"Failed to load Stable Audio model: {e}")
-                raise e
+            logger.info(f"Stable Audio model loaded successfully on {device}")
+            return pipeline
+            
+        except Exception as e:
+            logger.error(f"Failed to load Stable Audio model: {e}")
+            raise e
 
     async def generate_audio(
         self, 
@@ -87,19 +102,18 @@ class StableAudioService:
             loop = asyncio.get_event_loop()
             
             def _generate():
-                self._load_model()
-                
                 # Clamp duration to model limits
                 duration_clamped = min(max(duration, 1.0), 47.0)
                 
                 logger.info(f"Generating audio: '{prompt}' ({duration_clamped}s)")
                 
-                # Generate audio
-                output = self.pipeline(
-                    prompt=prompt,
-                    audio_end_in_s=duration_clamped,
-                    num_inference_steps=num_inference_steps,
-                )
+                # Generate audio (pinned so the registry cannot evict it mid-run)
+                with model_registry.use(self.registry_key) as pipeline:
+                    output = pipeline(
+                        prompt=prompt,
+                        audio_end_in_s=duration_clamped,
+                        num_inference_steps=num_inference_steps,
+                    )
                 
                 # Extract audio array
                 audio = output.audios[0]
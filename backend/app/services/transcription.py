@@ -2,24 +2,37 @@
 
 import asyncio
 from datetime import datetime
+from itertools import islice
 from pathlib import Path
 from typing import Optional
 import uuid
 import shutil
+import time
 from fastapi import UploadFile
+import numpy as np
 
 from app.core.config import settings
 from app.schemas.transcription import (
+    JobEvent,
     TranscriptionJob,
     TranscriptionOptions,
     TranscriptionResult,
     JobStatus,
+    ReharmonizationSuggestion,
 )
 from app.pipeline.downloader import download_video
 from app.pipeline.audio_extractor import extract_audio, get_audio_info
 from app.pipeline.source_separator import isolate_piano
 from app.pipeline.midi_converter import transcribe_audio, estimate_key
 from app.pipeline.chord_detector import detect_chords
+from app.services.job_events import job_event_broker
+
+# Event that ends a job's stream, by final status
+_TERMINAL_EVENTS = {
+    JobStatus.COMPLETE: "complete",
+    JobStatus.FAILED: "error",
+    JobStatus.CANCELLED: "cancelled",
+}
 
 
 class TranscriptionService:
@@ -27,6 +40,7 @@ class TranscriptionService:
     
     def __init__(self):
         self.jobs: dict[str, TranscriptionJob] = {}
+        self._stage_started: dict[str, float] = {}  # job_id -> perf_counter() at current step start
         settings.ensure_directories()
     
     async def process_url(self, url: str, options: TranscriptionOptions) -> str:
@@ -52,6 +66,7 @@ class TranscriptionService:
         )
         
         self.jobs[job_id] = job
+        self._publish(job, "queued")
         
         # Start pipeline in background
         asyncio.create_task(self._execute_url_pipeline(job_id))
@@ -89,6 +104,7 @@ class TranscriptionService:
         )
         
         self.jobs[job_id] = job
+        self._publish(job, "queued")
         
         # Start pipeline in background
         asyncio.create_task(self._execute_file_pipeline(job_id, upload_path))
@@ -99,10 +115,8 @@ class TranscriptionService:
         """Execute full URL pipeline with error handling"""
         try:
             job = self.jobs[job_id]
-            job.status = JobStatus.DOWNLOADING
-            job.current_step = "Downloading video..."
             job.started_at = datetime.now()
-            job.progress = 5
+            self._update(job, "Downloading video...", 5, JobStatus.DOWNLOADING)
             
             # Download video
             download_dir = settings.upload_dir / job_id
@@ -118,10 +132,8 @@ class TranscriptionService:
         """Execute full file pipeline with error handling"""
         try:
             job = self.jobs[job_id]
-            job.status = JobStatus.PROCESSING
-            job.current_step = "Processing uploaded file..."
             job.started_at = datetime.now()
-            job.progress = 10
+            self._update(job, "Processing uploaded file...", 10, JobStatus.PROCESSING)
             
             # Execute common pipeline
             await self._execute_common_pipeline(job_id, file_path, job.source_file)
@@ -142,9 +154,7 @@ class TranscriptionService:
             output_dir.mkdir(parents=True, exist_ok=True)
             
             # Step 1: Extract audio info
-            job.status = JobStatus.PROCESSING
-            job.current_step = "Extracting audio..."
-            job.progress = 15
+            self._update(job, "Extracting audio...", 15, JobStatus.PROCESSING)
             
             audio_info = await get_audio_info(input_file)
             duration = audio_info['duration']
@@ -152,61 +162,70 @@ class TranscriptionService:
             # Step 2: Extract/convert audio
             audio_path = output_dir / "audio.wav"
             await extract_audio(input_file, audio_path)
-            job.progress = 25
+            self._update(job, progress=25)
             
             # Step 3: Isolate piano (optional)
             piano_audio_path = audio_path
             if job.options.isolate_piano:
-                job.current_step = "Isolating piano..."
-                job.progress = 30
+                self._update(job, "Isolating piano...", 30)
                 piano_audio_path = await isolate_piano(audio_path, output_dir)
-                job.progress = 50
+                self._update(job, progress=50)
             
             # Step 4: Transcribe to MIDI
-            job.current_step = "Transcribing to MIDI..."
-            job.progress = 55
+            self._update(job, "Transcribing to MIDI...", 55)
             
             midi_path = output_dir / "transcription.mid"
             notes, midi_file, estimated_tempo = await transcribe_audio(
                 piano_audio_path,
                 midi_path
             )
-            job.progress = 75
+            self._update(job, progress=75)
             
             # Step 5: Detect chords (optional)
             chords = []
             if job.options.detect_chords:
-                job.status = JobStatus.ANALYZING
-                job.current_step = "Detecting chords..."
-                job.progress = 70
+                self._update(job, "Detecting chords...", 70, JobStatus.ANALYZING)
 
                 chords = await detect_chords(piano_audio_path)
-                job.progress = 75
+                self._update(job, progress=75)
+
+            # Step 6: Music Theory Analysis (key, key timeline, meter)
+            self._update(job, "Analyzing music theory...", 80)
 
-            # Step 6: Advanced Music Theory Analysis (music21)
-            job.current_step = "Analyzing music theory..."
-            job.progress = 80
+            from app.pipeline.tonal_analysis import analyze_tonality
+            analysis_result = analyze_tonality(notes, tempo=estimated_tempo)
 
-            from app.services.music_theory import music_theory_service
-            analysis_result = music_theory_service.analyze_score(midi_path)
+            # Optional full music21 analysis, off the event loop
+            if job.options.deep_theory_analysis:
+                from app.services.music_theory import music_theory_service
+                deep_result = await music_theory_service.analyze_score_async(midi_path)
+                if not deep_result.get("error"):
+                    analysis_result.update(deep_result)
 
             # Use analyzed key if available, otherwise fall back to estimation
-            # Using the analyzed key is much more accurate than simple estimation
             estimated_key = analysis_result.get("key") or estimate_key(notes)
 
             # Step 7: NEW - Voicing Analysis
-            job.current_step = "Analyzing voicings..."
-            job.progress = 85
+            self._update(job, "Analyzing voicings...", 85)
 
             from app.pipeline.voicing_analyzer import analyze_all_voicings
-            from app.gospel import Note
+            from app.gospel.note_array import HAND_LEFT, HAND_RIGHT, NoteArray
             from app.schemas.transcription import VoicingInfo
 
-            # Convert NoteEvent to Note for voicing analyzer
-            note_objects = [Note(pitch=n.pitch, start_time=n.start_time, end_time=n.end_time, velocity=n.velocity, hand=None) for n in notes]
+            # NoteEvents as columns for the voicing analyzer (hand split at middle C)
+            pitches = np.array([n.pitch for n in notes], dtype=np.int64)
+            onsets = np.array([n.start_time for n in notes], dtype=np.float64)
+            offsets = np.array([n.end_time for n in notes], dtype=np.float64)
+            note_array = NoteArray.from_columns(
+                pitch=pitches,
+                time=onsets,
+                duration=np.maximum(offsets - onsets, 1e-3),
+                velocity=[n.velocity for n in notes],
+                hand=np.where(pitches < 60, HAND_LEFT, HAND_RIGHT),
+            )
 
             # Analyze voicings for all chords
-            voicings = await analyze_all_voicings(note_objects, chords)
+            voicings = await analyze_all_voicings(note_array, chords)
 
             # Attach voicing info to corresponding chords
             for i, chord in enumerate(chords):
@@ -231,8 +250,7 @@ class TranscriptionService:
                 chord.end_time = chord.time + chord.duration
 
             # Step 8: NEW - Progression Detection
-            job.current_step = "Detecting progressions..."
-            job.progress = 90
+            self._update(job, "Detecting progressions...", 90)
 
             from app.pipeline.progression_detector import detect_progressions_async
             from app.schemas.transcription import ProgressionPattern
@@ -253,30 +271,9 @@ class TranscriptionService:
             ]
 
             # Step 9: NEW - Reharmonization Suggestions
-            job.current_step = "Generating reharmonization ideas..."
-            job.progress = 95
-
-            from app.pipeline.reharmonization_engine import suggest_reharmonizations_async
-            from app.schemas.transcription import ReharmonizationSuggestion
-
-            # Generate reharmonization suggestions for each chord
-            for chord in chords:
-                chord_dict = {
-                    'root': chord.root,
-                    'quality': chord.quality
-                }
-                suggestions = await suggest_reharmonizations_async(chord_dict, estimated_key)
-                chord.reharmonizations = [
-                    ReharmonizationSuggestion(
-                        original_chord=sugg.original_chord,
-                        suggested_chord=sugg.suggested_chord,
-                        reharmonization_type=sugg.reharmonization_type.value,
-                        explanation=sugg.explanation,
-                        jazz_level=sugg.jazz_level,
-                        voice_leading_quality=sugg.voice_leading_quality
-                    )
-                    for sugg in suggestions
-                ]
+            self._update(job, "Generating reharmonization ideas...", 95)
+
+            await _suggest_reharmonizations(chords, estimated_key)
 
             # Calculate average voicing complexity
             voicing_complexity_avg = None
@@ -308,12 +305,15 @@ class TranscriptionService:
                 # For now, we'll store it in the database via the song record
             )
             
+            # A job cancelled mid-pipeline keeps its cancelled state and is not saved
+            if job.status in _TERMINAL_EVENTS:
+                return
+
             # Mark job as complete
-            job.status = JobStatus.COMPLETE
-            job.current_step = "Complete"
             job.progress = 100
             job.result = result
             job.completed_at = datetime.now()
+            self._finish(job, JobStatus.COMPLETE, "Complete")
             
             # Save to database
             await self._save_to_database(job_id, result, source_title, analysis_result)
@@ -332,6 +332,7 @@ class TranscriptionService:
         try:
             from app.database.session import async_session_maker
             from app.database.models import Song, SongNote, SongChord
+            from app.services.harmonic_search_service import HarmonicSearchService
             
             async with async_session_maker() as db:
                 # Create song record
@@ -379,6 +380,10 @@ class TranscriptionService:
                     )
                     db.add(chord)
                 
+                # Keep the library harmonic search index current
+                await db.flush()
+                await HarmonicSearchService(db).index_song(job_id, result.chords)
+                
                 await db.commit()
         except Exception as e:
             # Log error but don't fail the job
@@ -386,13 +391,81 @@ class TranscriptionService:
     
     async def _handle_error(self, job_id: str, error_message: str):
         """Handle pipeline errors"""
-        if job_id in self.jobs:
-            job = self.jobs[job_id]
-            job.status = JobStatus.FAILED
+        job = self.jobs.get(job_id)
+        if job is not None and job.status not in _TERMINAL_EVENTS:
             job.error_message = error_message
-            job.current_step = "Failed"
             job.completed_at = datetime.now()
-    
+            self._finish(job, JobStatus.FAILED, "Failed")
+
+    def _update(
+        self,
+        job: TranscriptionJob,
+        step: Optional[str] = None,
+        progress: Optional[int] = None,
+        status: Optional[JobStatus] = None
+    ):
+        """Apply a pipeline update to a job and publish it to event streams
+
+        Ignored once the job has finished (e.g. cancelled mid-pipeline).
+        """
+        if job.status in _TERMINAL_EVENTS:
+            return
+        event = "progress"
+        if status is not None and status != job.status:
+            job.status = status
+            event = "stage"
+        if step is not None and step != job.current_step:
+            self._close_stage(job)
+            job.current_step = step
+            self._stage_started[job.id] = time.perf_counter()
+            event = "stage"
+        if progress is not None:
+            job.progress = progress
+        self._publish(job, event)
+
+    def _finish(self, job: TranscriptionJob, status: JobStatus, step: str):
+        """Move a job to a final status and publish the terminal event
+
+        A job finishes once; later calls are ignored, so each job stream
+        sees exactly one terminal event.
+        """
+        if job.status in _TERMINAL_EVENTS:
+            return
+        self._close_stage(job)
+        self._stage_started.pop(job.id, None)
+        job.status = status
+        job.current_step = step
+        self._publish(job, _TERMINAL_EVENTS[status])
+
+    def _close_stage(self, job: TranscriptionJob):
+        """Record how long the current step took"""
+        started = self._stage_started.get(job.id)
+        if started is not None and job.current_step:
+            job.stage_timings[job.current_step] = round(time.perf_counter() - started, 3)
+
+    def _publish(self, job: TranscriptionJob, event: str):
+        job_event_broker.publish(_to_event(job, event))
+
+    def event_snapshot(self, job_id: Optional[str] = None) -> list[dict]:
+        """
+        Current state as events, sent when a client opens an event stream
+
+        Args:
+            job_id: One job (a finished job yields its terminal event),
+                or None for every job still in progress
+        """
+        if job_id is not None:
+            job = self.jobs.get(job_id)
+            if job is None:
+                return []
+            return [_to_event(job, _TERMINAL_EVENTS.get(job.status, "snapshot"))]
+
+        return [
+            _to_event(job, "snapshot")
+            for job in self.jobs.values()
+            if job.status not in _TERMINAL_EVENTS
+        ]
+
     def get_job(self, job_id: str) -> Optional[TranscriptionJob]:
         """Get job by ID"""
         return self.jobs.get(job_id)
@@ -403,18 +476,17 @@ class TranscriptionService:
         limit: int = 20,
         offset: int = 0
     ) -> list[TranscriptionJob]:
-        """List jobs with optional filtering"""
-        jobs_list = list(self.jobs.values())
+        """List jobs with optional filtering (newest first)"""
+        # Jobs are inserted at creation, so reversed dict order is newest
+        # first; only the requested page is materialised
+        jobs_iter = reversed(self.jobs.values())
         
         # Filter by status
         if status:
-            jobs_list = [j for j in jobs_list if j.status.value == status]
-        
-        # Sort by creation time (newest first)
-        jobs_list.sort(key=lambda j: j.created_at, reverse=True)
+            jobs_iter = (j for j in jobs_iter if j.status.value == status)
         
         # Apply pagination
-        return jobs_list[offset:offset + limit]
+        return list(islice(jobs_iter, offset, offset + limit))
     
     def cancel_job(self, job_id: str) -> bool:
         """Cancel a running job"""
@@ -425,9 +497,8 @@ class TranscriptionService:
         
         # Only cancel if job is still in progress
         if job.status in [JobStatus.QUEUED, JobStatus.DOWNLOADING, JobStatus.PROCESSING, JobStatus.ANALYZING]:
-            job.status = JobStatus.CANCELLED
-            job.current_step = "Cancelled"
             job.completed_at = datetime.now()
+            self._finish(job, JobStatus.CANCELLED, "Cancelled")
         
         return True
     
@@ -450,6 +521,91 @@ class TranscriptionService:
             upload_file.unlink()
         
         # Remove from jobs dict
-        del self.jobs[job_id]
+        self._publish(self.jobs.pop(job_id), "deleted")
+        self._stage_started.pop(job_id, None)
         
         return True
+
+
+def _to_event(job: TranscriptionJob, event: str) -> dict:
+    """JSON-ready JobEvent for a job's current state"""
+    return JobEvent(
+        job_id=job.id,
+        event=event,
+        status=job.status,
+        progress=job.progress,
+        current_step=job.current_step,
+        stage_timings=dict(job.stage_timings),
+        error_message=job.error_message,
+    ).model_dump(mode="json")
+
+
+async def _suggest_reharmonizations(chords: list, key: str) -> None:
+    """
+    Attach reharmonization suggestions to each chord in place.
+
+    Args:
+        chords: ChordEvents in time order
+        key: Key as reported by analysis (e.g. "C major", "A minor")
+    """
+    from app.pipeline.reharmonization_engine import suggest_reharmonizations_async
+    from app.pipeline.reharmonization_lattice import parse_key
+
+    # The engine takes the tonic and mode separately
+    tonic, mode = parse_key(key)
+
+    # Identical chord contexts (chord, previous, next) get identical
+    # suggestions, so score each distinct context once
+    contexts = [
+        (
+            (chord.root, chord.quality),
+            (chords[i - 1].root, chords[i - 1].quality) if i > 0 else None,
+            (chords[i + 1].root, chords[i + 1].quality) if i < len(chords) - 1 else None,
+        )
+        for i, chord in enumerate(chords)
+    ]
+    suggestions_by_context = {}
+    for context in dict.fromkeys(contexts):
+        (root, quality), previous_chord, next_chord = context
+        options = await suggest_reharmonizations_async(
+            {'root': root, 'quality': quality},
+            tonic,
+            previous_chord=previous_chord,
+            next_chord=next_chord,
+            mode=mode,
+        )
+        suggestions_by_context[context] = [
+            _to_reharmonization_suggestion(f"{root}{quality}", option)
+            for option in options
+        ]
+
+    for chord, context in zip(chords, contexts):
+        chord.reharmonizations = list(suggestions_by_context[context])
+
+
+def _to_reharmonization_suggestion(original_chord: str, option: dict) -> ReharmonizationSuggestion:
+    """Convert an orchestrator option dict into the API suggestion schema"""
+    quality = option.get('new_quality', '')
+    if isinstance(quality, list):
+        quality = ''
+
+    # Simpler techniques score higher on complexity; map 1.0..0.4 onto jazz level 1..4
+    complexity = option.get('scores', {}).get('complexity', 0.5)
+    jazz_level = min(5, max(1, int(1 + (1.0 - complexity) * 5 + 0.5)))
+
+    smoothness = option.get('voice_leading', {}).get('smoothness', 0.0)
+    if smoothness >= 0.7:
+        voice_leading_quality = "smooth"
+    elif smoothness >= 0.4:
+        voice_leading_quality = "moderate"
+    else:
+        voice_leading_quality = "dramatic"
+
+    return ReharmonizationSuggestion(
+        original_chord=original_chord,
+        suggested_chord=f"{option.get('new_root', '')}{quality}",
+        reharmonization_type=option.get('technique', ''),
+        explanation=option.get('explanation', ''),
+        jazz_level=jazz_level,
+        voice_leading_quality=voice_leading_quality,
+    )
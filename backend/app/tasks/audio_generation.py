@@ -10,116 +10,79 @@ from pathlib import Path
 from typing import Dict, Optional
 
 from sqlalchemy import select
-from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
 
 from app.core.celery_app import celery_app
 from app.core.config import settings
 from app.database.curriculum_models import CurriculumExercise
-from app.services.midi_generation_service import midi_generation_service
-from app.services.audio_pipeline_service import audio_pipeline_service
+from app.services.exercise_audio_cache import render_exercise_batch
+from app.tasks.runtime import run_async, worker_session
 
 logger = logging.getLogger(__name__)
 
-# Create async database engine for tasks
-engine = create_async_engine(
-    f"sqlite+aiosqlite:///{settings.BASE_DIR}/piano_keys.db",
-    echo=False
-)
-AsyncSessionLocal = async_sessionmaker(
-    engine,
-    expire_on_commit=False,
-    class_=__import__('sqlalchemy.ext.asyncio', fromlist=['AsyncSession']).AsyncSession
-)
-
 
 @celery_app.task(bind=True, name="app.tasks.audio_generation.generate_exercise_audio_task")
-def generate_exercise_audio_task(self, exercise_id: str, method: str = "both") -> Dict:
+def generate_exercise_audio_task(self, exercise_id: str, method: str = "both", force: bool = False) -> Dict:
     """Background task to generate audio for a curriculum exercise
 
+    Reuses the cached render of identical exercise content unless forced.
+
     Args:
         exercise_id: Exercise ID
         method: Audio generation method ("fluidsynth", "stable_audio", "both")
+        force: Re-render even if identical content is already cached
 
     Returns:
         Dict with status and file paths
     """
-    import asyncio
-
     async def _generate():
-        async with AsyncSessionLocal() as session:
-            try:
-                # Update status to generating
-                result = await session.execute(
-                    select(CurriculumExercise).where(CurriculumExercise.id == exercise_id)
+        async with worker_session() as session:
+            summary = await render_exercise_batch(session, [exercise_id], method, force=force)
+            exercise = await session.get(CurriculumExercise, exercise_id)
+
+            if exercise is None:
+                logger.error(f"Exercise not found: {exercise_id}")
+                return {"status": "error", "message": "Exercise not found"}
+
+            if summary["deferred"]:
+                # The same content is rendering elsewhere; pick up its result shortly
+                generate_exercise_audio_task.apply_async(
+                    args=[exercise_id, method],
+                    countdown=settings.audio_generation_defer_seconds
                 )
-                exercise = result.scalar_one_or_none()
-
-                if not exercise:
-                    logger.error(f"Exercise not found: {exercise_id}")
-                    return {"status": "error", "message": "Exercise not found"}
-
-                # Update status
-                exercise.audio_generation_status = "generating"
-                await session.commit()
-
-                logger.info(f"Generating audio for exercise {exercise_id} using {method}")
-
-                # Generate MIDI
-                midi_path = await midi_generation_service.generate_exercise_midi(exercise)
-                exercise.midi_file_path = str(midi_path)
-                await session.commit()
-
-                # Generate audio
-                audio_paths = await audio_pipeline_service.generate_exercise_audio(
-                    exercise=exercise,
-                    method=method,
-                    midi_path=midi_path
-                )
-
-                # Update exercise with audio paths
-                audio_files = {}
-                if audio_paths.get("fluidsynth"):
-                    audio_files["fluidsynth"] = str(audio_paths["fluidsynth"])
-                if audio_paths.get("stable_audio"):
-                    audio_files["stable_audio"] = str(audio_paths["stable_audio"])
-
-                exercise.audio_files_json = json.dumps(audio_files)
-                exercise.audio_generation_status = "complete"
-                exercise.audio_generated_at = datetime.utcnow()
-                await session.commit()
-
-                logger.info(f"Audio generation complete for exercise {exercise_id}")
+                return {"status": "deferred", "exercise_id": exercise_id}
 
+            if exercise.audio_generation_status != "complete":
                 return {
-                    "status": "success",
+                    "status": "error",
                     "exercise_id": exercise_id,
-                    "midi_path": str(midi_path),
-                    "audio_files": audio_files
+                    "message": "Audio generation failed"
                 }
 
-            except Exception as e:
-                logger.error(f"Audio generation failed for {exercise_id}: {e}")
+            logger.info(f"Audio generation complete for exercise {exercise_id}")
 
-                # Update status to failed
-                try:
-                    exercise.audio_generation_status = "failed"
-                    await session.commit()
-                except Exception:
-                    pass
-
-                return {
-                    "status": "error",
-                    "exercise_id": exercise_id,
-                    "message": str(e)
-                }
+            return {
+                "status": "success",
+                "exercise_id": exercise_id,
+                "midi_path": exercise.midi_file_path,
+                "audio_files": json.loads(exercise.audio_files_json)
+            }
 
     # Run async code
-    return asyncio.run(_generate())
+    return run_async(_generate())
 
 
-@celery_app.task(name="app.tasks.audio_generation.generate_batch_audio_task")
+@celery_app.task(
+    name="app.tasks.audio_generation.generate_batch_audio_task",
+    rate_limit=settings.audio_generation_rate_limit
+)
 def generate_batch_audio_task(exercise_ids: list[str], method: str = "both") -> Dict:
-    """Generate audio for multiple exercises in batch
+    """Generate audio for multiple exercises in one worker invocation
+
+    Renders each distinct exercise content once (or reuses the cached
+    render) with the MIDI/audio services loaded once for the whole batch.
+    Throughput is bounded by the task's token-bucket rate limit
+    (settings.audio_generation_rate_limit) rather than per-task countdowns.
+    Exercises whose content another worker is rendering are re-queued.
 
     Args:
         exercise_ids: List of exercise IDs
@@ -128,25 +91,47 @@ def generate_batch_audio_task(exercise_ids: list[str], method: str = "both") ->
     Returns:
         Dict with batch status
     """
-    results = []
+    async def _generate():
+        async with worker_session() as session:
+            return await render_exercise_batch(session, exercise_ids, method)
+
+    summary = run_async(_generate())
 
-    for exercise_id in exercise_ids:
-        result = generate_exercise_audio_task.apply_async(
-            args=[exercise_id, method],
-            countdown=0
+    if summary["deferred"]:
+        generate_batch_audio_task.apply_async(
+            args=[summary["deferred"], method],
+            countdown=settings.audio_generation_defer_seconds
         )
-        results.append({
-            "exercise_id": exercise_id,
-            "task_id": result.id
-        })
+
+    logger.info(
+        f"Audio batch done: {summary['rendered']} rendered, {summary['cached']} from cache, "
+        f"{summary['failed']} failed, {len(summary['deferred'])} deferred"
+    )
 
     return {
-        "status": "batch_queued",
+        "status": "batch_complete",
         "total": len(exercise_ids),
-        "tasks": results
+        **summary
     }
 
 
+def queue_exercise_audio(exercise_ids: list[str], method: str = "both") -> list[str]:
+    """Dispatch audio generation as batch tasks
+
+    Args:
+        exercise_ids: Exercises to render
+        method: Audio generation method
+
+    Returns:
+        Celery task IDs, one per batch of settings.audio_generation_batch_size
+    """
+    size = max(1, settings.audio_generation_batch_size)
+    return [
+        generate_batch_audio_task.apply_async(args=[exercise_ids[i:i + size], method]).id
+        for i in range(0, len(exercise_ids), size)
+    ]
+
+
 @celery_app.task(name="app.tasks.audio_generation.cleanup_failed_audio_tasks")
 def cleanup_failed_audio_tasks() -> Dict:
     """Cleanup task to retry failed audio generation
@@ -154,10 +139,8 @@ def cleanup_failed_audio_tasks() -> Dict:
     Runs daily via Celery Beat to retry exercises stuck in 'generating' state
     for more than 1 hour.
     """
-    import asyncio
-
     async def _cleanup():
-        async with AsyncSessionLocal() as session:
+        async with worker_session() as session:
             try:
                 # Find exercises stuck in generating state
                 from datetime import timedelta
@@ -189,4 +172,4 @@ def cleanup_failed_audio_tasks() -> Dict:
                 logger.error(f"Cleanup task failed: {e}")
                 return {"status": "error", "message": str(e)}
 
-    return asyncio.run(_cleanup())
+    return run_async(_cleanup())
@@ -1,92 +1,189 @@
 """Celery tasks for curriculum adaptation (Phase 2)
 
-Analyzes user performance and adapts curricula weekly.
+Analyzes user performance and adapts curricula weekly, sharded into
+chunked subtasks.
 """
 
 import logging
-import asyncio
+from typing import Dict, List, Optional
+
+from celery import group
+from celery.result import GroupResult
 from sqlalchemy import select
-from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
 
 from app.core.celery_app import celery_app
 from app.core.config import settings
 from app.database.curriculum_models import Curriculum
 from app.services.adaptive_curriculum_service import AdaptiveCurriculumService
+from app.tasks.runtime import run_async, worker_session
 
 logger = logging.getLogger(__name__)
 
-# Create async database engine for tasks
-engine = create_async_engine(
-    f"sqlite+aiosqlite:///{settings.BASE_DIR}/piano_keys.db",
-    echo=False
-)
-AsyncSessionLocal = async_sessionmaker(
-    engine,
-    expire_on_commit=False,
-    class_=__import__('sqlalchemy.ext.asyncio', fromlist=['AsyncSession']).AsyncSession
-)
-
 
-@celery_app.task(name="app.tasks.curriculum_adaptation.weekly_curriculum_adaptation_task")
-def weekly_curriculum_adaptation_task():
+@celery_app.task(bind=True, name="app.tasks.curriculum_adaptation.weekly_curriculum_adaptation_task")
+def weekly_curriculum_adaptation_task(self, lookback_days: int = 7):
     """Weekly curriculum adaptation task (Phase 2)
 
     Scheduled to run every Monday at 2:00 AM.
-    Analyzes user performance and adapts curriculum difficulty and load.
+    Splits active curricula into chunks (settings.curriculum_adaptation_chunk_size)
+    and fans them out as adapt_curricula_chunk_task subtasks. Follow progress
+    with get_adaptation_progress(group_id).
+    """
+    async def _active_ids():
+        async with worker_session() as session:
+            result = await session.execute(
+                select(Curriculum.id)
+                .where(Curriculum.status == 'active')
+                .order_by(Curriculum.id)
+            )
+            return list(result.scalars().all())
+
+    try:
+        curriculum_ids = run_async(_active_ids())
+        size = max(1, settings.curriculum_adaptation_chunk_size)
+        chunks = [curriculum_ids[i:i + size] for i in range(0, len(curriculum_ids), size)]
+
+        logger.info(
+            f"Running weekly adaptation for {len(curriculum_ids)} active curricula "
+            f"in {len(chunks)} chunks"
+        )
+
+        if not chunks:
+            return {"status": "success", "total_curricula": 0, "chunks": 0}
+
+        job = group(adapt_curricula_chunk_task.s(chunk, lookback_days) for chunk in chunks).apply_async()
+        job.save()  # Lets get_adaptation_progress restore it by id
+
+        return {
+            "status": "dispatched",
+            "group_id": job.id,
+            "total_curricula": len(curriculum_ids),
+            "chunks": len(chunks)
+        }
+
+    except Exception as e:
+        logger.error(f"Weekly adaptation task failed: {e}")
+        return {"status": "error", "message": str(e)}
+
+
+@celery_app.task(bind=True, name="app.tasks.curriculum_adaptation.adapt_curricula_chunk_task")
+def adapt_curricula_chunk_task(self, curriculum_ids: List[str], lookback_days: int = 7):
+    """Analyze and adapt one chunk of curricula
+
+    Analysis is grouped SQL over the whole chunk and interval changes are
+    bulk UPDATEs (AdaptiveCurriculumService.adapt_curricula).
     """
-    import asyncio
-
     async def _adapt():
-        async with AsyncSessionLocal() as session:
+        async with worker_session() as session:
+            return await AdaptiveCurriculumService(session).adapt_curricula(
+                curriculum_ids, lookback_days=lookback_days
+            )
+
+    self.update_state(state="PROGRESS", meta={"curricula": len(curriculum_ids)})
+    try:
+        summary = run_async(_adapt())
+        logger.info(
+            f"Adapted {summary['adapted']}/{summary['analyzed']} curricula "
+            f"({summary['exercises_rescheduled']} exercises rescheduled)"
+        )
+        return {"status": "success", **summary}
+
+    except Exception as e:
+        logger.error(f"Adaptation chunk of {len(curriculum_ids)} curricula failed: {e}")
+        return {"status": "error", "message": str(e), "analyzed": 0, "adapted": 0}
+
+
+def get_adaptation_progress(group_id: str) -> Dict:
+    """Progress of a weekly adaptation run started by weekly_curriculum_adaptation_task
+
+    Returns:
+        Dict with completed/total chunks and curricula adapted so far
+    """
+    job = GroupResult.restore(group_id, app=celery_app)
+    if job is None:
+        return {"status": "unknown", "group_id": group_id}
+
+    finished = [r.result for r in job.results if r.successful()]
+    failed = sum(1 for r in job.results if r.failed()) + sum(1 for r in finished if r.get("status") == "error")
+    return {
+        "status": "complete" if job.ready() else "running",
+        "group_id": group_id,
+        "chunks": len(job.results),
+        "completed_chunks": job.completed_count(),
+        "failed_chunks": failed,
+        "analyzed": sum(r.get("analyzed", 0) for r in finished),
+        "adapted": sum(r.get("adapted", 0) for r in finished),
+    }
+
+
+@celery_app.task(name="app.tasks.curriculum_adaptation.recompute_completion_counters_task")
+def recompute_completion_counters_task(curriculum_id: Optional[str] = None):
+    """Rebuild lesson/module completion counters in bulk
+
+    Scheduled to run every day at 4:00 AM (or on demand for one curriculum).
+    Repairs any drift in exercises_total / exercises_mastered / lessons_completed.
+    """
+    from app.services.curriculum_service import CurriculumService
+
+    async def _recompute():
+        async with worker_session() as session:
             try:
-                # Get all active curricula
-                result = await session.execute(
-                    select(Curriculum).where(Curriculum.status == 'active')
+                updated = await CurriculumService(session).recompute_completion_counters(curriculum_id)
+                logger.info(
+                    f"Recomputed completion counters: {updated['lessons']} lessons, "
+                    f"{updated['modules']} modules"
                 )
-                active_curricula = result.scalars().all()
+                return {"status": "success", **updated}
+
+            except Exception as e:
+                logger.error(f"Completion counter repair failed: {e}")
+                return {"status": "error", "message": str(e)}
 
-                logger.info(f"Running weekly adaptation for {len(active_curricula)} active curricula")
+    return run_async(_recompute())
 
-                adapted_count = 0
 
-                for curriculum in active_curricula:
-                    try:
-                        # Create service instance with session
-                        adaptive_service = AdaptiveCurriculumService(session)
+@celery_app.task(name="app.tasks.curriculum_adaptation.refresh_recommendation_snapshots_task")
+def refresh_recommendation_snapshots_task(batch_size: Optional[int] = None):
+    """Rebuild stale or expired exercise recommendation snapshots
 
-                        # Analyze performance (7-day lookback)
-                        analysis = await adaptive_service.analyze_user_performance(
-                            user_id=curriculum.user_id,
-                            lookback_days=7
-                        )
+    Scheduled to run every 15 minutes so most /exercises/recommended reads
+    hit a fresh snapshot. Rebuilds at most settings.recommendation_refresh_batch_size
+    snapshots per run, oldest first.
+    """
+    from app.services.exercise_recommendation_service import ExerciseRecommendationService
 
-                        # Only adapt if there are recommendations
-                        if analysis.recommended_actions:
-                            await adaptive_service.apply_adaptations(
-                                curriculum_id=curriculum.id,
-                                analysis=analysis
-                            )
-                            adapted_count += 1
+    async def _refresh():
+        async with worker_session() as session:
+            try:
+                refreshed = await ExerciseRecommendationService(session).refresh_stale_snapshots(batch_size)
+                logger.info(f"Refreshed {refreshed} recommendation snapshots")
+                return {"status": "success", "refreshed": refreshed}
 
-                            logger.info(
-                                f"Adapted curriculum {curriculum.id}: "
-                                f"{len(analysis.recommended_actions)} changes"
-                            )
+            except Exception as e:
+                logger.error(f"Recommendation snapshot refresh failed: {e}")
+                return {"status": "error", "message": str(e)}
 
-                    except Exception as e:
-                        logger.error(f"Failed to adapt curriculum {curriculum.id}: {e}")
-                        continue
+    return run_async(_refresh())
 
-                logger.info(f"Weekly adaptation complete: {adapted_count}/{len(active_curricula)} adapted")
 
-                return {
-                    "status": "success",
-                    "total_curricula": len(active_curricula),
-                    "adapted": adapted_count
-                }
+@celery_app.task(name="app.tasks.curriculum_adaptation.refresh_user_recommendation_snapshot_task")
+def refresh_user_recommendation_snapshot_task(user_id: int):
+    """Rebuild one user's exercise recommendation snapshot
+
+    Queued when /exercises/recommended serves a stale or expired snapshot,
+    so the read does not rebuild it inline. Skipped if the snapshot was
+    already refreshed since.
+    """
+    from app.services.exercise_recommendation_service import ExerciseRecommendationService
+
+    async def _refresh():
+        async with worker_session() as session:
+            try:
+                refreshed = await ExerciseRecommendationService(session).refresh_snapshot_if_outdated(user_id)
+                return {"status": "success", "user_id": user_id, "refreshed": refreshed}
 
             except Exception as e:
-                logger.error(f"Weekly adaptation task failed: {e}")
+                logger.error(f"Recommendation snapshot refresh failed for user {user_id}: {e}")
                 return {"status": "error", "message": str(e)}
 
-    return asyncio.run(_adapt())
+    return run_async(_refresh())
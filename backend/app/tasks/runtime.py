@@ -0,0 +1,92 @@
+"""Per-process async runtime for Celery tasks
+
+Celery tasks are synchronous, but the services they call are async. Instead
+of a fresh asyncio.run() loop (and engine) per task, each worker process
+keeps one event loop and one pooled engine, created on first use and
+disposed when the process shuts down:
+
+    @celery_app.task
+    def my_task():
+        async def _work():
+            async with worker_session() as session:
+                ...
+        return run_async(_work())
+
+The runtime is rebuilt after a fork, so prefork children never reuse the
+parent's connections.
+"""
+
+import asyncio
+import logging
+import os
+import threading
+from typing import Any, Coroutine, TypeVar
+
+from celery.signals import worker_process_shutdown
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from app.database.engine import create_engine, create_sessionmaker
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class _WorkerRuntime:
+    """
+    Event loop, engine and session factory owned by one worker.
+
+    State is per thread as well as per process, so thread-pool workers each
+    get their own loop rather than sharing one that is already running.
+    """
+
+    def __init__(self):
+        self._local = threading.local()
+
+    def _state(self) -> threading.local:
+        state = self._local
+        if getattr(state, "pid", None) != os.getpid() or state.loop.is_closed():
+            # New process (or first use): the parent's loop and pool are not ours to touch
+            state.pid = os.getpid()
+            state.loop = asyncio.new_event_loop()
+            state.engine = create_engine()
+            state.sessionmaker = create_sessionmaker(state.engine)
+            logger.info(f"Started task runtime in process {state.pid}")
+        return state
+
+    @property
+    def engine(self) -> AsyncEngine:
+        return self._state().engine
+
+    def session(self) -> AsyncSession:
+        return self._state().sessionmaker()
+
+    def run(self, coro: Coroutine[Any, Any, T]) -> T:
+        return self._state().loop.run_until_complete(coro)
+
+    def shutdown(self) -> None:
+        state = self._local
+        if getattr(state, "pid", None) != os.getpid() or state.loop.is_closed():
+            return
+        try:
+            state.loop.run_until_complete(state.engine.dispose())
+        finally:
+            state.loop.close()
+
+
+worker_runtime = _WorkerRuntime()
+
+
+def run_async(coro: Coroutine[Any, Any, T]) -> T:
+    """Run a coroutine on this process's persistent event loop."""
+    return worker_runtime.run(coro)
+
+
+def worker_session() -> AsyncSession:
+    """New session from this process's pooled engine (use as an async context manager)."""
+    return worker_runtime.session()
+
+
+@worker_process_shutdown.connect
+def _shutdown_runtime(**kwargs) -> None:
+    worker_runtime.shutdown()
@@ -254,43 +254,47 @@ def get_recommended_model(
     return tier_config["recommended"], tier_config["warning"]
 
 
-def is_model_safe(model_path: str, memory_info: Optional[MemoryInfo] = None) -> Tuple[bool, str]:
-    """Check if a specific model is safe to load given system memory
+def estimate_model_ram(model_path: str) -> Tuple[float, ModelSizeClass]:
+    """Estimate a 4-bit model's RAM footprint from its name
     
     Args:
-        model_path: HuggingFace model path (e.g., "mlx-community/Llama-3.3-70B-Instruct-4bit")
-        memory_info: Optional pre-fetched memory info
+        model_path: HuggingFace model path (e.g., "mlx-community/Qwen2.5-7B-Instruct-4bit")
         
     Returns:
-        Tuple of (is_safe, reason_or_warning)
+        Tuple of (estimated_ram_gb, size_class)
     """
-    if memory_info is None:
-        memory_info = get_system_memory()
-    
-    # Estimate model size from name
     model_lower = model_path.lower()
     
-    estimated_ram_gb = 4  # Default for unknown models
-    size_class = ModelSizeClass.SMALL
-    
     if "70b" in model_lower:
-        estimated_ram_gb = 45
-        size_class = ModelSizeClass.XLARGE
+        return 45, ModelSizeClass.XLARGE
     elif "14b" in model_lower:
-        estimated_ram_gb = 12
-        size_class = ModelSizeClass.LARGE
+        return 12, ModelSizeClass.LARGE
     elif "8b" in model_lower:
-        estimated_ram_gb = 6
-        size_class = ModelSizeClass.MEDIUM
+        return 6, ModelSizeClass.MEDIUM
     elif "7b" in model_lower:
-        estimated_ram_gb = 5
-        size_class = ModelSizeClass.MEDIUM
+        return 5, ModelSizeClass.MEDIUM
     elif "3b" in model_lower or "3.5" in model_lower or "mini" in model_lower:
-        estimated_ram_gb = 3
-        size_class = ModelSizeClass.SMALL
+        return 3, ModelSizeClass.SMALL
     elif "1b" in model_lower or "2b" in model_lower:
-        estimated_ram_gb = 2
-        size_class = ModelSizeClass.TINY
+        return 2, ModelSizeClass.TINY
+    
+    return 4, ModelSizeClass.SMALL  # Default for unknown models
+
+
+def is_model_safe(model_path: str, memory_info: Optional[MemoryInfo] = None) -> Tuple[bool, str]:
+    """Check if a specific model is safe to load given system memory
+    
+    Args:
+        model_path: HuggingFace model path (e.g., "mlx-community/Llama-3.3-70B-Instruct-4bit")
+        memory_info: Optional pre-fetched memory info
+        
+    Returns:
+        Tuple of (is_safe, reason_or_warning)
+    """
+    if memory_info is None:
+        memory_info = get_system_memory()
+    
+    estimated_ram_gb, size_class = estimate_model_ram(model_path)
     
     # Check if we have enough available memory (with 10% margin)
     required_with_margin = estimated_ram_gb * 1.1
@@ -0,0 +1,93 @@
+"""Async Rate Limiter for Outbound LLM Calls
+
+Sliding-window limiter for coroutines that fan out API requests:
+- At most max_calls starts per period (default: per minute)
+- At most max_concurrent calls in flight at once
+- Waiters are served in arrival order
+
+Usage:
+    limiter = AsyncRateLimiter(max_calls=60, max_concurrent=4)
+    async with limiter:
+        response = await model.generate_content_async(prompt)
+"""
+
+import asyncio
+import time
+from collections import deque
+from typing import Deque, Optional
+
+
+class AsyncRateLimiter:
+    """Sliding-window rate limit plus a concurrency cap for async callers."""
+
+    def __init__(
+        self,
+        max_calls: int,
+        period: float = 60.0,
+        max_concurrent: Optional[int] = None
+    ):
+        """
+        Args:
+            max_calls: Calls allowed to start within any period window
+            period: Window length in seconds
+            max_concurrent: Calls allowed in flight at once (None = unbounded)
+        """
+        if max_calls < 1:
+            raise ValueError(f"max_calls must be positive, got {max_calls}")
+        if max_concurrent is not None and max_concurrent < 1:
+            raise ValueError(f"max_concurrent must be positive, got {max_concurrent}")
+
+        self.max_calls = max_calls
+        self.period = period
+        self.max_concurrent = max_concurrent
+        self._starts: Deque[float] = deque()
+        self._lock = asyncio.Lock()
+        self._slots = asyncio.Semaphore(max_concurrent) if max_concurrent else None
+
+    async def acquire(self) -> None:
+        """Wait for a concurrency slot and a free spot in the window."""
+        if self._slots is not None:
+            await self._slots.acquire()
+        try:
+            # Holding the lock while sleeping keeps waiters in FIFO order
+            async with self._lock:
+                while True:
+                    now = time.monotonic()
+                    while self._starts and now - self._starts[0] >= self.period:
+                        self._starts.popleft()
+                    if len(self._starts) < self.max_calls:
+                        self._starts.append(now)
+                        return
+                    await asyncio.sleep(self._starts[0] + self.period - now)
+        except BaseException:
+            if self._slots is not None:
+                self._slots.release()
+            raise
+
+    def release(self) -> None:
+        """Free the concurrency slot taken by acquire()."""
+        if self._slots is not None:
+            self._slots.release()
+
+    async def __aenter__(self) -> "AsyncRateLimiter":
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        self.release()
+
+    def stats(self) -> dict:
+        """Current window usage."""
+        now = time.monotonic()
+        recent = sum(1 for t in self._starts if now - t < self.period)
+        in_flight = (
+            self.max_concurrent - self._slots._value
+            if self._slots is not None else None
+        )
+        return {
+            "max_calls": self.max_calls,
+            "period_seconds": self.period,
+            "calls_in_window": recent,
+            "max_concurrent": self.max_concurrent,
+            "in_flight": in_flight,
+        }
@@ -260,7 +260,7 @@ async def generate_all_musical_files():
                 print(f"\n   📖 Lesson {lesson_idx}: {lesson.title}")
 
                 for ex_idx, exercise in enumerate(lesson.exercises, 1):
-                    content = json.loads(exercise.content_json)
+                    content = json.loads(exercise.effective_content_json)
 
                     # Create safe filename
                     safe_name = exercise.title.replace(" ", "_").replace("/", "-")
@@ -153,7 +153,7 @@ async def generate_curriculum():
 
                 # Show first 2 exercises per lesson
                 for k, exercise in enumerate(lesson.exercises[:2], 1):
-                    content = json.loads(exercise.content_json)
+                    content = json.loads(exercise.effective_content_json)
                     print(f"         • {exercise.title} ({exercise.exercise_type}, {exercise.difficulty})")
                     if exercise.exercise_type == "progression" and "chords" in content:
                         chords_str = " → ".join(content["chords"][:4])
@@ -92,7 +92,7 @@ def display_terminal(curriculum: Curriculum):
             print(f"\n   📝 Exercises:")
             for k, exercise in enumerate(lesson.exercises, 1):
                 total_exercises += 1
-                content = json.loads(exercise.content_json)
+                content = json.loads(exercise.effective_content_json)
 
                 print(f"\n      {k}. {exercise.title}")
                 print(f"         Type: {exercise.exercise_type} | Difficulty: {exercise.difficulty}")
@@ -153,7 +153,7 @@ def export_json(curriculum: Curriculum):
                     "difficulty": exercise.difficulty,
                     "duration_minutes": exercise.estimated_duration_minutes,
                     "bpm": exercise.target_bpm,
-                    "content": json.loads(exercise.content_json)
+                    "content": json.loads(exercise.effective_content_json)
                 }
                 lesson_data["exercises"].append(exercise_data)
 
@@ -219,7 +219,7 @@ def export_markdown(curriculum: Curriculum):
             lines.append("")
 
             for k, exercise in enumerate(lesson.exercises, 1):
-                content = json.loads(exercise.content_json)
+                content = json.loads(exercise.effective_content_json)
                 lines.append(f"{k}. **{exercise.title}**")
                 lines.append(f"   - Type: {exercise.exercise_type}")
                 lines.append(f"   - Difficulty: {exercise.difficulty}")
@@ -0,0 +1,169 @@
+"""
+Tests for set-based curriculum performance analysis and adaptation
+"""
+
+import json
+from datetime import datetime, timedelta
+
+import pytest
+import pytest_asyncio
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.database.models import Base, User
+from app.database.curriculum_models import (
+    Curriculum, CurriculumModule, CurriculumLesson, CurriculumExercise
+)
+from app.services import adaptive_curriculum_service
+from app.services.adaptive_curriculum_service import AdaptiveCurriculumService
+
+TEST_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
+
+
+@pytest_asyncio.fixture
+async def db():
+    """In-memory database with every table created."""
+    engine = create_async_engine(TEST_DATABASE_URL, echo=False)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    session_factory = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    async with session_factory() as session:
+        yield session
+    await engine.dispose()
+
+
+async def seed_curriculum(db, user_id, exercises):
+    """Active curriculum with one lesson holding exercises built from kwargs dicts."""
+    db.add(User(id=user_id, email=f"user{user_id}@example.com", hashed_password="x"))
+    lesson = CurriculumLesson(title="Week 1", week_number=1)
+    lesson.exercises = [
+        CurriculumExercise(title=f"ex{i}", order_index=i, **fields)
+        for i, fields in enumerate(exercises)
+    ]
+    module = CurriculumModule(title="Module 1", theme="gospel", order_index=0, start_week=1, end_week=4)
+    module.lessons = [lesson]
+    curriculum = Curriculum(user_id=user_id, title="Curriculum", status="active")
+    curriculum.modules = [module]
+    db.add(curriculum)
+    await db.commit()
+    return curriculum
+
+
+def struggling_user_exercises(now):
+    """Three recently reviewed, struggling scales and three unreviewed, easy voicings."""
+    return [
+        dict(exercise_type="scale", ease_factor=1.5, interval_days=2.0, last_reviewed_at=now - timedelta(days=3)),
+        dict(exercise_type="scale", ease_factor=1.8, interval_days=2.0, last_reviewed_at=now - timedelta(days=2)),
+        dict(exercise_type="scale", ease_factor=1.6, interval_days=2.0, last_reviewed_at=now - timedelta(days=1)),
+        dict(exercise_type="voicing", ease_factor=3.0, repetition_count=4, next_review_at=now),
+        dict(exercise_type="voicing", ease_factor=3.0, next_review_at=now),
+        dict(exercise_type="voicing", ease_factor=3.0, next_review_at=now),
+    ]
+
+
+class TestAnalyzeCurricula:
+    """Tests for grouped SQL performance analysis"""
+
+    @pytest.mark.asyncio
+    async def test_aggregates_match_expected_statistics(self, db):
+        curriculum = await seed_curriculum(db, 1, struggling_user_exercises(datetime.utcnow()))
+        analysis = (await AdaptiveCurriculumService(db).analyze_curricula([curriculum.id]))[curriculum.id]
+
+        assert analysis.total_exercises == 6
+        assert analysis.reviewed_exercises == 3
+        assert analysis.completion_rate == 0.5
+        assert analysis.avg_quality_score == pytest.approx((1.5 + 1.8 + 1.6 + 9.0) / 6)
+        assert len(analysis.struggling_exercises) == 3
+        assert len(analysis.mastered_exercises) == 1
+        assert analysis.weak_skill_areas == ["scale"]
+        assert analysis.strong_skill_areas == ["voicing"]
+        assert analysis.skill_area_trends["scale"] == pytest.approx(((1.8 + 1.6) / 2 - 1.5) / 5)
+        assert analysis.recent_performance_trend == "stable"
+        assert analysis.consecutive_struggles == 3
+        assert analysis.recommended_actions == ["reduce_daily_load", "add_remedial_scale"]
+
+    @pytest.mark.asyncio
+    async def test_many_curricula_in_one_call(self, db):
+        now = datetime.utcnow()
+        first = await seed_curriculum(db, 1, struggling_user_exercises(now))
+        second = await seed_curriculum(db, 2, [
+            dict(exercise_type="scale", ease_factor=2.5, last_reviewed_at=now - timedelta(days=1)),
+        ])
+        empty = Curriculum(user_id=2, title="Empty", status="active")
+        db.add(empty)
+        await db.commit()
+
+        analyses = await AdaptiveCurriculumService(db).analyze_curricula([first.id, second.id, empty.id])
+
+        assert set(analyses) == {first.id, second.id}
+        assert analyses[second.id].completion_rate == 1.0
+        assert analyses[second.id].recommended_actions == []
+
+    @pytest.mark.asyncio
+    async def test_analyze_user_performance_uses_active_curriculum(self, db):
+        await seed_curriculum(db, 1, struggling_user_exercises(datetime.utcnow()))
+        analysis = await AdaptiveCurriculumService(db).analyze_user_performance(user_id=1)
+
+        assert analysis.total_exercises == 6
+
+
+class TestAdaptCurricula:
+    """Tests for bulk adaptation"""
+
+    @pytest.mark.asyncio
+    async def test_scales_intervals_and_logs_history(self, db):
+        now = datetime.utcnow().replace(microsecond=0)
+        first = await seed_curriculum(db, 1, struggling_user_exercises(now))
+        second = await seed_curriculum(db, 2, [
+            dict(exercise_type="scale", ease_factor=2.5, interval_days=3.0, last_reviewed_at=now),
+        ])
+
+        exercises = [ex for c in (first, second) for ex in c.modules[0].lessons[0].exercises]
+
+        summary = await AdaptiveCurriculumService(db).adapt_curricula([first.id, second.id])
+
+        assert summary == {"analyzed": 2, "adapted": 1, "exercises_rescheduled": 6}
+        for curriculum in (first, second):
+            await db.refresh(curriculum, ["adaptation_history_json", "last_adapted_at"])
+        for exercise in exercises:
+            await db.refresh(exercise, ["interval_days", "next_review_at"])
+
+        reviewed, _, _, unreviewed = exercises[:4]
+        assert reviewed.interval_days == pytest.approx(2.4)
+        assert reviewed.next_review_at == reviewed.last_reviewed_at + timedelta(days=2.4)
+        assert unreviewed.interval_days == pytest.approx(1.2)
+        assert unreviewed.next_review_at == now
+
+        history = json.loads(first.adaptation_history_json)
+        assert history[-1]["changes"][0] == "Reduced daily exercise load by 20%"
+        assert first.last_adapted_at is not None
+
+        assert exercises[-1].interval_days == 3.0
+        assert json.loads(second.adaptation_history_json) == []
+
+    @pytest.mark.asyncio
+    async def test_per_row_fallback_matches_sql(self, db, monkeypatch):
+        monkeypatch.setattr(adaptive_curriculum_service, "_add_days", lambda *args: None)
+        now = datetime.utcnow().replace(microsecond=0)
+        curriculum = await seed_curriculum(db, 1, [
+            dict(exercise_type="scale", interval_days=2.0, last_reviewed_at=now),
+            dict(exercise_type="scale", interval_days=2.0, next_review_at=now),
+        ])
+        reviewed, unreviewed = curriculum.modules[0].lessons[0].exercises
+
+        updated = await AdaptiveCurriculumService(db)._scale_srs_intervals([curriculum.id], 1.5)
+        await db.commit()
+        for exercise in (reviewed, unreviewed):
+            await db.refresh(exercise, ["interval_days", "next_review_at"])
+
+        assert updated == 2
+        assert reviewed.next_review_at == now + timedelta(days=3)
+        assert (unreviewed.interval_days, unreviewed.next_review_at) == (3.0, now)
+
+    def test_postgres_uses_interval_arithmetic(self):
+        expr = adaptive_curriculum_service._add_days(
+            CurriculumExercise.last_reviewed_at, CurriculumExercise.interval_days, "postgresql"
+        )
+        sql = str(expr.compile(dialect=postgresql.dialect()))
+        assert "make_interval" in sql and "printf" not in sql
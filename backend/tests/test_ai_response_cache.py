@@ -0,0 +1,197 @@
+"""
+Tests for the shared AI response cache
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from app.services import generator_mixins
+from app.services.ai_response_cache import AIResponseCache, SQLiteCacheStore
+from app.services.generator_mixins import CachingMixin
+
+
+class TestMemoryCache:
+    """Tests for the bounded in-memory LRU"""
+
+    def test_evicts_least_recently_used(self):
+        cache = AIResponseCache(maxsize=2)
+        cache.set("a", 1, ttl_seconds=60)
+        cache.set("b", 2, ttl_seconds=60)
+        cache.get("a")
+        cache.set("c", 3, ttl_seconds=60)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.stats()["evictions"] == 1
+
+    def test_expired_entries_are_dropped(self):
+        cache = AIResponseCache(maxsize=4)
+        cache.set("a", {"x": 1}, ttl_seconds=0.01)
+        time.sleep(0.02)
+
+        assert cache.get("a") is None
+        assert cache.stats()["expired"] == 1
+        assert cache.count() == 0
+
+    def test_clear_by_prefix(self):
+        cache = AIResponseCache(maxsize=4)
+        cache.set("gospel:1", 1, ttl_seconds=60)
+        cache.set("jazz:1", 2, ttl_seconds=60)
+        cache.clear("gospel:")
+
+        assert cache.count() == 1
+        assert cache.get("jazz:1") == 2
+
+
+class TestSingleFlight:
+    """Tests for get_or_create"""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_share_one_generation(self):
+        cache = AIResponseCache(maxsize=4)
+        calls = 0
+
+        async def generate():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.02)
+            return {"plan": "ok"}
+
+        results = await asyncio.gather(*(cache.get_or_create("k", generate, ttl_seconds=60) for _ in range(5)))
+
+        assert calls == 1
+        assert all(r == {"plan": "ok"} for r in results)
+        stats = cache.stats()
+        assert stats["misses"] == 1
+        assert stats["coalesced"] == 4
+        assert stats["avg_generation_ms"] >= 15
+
+    @pytest.mark.asyncio
+    async def test_failures_reach_every_waiter_and_are_not_cached(self):
+        cache = AIResponseCache(maxsize=4)
+        calls = 0
+
+        async def generate():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            raise RuntimeError("model down")
+
+        results = await asyncio.gather(
+            *(cache.get_or_create("k", generate, ttl_seconds=60) for _ in range(3)),
+            return_exceptions=True
+        )
+
+        assert calls == 1
+        assert all(isinstance(r, RuntimeError) for r in results)
+
+        async def recover():
+            return "fresh"
+
+        assert await cache.get_or_create("k", recover, ttl_seconds=60) == "fresh"
+
+    @pytest.mark.asyncio
+    async def test_cancelled_first_caller_does_not_cancel_waiters(self):
+        cache = AIResponseCache(maxsize=4)
+
+        async def generate():
+            await asyncio.sleep(0.02)
+            return "ok"
+
+        first = asyncio.create_task(cache.get_or_create("k", generate, ttl_seconds=60))
+        await asyncio.sleep(0)
+        waiter = asyncio.create_task(cache.get_or_create("k", generate, ttl_seconds=60))
+        await asyncio.sleep(0)
+        first.cancel()
+
+        assert await waiter == "ok"
+        assert first.cancelled()
+        assert cache.get("k") == "ok"
+
+    @pytest.mark.asyncio
+    async def test_hit_skips_factory(self):
+        cache = AIResponseCache(maxsize=4)
+        cache.set("k", "cached", ttl_seconds=60)
+
+        async def generate():
+            raise AssertionError("should not run")
+
+        assert await cache.get_or_create("k", generate, ttl_seconds=60) == "cached"
+        assert cache.stats()["hits"] == 1
+
+
+class TestSharedStore:
+    """Tests for persistence shared across processes"""
+
+    @pytest.mark.asyncio
+    async def test_sqlite_entries_visible_to_other_instances(self, tmp_path):
+        path = tmp_path / "ai_cache.sqlite3"
+        first = AIResponseCache(maxsize=4, store=SQLiteCacheStore(path))
+
+        async def generate():
+            return {"chords": ["Cmaj7", "Am7"]}
+
+        await first.get_or_create("k", generate, ttl_seconds=60)
+
+        second = AIResponseCache(maxsize=4, store=SQLiteCacheStore(path))
+
+        async def unexpected():
+            raise AssertionError("should come from the store")
+
+        assert await second.get_or_create("k", unexpected, ttl_seconds=60) == {"chords": ["Cmaj7", "Am7"]}
+        assert second.stats()["store_hits"] == 1
+
+    def test_unserialisable_values_stay_in_memory(self, tmp_path):
+        path = tmp_path / "ai_cache.sqlite3"
+        cache = AIResponseCache(maxsize=4, store=SQLiteCacheStore(path))
+        marker = object()
+        cache.set("k", marker, ttl_seconds=60)
+
+        assert cache.get("k") is marker
+        assert SQLiteCacheStore(path).get("k") is None
+
+    def test_expired_store_entries_are_ignored(self, tmp_path):
+        store = SQLiteCacheStore(tmp_path / "ai_cache.sqlite3")
+        store.set("k", '"old"', expires_at=time.time() - 1)
+
+        assert AIResponseCache(maxsize=4, store=store).get("k") is None
+
+
+class FakeGenerator:
+    genre_name = "gospel"
+
+    def __init__(self):
+        self.calls = 0
+
+    async def _generate_progression_with_gemini(self, description, key, tempo, num_bars, complexity=5, style=""):
+        self.calls += 1
+        return ["Cmaj7", "Am7"], key or "C", tempo or 90, [{"symbol": "Cmaj7", "function": "I"}]
+
+    def _build_chord_analysis(self, chord_data):
+        return [dict(c) for c in chord_data]
+
+
+class CachedGenerator(CachingMixin, FakeGenerator):
+    pass
+
+
+class TestCachingMixin:
+    """Tests for generator progressions served through the shared cache"""
+
+    @pytest.mark.asyncio
+    async def test_identical_requests_share_one_generation(self, monkeypatch):
+        monkeypatch.setattr(generator_mixins, "ai_response_cache", AIResponseCache(maxsize=8))
+        generator = CachedGenerator()
+
+        first = await generator._generate_progression_with_gemini("sunday praise", "C", 90, 4)
+        first[0].append("G7")  # Callers get their own copies
+        second = await generator._generate_progression_with_gemini("sunday praise", "C", 90, 4)
+        await generator._generate_progression_with_gemini("sunday praise", "C", 90, 4, complexity=8)
+
+        assert second == (["Cmaj7", "Am7"], "C", 90, [{"symbol": "Cmaj7", "function": "I"}])
+        assert generator.calls == 2
+        assert generator.get_cache_stats()["cached_items"] == 2
+        generator.clear_cache()
+        assert generator.get_cache_stats()["cached_items"] == 0
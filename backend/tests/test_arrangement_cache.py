@@ -0,0 +1,147 @@
+"""
+Tests for seeded arrangements and the arrangement result cache
+"""
+
+import random
+
+import pytest
+
+from app.gospel import Arrangement, Note
+from app.gospel.arrangement.arranger import GospelArranger
+from app.services.arrangement_cache import ArrangementCache
+
+
+def _arrangement(tempo=90):
+    return Arrangement(
+        left_hand_notes=[Note(pitch=36, time=0.0, duration=4.0, velocity=70, hand="left")],
+        right_hand_notes=[Note(pitch=64, time=0.5, duration=0.5, velocity=90, hand="right")],
+        tempo=tempo,
+        time_signature=(4, 4),
+        key="C",
+        total_bars=1,
+        application="worship",
+    )
+
+
+def _key(**overrides):
+    params = dict(
+        genre="gospel", chords=["Cmaj7", "Am7"], key="C", tempo=90,
+        application="worship", complexity=5, seed=7,
+    )
+    params.update(overrides)
+    return ArrangementCache.make_key(**params)
+
+
+class TestSeededArrangement:
+    """Tests for arrangements driven by a per-request random.Random"""
+
+    CHORDS = ["Cmaj7", "Am7", "Fmaj7", "G7"]
+
+    def _arrange(self, rng):
+        return GospelArranger().arrange_progression(self.CHORDS, key="C", bpm=90, application="worship", rng=rng)
+
+    def test_same_seed_is_reproducible(self):
+        first = self._arrange(random.Random(11))
+        second = self._arrange(random.Random(11))
+
+        assert repr(first.left_hand_notes) == repr(second.left_hand_notes)
+        assert repr(first.right_hand_notes) == repr(second.right_hand_notes)
+
+    def test_global_draws_do_not_leak_in(self):
+        expected = self._arrange(random.Random(11))
+
+        class DrawingRandom(random.Random):
+            """Draws from the global random module between every choice"""
+
+            def random(self):
+                random.random()
+                return super().random()
+
+            def getrandbits(self, k):
+                # Also overridden so choice()/randint() keep Random's draw path
+                random.random()
+                return super().getrandbits(k)
+
+        assert repr(self._arrange(DrawingRandom(11)).right_hand_notes) == repr(expected.right_hand_notes)
+
+    def test_leaves_global_state_alone(self):
+        random.seed(3)
+        expected = random.random()
+
+        random.seed(3)
+        self._arrange(random.Random(11))
+        assert random.random() == expected
+
+
+class TestMakeKey:
+    """Tests for request fingerprints"""
+
+    def test_stable(self):
+        assert _key() == _key()
+
+    @pytest.mark.parametrize("field,value", [
+        ("genre", "jazz"),
+        ("chords", ["Am7", "Cmaj7"]),
+        ("key", "D"),
+        ("tempo", 91),
+        ("application", "uptempo"),
+        ("complexity", 6),
+        ("seed", 8),
+    ])
+    def test_sensitive_to_each_field(self, field, value):
+        assert _key(**{field: value}) != _key()
+
+    def test_genre_is_case_insensitive(self):
+        assert _key(genre="Gospel") == _key()
+
+
+class TestArrangementCache:
+    """Tests for the memory LRU and disk store"""
+
+    def test_lru_eviction(self, tmp_path):
+        cache = ArrangementCache(maxsize=2, max_disk_entries=10, cache_dir=tmp_path)
+        cache.put("a", _arrangement(), b"a")
+        cache.put("b", _arrangement(), b"b")
+        cache.get("a")
+        cache.put("c", _arrangement(), b"c")
+
+        assert set(cache._entries) == {"a", "c"}
+
+    def test_disk_round_trip(self, tmp_path):
+        arrangement = _arrangement()
+        ArrangementCache(cache_dir=tmp_path).put("k", arrangement, b"MThd")
+
+        fresh = ArrangementCache(cache_dir=tmp_path)
+        entry = fresh.get("k")
+
+        assert entry.midi_bytes == b"MThd"
+        assert entry.arrangement.left_hand_notes == arrangement.left_hand_notes
+        assert entry.arrangement.right_hand_notes == arrangement.right_hand_notes
+        assert entry.arrangement.time_signature == (4, 4)
+        assert fresh.stats()["disk_hits"] == 1
+
+    def test_miss_and_hit_counters(self, tmp_path):
+        cache = ArrangementCache(cache_dir=tmp_path)
+        assert cache.get("missing") is None
+        cache.put("k", _arrangement(), b"x")
+        cache.get("k")
+
+        stats = cache.stats()
+        assert (stats["hits"], stats["misses"]) == (1, 1)
+        assert stats["hit_rate"] == 0.5
+
+    def test_disk_trimmed_to_limit(self, tmp_path):
+        cache = ArrangementCache(maxsize=10, max_disk_entries=2, cache_dir=tmp_path)
+        for key in ("a", "b", "c"):
+            cache.put(key, _arrangement(), key.encode())
+
+        assert len(list(tmp_path.glob("*.mid"))) == 2
+        assert len(list(tmp_path.glob("*.json"))) == 2
+
+    def test_clear_disk(self, tmp_path):
+        cache = ArrangementCache(cache_dir=tmp_path)
+        cache.put("k", _arrangement(), b"x")
+        cache.clear(disk=True)
+
+        assert cache.get("k") is None
+        assert list(tmp_path.iterdir()) == []
@@ -131,10 +131,10 @@ class TestGenerationPipeline:
         return arrangement
 
     @pytest.mark.asyncio
-    @patch('app.services.base_genre_generator.export_to_midi')
+    @patch('app.services.base_genre_generator.render_midi', new_callable=AsyncMock)
     async def test_generate_without_gemini(self, mock_export, generator):
         """Should generate using fallback when Gemini unavailable."""
-        mock_export.return_value = (Path("/tmp/test.mid"), "base64data")
+        mock_export.return_value = (b"base64data", "test.mid", Path("/tmp/test.mid"))
 
         request = Mock()
         request.include_progression = True
@@ -145,15 +145,16 @@ class TestGenerationPipeline:
         request.complexity = 5
         request.style = "test"
         request.ai_percentage = 0.0
+        request.seed = None
 
         response = await generator.generate_arrangement(request)
 
         assert response.success is True
         assert response.midi_file_path == "/tmp/test.mid"
-        assert response.midi_base64 == "base64data"
+        assert response.midi_base64 == "YmFzZTY0ZGF0YQ=="
 
     @pytest.mark.asyncio
-    @patch('app.services.base_genre_generator.export_to_midi')
+    @patch('app.services.base_genre_generator.render_midi', new_callable=AsyncMock)
     @patch('app.services.base_genre_generator.parse_json_from_response')
     async def test_generate_with_gemini(self, mock_parse_json, mock_export, generator):
         """Should generate using Gemini when available."""
@@ -161,7 +162,7 @@ class TestGenerationPipeline:
         generator.gemini_model = Mock()
         mock_response = Mock()
         mock_response.text = '{"key": "C", "tempo": 120, "chords": []}'
-        generator.gemini_model.generate_content = Mock(return_value=mock_response)
+        generator.gemini_model.generate_content_async = AsyncMock(return_value=mock_response)
 
         mock_parse_json.return_value = {
             "key": "C",
@@ -171,7 +172,7 @@ class TestGenerationPipeline:
             ]
         }
 
-        mock_export.return_value = (Path("/tmp/test.mid"), "base64data")
+        mock_export.return_value = (b"base64data", "test.mid", Path("/tmp/test.mid"))
 
         request = Mock()
         request.include_progression = True
@@ -182,11 +183,12 @@ class TestGenerationPipeline:
         request.complexity = 5
         request.style = "test"
         request.ai_percentage = 0.0
+        request.seed = None
 
         response = await generator.generate_arrangement(request)
 
         assert response.success is True
-        generator.gemini_model.generate_content.assert_called_once()
+        generator.gemini_model.generate_content_async.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_generate_handles_errors_gracefully(self, generator):
@@ -202,6 +204,7 @@ class TestGenerationPipeline:
         request.complexity = 5
         request.style = "test"
         request.ai_percentage = 0.0
+        request.seed = None
 
         response = await generator.generate_arrangement(request)
 
@@ -209,6 +212,37 @@ class TestGenerationPipeline:
         assert "Test error" in response.error
         assert response.generation_method == "failed"
 
+    @pytest.mark.asyncio
+    @patch('app.services.base_genre_generator.render_midi', new_callable=AsyncMock)
+    async def test_seeded_request_served_from_cache(self, mock_export, generator, tmp_path):
+        """Identical seeded requests should arrange and render only once."""
+        from app.services.arrangement_cache import ArrangementCache
+
+        mock_export.return_value = (b"MThd", "test.mid", None)
+
+        request = Mock()
+        request.include_progression = False
+        request.description = "Test"
+        request.key = "C"
+        request.tempo = 120
+        request.complexity = 5
+        request.application = Mock(value="standard")
+        request.ai_percentage = 0.0
+        request.seed = 42
+
+        cache = ArrangementCache(cache_dir=tmp_path)
+        cache._write_disk = Mock()  # Mock arrangements are not serializable
+        with patch('app.services.base_genre_generator.arrangement_cache', cache):
+            first = await generator.generate_midi(request)
+            second = await generator.generate_midi(request)
+
+        assert first == (b"MThd", "test.mid")
+        assert second[0] == b"MThd"
+        assert second[1].startswith("test_C_120bpm_")
+        generator.arranger.arrange_progression.assert_called_once()
+        mock_export.assert_called_once()
+        assert mock_export.call_args.kwargs["seed"] == 42
+
 
 class TestProgressionGeneration:
     """Test chord progression generation."""
@@ -240,7 +274,7 @@ class TestProgressionGeneration:
         """Should generate progression using Gemini."""
         mock_response = Mock()
         mock_response.text = '{"key": "D", "tempo": 100, "chords": []}'
-        generator_with_gemini.gemini_model.generate_content = Mock(return_value=mock_response)
+        generator_with_gemini.gemini_model.generate_content_async = AsyncMock(return_value=mock_response)
 
         mock_parse_json.return_value = {
             "key": "D",
@@ -267,7 +301,7 @@ class TestProgressionGeneration:
         """Should include genre-specific context in prompt."""
         mock_response = Mock()
         mock_response.text = '{"key": "C", "tempo": 120, "chords": []}'
-        generator_with_gemini.gemini_model.generate_content = Mock(return_value=mock_response)
+        generator_with_gemini.gemini_model.generate_content_async = AsyncMock(return_value=mock_response)
 
         with patch('app.services.base_genre_generator.parse_json_from_response') as mock_parse:
             mock_parse.return_value = {"key": "C", "tempo": 120, "chords": []}
@@ -280,7 +314,7 @@ class TestProgressionGeneration:
             )
 
             # Check that style context was included
-            call_args = generator_with_gemini.gemini_model.generate_content.call_args
+            call_args = generator_with_gemini.gemini_model.generate_content_async.call_args
             prompt = call_args[0][0]
             assert "Test genre style context" in prompt
 
@@ -407,6 +441,7 @@ class TestResponseBuilding:
         request.complexity = 5
         request.style = "test"
         request.ai_percentage = 0.0
+        request.seed = None
 
         response = generator._build_success_response(
             midi_path=Path("/tmp/test.mid"),
@@ -462,6 +497,7 @@ class TestGenerationMethod:
         request.complexity = 5
         request.style = "test"
         request.ai_percentage = 0.0
+        request.seed = None
 
         method = generator._determine_generation_method(request)
         assert method == "gemini+rules"
@@ -476,6 +512,7 @@ class TestGenerationMethod:
         request.complexity = 5
         request.style = "test"
         request.ai_percentage = 0.0
+        request.seed = None
 
         method = generator._determine_generation_method(request)
         assert method == "rules-only"
@@ -486,7 +523,7 @@ class TestBaseGeneratorIntegration:
     """Test base generator with realistic scenarios."""
 
     @pytest.mark.asyncio
-    @patch('app.services.base_genre_generator.export_to_midi')
+    @patch('app.services.base_genre_generator.render_midi', new_callable=AsyncMock)
     @patch('app.services.base_genre_generator.settings')
     async def test_full_generation_flow(self, mock_settings, mock_export):
         """Test complete generation from request to response."""
@@ -509,7 +546,7 @@ class TestBaseGeneratorIntegration:
         mock_arranger.arrange_progression.return_value = mock_arrangement
         mock_arranger_class.return_value = mock_arranger
 
-        mock_export.return_value = (Path("/tmp/test.mid"), "YmFzZTY0ZGF0YQ==")
+        mock_export.return_value = (b"base64data", "test.mid", Path("/tmp/test.mid"))
 
         # Create generator
         generator = TestGenreGenerator(
@@ -532,6 +569,7 @@ class TestBaseGeneratorIntegration:
         request.complexity = 5
         request.style = "test"
         request.ai_percentage = 0.0
+        request.seed = None
 
         # Generate
         response = await generator.generate_arrangement(request)
@@ -0,0 +1,205 @@
+"""
+Tests for batch arrangement generation, render jobs and the async rate limiter
+"""
+
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import pytest
+
+from app.gospel.arrangement.arranger import GospelArranger
+from app.schemas.batch import BatchArrangementItem
+from app.schemas.gospel import GenerateGospelRequest
+from app.services.base_genre_generator import BaseGenreGenerator
+from app.services.batch_arrangement import BatchArrangementService
+from app.services.generator_utils import RenderJob, run_render_job
+from app.utils.rate_limiter import AsyncRateLimiter
+
+
+class _GospelGenerator(BaseGenreGenerator):
+    """Rule-based gospel generator without Gemini or the local LLM mixins."""
+
+    def _get_style_context(self, complexity: int = 5, style: str = "") -> str:
+        return "gospel"
+
+    def _get_default_progression(self, key: str):
+        return [f"{key}maj7", "Am7", "Dm7", "G7"]
+
+    def get_status(self):
+        return {"ready": True}
+
+
+@pytest.fixture
+def generator():
+    with patch('app.services.base_genre_generator.settings') as mock_settings:
+        mock_settings.google_api_key = None
+        return _GospelGenerator(
+            genre_name="Gospel",
+            arranger_class=GospelArranger,
+            request_schema=GenerateGospelRequest,
+            response_schema=dict,
+            status_schema=dict,
+            output_subdir="gospel_test"
+        )
+
+
+def _job(seed=5):
+    return RenderJob(
+        arranger_class=GospelArranger,
+        arrange_params=dict(chords=["Cmaj7", "Am7", "Dm7", "G7"], key="C", bpm=90, application="worship"),
+        genre="gospel",
+        seed=seed
+    )
+
+
+def _items(*requests):
+    return [BatchArrangementItem(genre="gospel", request=r) for r in requests]
+
+
+async def _collect(service, items, **kwargs):
+    return [result async for result in service.generate(items, **kwargs)]
+
+
+class TestRenderJob:
+    """Tests for the worker-process render function"""
+
+    def test_seeded_job_is_reproducible(self):
+        first_arrangement, first_midi = run_render_job(_job())
+        second_arrangement, second_midi = run_render_job(_job())
+
+        assert first_midi == second_midi
+        assert first_midi.startswith(b"MThd")
+        assert repr(first_arrangement.right_hand_notes) == repr(second_arrangement.right_hand_notes)
+
+    @pytest.mark.asyncio
+    async def test_matches_in_process_render(self, generator):
+        request = GenerateGospelRequest(description="worship in C", seed=5)
+        chords = ["Cmaj7", "Am7", "Dm7", "G7"]
+
+        with patch('app.services.base_genre_generator.arrangement_cache.get', return_value=None), \
+                patch('app.services.base_genre_generator.arrangement_cache.put'):
+            _, local_midi, _, _ = await generator._render_progression(chords, "C", 90, request, persist=False)
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                _, pooled_midi, _, _ = await generator._render_progression(
+                    chords, "C", 90, request, persist=False, executor=executor
+                )
+
+        assert pooled_midi == local_midi
+
+    def test_ai_blend_stays_in_process(self, generator):
+        request = GenerateGospelRequest(description="worship in C", ai_percentage=0.5)
+        assert generator._render_job(["Cmaj7"], "C", 90, request) is None
+
+
+class TestAsyncRateLimiter:
+    """Tests for the sliding-window limiter"""
+
+    @pytest.mark.asyncio
+    async def test_limits_calls_per_window(self):
+        limiter = AsyncRateLimiter(max_calls=2, period=0.2)
+        start = time.monotonic()
+        for _ in range(3):
+            async with limiter:
+                pass
+
+        assert time.monotonic() - start >= 0.18
+
+    @pytest.mark.asyncio
+    async def test_caps_concurrency(self):
+        limiter = AsyncRateLimiter(max_calls=100, max_concurrent=2)
+        in_flight = peak = 0
+
+        async def call():
+            nonlocal in_flight, peak
+            async with limiter:
+                in_flight += 1
+                peak = max(peak, in_flight)
+                await asyncio.sleep(0.01)
+                in_flight -= 1
+
+        await asyncio.gather(*(call() for _ in range(6)))
+        assert peak == 2
+
+    def test_rejects_invalid_limits(self):
+        with pytest.raises(ValueError):
+            AsyncRateLimiter(max_calls=0)
+
+
+class TestBatchArrangementService:
+    """Tests for concurrent batch generation"""
+
+    @pytest.mark.asyncio
+    async def test_generates_every_item(self, generator):
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            service = BatchArrangementService(executor=executor, generators={"gospel": generator})
+            results = await _collect(service, _items(
+                {"description": "worship in Eb", "num_bars": 4, "seed": 1},
+                {"description": "upbeat praise in G", "num_bars": 4, "seed": 2},
+                {"description": "slow ballad in C", "num_bars": 4},
+            ), include_midi=True)
+
+        assert sorted(r.index for r in results) == [0, 1, 2]
+        assert all(r.success and r.midi_base64 for r in results)
+
+    @pytest.mark.asyncio
+    async def test_failed_item_does_not_abort_batch(self, generator):
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            service = BatchArrangementService(executor=executor, generators={"gospel": generator})
+            results = await _collect(service, _items(
+                {"num_bars": 4},
+                {"description": "worship in F", "num_bars": 4},
+            ), include_midi=False)
+
+        by_index = {r.index: r for r in results}
+        assert not by_index[0].success
+        assert "Invalid request" in by_index[0].error
+        assert by_index[1].success
+        assert by_index[1].midi_base64 is None
+
+    @pytest.mark.asyncio
+    async def test_results_stream_in_completion_order(self, generator):
+        async def prepare(request):
+            # The first item's progression takes longest
+            await asyncio.sleep(0.05 if request.description == "slow" else 0)
+            return ["Cmaj7", "G7"], "C", 90, []
+
+        generator._prepare_progression = prepare
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            service = BatchArrangementService(executor=executor, generators={"gospel": generator})
+            results = await _collect(service, _items(
+                {"description": "slow"},
+                {"description": "fast"},
+            ))
+
+        assert [r.index for r in results] == [1, 0]
+
+    @pytest.mark.asyncio
+    async def test_llm_progressions_are_rate_limited(self, generator):
+        in_flight = peak = 0
+
+        async def prepare(request):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return ["Cmaj7"], "C", 90, []
+
+        generator._prepare_progression = prepare
+        generator.uses_llm_progression = lambda request: True
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            service = BatchArrangementService(
+                executor=executor,
+                generators={"gospel": generator},
+                llm_max_concurrency=2
+            )
+            results = await _collect(service, _items(*({"description": f"item {i}"} for i in range(6))))
+
+        assert len(results) == 6
+        assert peak == 2
+
+    def test_unknown_genre_raises(self):
+        with pytest.raises(ValueError, match="Unknown genre"):
+            BatchArrangementService(executor=ThreadPoolExecutor()).get_generator("polka")
@@ -0,0 +1,272 @@
+"""
+Tests for the curriculum daily practice queue, progress tracking and cloning
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import event, select, update
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.database.models import Base, User
+from app.database.curriculum_models import (
+    Curriculum, CurriculumModule, CurriculumLesson, CurriculumExercise
+)
+from app.services.curriculum_service import CurriculumService, practice_queue_cache
+
+TEST_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
+
+
+@pytest_asyncio.fixture
+async def db():
+    """In-memory database with every table created."""
+    engine = create_async_engine(TEST_DATABASE_URL, echo=False)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    session_factory = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    practice_queue_cache.clear()
+    async with session_factory() as session:
+        session.info["engine"] = engine
+        yield session
+    practice_queue_cache.clear()
+    await engine.dispose()
+
+
+async def seed_curriculum(db, user_id=1, status="active"):
+    """One module, two lessons; exercises overdue, due today, new and mastered."""
+    now = datetime.utcnow()
+    if await db.get(User, user_id) is None:
+        db.add(User(id=user_id, email=f"user{user_id}@example.com", hashed_password="x"))
+    curriculum = Curriculum(user_id=user_id, title="Gospel Foundations", status=status)
+    module = CurriculumModule(title="Module 1", theme="gospel", order_index=0, start_week=1, end_week=2)
+    week1 = CurriculumLesson(title="Week 1", week_number=1)
+    week2 = CurriculumLesson(title="Week 2", week_number=2)
+    week1.exercises = [
+        CurriculumExercise(title="new", exercise_type="scale", order_index=0),
+        CurriculumExercise(title="due_today", exercise_type="scale", order_index=1,
+                           next_review_at=now.replace(hour=23, minute=59, second=0)),
+        CurriculumExercise(title="mastered", exercise_type="scale", order_index=2,
+                           is_mastered=True, next_review_at=now - timedelta(days=3)),
+    ]
+    week2.exercises = [
+        CurriculumExercise(title="overdue", exercise_type="voicing", order_index=0,
+                           next_review_at=now - timedelta(days=2)),
+        CurriculumExercise(title="next_week", exercise_type="voicing", order_index=1,
+                           next_review_at=now + timedelta(days=7)),
+    ]
+    module.lessons = [week1, week2]
+    curriculum.modules = [module]
+    db.add(curriculum)
+    await db.commit()
+    return curriculum
+
+
+class TestDailyPractice:
+    """Tests for get_daily_practice"""
+
+    @pytest.mark.asyncio
+    async def test_orders_overdue_then_due_then_new(self, db):
+        await seed_curriculum(db)
+        items = await CurriculumService(db).get_daily_practice(user_id=1)
+
+        assert [item['exercise'].title for item in items] == ["overdue", "due_today", "new"]
+        assert [item['priority'] for item in items] == [1, 2, 3]
+        assert items[0]['lesson_title'] == "Week 2"
+        assert items[0]['module_title'] == "Module 1"
+
+    @pytest.mark.asyncio
+    async def test_limit_applies_after_priority(self, db):
+        await seed_curriculum(db)
+        items = await CurriculumService(db).get_daily_practice(user_id=1, limit=1)
+
+        assert [item['exercise'].title for item in items] == ["overdue"]
+
+    @pytest.mark.asyncio
+    async def test_only_active_curriculum_counts(self, db):
+        await seed_curriculum(db, status="paused")
+        assert await CurriculumService(db).get_daily_practice(user_id=1) == []
+
+    @pytest.mark.asyncio
+    async def test_completing_an_exercise_refreshes_cached_queue(self, db):
+        await seed_curriculum(db)
+        service = CurriculumService(db)
+        items = await service.get_daily_practice(user_id=1)
+        overdue = items[0]['exercise']
+
+        await service.complete_exercise(overdue.id, quality=5)
+        items = await service.get_daily_practice(user_id=1)
+
+        assert "overdue" not in [item['exercise'].title for item in items]
+
+    @pytest.mark.asyncio
+    async def test_cached_queue_reloads_exercises(self, db):
+        await seed_curriculum(db)
+        service = CurriculumService(db)
+        first = await service.get_daily_practice(user_id=1)
+        overdue = first[0]['exercise']
+
+        # Cache holds plain rows, not ORM instances
+        cached = practice_queue_cache.get(1, 20)
+        assert cached[0] == {
+            'exercise_id': overdue.id, 'lesson_title': "Week 2", 'module_title': "Module 1", 'priority': 1,
+        }
+
+        # Mastered elsewhere (e.g. another worker) without invalidating this process's cache
+        await db.execute(
+            update(CurriculumExercise).where(CurriculumExercise.id == overdue.id).values(is_mastered=True)
+        )
+        await db.commit()
+        items = await service.get_daily_practice(user_id=1)
+
+        assert [item['exercise'].title for item in items] == ["due_today", "new"]
+
+
+async def refresh_counters(db, curriculum):
+    """Reload counter columns (the service updates them in SQL)."""
+    module = curriculum.modules[0]
+    await db.refresh(module, ["lessons_total", "lessons_completed", "completion_percentage"])
+    for lesson in module.lessons:
+        await db.refresh(lesson, ["exercises_total", "exercises_mastered", "is_completed"])
+    return module
+
+
+class TestCompletionCounters:
+    """Tests for the lesson/module completion counters"""
+
+    @pytest.mark.asyncio
+    async def test_recompute_rebuilds_counters(self, db):
+        curriculum = await seed_curriculum(db)
+        updated = await CurriculumService(db).recompute_completion_counters()
+        module = await refresh_counters(db, curriculum)
+        week1, week2 = module.lessons
+
+        assert updated == {"lessons": 2, "modules": 1}
+        assert (week1.exercises_total, week1.exercises_mastered) == (3, 1)
+        assert (week2.exercises_total, week2.exercises_mastered) == (2, 0)
+        assert (module.lessons_total, module.lessons_completed) == (2, 0)
+
+    @pytest.mark.asyncio
+    async def test_mastering_last_exercise_completes_lesson_and_module(self, db):
+        curriculum = await seed_curriculum(db)
+        service = CurriculumService(db)
+        await service.recompute_completion_counters(curriculum.id)
+        week2 = curriculum.modules[0].lessons[1]
+        for exercise in week2.exercises:
+            exercise.repetition_count = 5
+        await db.commit()
+
+        for exercise in week2.exercises:
+            await service.complete_exercise(exercise.id, quality=5)
+            await service.complete_exercise(exercise.id, quality=5)  # Already mastered: not counted twice
+        module = await refresh_counters(db, curriculum)
+
+        assert week2.exercises_mastered == 2
+        assert week2.is_completed
+        assert module.lessons_completed == 1
+        assert module.completion_percentage == 50.0
+
+    @pytest.mark.asyncio
+    async def test_lesson_without_counted_exercises_never_completes(self, db):
+        curriculum = await seed_curriculum(db)  # Counters left at 0 (never backfilled)
+        exercise = curriculum.modules[0].lessons[1].exercises[0]
+        exercise.repetition_count = 5
+        await db.commit()
+
+        await CurriculumService(db).complete_exercise(exercise.id, quality=5)
+        module = await refresh_counters(db, curriculum)
+
+        assert not module.lessons[1].is_completed
+        assert module.lessons_completed == 0
+
+    @pytest.mark.asyncio
+    async def test_completion_cost_is_constant(self, db):
+        curriculum = await seed_curriculum(db)
+        service = CurriculumService(db)
+        await service.recompute_completion_counters()
+        exercise = curriculum.modules[0].lessons[1].exercises[0]
+        exercise.repetition_count = 5
+        await db.commit()
+
+        statements = []
+        engine = db.info["engine"].sync_engine
+        listener = lambda conn, cursor, statement, *args: statements.append(statement)
+        event.listen(engine, "before_cursor_execute", listener)
+        try:
+            await service.complete_exercise(exercise.id, quality=5)
+        finally:
+            event.remove(engine, "before_cursor_execute", listener)
+
+        # select, exercise update, two lesson updates, refresh; no lesson/module collections loaded
+        assert len(statements) <= 5
+        assert not any("FROM curriculum_modules" in s and s.lstrip().startswith("SELECT") for s in statements)
+
+
+class TestCloneCurriculum:
+    """Tests for activating (cloning) another user's curriculum"""
+
+    async def _clone(self, db, share_content=False):
+        template = await seed_curriculum(db, user_id=99)
+        template.modules[0].lessons[0].exercises[0].content_json = '{"chords": ["Dm7", "G7", "Cmaj7"]}'
+        await db.commit()
+        service = CurriculumService(db)
+        clone = await service._clone_curriculum(template, new_owner_id=1, share_content=share_content)
+        return template, await service.get_curriculum_with_details(clone.id)
+
+    @pytest.mark.asyncio
+    async def test_copies_tree_with_new_ids_and_fresh_progress(self, db):
+        template, clone = await self._clone(db)
+        source_ids = {ex.id for lesson in template.modules[0].lessons for ex in lesson.exercises}
+
+        assert clone.user_id == 1
+        assert [m.title for m in clone.modules] == ["Module 1"]
+        module = clone.modules[0]
+        assert [l.title for l in module.lessons] == ["Week 1", "Week 2"]
+        assert module.lessons_total == 2
+        exercises = [ex for lesson in module.lessons for ex in lesson.exercises]
+        assert [ex.title for ex in exercises] == ["new", "due_today", "mastered", "overdue", "next_week"]
+        assert not source_ids & {ex.id for ex in exercises}
+        assert not any(ex.is_mastered for ex in exercises)
+        assert [l.exercises_total for l in module.lessons] == [3, 2]
+        assert exercises[0].content_json == '{"chords": ["Dm7", "G7", "Cmaj7"]}'
+        assert exercises[0].content_source_id is None
+
+    @pytest.mark.asyncio
+    async def test_shared_content_points_at_template(self, db):
+        template, clone = await self._clone(db, share_content=True)
+        source = template.modules[0].lessons[0].exercises[0]
+        cloned = clone.modules[0].lessons[0].exercises[0]
+
+        assert cloned.content_json == "{}"
+        assert cloned.content_source_id == source.id
+        assert cloned.effective_content_json == '{"chords": ["Dm7", "G7", "Cmaj7"]}'
+
+    @pytest.mark.asyncio
+    async def test_clone_of_clone_shares_original_content(self, db):
+        template, clone = await self._clone(db, share_content=True)
+        second = await CurriculumService(db)._clone_curriculum(clone, new_owner_id=2, share_content=True)
+        second = await CurriculumService(db).get_curriculum_with_details(second.id)
+
+        assert (
+            second.modules[0].lessons[0].exercises[0].content_source_id
+            == template.modules[0].lessons[0].exercises[0].id
+        )
+
+    @pytest.mark.asyncio
+    async def test_deleting_template_copies_shared_content_into_clones(self, db):
+        template, clone = await self._clone(db, share_content=True)
+        cloned_id = clone.modules[0].lessons[0].exercises[0].id
+        service = CurriculumService(db)
+
+        assert await service.delete_curriculum(template.id)
+        assert not await service.delete_curriculum(template.id)
+
+        cloned = (await db.execute(
+            select(CurriculumExercise)
+            .where(CurriculumExercise.id == cloned_id)
+            .execution_options(populate_existing=True)
+        )).scalar_one()
+        assert await db.get(Curriculum, template.id) is None
+        assert cloned.content_source_id is None
+        assert cloned.effective_content_json == '{"chords": ["Dm7", "G7", "Cmaj7"]}'
@@ -0,0 +1,92 @@
+"""
+Tests for the shared engine factory and the Celery task runtime
+"""
+
+import asyncio
+
+import pytest
+from sqlalchemy import text
+
+from app.core.config import settings
+from app.database.engine import create_engine, get_database_url
+from app.tasks.runtime import _WorkerRuntime
+
+
+@pytest.fixture
+def database_url(tmp_path, monkeypatch):
+    url = f"sqlite+aiosqlite:///{tmp_path}/test.db"
+    monkeypatch.setattr(settings, "database_url", url)
+    return url
+
+
+async def pragmas(engine):
+    async with engine.connect() as conn:
+        return [
+            (await conn.execute(text(f"PRAGMA {name}"))).scalar()
+            for name in ("journal_mode", "busy_timeout", "synchronous", "mmap_size")
+        ]
+
+
+class TestCreateEngine:
+    """Tests for create_engine"""
+
+    def test_url_from_settings(self, database_url):
+        assert get_database_url() == database_url
+
+    @pytest.mark.asyncio
+    async def test_sqlite_pragmas_on_connect(self, database_url):
+        engine = create_engine()
+        try:
+            assert await pragmas(engine) == [
+                "wal", settings.sqlite_busy_timeout_ms, 1, settings.sqlite_mmap_size
+            ]
+        finally:
+            await engine.dispose()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_writers_wait_instead_of_failing(self, database_url):
+        api, worker = create_engine(), create_engine()
+        try:
+            async with api.begin() as conn:
+                await conn.execute(text("CREATE TABLE counter (n INTEGER)"))
+
+            async def write(engine, n):
+                async with engine.begin() as conn:
+                    await conn.execute(text("INSERT INTO counter VALUES (:n)"), {"n": n})
+                    await asyncio.sleep(0.05)  # Hold the write lock
+
+            await asyncio.gather(*(write(engine, i) for i in range(5) for engine in (api, worker)))
+
+            async with api.connect() as conn:
+                assert (await conn.execute(text("SELECT COUNT(*) FROM counter"))).scalar() == 10
+        finally:
+            await api.dispose()
+            await worker.dispose()
+
+
+class TestWorkerRuntime:
+    """Tests for the per-process task runtime"""
+
+    def test_loop_and_engine_persist_across_tasks(self, database_url):
+        runtime = _WorkerRuntime()
+
+        async def current():
+            async with runtime.session() as session:
+                await session.execute(text("SELECT 1"))
+            return asyncio.get_running_loop()
+
+        try:
+            engine = runtime.engine
+            assert runtime.run(current()) is runtime.run(current())
+            assert runtime.engine is engine
+        finally:
+            runtime.shutdown()
+
+    def test_rebuilt_after_fork(self, database_url):
+        runtime = _WorkerRuntime()
+        try:
+            engine = runtime.engine
+            runtime._local.pid = -1  # As seen from a forked child
+            assert runtime.engine is not engine
+        finally:
+            runtime.shutdown()
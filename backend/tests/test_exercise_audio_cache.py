@@ -0,0 +1,175 @@
+"""
+Tests for content-hash deduplicated exercise audio rendering
+"""
+
+import json
+from pathlib import Path
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.database.models import Base
+from app.database.curriculum_models import CurriculumExercise
+from app.services.audio_pipeline_service import audio_pipeline_service
+from app.services.midi_generation_service import midi_generation_service
+from app.services.exercise_audio_cache import ExerciseAudioCache, render_exercise_batch
+
+TEST_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
+
+
+@pytest_asyncio.fixture
+async def db():
+    """In-memory database with every table created."""
+    engine = create_async_engine(TEST_DATABASE_URL, echo=False)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    session_factory = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    async with session_factory() as session:
+        session.info["engine"] = engine
+        yield session
+    await engine.dispose()
+
+
+@pytest.fixture
+def renders(tmp_path, monkeypatch):
+    """Fake MIDI/audio renderers that write small files and record calls."""
+    calls = []
+
+    async def fake_midi(exercise):
+        calls.append(exercise.id)
+        path = tmp_path / f"{exercise.id}.mid"
+        path.write_bytes(b"MThd")
+        return path
+
+    async def fake_audio(exercise, method, midi_path):
+        path = tmp_path / f"{exercise.id}_fluidsynth.wav"
+        path.write_bytes(b"RIFF")
+        return {"fluidsynth": path, "stable_audio": None}
+
+    monkeypatch.setattr(midi_generation_service, "generate_exercise_midi", fake_midi)
+    monkeypatch.setattr(audio_pipeline_service, "generate_exercise_audio", fake_audio)
+    return calls
+
+
+async def add_exercises(db, *contents):
+    exercises = [
+        CurriculumExercise(id=f"ex{i}", lesson_id="lesson", title=f"ex{i}", order_index=i,
+                           exercise_type="progression", content_json=json.dumps(content), target_bpm=90)
+        for i, content in enumerate(contents)
+    ]
+    db.add_all(exercises)
+    await db.commit()
+    return exercises
+
+
+class TestRenderExerciseBatch:
+    """Tests for render_exercise_batch"""
+
+    @pytest.mark.asyncio
+    async def test_identical_content_renders_once(self, db, tmp_path, renders):
+        ii_v_i = {"chords": ["Dm7", "G7", "Cmaj7"], "key": "C"}
+        exercises = await add_exercises(db, ii_v_i, {"chords": ["Fmaj7"], "key": "F"}, ii_v_i)
+        cache = ExerciseAudioCache(cache_dir=tmp_path / "cache")
+
+        summary = await render_exercise_batch(db, [ex.id for ex in exercises], "fluidsynth", cache=cache)
+
+        assert summary == {"rendered": 2, "cached": 0, "failed": 0, "deferred": []}
+        assert len(renders) == 2
+        first, _, third = exercises
+        assert first.audio_generation_status == third.audio_generation_status == "complete"
+        assert first.midi_file_path == third.midi_file_path
+        assert first.audio_files_json == third.audio_files_json
+        assert Path(first.midi_file_path).parent.parent == tmp_path / "cache"
+        assert Path(first.midi_file_path).exists()
+
+    @pytest.mark.asyncio
+    async def test_second_batch_hits_cache(self, db, tmp_path, renders):
+        content = {"chords": ["Cmaj7"], "key": "C"}
+        first, second = await add_exercises(db, content, content)
+        cache = ExerciseAudioCache(cache_dir=tmp_path / "cache")
+
+        await render_exercise_batch(db, [first.id], "fluidsynth", cache=cache)
+        summary = await render_exercise_batch(db, [second.id], "fluidsynth", cache=cache)
+
+        assert summary["cached"] == 1
+        assert renders == [first.id]
+        assert second.midi_file_path == first.midi_file_path
+        assert cache.stats()["hit_rate"] == 0.5
+
+    @pytest.mark.asyncio
+    async def test_claimed_content_is_deferred(self, db, tmp_path, renders):
+        (exercise,) = await add_exercises(db, {"chords": ["Cmaj7"]})
+        cache = ExerciseAudioCache(cache_dir=tmp_path / "cache")
+        key = cache.make_key(exercise, "fluidsynth")
+        assert cache.claim(key)  # Another worker is rendering
+
+        summary = await render_exercise_batch(db, [exercise.id], "fluidsynth", cache=cache)
+
+        assert summary["deferred"] == [exercise.id]
+        assert renders == []
+        cache.release(key)
+        assert cache.claim(key)
+
+    def test_expired_lock_is_broken(self, tmp_path):
+        cache = ExerciseAudioCache(cache_dir=tmp_path / "cache", lock_timeout=-1)
+        assert cache.claim("key")
+        assert cache.claim("key")
+
+    @pytest.mark.asyncio
+    async def test_failed_render_marks_group_failed(self, db, tmp_path, renders, monkeypatch):
+        async def broken(exercise):
+            raise RuntimeError("no soundfont")
+
+        monkeypatch.setattr(midi_generation_service, "generate_exercise_midi", broken)
+        exercises = await add_exercises(db, {"chords": ["C"]}, {"chords": ["C"]})
+        cache = ExerciseAudioCache(cache_dir=tmp_path / "cache")
+
+        summary = await render_exercise_batch(db, [ex.id for ex in exercises], "fluidsynth", cache=cache)
+
+        assert summary["failed"] == 2
+        assert {ex.audio_generation_status for ex in exercises} == {"failed"}
+        assert cache.claim(cache.make_key(exercises[0], "fluidsynth"))  # Lock released
+
+    @pytest.mark.asyncio
+    async def test_failed_commit_does_not_abort_later_groups(self, db, tmp_path, renders):
+        exercises = await add_exercises(db, {"chords": ["C"]}, {"chords": ["C"]}, {"chords": ["F"]})
+        cache = ExerciseAudioCache(cache_dir=tmp_path / "cache")
+        failures = []
+
+        def fail_first_update(conn, cursor, statement, *args):
+            if statement.startswith("UPDATE curriculum_exercises") and not failures:
+                failures.append(statement)
+                raise RuntimeError("database went away")
+
+        engine = db.info["engine"].sync_engine
+        event.listen(engine, "before_cursor_execute", fail_first_update)
+        try:
+            summary = await render_exercise_batch(db, [ex.id for ex in exercises], "fluidsynth", cache=cache)
+        finally:
+            event.remove(engine, "before_cursor_execute", fail_first_update)
+
+        assert summary == {"rendered": 1, "cached": 0, "failed": 2, "deferred": []}
+        assert [ex.audio_generation_status for ex in exercises] == ["failed", "failed", "complete"]
+
+    @pytest.mark.asyncio
+    async def test_forced_render_replaces_files_in_place(self, db, tmp_path, renders, monkeypatch):
+        (exercise,) = await add_exercises(db, {"chords": ["Cmaj7"]})
+        cache = ExerciseAudioCache(cache_dir=tmp_path / "cache")
+        await render_exercise_batch(db, [exercise.id], "fluidsynth", cache=cache)
+        old_midi = Path(exercise.midi_file_path)
+
+        async def rerender(exercise):
+            assert old_midi.exists()  # Still served while the new render runs
+            path = tmp_path / "rerender.mid"
+            path.write_bytes(b"MThd-new")
+            return path
+
+        monkeypatch.setattr(midi_generation_service, "generate_exercise_midi", rerender)
+        summary = await render_exercise_batch(db, [exercise.id], "fluidsynth", force=True, cache=cache)
+
+        assert summary["rendered"] == 1
+        assert Path(exercise.midi_file_path) == old_midi
+        assert old_midi.read_bytes() == b"MThd-new"
@@ -0,0 +1,178 @@
+"""
+Tests for precomputed exercise recommendation snapshots
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.database.models import (
+    Base, User, CurriculumLibrary, ExerciseLibrary, UserExerciseProgress, UserRecommendationSnapshot
+)
+from app.services.exercise_recommendation_service import (
+    ExerciseRecommendationService,
+    recommendation_snapshot_stats,
+)
+from app.services.spaced_repetition_service import SpacedRepetitionService
+
+TEST_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
+
+
+@pytest_asyncio.fixture
+async def db():
+    """In-memory database with every table created."""
+    engine = create_async_engine(TEST_DATABASE_URL, echo=False)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    session_factory = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    recommendation_snapshot_stats.reset()
+    async with session_factory() as session:
+        session.info["engine"] = engine
+        yield session
+    await engine.dispose()
+
+
+async def seed_library(db):
+    """Six library exercises; one overdue review, one due tomorrow, one weak."""
+    now = datetime.utcnow()
+    db.add(User(id=1, email="user1@example.com", hashed_password="x"))
+    db.add(CurriculumLibrary(id="lib", title="Library"))
+    db.add_all([
+        ExerciseLibrary(id=f"ex{i}", curriculum_id="lib", title=f"Exercise {i}",
+                        exercise_type="scale", difficulty="beginner")
+        for i in range(6)
+    ])
+    db.add_all([
+        UserExerciseProgress(user_id=1, exercise_id="ex0", times_practiced=1, total_practice_time_seconds=0,
+                             next_review=now - timedelta(days=5), repetitions=2),
+        UserExerciseProgress(user_id=1, exercise_id="ex1", times_practiced=1, total_practice_time_seconds=0,
+                             next_review=now + timedelta(days=1), repetitions=1),
+        UserExerciseProgress(user_id=1, exercise_id="ex2", times_practiced=4, total_practice_time_seconds=0,
+                             avg_score=35.0, next_review=now + timedelta(days=3)),
+    ])
+    await db.commit()
+
+
+class TestRecommendationSnapshots:
+    """Tests for snapshot-backed get_recommended_exercises"""
+
+    @pytest.mark.asyncio
+    async def test_first_read_builds_snapshot(self, db):
+        await seed_library(db)
+        recs = await ExerciseRecommendationService(db).get_recommended_exercises(user_id=1, limit=10)
+
+        ids = [r["exercise_id"] for r in recs]
+        assert ids[0] == "ex0"
+        assert recs[0]["priority"] == "urgent"
+        assert "ex1" not in ids[:4]  # Not due yet
+        assert "ex2" in ids  # Weak area
+        assert len(ids) == len(set(ids))
+        assert await db.get(UserRecommendationSnapshot, 1) is not None
+        assert recommendation_snapshot_stats.stats()["rebuilds"]["missing"] == 1
+
+    @pytest.mark.asyncio
+    async def test_fresh_snapshot_is_one_query(self, db):
+        await seed_library(db)
+        service = ExerciseRecommendationService(db)
+        first = await service.get_recommended_exercises(user_id=1)
+
+        statements = []
+        engine = db.info["engine"].sync_engine
+        listener = lambda conn, cursor, statement, *args: statements.append(statement)
+        event.listen(engine, "before_cursor_execute", listener)
+        try:
+            second = await service.get_recommended_exercises(user_id=1)
+        finally:
+            event.remove(engine, "before_cursor_execute", listener)
+
+        assert len(statements) == 1
+        assert [r["exercise_id"] for r in second] == [r["exercise_id"] for r in first]
+        stats = recommendation_snapshot_stats.stats()
+        assert (stats["hits"], stats["misses"], stats["hit_rate"]) == (1, 1, 0.5)
+
+    @pytest.mark.asyncio
+    async def test_progress_change_marks_snapshot_stale(self, db, monkeypatch):
+        await seed_library(db)
+        service = ExerciseRecommendationService(db)
+        await service.get_recommended_exercises(user_id=1)
+        queued = []
+        monkeypatch.setattr(ExerciseRecommendationService, "_schedule_refresh", staticmethod(queued.append))
+
+        await SpacedRepetitionService(db).mark_as_reviewed_many(1, [("ex0", 5)])
+        metrics = await service.get_snapshot_metrics()
+        assert metrics["stale_snapshots"] == 1
+
+        # The stale snapshot is served as is; the rebuild is queued
+        recs = await service.get_recommended_exercises(user_id=1)
+        assert recs[0]["exercise_id"] == "ex0"
+        assert queued == [1]
+        assert (await db.get(UserRecommendationSnapshot, 1)).is_stale
+        assert recommendation_snapshot_stats.stats()["rebuilds"]["stale"] == 1
+
+        # What the queued task runs; a second run finds the snapshot fresh
+        assert await service.refresh_snapshot_if_outdated(1)
+        assert not await service.refresh_snapshot_if_outdated(1)
+        recs = await service.get_recommended_exercises(user_id=1)
+        assert recs[0]["exercise_id"] != "ex0"
+        assert queued == [1]
+
+    @pytest.mark.asyncio
+    async def test_refresh_stale_snapshots(self, db):
+        await seed_library(db)
+        service = ExerciseRecommendationService(db)
+        await service.get_recommended_exercises(user_id=1)
+        assert await service.refresh_stale_snapshots() == 0
+
+        snapshot = await db.get(UserRecommendationSnapshot, 1)
+        snapshot.refreshed_at = datetime.utcnow() - timedelta(days=1)
+        await db.commit()
+
+        assert await service.refresh_stale_snapshots() == 1
+        metrics = await service.get_snapshot_metrics()
+        assert metrics["snapshots"] == 1
+        assert metrics["oldest_snapshot_age_seconds"] < 60
+        assert metrics["background_refreshes"] == 1
+
+    @pytest.mark.asyncio
+    async def test_genre_filter(self, db):
+        await seed_library(db)
+        (await db.get(CurriculumLibrary, "lib")).genre = "gospel"
+        db.add(CurriculumLibrary(id="jazz", title="Jazz", genre="Jazz"))
+        db.add(ExerciseLibrary(id="jazz0", curriculum_id="jazz", title="ii-V-I",
+                               exercise_type="progression", difficulty="beginner"))
+        await db.commit()
+        service = ExerciseRecommendationService(db)
+
+        jazz = await service.get_recommended_exercises(user_id=1, genre="jazz")
+        gospel = await service.get_recommended_exercises(user_id=1, limit=10, genre="Gospel")
+
+        assert [r["exercise_id"] for r in jazz] == ["jazz0"]
+        assert gospel[0]["exercise_id"] == "ex0"
+        assert {r["genre"] for r in gospel} == {"gospel"}
+
+    @pytest.mark.asyncio
+    async def test_concurrent_first_build_updates_existing_row(self, db, monkeypatch):
+        await seed_library(db)
+        service = ExerciseRecommendationService(db)
+        db.add(UserRecommendationSnapshot(user_id=1, pools_json="{}", is_stale=True))
+        await db.commit()
+        db.expunge_all()
+
+        # The other request's insert lands after this one looked for a row
+        get = db.get
+        calls = []
+
+        async def racing_get(*args, **kwargs):
+            calls.append(args)
+            return None if len(calls) == 1 else await get(*args, **kwargs)
+
+        monkeypatch.setattr(db, "get", racing_get)
+        snapshot = await service.refresh_snapshot(1)
+
+        assert len(calls) == 2
+        assert snapshot.is_stale is False
+        assert "review" in snapshot.pools_json
@@ -199,7 +199,7 @@ async def test_curriculum_generation():
         first_lesson = curriculum.modules[0].lessons[0] if curriculum.modules and curriculum.modules[0].lessons else None
         if first_lesson and first_lesson.exercises:
             for i, exercise in enumerate(first_lesson.exercises[:3], 1):  # Show first 3
-                content = json.loads(exercise.content_json)
+                content = json.loads(exercise.effective_content_json)
                 print(f"\n      Exercise {i}: {exercise.title}")
                 print(f"         Type: {exercise.exercise_type}")
                 print(f"         Difficulty: {exercise.difficulty}")
@@ -216,7 +216,7 @@ async def test_curriculum_generation():
             test_exercise = first_lesson.exercises[0]
 
             print(f"\n   Generating audio for: {test_exercise.title}")
-            print(f"   Content: {json.dumps(json.loads(test_exercise.content_json), indent=6)[:150]}...")
+            print(f"   Content: {json.dumps(json.loads(test_exercise.effective_content_json), indent=6)[:150]}...")
 
             # This will use the MIDI generation service + Rust engine
             from app.services.midi_generation_service import midi_generation_service
@@ -7,7 +7,7 @@ Tests all shared utility functions used across genre generators.
 import json
 import pytest
 from pathlib import Path
-from unittest.mock import Mock, patch, mock_open
+from unittest.mock import Mock, patch
 
 from app.services.generator_utils import (
     parse_json_from_response,
@@ -118,10 +118,10 @@ class TestNoteToMidi:
 class TestExportToMidi:
     """Test MIDI export with base64 encoding."""
 
-    @patch('app.services.generator_utils.export_enhanced_midi')
-    @patch('builtins.open', new_callable=mock_open, read_data=b'MIDI_DATA')
+    @patch('app.services.generator_utils.encode_arrangement', return_value=b'MIDI_DATA')
+    @patch('pathlib.Path.write_bytes')
     @patch('app.services.generator_utils.settings')
-    def test_export_creates_directory(self, mock_settings, mock_file, mock_export):
+    def test_export_creates_directory(self, mock_settings, mock_write, mock_encode):
         """Should create output directory if it doesn't exist."""
         mock_settings.OUTPUTS_DIR = Path("/tmp/outputs")
 
@@ -134,10 +134,11 @@ class TestExportToMidi:
             export_to_midi(arrangement, "test_subdir", "test")
             mock_mkdir.assert_called_once_with(parents=True, exist_ok=True)
 
-    @patch('app.services.generator_utils.export_enhanced_midi')
-    @patch('builtins.open', new_callable=mock_open, read_data=b'MIDI_DATA')
+    @patch('app.services.generator_utils.encode_arrangement', return_value=b'MIDI_DATA')
+    @patch('pathlib.Path.write_bytes')
+    @patch('pathlib.Path.mkdir')
     @patch('app.services.generator_utils.settings')
-    def test_export_returns_path_and_base64(self, mock_settings, mock_file, mock_export):
+    def test_export_returns_path_and_base64(self, mock_settings, mock_mkdir, mock_write, mock_encode):
         """Should return MIDI path and base64-encoded data."""
         mock_settings.OUTPUTS_DIR = Path("/tmp/outputs")
 
@@ -148,12 +149,14 @@ class TestExportToMidi:
         midi_path, midi_base64 = export_to_midi(arrangement, "test", "prefix")
 
         assert isinstance(midi_path, Path)
-        assert isinstance(midi_base64, str)
-        assert midi_base64  # Should not be empty
+        assert midi_base64 == "TUlESV9EQVRB"
+        mock_write.assert_called_once_with(b'MIDI_DATA')
 
-    @patch('app.services.generator_utils.export_enhanced_midi')
+    @patch('app.services.generator_utils.encode_arrangement', return_value=b'test')
+    @patch('pathlib.Path.write_bytes')
+    @patch('pathlib.Path.mkdir')
     @patch('app.services.generator_utils.settings')
-    def test_export_filename_format(self, mock_settings, mock_export):
+    def test_export_filename_format(self, mock_settings, mock_mkdir, mock_write, mock_encode):
         """Should generate filename with correct format."""
         mock_settings.OUTPUTS_DIR = Path("/tmp/outputs")
 
@@ -161,14 +164,13 @@ class TestExportToMidi:
         arrangement.key = "Dm"
         arrangement.tempo = 90
 
-        with patch('builtins.open', mock_open(read_data=b'test')):
-            midi_path, _ = export_to_midi(arrangement, "blues", "blues")
+        midi_path, _ = export_to_midi(arrangement, "blues", "blues")
 
-            filename = midi_path.name
-            assert "blues" in filename
-            assert "Dm" in filename
-            assert "90bpm" in filename
-            assert filename.endswith(".mid")
+        filename = midi_path.name
+        assert "blues" in filename
+        assert "Dm" in filename
+        assert "90bpm" in filename
+        assert filename.endswith(".mid")
 
 
 class TestGetNotesPreview:
@@ -0,0 +1,160 @@
+"""
+Tests for the harmonic search index (n-gram inverted index + MinHash)
+"""
+
+import numpy as np
+import pytest
+
+from app.database.models import Song, SongChord
+from app.pipeline.harmonic_index import (
+    extract_ngrams,
+    minhash_signature,
+    ngram_key,
+    parse_progression_query,
+    quality_class,
+    query_keys,
+    signature_similarity,
+    song_signature,
+    tokenize_chords,
+)
+from app.services.harmonic_search_service import HarmonicSearchService
+
+
+def _chords(symbols, duration=2.0):
+    """Build chord dicts from symbols, one every `duration` seconds"""
+    return [
+        {**c, "time": i * duration, "duration": duration}
+        for i, c in enumerate(parse_progression_query(" ".join(symbols)))
+    ]
+
+
+class TestTokenization:
+    """Tests for chord tokenization and n-gram keys"""
+
+    def test_quality_classes(self):
+        assert quality_class("maj7") == "M"
+        assert quality_class("") == "M"
+        assert quality_class("min7") == "m"
+        assert quality_class("m9") == "m"
+        assert quality_class("7") == "7"
+        assert quality_class("13") == "7"
+        assert quality_class("m7b5") == "ø"
+        assert quality_class("dim") == "o"
+        assert quality_class("7sus4") == "sus"
+
+    def test_transposition_invariant(self):
+        in_c = tokenize_chords(_chords(["Dm7", "G7", "Cmaj7"]))
+        in_d = tokenize_chords(_chords(["Em9", "A13", "Dmaj9"]))
+        assert ngram_key(in_c) == ngram_key(in_d) == "m|5:7|5:M"
+
+    def test_repeated_chords_merged(self):
+        tokens = tokenize_chords(_chords(["C", "C", "F", "G"]))
+        assert len(tokens) == 3
+        assert tokens[0].chord_index == 0
+        assert tokens[0].end_chord_index == 1
+        assert tokens[1].chord_index == 2
+
+    def test_no_chord_frames_skipped(self):
+        chords = [
+            {"root": "N", "quality": "none", "time": 0.0, "duration": 1.0},
+            {"root": "C", "quality": "maj", "time": 1.0, "duration": 1.0},
+        ]
+        tokens = tokenize_chords(chords)
+        assert len(tokens) == 1
+        assert tokens[0].chord_index == 1
+
+    def test_extract_ngrams_positions(self):
+        tokens = tokenize_chords(_chords(["C", "Am", "Dm", "G7"]))
+        ngrams = extract_ngrams(tokens, sizes=(2,))
+        assert [n.position for n in ngrams] == [0, 1, 2]
+        assert ngrams[-1].start_time == 4.0
+        assert ngrams[-1].end_time == 8.0
+
+    def test_long_query_split_into_overlapping_keys(self):
+        tokens = tokenize_chords(_chords(["C", "Am", "Dm", "G7", "Em", "A7"]))
+        lookups = query_keys(tokens)
+        assert [offset for offset, _ in lookups] == [0, 1, 2]
+
+    def test_invalid_query_rejected(self):
+        with pytest.raises(ValueError):
+            parse_progression_query("Dm7 xyz")
+
+
+class TestMinHash:
+    """Tests for MinHash signatures"""
+
+    def test_signature_is_deterministic(self):
+        assert minhash_signature(["a", "b", "c"]) == minhash_signature(["c", "b", "a"])
+
+    def test_identical_sets_fully_similar(self):
+        sig = minhash_signature(["a", "b", "c"])
+        scores = signature_similarity(sig, np.array([sig], dtype=np.int64))
+        assert scores[0] == 1.0
+
+    def test_similarity_tracks_overlap(self):
+        base = song_signature(tokenize_chords(_chords(["Dm7", "G7", "Cmaj7", "Am7", "Dm7", "G7", "Cmaj7", "A7"])))
+        transposed = song_signature(tokenize_chords(_chords(["Em7", "A7", "Dmaj7", "Bm7", "Em7", "A7", "Dmaj7", "B7"])))
+        unrelated = song_signature(tokenize_chords(_chords(["C", "C#dim", "F#m", "B", "E+", "Bbsus4"])))
+
+        scores = signature_similarity(base, np.array([transposed, unrelated], dtype=np.int64))
+        assert scores[0] == 1.0
+        assert scores[1] < 0.2
+
+
+class TestHarmonicSearchService:
+    """Tests for indexing and querying stored songs"""
+
+    async def _add_song(self, db, song_id, symbols):
+        db.add(Song(id=song_id, title=song_id))
+        for chord in _chords(symbols):
+            db.add(SongChord(song_id=song_id, chord="", **chord))
+        await db.flush()
+        await HarmonicSearchService(db).index_song(song_id, _chords(symbols))
+        await db.commit()
+
+    @pytest.mark.asyncio
+    async def test_search_progression_any_key(self, db_session):
+        await self._add_song(db_session, "in_c", ["Dm7", "G7", "Cmaj7", "F", "Dm7", "G7", "Cmaj7"])
+        await self._add_song(db_session, "in_eb", ["Ab", "Fm7", "Bb7", "Ebmaj7"])
+        await self._add_song(db_session, "blues", ["C7", "F7", "C7", "G7"])
+
+        results = await HarmonicSearchService(db_session).search_progression("Am7 D7 Gmaj7")
+
+        assert [r["song_id"] for r in results] == ["in_c", "in_eb"]
+        assert results[0]["occurrences"] == 2
+        assert results[0]["matches"][0]["start_index"] == 0
+        assert results[0]["matches"][0]["end_index"] == 2
+        assert results[1]["matches"][0]["start_time"] == 2.0
+
+    @pytest.mark.asyncio
+    async def test_long_progression_requires_contiguous_match(self, db_session):
+        await self._add_song(db_session, "full", ["C", "Am", "Dm", "G7", "C", "A7"])
+        await self._add_song(db_session, "split", ["C", "Am", "Dm", "G7", "E", "Dm", "G7", "C", "A7"])
+
+        results = await HarmonicSearchService(db_session).search_progression("F Dm Gm C7 F D7")
+
+        assert [r["song_id"] for r in results] == ["full"]
+
+    @pytest.mark.asyncio
+    async def test_find_similar(self, db_session):
+        await self._add_song(db_session, "a", ["Dm7", "G7", "Cmaj7", "Am7", "Dm7", "G7", "Cmaj7"])
+        await self._add_song(db_session, "b", ["Gm7", "C7", "Fmaj7", "Dm7", "Gm7", "C7", "Fmaj7"])
+        await self._add_song(db_session, "c", ["C", "F", "C", "G"])
+
+        service = HarmonicSearchService(db_session)
+        results = await service.find_similar("a")
+
+        assert results[0]["song_id"] == "b"
+        assert results[0]["similarity"] == 1.0
+        assert await service.find_similar("missing") is None
+
+    @pytest.mark.asyncio
+    async def test_reindex_replaces_entries(self, db_session):
+        await self._add_song(db_session, "song", ["Dm7", "G7", "Cmaj7"])
+
+        service = HarmonicSearchService(db_session)
+        await service.index_song("song", _chords(["C", "F", "G"]))
+        await db_session.commit()
+
+        assert await service.search_progression("Dm7 G7 Cmaj7") == []
+        assert len(await service.search_progression("C F G")) == 1
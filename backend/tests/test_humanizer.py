@@ -0,0 +1,128 @@
+"""
+Tests for the vectorized arrangement humanizer
+"""
+
+import numpy as np
+
+from app.gospel import Arrangement
+from app.gospel import Note as GospelNote
+from app.gospel.note_array import NoteArray
+from app.services.humanizer import (
+    ArrangementHumanizer,
+    GROOVE_PROFILES,
+    Note,
+    humanize_arrangement,
+    jitter_performance,
+)
+
+
+def _grid(bars=8, hand="right"):
+    """Eighth notes on a straight grid"""
+    return [
+        Note(pitch=60 + (i % 12), time=i * 0.5, duration=0.5, velocity=80, hand=hand)
+        for i in range(bars * 8)
+    ]
+
+
+def _arrangement(bars=8):
+    return Arrangement(
+        left_hand_notes=[GospelNote(pitch=36, time=float(b * 4), duration=4.0, velocity=70, hand="left") for b in range(bars)],
+        right_hand_notes=[GospelNote(pitch=n.pitch, time=n.time, duration=n.duration, velocity=n.velocity, hand="right") for n in _grid(bars)],
+        tempo=90,
+        time_signature=(4, 4),
+        key="C",
+        total_bars=bars,
+        application="worship",
+    )
+
+
+class TestArrangementHumanizer:
+    """Tests for groove-profile humanization"""
+
+    def test_seeded_output_is_deterministic(self):
+        first = ArrangementHumanizer("jazz", seed=5).humanize(_grid(), 0.8)
+        second = ArrangementHumanizer("jazz", seed=5).humanize(_grid(), 0.8)
+        assert first == second
+
+    def test_zero_amount_keeps_timing(self):
+        notes = _grid()
+        humanized = ArrangementHumanizer("gospel", seed=1).humanize(notes, 0.0, apply_phrase_dynamics=False)
+
+        assert [n.time for n in humanized] == [n.time for n in notes]
+        assert [n.duration for n in humanized] == [n.duration for n in notes]
+        assert all(n.velocity == 80 for n in humanized)
+
+    def test_swing_delays_off_beats(self):
+        humanizer = ArrangementHumanizer("blues", seed=0)
+        humanizer.profile = {**humanizer.profile, "ghost_note_probability": 0.0}
+        humanized = humanizer.humanize(_grid(bars=32), 1.0)
+
+        off_beat = [n.time - round(n.time * 2) / 2 for n in humanized if round(n.time * 2) % 2 == 1]
+        assert np.mean(off_beat) > GROOVE_PROFILES["blues"]["swing_amount"] * 0.5
+
+    def test_velocities_within_range(self):
+        notes = _grid() + _grid(hand="left")
+        humanized = ArrangementHumanizer("blues", seed=2).humanize(notes, 1.0)
+
+        assert all(1 <= n.velocity <= 127 for n in humanized)
+        assert all(n.duration > 0 for n in humanized)
+        assert [n.time for n in humanized] == sorted(n.time for n in humanized)
+
+    def test_ghost_notes_added_above_threshold(self):
+        notes = _grid(bars=16, hand="left")
+        assert len(ArrangementHumanizer("blues", seed=3).humanize(notes, 1.0)) > len(notes)
+        assert len(ArrangementHumanizer("blues", seed=3).humanize(notes, 0.3)) == len(notes)
+
+    def test_accepts_dicts(self):
+        notes = [{"pitch": 60, "time": 0.0, "duration": 1.0, "velocity": 90}]
+        humanized = humanize_arrangement(notes, genre="classical", amount=0.2, seed=0)
+        assert humanized[0].hand == "right"
+
+    def test_genre_aliases(self):
+        assert ArrangementHumanizer("Neo-Soul").profile is GROOVE_PROFILES["neo_soul"]
+        assert ArrangementHumanizer("R&B").profile is GROOVE_PROFILES["rnb"]
+        assert ArrangementHumanizer("unknown").profile is GROOVE_PROFILES["gospel"]
+
+
+class TestHumanizeArrangement:
+    """Tests for whole-arrangement humanization"""
+
+    def test_hands_preserved(self):
+        arrangement = _arrangement()
+        humanized = ArrangementHumanizer("gospel", seed=4).humanize_arrangement(arrangement, 0.3)
+
+        assert len(humanized.left_hand_notes) == len(arrangement.left_hand_notes)
+        assert all(n.hand == "left" for n in humanized.left_hand_notes)
+        assert all(n.hand == "right" for n in humanized.right_hand_notes)
+        assert humanized.key == arrangement.key
+        assert arrangement.right_hand_notes[1].time == 0.5
+
+    def test_empty_array(self):
+        assert len(ArrangementHumanizer(seed=0).humanize_array(NoteArray())) == 0
+
+
+class TestJitterPerformance:
+    """Tests for exercise-playback jitter"""
+
+    def test_bounds(self):
+        rng = np.random.default_rng(0)
+        starts = np.arange(100) * 0.5
+        onsets, offsets, velocities = jitter_performance(
+            starts, np.full(100, 0.5), np.full(100, 80), rng,
+            timing_variance=0.015, duration_variance=0.05, velocity_variance=8
+        )
+
+        assert np.all(np.abs(onsets - starts) <= 0.015)
+        assert np.all(offsets > onsets)
+        assert velocities.min() >= 72 and velocities.max() <= 88
+
+    def test_chord_stagger_rolls_onsets(self):
+        rng = np.random.default_rng(0)
+        onsets, _, _ = jitter_performance(
+            np.zeros(4), np.ones(4), np.full(4, 80), rng,
+            timing_variance=0.0, duration_variance=0.0, velocity_variance=0,
+            chord_index=np.arange(4)
+        )
+        assert onsets[0] == 0.0
+        assert np.all(onsets[1:] >= np.arange(1, 4) * 0.005)
+        assert np.all(onsets[1:] <= np.arange(1, 4) * 0.015)
@@ -0,0 +1,213 @@
+"""
+Tests for job progress pub/sub and the event stream endpoints
+"""
+
+import asyncio
+import json
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.api.routes import jobs
+from app.schemas.transcription import JobStatus, TranscriptionJob, TranscriptionOptions
+from app.services import transcription as transcription_module
+from app.services.job_events import JobEventBroker
+from app.services.transcription import TranscriptionService
+
+
+class LoopbackBackend:
+    """Shared channel for brokers in one test, standing in for Redis pub/sub."""
+
+    def __init__(self):
+        self.listeners = []
+
+    async def publish(self, message):
+        for queue in self.listeners:
+            queue.put_nowait(message)
+
+    async def listen(self):
+        queue = asyncio.Queue()
+        self.listeners.append(queue)
+        while True:
+            yield await queue.get()
+
+    async def close(self):
+        pass
+
+
+@pytest.fixture
+def broker(monkeypatch):
+    broker = JobEventBroker()
+    monkeypatch.setattr(transcription_module, "job_event_broker", broker)
+    monkeypatch.setattr(jobs, "job_event_broker", broker)
+    return broker
+
+
+@pytest.fixture
+def service(broker, monkeypatch):
+    service = TranscriptionService()
+    monkeypatch.setattr(jobs, "transcription_service", service)
+    return service
+
+
+def add_job(service, job_id, status=JobStatus.QUEUED):
+    job = TranscriptionJob(id=job_id, status=status, options=TranscriptionOptions())
+    service.jobs[job_id] = job
+    return job
+
+
+class TestJobEventBroker:
+    """Tests for JobEventBroker"""
+
+    @pytest.mark.asyncio
+    async def test_subscribers_receive_their_jobs(self, broker):
+        async with broker.subscribe("a") as only_a, broker.subscribe() as every_job:
+            broker.publish({"job_id": "a", "event": "progress"})
+            broker.publish({"job_id": "b", "event": "progress"})
+
+            assert [only_a.get_nowait()["job_id"]] == ["a"] and only_a.empty()
+            assert [every_job.get_nowait()["job_id"] for _ in range(2)] == ["a", "b"]
+
+        assert broker.stats()["subscribers"] == 0
+
+    @pytest.mark.asyncio
+    async def test_slow_subscriber_keeps_latest_events(self):
+        broker = JobEventBroker(queue_size=2)
+        async with broker.subscribe("a") as queue:
+            for progress in (10, 20, 30):
+                broker.publish({"job_id": "a", "event": "progress", "progress": progress})
+
+            assert [queue.get_nowait()["progress"] for _ in range(2)] == [20, 30]
+        assert broker.stats()["dropped"] == 1
+
+    @pytest.mark.asyncio
+    async def test_stream_ends_after_terminal_event(self, broker):
+        async def follow():
+            return [
+                event and event["event"]
+                async for event in broker.stream(
+                    "a", lambda: [{"job_id": "a", "event": "snapshot"}], heartbeat=0.01
+                )
+            ]
+
+        task = asyncio.create_task(follow())
+        await asyncio.sleep(0.05)
+        broker.publish({"job_id": "a", "event": "stage"})
+        broker.publish({"job_id": "a", "event": "complete"})
+        broker.publish({"job_id": "a", "event": "progress"})
+        events = await asyncio.wait_for(task, 1)
+
+        assert events[0] == "snapshot"
+        assert None in events  # Heartbeat while idle
+        assert [e for e in events if e][1:] == ["stage", "complete"]
+
+    @pytest.mark.asyncio
+    async def test_backend_relays_between_processes(self):
+        backend = LoopbackBackend()
+        api_a, api_b = JobEventBroker(backend=backend), JobEventBroker(backend=backend)
+        await api_a.start()
+        await api_b.start()
+        try:
+            await asyncio.sleep(0.01)
+            async with api_a.subscribe("a") as on_a, api_b.subscribe("a") as on_b:
+                api_a.publish({"job_id": "a", "event": "progress"})
+
+                assert (await asyncio.wait_for(on_b.get(), 1)) == {"job_id": "a", "event": "progress"}
+                await asyncio.sleep(0.01)
+                assert on_a.qsize() == 1  # Own events are not delivered twice
+        finally:
+            await api_a.stop()
+            await api_b.stop()
+        assert api_b.stats()["relayed"] == 1
+
+
+class TestTranscriptionJobEvents:
+    """Tests for progress events published by TranscriptionService"""
+
+    @pytest.mark.asyncio
+    async def test_updates_publish_stages_and_timings(self, service, broker):
+        job = add_job(service, "a")
+        async with broker.subscribe("a") as queue:
+            service._update(job, "Extracting audio...", 15, JobStatus.PROCESSING)
+            service._update(job, progress=25)
+            service._update(job, "Transcribing to MIDI...", 55)
+            job.progress = 100
+            service._finish(job, JobStatus.COMPLETE, "Complete")
+
+            events = [queue.get_nowait() for _ in range(queue.qsize())]
+
+        assert [e["event"] for e in events] == ["stage", "progress", "stage", "complete"]
+        assert [e["progress"] for e in events] == [15, 25, 55, 100]
+        assert list(events[-1]["stage_timings"]) == ["Extracting audio...", "Transcribing to MIDI..."]
+        assert job.stage_timings == events[-1]["stage_timings"]
+
+    @pytest.mark.asyncio
+    async def test_cancel_publishes_terminal_event(self, service, broker):
+        add_job(service, "a", JobStatus.PROCESSING)
+        async with broker.subscribe("a") as queue:
+            service.cancel_job("a")
+            assert queue.get_nowait()["event"] == "cancelled"
+
+    @pytest.mark.asyncio
+    async def test_no_events_after_cancel_mid_pipeline(self, service, broker, monkeypatch, tmp_path):
+        job = add_job(service, "a")
+        monkeypatch.setattr(transcription_module.settings, "output_dir", tmp_path)
+
+        async def cancel_during_step(path):
+            service.cancel_job("a")
+            return {"duration": 1.0}
+
+        async def extract_audio(source, target):
+            pass
+
+        async def transcribe_audio(source, target):
+            raise RuntimeError("pipeline kept running")
+
+        monkeypatch.setattr(transcription_module, "get_audio_info", cancel_during_step)
+        monkeypatch.setattr(transcription_module, "extract_audio", extract_audio)
+        monkeypatch.setattr(transcription_module, "isolate_piano", extract_audio)
+        monkeypatch.setattr(transcription_module, "transcribe_audio", transcribe_audio)
+
+        async with broker.subscribe("a") as queue:
+            await service._execute_common_pipeline("a", tmp_path / "input.mp3")
+            service._finish(job, JobStatus.COMPLETE, "Complete")
+
+            events = [queue.get_nowait() for _ in range(queue.qsize())]
+
+        assert [e["event"] for e in events] == ["stage", "cancelled"]
+        assert job.status == JobStatus.CANCELLED
+        assert job.error_message is None
+        assert list(job.stage_timings) == ["Extracting audio..."]
+
+    def test_list_jobs_newest_first(self, service):
+        for i in range(5):
+            add_job(service, f"job{i}", JobStatus.COMPLETE if i % 2 else JobStatus.QUEUED)
+
+        assert [j.id for j in service.list_jobs(limit=2, offset=1)] == ["job3", "job2"]
+        assert [j.id for j in service.list_jobs(status="complete")] == ["job3", "job1"]
+
+
+class TestJobEventRoutes:
+    """Tests for the SSE endpoints"""
+
+    @pytest.fixture
+    def client(self, service):
+        app = FastAPI()
+        app.include_router(jobs.router)
+        return TestClient(app)
+
+    def test_finished_job_streams_terminal_event(self, client, service):
+        job = add_job(service, "a", JobStatus.COMPLETE)
+        job.progress = 100
+
+        with client.stream("GET", "/jobs/a/events") as response:
+            assert response.headers["content-type"].startswith("text/event-stream")
+            body = response.read().decode()
+
+        event, data = body.strip().split("\n")
+        assert event == "event: complete"
+        assert json.loads(data.removeprefix("data: "))["progress"] == 100
+
+    def test_unknown_job_is_404(self, client, service):
+        assert client.get("/jobs/missing/events").status_code == 404
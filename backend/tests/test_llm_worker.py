@@ -0,0 +1,230 @@
+"""
+Tests for the local LLM inference worker (stub backend, no MLX required)
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from app.services.llm_worker import (
+    InferencePriority,
+    InferenceRequest,
+    LLMInferenceWorker,
+    StubInferenceBackend,
+    _Job,
+)
+
+
+@pytest.fixture
+def make_worker():
+    workers = []
+
+    def make(backend=None, **kwargs):
+        worker = LLMInferenceWorker(backend or StubInferenceBackend(), **kwargs)
+        workers.append(worker)
+        return worker
+
+    yield make
+    for worker in workers:
+        worker.stop()
+
+
+class _GatedBackend(StubInferenceBackend):
+    """Blocks the first generation until released, recording run order."""
+
+    def __init__(self):
+        super().__init__()
+        self.gate = threading.Event()
+        self.started = threading.Event()
+        self.order = []
+
+    def generate(self, tier, request):
+        self.started.set()
+        self.gate.wait(5)
+        self.order.append(request.prompt)
+        return request.prompt
+
+
+async def _wait_started(backend):
+    await asyncio.get_running_loop().run_in_executor(None, backend.started.wait, 5)
+
+
+class TestSubmit:
+    """Tests for the async submit API"""
+
+    @pytest.mark.asyncio
+    async def test_returns_response(self, make_worker):
+        worker = make_worker()
+        assert await worker.submit(InferenceRequest("hello", complexity=3)) == "echo: hello"
+        assert worker.stats()["completed"] == 1
+
+    @pytest.mark.asyncio
+    async def test_does_not_block_event_loop(self, make_worker):
+        worker = make_worker(StubInferenceBackend(delay=0.2))
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        task = asyncio.create_task(ticker())
+        await worker.submit(InferenceRequest("slow"))
+        task.cancel()
+
+        assert ticks >= 10
+
+    @pytest.mark.asyncio
+    async def test_tier_errors_raise_before_queueing(self, make_worker):
+        worker = make_worker()
+        with pytest.raises(ValueError, match="too high"):
+            await worker.submit(InferenceRequest("hard", complexity=9))
+        assert worker.stats()["submitted"] == 0
+
+    @pytest.mark.asyncio
+    async def test_backend_errors_propagate(self, make_worker):
+        def respond(request):
+            raise RuntimeError("model crashed")
+
+        worker = make_worker(StubInferenceBackend(respond))
+        with pytest.raises(RuntimeError, match="model crashed"):
+            await worker.submit(InferenceRequest("x"))
+
+
+class TestQueue:
+    """Tests for priority, timeouts and backpressure"""
+
+    @pytest.mark.asyncio
+    async def test_priority_order(self, make_worker):
+        backend = _GatedBackend()
+        worker = make_worker(backend, max_batch_size=1, batch_window=0)
+
+        first = asyncio.create_task(worker.submit(InferenceRequest("first")))
+        await _wait_started(backend)
+        background = asyncio.create_task(worker.submit(InferenceRequest("background"), InferencePriority.BACKGROUND))
+        interactive = asyncio.create_task(worker.submit(InferenceRequest("interactive"), InferencePriority.INTERACTIVE))
+        await asyncio.sleep(0.02)
+        backend.gate.set()
+        await asyncio.gather(first, background, interactive)
+
+        assert backend.order == ["first", "interactive", "background"]
+
+    @pytest.mark.asyncio
+    async def test_timed_out_request_is_skipped(self, make_worker):
+        backend = _GatedBackend()
+        worker = make_worker(backend, max_batch_size=1, batch_window=0)
+
+        first = asyncio.create_task(worker.submit(InferenceRequest("first")))
+        await _wait_started(backend)
+        with pytest.raises(asyncio.TimeoutError):
+            await worker.submit(InferenceRequest("late"), timeout=0.02)
+        backend.gate.set()
+        await first
+        await worker.submit(InferenceRequest("after"))
+
+        assert backend.order == ["first", "after"]
+        assert worker.stats()["skipped"] == 1
+
+    @pytest.mark.asyncio
+    async def test_full_queue_rejects(self, make_worker):
+        backend = _GatedBackend()
+        worker = make_worker(backend, max_queue_size=1)
+
+        first = asyncio.create_task(worker.submit(InferenceRequest("first")))
+        await _wait_started(backend)
+        with pytest.raises(RuntimeError, match="queue is full"):
+            await worker.submit(InferenceRequest("second"))
+        backend.gate.set()
+        await first
+
+
+class TestBatching:
+    """Tests for same-tier micro-batching"""
+
+    @pytest.mark.asyncio
+    async def test_batches_same_tier_requests(self, make_worker):
+        backend = _GatedBackend()
+        worker = make_worker(backend, max_batch_size=4, batch_window=0)
+
+        first = asyncio.create_task(worker.submit(InferenceRequest("first", complexity=3)))
+        await _wait_started(backend)
+        rest = [
+            asyncio.create_task(worker.submit(InferenceRequest(f"p{i}", complexity=c)))
+            for i, c in enumerate([3, 6, 3, 6, 3])
+        ]
+        await asyncio.sleep(0.02)
+        backend.gate.set()
+        results = await asyncio.gather(first, *rest)
+
+        assert results == ["first", "p0", "p1", "p2", "p3", "p4"]
+        sizes = [[r.prompt for r in batch] for batch in backend.batches]
+        assert sizes == [["first"], ["p0", "p2", "p4"], ["p1", "p3"]]
+        assert worker.stats()["largest_batch"] == 3
+
+    @pytest.mark.asyncio
+    async def test_batch_window_collects_concurrent_requests(self, make_worker):
+        backend = StubInferenceBackend()
+        worker = make_worker(backend, max_batch_size=8, batch_window=0.05)
+
+        await asyncio.gather(*(worker.submit(InferenceRequest(f"p{i}")) for i in range(5)))
+
+        assert len(backend.batches) == 1
+        assert len(backend.batches[0]) == 5
+
+
+class TestStreaming:
+    """Tests for chunked responses"""
+
+    @pytest.mark.asyncio
+    async def test_streams_chunks(self, make_worker):
+        worker = make_worker(StubInferenceBackend(lambda r: "one two three"))
+        chunks = [chunk async for chunk in worker.stream(InferenceRequest("x"))]
+        assert chunks == ["one ", "two ", "three "]
+
+    @pytest.mark.asyncio
+    async def test_stream_errors_propagate(self, make_worker):
+        class FailingBackend(StubInferenceBackend):
+            def stream(self, tier, request):
+                yield "partial "
+                raise RuntimeError("stream broke")
+
+        worker = make_worker(FailingBackend())
+        chunks = []
+        with pytest.raises(RuntimeError, match="stream broke"):
+            async for chunk in worker.stream(InferenceRequest("x")):
+                chunks.append(chunk)
+        assert chunks == ["partial "]
+
+    @pytest.mark.asyncio
+    async def test_closing_stream_stops_generation(self, make_worker):
+        produced = []
+
+        class SlowBackend(StubInferenceBackend):
+            def stream(self, tier, request):
+                for i in range(50):
+                    time.sleep(0.005)
+                    produced.append(i)
+                    yield str(i)
+
+        worker = make_worker(SlowBackend())
+        stream = worker.stream(InferenceRequest("x"))
+        assert await stream.__anext__() == "0"
+        await stream.aclose()
+        await asyncio.sleep(0.05)
+
+        assert len(produced) < 50
+        assert await worker.submit(InferenceRequest("next")) == "echo: next"
+
+    def test_closed_caller_loop_does_not_kill_worker(self, make_worker):
+        worker = make_worker(StubInferenceBackend(lambda r: "one two"))
+        loop = asyncio.new_event_loop()
+        job = _Job(InferenceRequest("x"), None, loop, loop.create_future(), asyncio.Queue())
+        loop.close()
+
+        worker._run_stream(job)  # Runs on the worker thread; must not raise
+
+        assert worker.stats()["completed"] == 1
+        assert asyncio.run(worker.submit(InferenceRequest("next"))) == "one two"
@@ -0,0 +1,174 @@
+"""
+Tests for the memory-budgeted model registry
+"""
+
+import threading
+import time
+
+import pytest
+
+from app.services.model_registry import ModelBudgetError, ModelRegistry
+
+
+class _Loader:
+    """Counts loads and returns a fresh object per load."""
+
+    def __init__(self, name):
+        self.name = name
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        return {"name": self.name, "load": self.calls}
+
+
+@pytest.fixture
+def registry():
+    registry = ModelRegistry(budget_gb=10.0, idle_timeout=0)
+    for name, size in (("a", 4.0), ("b", 4.0), ("c", 4.0)):
+        registry.register(name, _Loader(name), size_gb=size)
+    return registry
+
+
+class TestLoading:
+    """Tests for lazy loading and sharing"""
+
+    def test_loads_once(self, registry):
+        first = registry.load("a")
+        assert registry.load("a") is first
+        assert registry.stats()["loads"] == 1
+
+    def test_unregistered_key_raises(self, registry):
+        with pytest.raises(KeyError):
+            registry.load("missing")
+
+    def test_concurrent_loads_share_one_instance(self):
+        registry = ModelRegistry(budget_gb=10.0, idle_timeout=0)
+
+        def slow_loader():
+            time.sleep(0.05)
+            return object()
+
+        registry.register("slow", slow_loader, size_gb=1.0)
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(registry.load("slow"))) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert len({id(r) for r in results}) == 1
+        assert registry.stats()["loads"] == 1
+
+
+class TestBudget:
+    """Tests for LRU eviction under the memory budget"""
+
+    def test_evicts_least_recently_used(self, registry):
+        registry.load("a")
+        registry.load("b")
+        registry.load("a")
+        registry.load("c")
+
+        assert set(registry.loaded_keys()) == {"a", "c"}
+        assert registry.used_gb == 8.0
+        assert registry.stats()["evictions"] == 1
+
+    def test_pinned_models_are_not_evicted(self, registry):
+        with registry.use("a"):
+            registry.load("b")
+            registry.load("c")
+            assert "a" in registry.loaded_keys()
+
+    def test_raises_when_budget_held_by_models_in_use(self, registry):
+        with registry.use("a"), registry.use("b"):
+            with pytest.raises(ModelBudgetError, match="in use"):
+                registry.load("c")
+
+    def test_model_larger_than_budget_rejected(self, registry):
+        registry.register("huge", _Loader("huge"), size_gb=40.0)
+        with pytest.raises(ModelBudgetError, match="exceeds"):
+            registry.load("huge")
+
+    def test_unloader_runs_on_eviction(self):
+        unloaded = []
+        registry = ModelRegistry(budget_gb=5.0, idle_timeout=0)
+        registry.register("a", _Loader("a"), size_gb=4.0, unloader=lambda m: unloaded.append(m["name"]))
+        registry.register("b", _Loader("b"), size_gb=4.0)
+
+        registry.load("a")
+        registry.load("b")
+
+        assert unloaded == ["a"]
+
+    def test_loads_in_progress_count_against_budget(self):
+        registry = ModelRegistry(budget_gb=15.0, idle_timeout=0)
+        started, release = threading.Event(), threading.Event()
+
+        def slow_loader():
+            started.set()
+            release.wait(1)
+            return object()
+
+        registry.register("x", slow_loader, size_gb=10.0)
+        registry.register("y", _Loader("y"), size_gb=10.0)
+        loading = threading.Thread(target=registry.load, args=("x",))
+        loading.start()
+        started.wait(1)
+
+        with pytest.raises(ModelBudgetError, match="x \\(loading\\)"):
+            registry.load("y")
+
+        release.set()
+        loading.join()
+        assert registry.used_gb == 10.0
+        assert registry.stats()["reserved_gb"] == 0
+
+    def test_failed_load_releases_reservation(self, registry):
+        def broken():
+            raise RuntimeError("no weights")
+
+        registry.register("broken", broken, size_gb=8.0)
+        with pytest.raises(RuntimeError):
+            registry.load("broken")
+
+        registry.load("a")
+        registry.load("b")
+        assert registry.stats()["reserved_gb"] == 0
+        assert registry.used_gb == 8.0
+
+
+class TestIdleAndPreload:
+    """Tests for idle eviction and startup preloading"""
+
+    def test_evict_idle_skips_models_in_use(self, registry):
+        registry.load("a")
+        with registry.use("b"):
+            assert registry.evict_idle(idle_for=0) == ["a"]
+        assert registry.loaded_keys() == ["b"]
+
+    def test_unload_refuses_pinned_model(self, registry):
+        with registry.use("a"):
+            assert registry.unload("a") is False
+        assert registry.unload("a") is True
+        assert registry.get("a") is None
+
+    def test_background_reaper_unloads_idle_models(self):
+        registry = ModelRegistry(budget_gb=10.0, idle_timeout=0.05)
+        registry.register("a", _Loader("a"), size_gb=1.0)
+        registry.load("a")
+
+        deadline = time.monotonic() + 3
+        while registry.is_loaded("a") and time.monotonic() < deadline:
+            time.sleep(0.05)
+
+        assert not registry.is_loaded("a")
+
+    def test_preload_skips_unknown_and_failing(self, registry):
+        def broken():
+            raise RuntimeError("no weights")
+
+        registry.register("broken", broken, size_gb=1.0)
+
+        assert registry.preload(["a", "unknown", "broken"]) == ["a"]
+        assert registry.loaded_keys() == ["a"]
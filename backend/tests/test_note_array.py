@@ -0,0 +1,106 @@
+"""
+Tests for the array-backed NoteArray representation
+"""
+
+import numpy as np
+import pytest
+
+from app.gospel import Note
+from app.gospel.note_array import HAND_RIGHT, NoteArray, benchmark_note_array
+
+
+def _notes():
+    return [
+        Note(pitch=60, time=1.0, duration=0.5, velocity=100, hand="right"),
+        Note(pitch=36, time=0.0, duration=2.0, velocity=80, hand="left"),
+        Note(pitch=64, time=1.0, duration=0.5, velocity=127, hand="right"),
+        Note(pitch=43, time=0.5, duration=1.0, velocity=0, hand="left"),
+    ]
+
+
+class TestAdapters:
+    """Tests for conversion to and from Note lists"""
+
+    def test_round_trip(self):
+        notes = _notes()
+        assert NoteArray.from_notes(notes).to_notes() == notes
+
+    def test_empty(self):
+        array = NoteArray.from_notes([])
+        assert len(array) == 0
+        assert array.to_notes() == []
+        assert array.end_time == 0.0
+
+    def test_from_columns_with_single_hand(self):
+        array = NoteArray.from_columns([60, 62], [0.0, 1.0], [1.0, 1.0], [90, 90], hand="right")
+        assert array.hand.tolist() == [HAND_RIGHT, HAND_RIGHT]
+        assert [n.hand for n in array.to_notes()] == ["right", "right"]
+
+
+class TestValidation:
+    """Tests for bulk validation against Note's invariants"""
+
+    @pytest.mark.parametrize("field,value,message", [
+        ("pitch", 128, "Invalid MIDI pitch"),
+        ("velocity", -1, "Invalid velocity"),
+        ("duration", 0.0, "Invalid duration"),
+        ("hand", 2, "Invalid hand"),
+    ])
+    def test_rejects_out_of_range(self, field, value, message):
+        columns = {"pitch": [60, 62], "time": [0.0, 1.0], "duration": [1.0, 1.0], "velocity": [80, 80], "hand": [0, 1]}
+        columns[field] = [columns[field][0], value]
+
+        with pytest.raises(ValueError, match=f"Note 1: {message}"):
+            NoteArray.from_columns(**columns)
+
+    def test_nan_duration_rejected(self):
+        with pytest.raises(ValueError, match="Invalid duration"):
+            NoteArray.from_columns([60], [0.0], [np.nan], [80], hand="left")
+
+
+class TestTransforms:
+    """Tests for vectorized operations matching the list-based helpers"""
+
+    def test_shifted_does_not_modify_original(self):
+        array = NoteArray.from_notes(_notes())
+        shifted = array.shifted(8)
+
+        assert shifted.time.tolist() == [9.0, 8.0, 9.0, 8.5]
+        assert array.time.tolist() == [1.0, 0.0, 1.0, 0.5]
+
+    def test_transposed_checks_range(self):
+        array = NoteArray.from_notes(_notes())
+        assert array.transposed(-2).pitch.tolist() == [58, 34, 62, 41]
+
+        with pytest.raises(ValueError, match="Invalid MIDI pitch"):
+            array.transposed(64)
+
+    def test_velocity_range_matches_scalar_formula(self):
+        notes = _notes()
+        min_vel, max_vel = 45, 95
+        expected = [max(min_vel, min(int(min_vel + (n.velocity / 127.0) * (max_vel - min_vel)), max_vel)) for n in notes]
+
+        assert NoteArray.from_notes(notes).with_velocity_range(min_vel, max_vel).velocity.tolist() == expected
+
+    def test_sorted_is_stable(self):
+        notes = _notes()
+        expected = sorted(notes, key=lambda n: n.time)
+        assert NoteArray.from_notes(notes).sorted().to_notes() == expected
+
+    def test_concatenate_and_select_hand(self):
+        array = NoteArray.concatenate([NoteArray.from_notes(_notes()[:2]), NoteArray.from_notes(_notes()[2:])])
+        assert array == NoteArray.from_notes(_notes())
+        assert array.for_hand("left").pitch.tolist() == [36, 43]
+        assert array.end_time == 2.0
+
+
+class TestBenchmark:
+    """Smoke test for the 64-bar benchmark"""
+
+    def test_benchmark_runs(self):
+        results = benchmark_note_array(num_bars=64, iterations=2)
+
+        assert results["num_bars"] == 64
+        assert results["num_notes"] > 0
+        for key in ("list_ms", "array_ms", "array_roundtrip_ms"):
+            assert results[key] > 0
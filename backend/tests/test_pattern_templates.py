@@ -0,0 +1,123 @@
+"""
+Tests for precompiled, transposable hand pattern templates
+"""
+
+import pytest
+
+from app.core.arrangers.pattern_templates import (
+    PatternTemplateLibrary,
+    ROOT_PITCH_CLASSES,
+    split_chord_root,
+    voice_leading_shift,
+)
+from app.gospel import ChordContext
+from app.gospel.patterns import left_hand as gospel_left
+from app.gospel.patterns import right_hand as gospel_right
+from app.jazz.patterns import left_hand as jazz_left
+from app.neosoul.patterns import right_hand as neosoul_right
+from app.reggae.patterns import right_hand as reggae_right
+
+
+SUFFIXES = ["", "m", "7", "maj7", "m7", "9", "maj9", "min11", "13", "dim7", "m7b5", "sus4", "7#9"]
+PREVIOUS_VOICINGS = [None, [40, 44, 47], [60, 64, 67, 71], [70, 74, 77]]
+
+
+def _signature(pattern):
+    notes = [(n.pitch, n.time, n.duration, n.velocity, n.hand) for n in pattern.notes]
+    return pattern.name, notes, pattern.difficulty, tuple(pattern.tempo_range), list(pattern.characteristics)
+
+
+def _context(chord, previous_voicing=None, next_chord=None):
+    return ChordContext(
+        chord=chord, key="C", position=0, tempo=100,
+        previous_voicing=previous_voicing, next_chord=next_chord
+    )
+
+
+LIBRARIES = [
+    (gospel_left.LEFT_HAND_TEMPLATES, gospel_left._build_left_hand_pattern, {}),
+    (gospel_right.RIGHT_HAND_TEMPLATES, gospel_right._build_right_hand_pattern, {}),
+    (jazz_left.JAZZ_LEFT_HAND_TEMPLATES, jazz_left._build_jazz_left_hand_pattern, {}),
+    (neosoul_right.NEOSOUL_RIGHT_HAND_TEMPLATES, neosoul_right._build_neosoul_right_hand_pattern, {"complexity": 8}),
+    (reggae_right.REGGAE_RIGHT_HAND_TEMPLATES, reggae_right._build_reggae_right_hand_pattern, {}),
+]
+
+
+class TestTemplateEquivalence:
+    """Templates must reproduce their generators exactly"""
+
+    @pytest.mark.parametrize("library,build,kwargs", LIBRARIES)
+    def test_matches_generator_for_every_root(self, library, build, kwargs):
+        for pattern_name in sorted(library.transposable):
+            for root in ROOT_PITCH_CLASSES:
+                for suffix in SUFFIXES:
+                    for previous in PREVIOUS_VOICINGS:
+                        context = _context(root + suffix, previous)
+                        expected = _signature(build(pattern_name, context, **kwargs))
+                        actual = _signature(library.generate(pattern_name, context, **kwargs))
+                        assert actual == expected, (pattern_name, context.chord, previous)
+
+    def test_next_chord_patterns_use_generator(self):
+        assert "walking_bass" not in gospel_left.LEFT_HAND_TEMPLATES.transposable
+
+        context = _context("Dm7", next_chord="G7")
+        expected = _signature(gospel_left._build_left_hand_pattern("walking_bass", context))
+        assert _signature(gospel_left.generate_left_hand_pattern("walking_bass", context)) == expected
+
+    def test_unknown_pattern_still_raises(self):
+        with pytest.raises(ValueError, match="Unknown left hand pattern"):
+            gospel_left.generate_left_hand_pattern("not_a_pattern", _context("C"))
+
+
+class TestPatternTemplateLibrary:
+    """Tests for compilation and caching"""
+
+    def _library(self, calls):
+        def build(pattern_name, context):
+            calls.append(context.chord)
+            return gospel_left._build_left_hand_pattern(pattern_name, context)
+
+        return PatternTemplateLibrary(build, transposable=["shell_voicing"])
+
+    def test_compiled_once_per_quality(self):
+        calls = []
+        library = self._library(calls)
+        for chord in ["Cmaj7", "Fmaj7", "Bbmaj7", "F#maj7", "Dm7", "Gm7"]:
+            library.generate("shell_voicing", _context(chord))
+
+        assert calls == ["Cmaj7", "Cm7"]
+        assert library.cache_info().hits == 4
+
+    def test_slash_chords_and_odd_roots_use_generator(self):
+        calls = []
+        library = self._library(calls)
+        library.generate("shell_voicing", _context("C/E"))
+        library.generate("shell_voicing", _context("Cb7"))
+
+        assert calls == ["C/E", "Cb7"]
+        assert library.cache_info().currsize == 0
+
+    def test_returns_fresh_notes(self):
+        library = self._library([])
+        first = library.generate("shell_voicing", _context("D7"))
+        first.notes[0].pitch = 0
+        second = library.generate("shell_voicing", _context("D7"))
+
+        assert second.notes[0].pitch != 0
+
+
+class TestVoiceLeadingShift:
+    """The octave shift must agree with find_closest_voicing"""
+
+    @pytest.mark.parametrize("previous", [[40, 44, 47], [60, 64, 67, 71], [33], [84, 88], [55]])
+    def test_matches_find_closest_voicing(self, previous):
+        for root in range(12):
+            tones = [48 + root + i for i in (0, 4, 7, 10)]
+            shift = voice_leading_shift(tones, previous)
+            assert [t + shift for t in tones] == gospel_left.find_closest_voicing(tones, previous)
+
+
+def test_split_chord_root():
+    assert split_chord_root("Bbmaj7") == ("Bb", "maj7")
+    assert split_chord_root("F#m7b5") == ("F#", "m7b5")
+    assert split_chord_root("C") == ("C", "")
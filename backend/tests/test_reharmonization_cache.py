@@ -0,0 +1,125 @@
+"""
+Tests for the reharmonization orchestrator's scoring caches
+"""
+
+import pytest
+
+from app.pipeline.reharmonization_orchestrator import (
+    _BoundedCache,
+    clear_caches,
+    get_all_reharmonizations_for_chord,
+    get_cache_stats,
+)
+from app.pipeline.tonal_analysis import analyze_tonality
+from app.schemas.transcription import ChordEvent, NoteEvent
+from app.services.transcription import _suggest_reharmonizations, _to_reharmonization_suggestion
+
+
+@pytest.fixture(autouse=True)
+def fresh_caches():
+    clear_caches()
+    yield
+    clear_caches()
+
+
+class TestBoundedCache:
+    """Tests for the LRU cache primitive"""
+
+    def test_evicts_least_recently_used(self):
+        cache = _BoundedCache(maxsize=2)
+        cache.put('a', 1)
+        cache.put('b', 2)
+        assert cache.get('a') == 1
+        cache.put('c', 3)
+
+        assert cache.get('b') is None
+        assert cache.get('a') == 1
+        assert cache.get('c') == 3
+
+    def test_hit_rate(self):
+        cache = _BoundedCache(maxsize=4)
+        cache.get('a')
+        cache.put('a', 1)
+        cache.get('a')
+        cache.get('a')
+
+        stats = cache.stats()
+        assert stats['hits'] == 2
+        assert stats['misses'] == 1
+        assert stats['hit_rate'] == pytest.approx(2 / 3, abs=1e-4)
+
+
+class TestOrchestratorCaching:
+    """Tests for cached option scoring"""
+
+    def test_repeated_context_is_a_hit(self):
+        chord = {'root': 'G', 'quality': '7'}
+        first = get_all_reharmonizations_for_chord(chord, 'C', next_chord=('C', 'maj7'))
+        second = get_all_reharmonizations_for_chord(chord, 'C', next_chord=('C', 'maj7'))
+
+        assert first == second
+        assert get_cache_stats()['scored_options']['hits'] == 1
+
+    def test_new_context_reuses_candidates(self):
+        chord = {'root': 'G', 'quality': '7'}
+        get_all_reharmonizations_for_chord(chord, 'C', previous_chord=('D', 'm7'))
+        get_all_reharmonizations_for_chord(chord, 'C', previous_chord=('A', 'm7'))
+
+        stats = get_cache_stats()
+        assert stats['scored_options']['misses'] == 2
+        assert stats['candidates']['hits'] == 1
+
+    def test_filters_applied_after_cache(self):
+        chord = {'root': 'G', 'quality': '7'}
+        everything = get_all_reharmonizations_for_chord(chord, 'C', max_options=50, min_score=0.0)
+        limited = get_all_reharmonizations_for_chord(chord, 'C', max_options=1, min_score=0.0)
+
+        assert limited == everything[:1]
+        assert get_cache_stats()['scored_options']['hits'] == 1
+
+    def test_results_are_copies(self):
+        chord = {'root': 'G', 'quality': '7'}
+        first = get_all_reharmonizations_for_chord(chord, 'C', min_score=0.0)
+        first[0]['scores']['genre'] = -1
+
+        second = get_all_reharmonizations_for_chord(chord, 'C', min_score=0.0)
+        assert second[0]['scores']['genre'] != -1
+
+
+class TestTranscriptionSuggestions:
+    """Tests for converting orchestrator options to the API schema"""
+
+    def test_option_conversion(self):
+        option = get_all_reharmonizations_for_chord({'root': 'G', 'quality': '7'}, 'C', min_score=0.0)[0]
+        suggestion = _to_reharmonization_suggestion('G7', option)
+
+        assert suggestion.original_chord == 'G7'
+        assert suggestion.reharmonization_type == option['technique']
+        assert 1 <= suggestion.jazz_level <= 5
+        assert suggestion.voice_leading_quality in ('smooth', 'moderate', 'dramatic')
+
+
+class TestTranscriptionReharmonization:
+    """Tests for the pipeline's reharmonization step fed by real key analysis"""
+
+    @pytest.mark.asyncio
+    async def test_uses_analyzed_key(self):
+        # i - iv - V7 - i in A minor, arpeggiated
+        bars = [(57, 60, 64), (62, 65, 69), (64, 68, 71), (57, 60, 64)]
+        notes = [
+            NoteEvent(pitch=pitch, start_time=bar + beat * 0.25, end_time=bar + 1.0, velocity=80)
+            for bar, chord in enumerate(bars)
+            for beat, pitch in enumerate(chord)
+        ]
+        key = analyze_tonality(notes)['key']
+        assert key == 'A minor'
+
+        chords = [
+            ChordEvent(time=float(t), duration=1.0, chord=f"{root}{quality}", confidence=0.9, root=root, quality=quality)
+            for t, (root, quality) in enumerate([('A', 'm'), ('D', 'm'), ('E', '7'), ('A', 'm')])
+        ]
+        await _suggest_reharmonizations(chords, key)
+
+        assert all(chord.reharmonizations for chord in chords)
+        relative = [s for s in chords[0].reharmonizations if s.reharmonization_type == 'diatonic_substitution']
+        assert relative and relative[0].suggested_chord.startswith('C')  # Relative major, so the mode got through
@@ -0,0 +1,133 @@
+"""
+Tests for lattice-based global reharmonization
+"""
+
+import itertools
+
+import numpy as np
+import pytest
+
+from app.pipeline.reharmonization_engine import reharmonize_progression_globally
+from app.pipeline.reharmonization_orchestrator import get_cache_stats
+from app.pipeline.reharmonization_lattice import (
+    parse_key,
+    clear_candidate_cache,
+    k_best_viterbi,
+    optimize_reharmonization,
+    transition_matrix,
+)
+
+
+TURNAROUND = [('C', 'maj7'), ('A', 'm7'), ('D', 'm7'), ('G', '7'), ('C', 'maj7')]
+
+
+class TestDecoding:
+    """Tests for k-best Viterbi decoding"""
+
+    def test_matches_brute_force(self):
+        rng = np.random.default_rng(7)
+        sizes = [3, 4, 2, 3]
+        nodes = [rng.random(n) for n in sizes]
+        edges = [rng.random((sizes[t], sizes[t + 1])) for t in range(len(sizes) - 1)]
+
+        def total(path):
+            return sum(nodes[t][i] for t, i in enumerate(path)) + sum(
+                edges[t][path[t], path[t + 1]] for t in range(len(path) - 1)
+            )
+
+        brute = sorted((total(p) for p in itertools.product(*[range(n) for n in sizes])), reverse=True)
+        decoded = k_best_viterbi(nodes, edges, k=5)
+
+        assert [round(s, 9) for s, _ in decoded] == [round(s, 9) for s in brute[:5]]
+        for score, path in decoded:
+            assert score == pytest.approx(total(path))
+
+    def test_k_larger_than_path_count(self):
+        decoded = k_best_viterbi([np.array([1.0]), np.array([0.5, 0.2])], [np.array([[0.0, 0.0]])], k=5)
+        assert [path for _, path in decoded] == [[0, 0], [0, 1]]
+
+    def test_voice_leading_prefers_common_tones(self):
+        c_major = np.zeros((1, 12))
+        c_major[0, [0, 4, 7]] = 1
+        candidates = np.zeros((2, 12))
+        candidates[0, [9, 0, 4]] = 1  # Am shares two tones
+        candidates[1, [6, 10, 1]] = 1  # F# major shares none
+
+        scores = transition_matrix(c_major, candidates, np.array([0]), np.array([0, 0]))
+        assert scores.shape == (1, 2)
+        assert scores[0, 0] > scores[0, 1]
+
+
+class TestOptimizeReharmonization:
+    """Tests for lattice construction and cadence constraints"""
+
+    def test_one_entry_per_chord(self):
+        paths, positions = optimize_reharmonization(TURNAROUND, 'C', k=3)
+        assert len(positions) == len(TURNAROUND)
+        assert 1 <= len(paths) <= 3
+        assert all(len(p.chords) == len(TURNAROUND) for p in paths)
+        assert paths == sorted(paths, key=lambda p: -p.score)
+
+    def test_cadence_constraints(self):
+        paths, positions = optimize_reharmonization(TURNAROUND, 'C')
+        assert positions[3]['constraint'] == 'same_function'
+        assert positions[4]['constraint'] == 'pinned'
+        assert paths[0].chords[4]['technique'] == 'original'
+
+    def test_without_cadence_preservation(self):
+        _, positions = optimize_reharmonization(TURNAROUND, 'C', preserve_cadences=False)
+        assert all(p['constraint'] is None for p in positions)
+
+    def test_candidates_memoized(self):
+        clear_candidate_cache()
+        optimize_reharmonization(TURNAROUND + TURNAROUND, 'C')
+        stats = get_cache_stats()['scored_options']
+        assert stats['misses'] == 4
+        assert stats['hits'] == 6
+
+    def test_results_do_not_share_cached_options(self):
+        clear_candidate_cache()
+        _, first = optimize_reharmonization(TURNAROUND, 'C')
+        for position in first:
+            for option in position['options']:
+                option['score'] = -1.0
+                option.get('scores', {}).clear()
+
+        _, second = optimize_reharmonization(TURNAROUND, 'C')
+        assert all(o['score'] >= 0 for p in second for o in p['options'])
+        assert all(o['scores'] for p in second for o in p['options'] if o['technique'] != 'original')
+
+    def test_minor_key_keeps_its_mode(self):
+        clear_candidate_cache()
+        progression = [('A', 'm'), ('D', 'm'), ('E', '7'), ('A', 'm')]
+        _, minor = optimize_reharmonization(progression, 'Am')
+        _, major = optimize_reharmonization(progression, 'A')
+
+        assert get_cache_stats()['scored_options']['misses'] == 6  # Mode is part of the cache key
+        relative = [o for o in minor[0]['options'] if o['technique'] == 'diatonic_substitution']
+        assert relative and relative[0]['new_root'] == 'C'
+        assert minor[0]['options'] != major[0]['options']
+
+    def test_parse_key(self):
+        assert parse_key('C') == ('C', 'major')
+        assert parse_key('Am') == ('A', 'minor')
+        assert parse_key('f# minor') == ('F#', 'minor')
+        assert parse_key('Eb major') == ('Eb', 'major')
+
+
+class TestGlobalReharmonization:
+    """Tests for the async engine entry point"""
+
+    @pytest.mark.asyncio
+    async def test_output_shape(self):
+        result = await reharmonize_progression_globally(TURNAROUND, 'C')
+
+        assert [r['chord_index'] for r in result] == list(range(len(TURNAROUND)))
+        assert result[-1]['selected']['technique'] == 'original'
+        assert result[-1]['selected']['explanation'] == 'Preserved cadence'
+        for entry in result:
+            assert {'new_root', 'new_quality', 'technique'} <= set(entry['selected'])
+
+    @pytest.mark.asyncio
+    async def test_empty_progression(self):
+        assert await reharmonize_progression_globally([], 'C') == []
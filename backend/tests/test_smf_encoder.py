@@ -0,0 +1,97 @@
+"""
+Tests for the in-memory Standard MIDI File encoder
+"""
+
+import io
+
+import mido
+import numpy as np
+import pytest
+
+from app.gospel import Arrangement, Note
+from app.gospel.midi.enhanced_exporter import export_enhanced_midi
+from app.gospel.midi.smf_encoder import encode_arrangement
+from app.services import generator_utils
+from app.services.generator_utils import render_midi
+
+
+def _arrangement(key="C", time_signature=(4, 4), bars=8, seed=0):
+    rng = np.random.default_rng(seed)
+    beats = bars * time_signature[0]
+
+    def hand(low, count):
+        times = np.sort(rng.uniform(0, beats - 1, count))
+        return [
+            Note(
+                pitch=int(rng.integers(low, low + 24)),
+                time=float(t),
+                duration=float(rng.uniform(0.25, 2.0)),
+                velocity=int(rng.integers(40, 120)),
+                hand="left" if low < 60 else "right",
+            )
+            for t in times
+        ]
+
+    return Arrangement(
+        left_hand_notes=hand(36, 40),
+        right_hand_notes=hand(60, 80),
+        tempo=96,
+        time_signature=time_signature,
+        key=key,
+        total_bars=bars,
+        application="worship",
+    )
+
+
+class TestEncodeArrangement:
+    """Tests for byte-level SMF encoding"""
+
+    @pytest.mark.parametrize("key,time_signature", [("C", (4, 4)), ("Eb", (3, 4)), ("F#", (6, 8))])
+    @pytest.mark.parametrize("include_pedal", [True, False])
+    def test_matches_exporter(self, tmp_path, key, time_signature, include_pedal):
+        arrangement = _arrangement(key=key, time_signature=time_signature)
+        path = export_enhanced_midi(arrangement, tmp_path / "ref.mid", include_pedal=include_pedal, humanize=False)
+
+        encoded = encode_arrangement(arrangement, include_pedal=include_pedal, humanize=False)
+        assert encoded == path.read_bytes()
+
+    def test_parseable_when_humanized(self):
+        midi = mido.MidiFile(file=io.BytesIO(encode_arrangement(_arrangement(), seed=1)))
+
+        assert len(midi.tracks) == 3
+        note_ons = [m for m in midi.tracks[2] if m.type == "note_on"]
+        assert len(note_ons) == 80
+        assert all(1 <= m.velocity <= 127 for m in note_ons)
+
+    def test_seeded_humanization_is_deterministic(self):
+        arrangement = _arrangement()
+        assert encode_arrangement(arrangement, seed=7) == encode_arrangement(arrangement, seed=7)
+        assert encode_arrangement(arrangement, seed=7) != encode_arrangement(arrangement, seed=8)
+
+    def test_empty_hand(self):
+        arrangement = _arrangement()
+        arrangement.left_hand_notes = []
+        midi = mido.MidiFile(file=io.BytesIO(encode_arrangement(arrangement, humanize=False)))
+        assert not [m for m in midi.tracks[1] if m.type == "note_on"]
+
+
+class TestRenderMidi:
+    """Tests for the async render helper"""
+
+    @pytest.mark.asyncio
+    async def test_no_disk_write_by_default(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(generator_utils.settings, "OUTPUTS_DIR", tmp_path)
+        midi_bytes, filename, path = await render_midi(_arrangement(), "gen", "gospel", persist=False)
+
+        assert midi_bytes.startswith(b"MThd")
+        assert filename.startswith("gospel_C_96bpm_")
+        assert path is None
+        assert not (tmp_path / "gen").exists()
+
+    @pytest.mark.asyncio
+    async def test_persist_writes_same_bytes(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(generator_utils.settings, "OUTPUTS_DIR", tmp_path)
+        midi_bytes, filename, path = await render_midi(_arrangement(), "gen", "gospel")
+
+        assert path == tmp_path / "gen" / filename
+        assert path.read_bytes() == midi_bytes
@@ -0,0 +1,112 @@
+"""
+Tests for SpacedRepetitionService review statistics and bulk reviews
+"""
+
+import json
+from datetime import datetime, timedelta
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.database.models import Base, UserExerciseProgress
+from app.services.spaced_repetition_service import SpacedRepetitionService
+
+TEST_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
+
+
+@pytest_asyncio.fixture
+async def db():
+    """In-memory database with every table created."""
+    engine = create_async_engine(TEST_DATABASE_URL, echo=False)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    session_factory = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    async with session_factory() as session:
+        yield session
+    await engine.dispose()
+
+
+def progress(user_id, exercise_id, **fields):
+    return UserExerciseProgress(
+        user_id=user_id, exercise_id=exercise_id,
+        times_practiced=0, total_practice_time_seconds=0, **fields
+    )
+
+
+class TestReviewStats:
+    """Tests for get_review_stats"""
+
+    @pytest.mark.asyncio
+    async def test_buckets_and_averages(self, db):
+        now = datetime.utcnow()
+        db.add_all([
+            progress(1, "overdue", next_review=now - timedelta(days=2), ease_factor=2.0, interval=3, repetitions=2),
+            progress(1, "this_week", next_review=now + timedelta(days=3), ease_factor=2.5, interval=6, repetitions=1),
+            progress(1, "next_month", next_review=now + timedelta(days=30), ease_factor=2.3, interval=20, repetitions=4),
+            progress(1, "unscheduled", next_review=None, ease_factor=2.2, interval=1, repetitions=0),
+            progress(2, "other_user", next_review=now - timedelta(days=1), ease_factor=1.3, interval=1, repetitions=9),
+        ])
+        await db.commit()
+
+        stats = await SpacedRepetitionService(db).get_review_stats(user_id=1)
+
+        assert stats["total_due_today"] == 1
+        assert stats["total_overdue"] == 1
+        assert stats["total_upcoming_week"] == 1
+        assert stats["avg_ease_factor"] == pytest.approx((2.0 + 2.5 + 2.3 + 2.2) / 4)
+        assert stats["avg_interval"] == pytest.approx((3 + 6 + 20 + 1) / 4)
+        assert stats["total_repetitions"] == 7
+
+    @pytest.mark.asyncio
+    async def test_no_progress(self, db):
+        stats = await SpacedRepetitionService(db).get_review_stats(user_id=1)
+
+        assert stats == {
+            "total_due_today": 0,
+            "total_upcoming_week": 0,
+            "total_overdue": 0,
+            "avg_ease_factor": 0.0,
+            "avg_interval": 0.0,
+            "total_repetitions": 0,
+        }
+
+
+class TestMarkAsReviewedMany:
+    """Tests for finishing a practice session in one transaction"""
+
+    REVIEWS = [("scale", 5), ("voicing", 2), ("scale", 4)]
+
+    async def _rows(self, db, user_id):
+        result = await db.execute(
+            select(UserExerciseProgress)
+            .where(UserExerciseProgress.user_id == user_id)
+            .order_by(UserExerciseProgress.exercise_id)
+        )
+        return result.scalars().all()
+
+    @pytest.mark.asyncio
+    async def test_matches_sequential_reviews(self, db):
+        for user_id in (1, 2):
+            db.add(progress(user_id, "scale", ease_factor=2.4, interval=6, repetitions=2,
+                            quality_ratings_json=json.dumps([4, 4])))
+        await db.commit()
+        service = SpacedRepetitionService(db)
+
+        for exercise_id, quality in self.REVIEWS:
+            await service.mark_as_reviewed(1, exercise_id, quality)
+        schedules = await service.mark_as_reviewed_many(2, self.REVIEWS)
+
+        assert [s["exercise_id"] for s in schedules] == ["scale", "voicing", "scale"]
+        for one, many in zip(await self._rows(db, 1), await self._rows(db, 2)):
+            assert (one.exercise_id, one.ease_factor, one.interval, one.repetitions) == \
+                   (many.exercise_id, many.ease_factor, many.interval, many.repetitions)
+            assert one.times_practiced == many.times_practiced
+            assert one.avg_score == pytest.approx(many.avg_score)
+            assert json.loads(one.quality_ratings_json) == json.loads(many.quality_ratings_json)
+
+    @pytest.mark.asyncio
+    async def test_empty_session(self, db):
+        assert await SpacedRepetitionService(db).mark_as_reviewed_many(1, []) == []
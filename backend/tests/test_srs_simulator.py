@@ -0,0 +1,148 @@
+"""
+Tests for the vectorized SM-2 simulator and review workload forecast
+"""
+
+import json
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.database.models import Base, User, UserExerciseProgress
+from app.database.curriculum_models import (
+    Curriculum, CurriculumModule, CurriculumLesson, CurriculumExercise
+)
+from app.services.srs_service import SRSService
+from app.services.srs_simulator import (
+    CardStates,
+    ReviewForecastService,
+    SM2Parameters,
+    forecast_workload,
+    pad_histories,
+    quality_distribution,
+    replay,
+    sm2_step,
+)
+
+TEST_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
+
+
+@pytest_asyncio.fixture
+async def db():
+    """In-memory database with every table created."""
+    engine = create_async_engine(TEST_DATABASE_URL, echo=False)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    session_factory = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    async with session_factory() as session:
+        yield session
+    await engine.dispose()
+
+
+class TestSM2Step:
+    """Tests for the vectorized SM-2 step"""
+
+    def test_matches_scalar_scheduler(self):
+        rng = np.random.default_rng(0)
+        quality = rng.integers(0, 6, 500)
+        interval = rng.uniform(1, 60, 500)
+        ease = rng.uniform(1.3, 3.0, 500)
+        repetitions = rng.integers(0, 6, 500)
+
+        new_interval, new_ease, new_repetitions = sm2_step(ease, interval, repetitions, quality)
+
+        for i in range(500):
+            expected = SRSService.calculate_next_review(
+                int(quality[i]), float(interval[i]), float(ease[i]), int(repetitions[i])
+            )
+            assert (new_interval[i], new_ease[i], new_repetitions[i]) == pytest.approx(expected)
+
+    def test_parameter_overrides(self):
+        params = SM2Parameters(interval_modifier=2.0, max_interval=30.0)
+        new_interval, _, _ = sm2_step(
+            np.array([2.5, 2.5]), np.array([6.0, 20.0]), np.array([2, 2]), np.array([4, 4]), params
+        )
+
+        assert new_interval.tolist() == [30.0, 30.0]
+
+    def test_replay_matches_sequential_reviews(self):
+        histories = [[5, 4, 3, 5], [2, 5], []]
+        states = replay(pad_histories(histories))
+
+        for card, history in enumerate(histories):
+            interval, ease, repetitions = 0.0, 2.5, 0
+            for quality in history:
+                interval, ease, repetitions = SRSService.calculate_next_review(
+                    quality, interval, ease, repetitions
+                )
+            assert states.interval[card] == pytest.approx(interval)
+            assert states.ease[card] == pytest.approx(ease)
+            assert states.repetitions[card] == repetitions
+
+
+class TestForecastWorkload:
+    """Tests for the Monte-Carlo forecast"""
+
+    def test_all_cards_due_today_then_spread_out(self):
+        cards = CardStates.new(100)
+        curve = forecast_workload(cards, [0, 0, 0, 0, 0, 1], days=10, simulations=20, seed=1)
+
+        # Perfect recall: reviewed on day 0, day 1 (interval 1), then day 7 (interval 6)
+        assert curve["mean"].tolist() == [100, 100, 0, 0, 0, 0, 0, 100, 0, 0]
+        assert curve["p10"].tolist() == curve["p90"].tolist() == curve["mean"].tolist()
+
+    def test_seeded_forecast_is_reproducible(self):
+        cards = CardStates.new(50)
+        probs = quality_distribution([1, 3, 4, 4, 5])
+        first = forecast_workload(cards, probs, days=14, simulations=30, seed=7)
+        second = forecast_workload(cards, probs, days=14, simulations=30, seed=7)
+
+        assert np.array_equal(first["mean"], second["mean"])
+        assert (first["p10"] <= first["mean"]).all() and (first["mean"] <= first["p90"]).all()
+
+    def test_quality_distribution(self):
+        assert quality_distribution([5, 5, 3, 0]).tolist() == [0.25, 0, 0, 0.25, 0, 0.5]
+        assert quality_distribution([]).sum() == pytest.approx(1.0)
+
+
+class TestReviewForecastService:
+    """Tests for loading cards and rating history from the database"""
+
+    @pytest.mark.asyncio
+    async def test_forecast_from_active_curriculum(self, db):
+        now = datetime.utcnow()
+        db.add(User(id=1, email="user1@example.com", hashed_password="x"))
+        lesson = CurriculumLesson(title="Week 1", week_number=1)
+        lesson.exercises = [
+            CurriculumExercise(title="overdue", exercise_type="scale", order_index=0,
+                               next_review_at=now - timedelta(days=3)),
+            CurriculumExercise(title="in_two_days", exercise_type="scale", order_index=1,
+                               next_review_at=now + timedelta(days=2)),
+            CurriculumExercise(title="new_a", exercise_type="scale", order_index=2),
+            CurriculumExercise(title="new_b", exercise_type="scale", order_index=3),
+            CurriculumExercise(title="mastered", exercise_type="scale", order_index=4, is_mastered=True),
+        ]
+        module = CurriculumModule(title="Module 1", theme="gospel", order_index=0, start_week=1, end_week=4)
+        module.lessons = [lesson]
+        curriculum = Curriculum(user_id=1, title="Curriculum", status="active")
+        curriculum.modules = [module]
+        db.add(curriculum)
+        db.add(UserExerciseProgress(
+            user_id=1, exercise_id="lib", times_practiced=2, total_practice_time_seconds=0,
+            quality_ratings_json=json.dumps([5, 5]),
+        ))
+        await db.commit()
+
+        result = await ReviewForecastService(db).forecast(
+            [1], days=3, simulations=5, new_cards_per_day=1, seed=3
+        )
+
+        assert result["card_count"] == 4
+        assert result["quality_distribution"] == [0, 0, 0, 0, 0, 1.0]
+        # Day 0: overdue + new_a; day 1: both again + new_b; day 2: new_b + in_two_days
+        assert [day["mean"] for day in result["days"]] == [2, 3, 2]
+        assert result["days"][0]["date"] == now.date()
+        assert result["total_expected_reviews"] == 7
@@ -0,0 +1,145 @@
+"""
+Tests for lazy service construction and the API import-time budget
+"""
+
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from app.core.lazy import LazyService, ServiceRegistry, lazy_import, module_available
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+
+# Seconds allowed for `import app.main` in a fresh interpreter
+IMPORT_BUDGET_SECONDS = float(os.environ.get("IMPORT_BUDGET_SECONDS", "3.0"))
+
+# Modules that must only be imported on first use, never at startup
+DEFERRED_MODULES = [
+    "torch", "librosa", "music21", "mlx_lm", "miditok",
+    "chromadb", "transformers", "sklearn", "anthropic", "google.generativeai",
+]
+
+_PROBE = """
+import json, sys, time
+started = time.perf_counter()
+import app.main
+elapsed = time.perf_counter() - started
+from app.core.lazy import service_registry
+print(json.dumps({
+    "seconds": elapsed,
+    "loaded": [m for m in %r if m in sys.modules],
+    "built": service_registry.created(),
+}))
+""" % (DEFERRED_MODULES,)
+
+
+@pytest.fixture(scope="module")
+def startup_profile():
+    """Import app.main in a clean interpreter and report time + heavy modules."""
+    result = subprocess.run(
+        [sys.executable, "-c", _PROBE],
+        cwd=BACKEND_DIR,
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+    if result.returncode != 0:
+        if "ModuleNotFoundError" in result.stderr:
+            pytest.skip(f"app.main dependencies not installed: {result.stderr.strip().splitlines()[-1]}")
+        pytest.fail(f"import app.main failed:\n{result.stderr}")
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+class TestStartupImports:
+    """Tests for import app.main (run in a subprocess)"""
+
+    def test_within_budget(self, startup_profile):
+        assert startup_profile["seconds"] < IMPORT_BUDGET_SECONDS, (
+            f"import app.main took {startup_profile['seconds']:.2f}s "
+            f"(budget {IMPORT_BUDGET_SECONDS}s); profile with `python -X importtime -c 'import app.main'`"
+        )
+
+    def test_heavy_modules_deferred(self, startup_profile):
+        assert startup_profile["loaded"] == []
+
+    def test_no_services_built(self, startup_profile):
+        assert startup_profile["built"] == []
+
+
+class TestLazyService:
+    """Tests for lazily built singletons"""
+
+    def test_built_on_first_access(self):
+        calls = []
+
+        class Service:
+            def __init__(self):
+                calls.append(1)
+                self.value = 42
+
+        service = LazyService("svc", Service)
+        assert not service.created
+        assert service.value == 42
+        assert service.value == 42
+        assert service.created
+        assert len(calls) == 1
+
+    def test_concurrent_first_access_builds_once(self):
+        calls = []
+
+        def factory():
+            calls.append(1)
+            time.sleep(0.05)
+            return object()
+
+        service = LazyService("svc", factory)
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(service.resolve())) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert len(calls) == 1
+        assert len({id(r) for r in results}) == 1
+
+    def test_setattr_and_reset(self):
+        class Service:
+            flag = False
+
+        service = LazyService("svc", Service)
+        service.flag = True
+        assert service.resolve().flag is True
+
+        service.reset()
+        assert service.flag is False
+
+    def test_registry_reports_built_services(self):
+        registry = ServiceRegistry()
+        registry.register("a", dict)
+        registry.register("b", list)
+
+        assert registry.created() == []
+        assert registry.get("b") == []
+        assert registry.created() == ["b"]
+        assert registry.stats()["a"] == {"created": False, "build_seconds": None}
+
+
+class TestLazyImport:
+    """Tests for deferred module imports"""
+
+    def test_proxies_module_attributes(self):
+        json_module = lazy_import("json")
+        assert json_module.dumps({"a": 1}) == '{"a": 1}'
+
+    def test_missing_module_fails_on_use(self):
+        missing = lazy_import("definitely_not_a_module_xyz")
+        assert not module_available("definitely_not_a_module_xyz")
+        with pytest.raises(ModuleNotFoundError):
+            missing.anything
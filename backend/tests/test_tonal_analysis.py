@@ -0,0 +1,127 @@
+"""
+Tests for NumPy key and meter estimation
+"""
+
+import numpy as np
+import pytest
+
+from app.pipeline.tonal_analysis import (
+    analyze_tonality,
+    estimate_key_from_arrays,
+    estimate_meter,
+    key_correlations,
+    key_timeline,
+)
+from app.schemas.transcription import NoteEvent
+
+
+C_MAJOR = [0, 2, 4, 5, 7, 9, 11]
+G_MINOR = [7, 9, 10, 0, 2, 3, 6]
+
+
+def _phrase(scale, start, bars, beats_per_bar=4, beat=0.5, seed=0):
+    """Chords of scale tones on every beat, accented bass on each downbeat"""
+    rng = np.random.default_rng(seed)
+    pitches, starts, ends, velocities = [], [], [], []
+
+    for i in range(bars * beats_per_bar):
+        t = start + i * beat
+        downbeat = i % beats_per_bar == 0
+        for pc in [scale[0], scale[2], scale[4]] + list(rng.choice(scale, 1)):
+            pitches.append(60 + pc)
+            starts.append(t)
+            ends.append(t + beat * 0.9)
+            velocities.append(110 if downbeat else 60)
+        if downbeat:
+            pitches.append(36 + scale[0])
+            starts.append(t)
+            ends.append(t + beat * beats_per_bar * 0.9)
+            velocities.append(110)
+
+    return (
+        np.array(pitches, dtype=np.int64),
+        np.array(starts, dtype=np.float64),
+        np.array(ends, dtype=np.float64),
+        np.array(velocities, dtype=np.float64),
+    )
+
+
+def _concat(*phrases):
+    return tuple(np.concatenate(parts) for parts in zip(*phrases))
+
+
+class TestKeyEstimation:
+    """Tests for profile-correlation key finding"""
+
+    def test_major_key(self):
+        pitches, starts, ends, _ = _phrase(C_MAJOR, 0.0, 8)
+        key = estimate_key_from_arrays(pitches, starts, ends)
+        assert key.name == "C major"
+        assert key.correlation > 0.6
+
+    def test_minor_key_with_temperley(self):
+        pitches, starts, ends, _ = _phrase(G_MINOR, 0.0, 8)
+        assert estimate_key_from_arrays(pitches, starts, ends, profile='temperley').name == "G minor"
+
+    def test_matches_scalar_correlation(self):
+        histogram = np.random.default_rng(3).random(12)
+        profile = [6.35, 2.23, 3.48, 2.33, 4.38, 4.09, 2.52, 5.19, 2.39, 3.66, 2.29, 2.88]
+
+        scores = key_correlations(histogram)
+        for shift in range(12):
+            expected = np.corrcoef(np.roll(histogram, -shift), profile)[0, 1]
+            assert scores[2 * shift] == pytest.approx(expected)
+
+    def test_no_notes(self):
+        empty = np.array([], dtype=np.int64)
+        assert estimate_key_from_arrays(empty, empty.astype(float), empty.astype(float)) is None
+
+    def test_timeline_detects_modulation(self):
+        pitches, starts, ends, _ = _concat(_phrase(C_MAJOR, 0.0, 16), _phrase(G_MINOR, 32.0, 16))
+        segments = key_timeline(pitches, starts, ends)
+
+        assert [s.key.name for s in segments] == ["C major", "G minor"]
+        assert segments[0].start == 0.0
+        assert 28.0 <= segments[1].start <= 36.0
+
+
+class TestMeterEstimation:
+    """Tests for onset-autocorrelation meter estimation"""
+
+    def test_duple_meter(self):
+        _, starts, ends, velocities = _phrase(C_MAJOR, 0.0, 16, beats_per_bar=4)
+        meter = estimate_meter(starts, ends, velocities)
+        assert meter.time_signature == "4/4"
+        assert meter.beat_period == pytest.approx(0.5, abs=0.02)
+
+    def test_triple_meter(self):
+        _, starts, ends, velocities = _phrase(C_MAJOR, 0.0, 16, beats_per_bar=3)
+        assert estimate_meter(starts, ends, velocities, tempo=120).time_signature == "3/4"
+
+    def test_too_few_notes(self):
+        starts = np.array([0.0, 1.0])
+        assert estimate_meter(starts, starts + 0.5, np.array([80.0, 80.0])) is None
+
+
+class TestAnalyzeTonality:
+    """Tests for the pipeline entry point"""
+
+    def test_result_shape(self):
+        pitches, starts, ends, velocities = _phrase(C_MAJOR, 0.0, 8)
+        notes = [
+            NoteEvent(pitch=int(p), start_time=float(s), end_time=float(e), velocity=int(v))
+            for p, s, e, v in zip(pitches, starts, ends, velocities)
+        ]
+
+        result = analyze_tonality(notes, tempo=120)
+
+        assert result["key"] == "C major"
+        assert result["time_signature"] == "4/4"
+        assert result["time_signatures"] == ["4/4"]
+        assert result["key_timeline"][0]["key"] == "C major"
+
+    def test_empty_notes(self):
+        result = analyze_tonality([])
+        assert result["key"] is None
+        assert result["time_signature"] == "4/4"
+        assert result["key_timeline"] == []
@@ -6,9 +6,12 @@ Tests cover:
 - Chord tone identification (root, 3rd, 7th, extensions)
 - Complexity calculation
 - Hand span measurement
+- Note-to-chord assignment
 - Edge cases and error handling
 """
 
+import random
+
 import pytest
 from app.pipeline.voicing_analyzer import (
     VoicingInfo,
@@ -19,8 +22,11 @@ from app.pipeline.voicing_analyzer import (
     identify_chord_tones,
     calculate_complexity_score,
     estimate_hand_span,
+    assign_notes_to_chords,
+    group_notes_by_time,
 )
 from app.gospel import Note
+from app.gospel.note_array import NoteArray
 from app.schemas.transcription import ChordEvent
 
 
@@ -492,3 +498,47 @@ class TestVoiceLeadingAnalysis:
 
         assert abs(avg_pitch_1 - avg_pitch_2) < 5, \
             f"Voice leading should be smooth, average pitch change: {abs(avg_pitch_1 - avg_pitch_2)}"
+
+
+class TestNoteAssignment:
+    """Test single-pass note-to-chord assignment"""
+
+    def test_matches_per_chord_grouping(self):
+        """Sweep-line assignment should agree with group_notes_by_time on every chord"""
+        rng = random.Random(42)
+        notes = [
+            Note(
+                pitch=rng.randint(36, 84),
+                time=round(rng.uniform(0, 30), 3),
+                duration=round(rng.choice([rng.uniform(0.05, 0.5), rng.uniform(1, 6)]), 3),
+                velocity=80,
+                hand="right",
+            )
+            for _ in range(400)
+        ]
+        chords = []
+        t = 0.0
+        while t < 30:
+            duration = rng.choice([0.5, 1.0, 2.0])
+            chords.append(ChordEvent(time=t, duration=duration, chord="C", confidence=0.9, root="C", quality=""))
+            t += duration
+
+        expected = [group_notes_by_time(notes, chord) for chord in chords]
+        assert assign_notes_to_chords(notes, chords) == expected
+        assert assign_notes_to_chords(NoteArray.from_notes(notes), chords) == expected
+
+    def test_held_and_trailing_notes(self):
+        """Long held notes count; notes starting after the chord only count if short"""
+        notes = [
+            Note(pitch=36, time=0.0, duration=8.0, velocity=80, hand="left"),   # Pedal under everything
+            Note(pitch=60, time=4.1, duration=0.05, velocity=80, hand="right"),  # Grace note just after chord
+            Note(pitch=64, time=4.1, duration=2.0, velocity=80, hand="right"),   # Next chord's note
+        ]
+        chord = ChordEvent(time=3.0, duration=1.0, chord="C", confidence=0.9, root="C", quality="")
+
+        assert assign_notes_to_chords(notes, [chord]) == [[36, 60]]
+
+    def test_empty_notes(self):
+        """No notes yields an empty pitch set per chord"""
+        chord = ChordEvent(time=0.0, duration=1.0, chord="C", confidence=0.9, root="C", quality="")
+        assert assign_notes_to_chords([], [chord]) == [[]]